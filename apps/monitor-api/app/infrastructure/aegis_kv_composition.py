@@ -156,11 +156,14 @@ class AegisKVStoreComposition(ServiceRegistryKVStorePort):
             services = []
             assert self._kv_store is not None
             keys = await self._kv_store.keys()
-            for key in keys:
-                if key.startswith("service-instances_"):
-                    continue
-                entry = await self._kv_store.get(key)
-                if entry and entry.value:
+            keys = [
+                key
+                for key in keys
+                if not key.startswith(("service-instances.", "service-instances__"))
+            ]
+            entries = await self._kv_store.get_many(keys)
+            for key, entry in entries.items():
+                if entry.value:
                     try:
                         if isinstance(entry.value, dict):
                             services.append(ServiceDefinition(**entry.value))
@@ -238,14 +238,17 @@ class AegisSDKKVAdapter(ServiceRegistryKVStorePort):
             assert self._kv_store is not None  # Type guard for mypy
             keys = await self._kv_store.keys()
 
-            # Get all values, but skip service instances
-            for key in keys:
-                # Skip service instance keys (they start with "service-instances__")
-                if key.startswith("service-instances__"):
-                    continue
-
-                entry = await self._kv_store.get(key)
-                if entry and entry.value:
+            # Skip service instance keys (service-instances. or legacy service-instances__)
+            keys = [
+                key
+                for key in keys
+                if not key.startswith(("service-instances.", "service-instances__"))
+            ]
+
+            # Fetch all values in one pipelined batch
+            entries = await self._kv_store.get_many(keys)
+            for key, entry in entries.items():
+                if entry.value:
                     try:
                         if isinstance(entry.value, dict):
                             services.append(ServiceDefinition(**entry.value))
@@ -38,7 +38,9 @@ class ServiceInstanceRepositoryAdapter(ServiceInstanceRepositoryPort):
             stale_threshold_seconds: Seconds after which an entry is considered stale (default: 35)
         """
         self._kv = kv_store
-        self._prefix = "service-instances__"  # SDK uses double underscore separator
+        # SDK registry keys are service-instances.{service}.{instance}; older SDK
+        # releases used a double underscore separator
+        self._prefixes = ("service-instances.", "service-instances__")
         self._stale_threshold_seconds = stale_threshold_seconds
 
     async def get_all_instances(self) -> list[ServiceInstance]:
@@ -50,7 +52,9 @@ class ServiceInstanceRepositoryAdapter(ServiceInstanceRepositoryPort):
         try:
             # List all keys with service-instances prefix (SDK pattern)
             all_keys = await self._kv.keys()
-            keys = [key for key in all_keys if key.startswith(self._prefix)]
+            keys = self._without_legacy_copies(
+                [key for key in all_keys if key.startswith(self._prefixes)]
+            )
 
             instances = []
             for key in keys:
@@ -95,12 +99,12 @@ class ServiceInstanceRepositoryAdapter(ServiceInstanceRepositoryPort):
             List of service instances for the specified service
         """
         try:
-            # Build pattern for this service (SDK uses __ as separator)
-            pattern = f"{self._prefix}{service_name}__"
+            # Build patterns for this service in both key layouts
+            pattern = (f"service-instances.{service_name}.", f"service-instances__{service_name}__")
 
             # List all keys matching the pattern
             all_keys = await self._kv.keys()
-            keys = [key for key in all_keys if key.startswith(pattern)]
+            keys = self._without_legacy_copies([key for key in all_keys if key.startswith(pattern)])
 
             instances = []
             for key in keys:
@@ -130,6 +134,24 @@ class ServiceInstanceRepositoryAdapter(ServiceInstanceRepositoryPort):
             logger.error(f"Failed to get instances by service: {e}")
             raise KVStoreException(f"Failed to get instances by service: {e}") from e
 
+    @staticmethod
+    def _without_legacy_copies(keys: list[str]) -> list[str]:
+        """Drop legacy keys of instances that are also registered under a dotted key.
+
+        SDK releases that write dotted keys keep writing a legacy copy during
+        upgrades, so each such instance would otherwise be read twice.
+        """
+        listed = set(keys)
+        legacy_prefix = "service-instances__"
+        kept = []
+        for key in keys:
+            if key.startswith(legacy_prefix):
+                service_name, _, instance_id = key[len(legacy_prefix) :].partition("__")
+                if f"service-instances.{service_name}.{instance_id}" in listed:
+                    continue
+            kept.append(key)
+        return kept
+
     def _translate_to_domain_model(self, data: dict[str, Any]) -> ServiceInstance:
         """Translate SDK service instance data to our domain model.
 
@@ -239,11 +261,11 @@ class ServiceInstanceRepositoryAdapter(ServiceInstanceRepositoryPort):
             KVStoreException: If retrieval fails
         """
         try:
-            # Build the key for this specific instance (SDK uses __ as separator)
-            key = f"{self._prefix}{service_name}__{instance_id}"
-
-            # Get the value from KV Store
-            entry = await self._kv.get(key)
+            # Build the key for this specific instance, falling back to the
+            # legacy double underscore layout
+            entry = await self._kv.get(f"service-instances.{service_name}.{instance_id}")
+            if not entry:
+                entry = await self._kv.get(f"service-instances__{service_name}__{instance_id}")
             if entry and entry.value:
                 # Parse the data - handle both bytes and dict formats
                 if isinstance(entry.value, bytes):
@@ -224,7 +224,9 @@ class TestAegisSDKKVAdapter:
         mock_kv_store.keys = AsyncMock(return_value=["service1", "service2"])
         mock_entry = Mock()
         mock_entry.value = service_definition.model_dump()
-        mock_kv_store.get = AsyncMock(return_value=mock_entry)
+        mock_kv_store.get_many = AsyncMock(
+            return_value={"service1": mock_entry, "service2": mock_entry}
+        )
 
         adapter._kv_store = mock_kv_store
         adapter._connected = True
@@ -236,4 +238,4 @@ class TestAegisSDKKVAdapter:
         assert len(result) == 2
         assert all(s.service_name == "test-service" for s in result)
         mock_kv_store.keys.assert_called_once()
-        assert mock_kv_store.get.call_count == 2
+        mock_kv_store.get_many.assert_awaited_once_with(["service1", "service2"])
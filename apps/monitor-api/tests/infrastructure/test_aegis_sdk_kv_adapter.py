@@ -343,7 +343,7 @@ class TestAegisSDKKVAdapter:
         mock_entry2 = Mock()
         mock_entry2.value = service2_data
 
-        adapter._kv_store.get.side_effect = [mock_entry1, mock_entry2]
+        adapter._kv_store.get_many.return_value = {"service1": mock_entry1, "service2": mock_entry2}
 
         # Act
         services = await adapter.list_all()
@@ -352,8 +352,8 @@ class TestAegisSDKKVAdapter:
         assert len(services) == 2
         assert services[0].service_name == "test-service"
         assert services[1].service_name == "service2"
-        # Verify service-instances_ key was skipped
-        assert adapter._kv_store.get.call_count == 2
+        # Verify service-instances_ key was skipped and values fetched in one batch
+        adapter._kv_store.get_many.assert_awaited_once_with(["service1", "service2"])
 
     @pytest.mark.asyncio
     async def test_list_all_with_parse_error(self, adapter: AegisSDKKVAdapter) -> None:
@@ -376,7 +376,7 @@ class TestAegisSDKKVAdapter:
             "updated_at": datetime.now().isoformat(),
         }
 
-        adapter._kv_store.get.side_effect = [mock_entry1, mock_entry2]
+        adapter._kv_store.get_many.return_value = {"service1": mock_entry1, "service2": mock_entry2}
 
         # Act
         services = await adapter.list_all()
@@ -134,7 +134,10 @@ class TestAegisComposition:
             }
             return mock_entry
 
-        mock_kv_store.get.side_effect = get_side_effect
+        async def get_many_side_effect(keys: list[str]) -> dict[str, Mock]:
+            return {key: await get_side_effect(key) for key in keys}
+
+        mock_kv_store.get_many = AsyncMock(side_effect=get_many_side_effect)
 
         services = await composition.list_all()
         assert len(services) == 2
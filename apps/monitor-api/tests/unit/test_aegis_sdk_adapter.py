@@ -181,7 +181,11 @@ class TestAegisSDKAdapter:
             }
             return mock_entry
 
-        mock_kv_store.get.side_effect = get_side_effect
+        async def get_many_side_effect(keys: list[str]) -> dict[str, Any]:
+            entries = {key: await get_side_effect(key) for key in keys}
+            return {key: entry for key, entry in entries.items() if entry is not None}
+
+        mock_kv_store.get_many = AsyncMock(side_effect=get_many_side_effect)
 
         services = await adapter.list_all()
         assert len(services) == 2  # Should exclude service-instances_ key
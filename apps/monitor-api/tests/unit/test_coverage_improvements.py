@@ -427,7 +427,7 @@ class TestAegisKVCompositionImproved:
         entry2 = MagicMock()
         entry2.value = "invalid json {"
 
-        mock_kv_store.get.side_effect = [entry1, entry2]
+        mock_kv_store.get_many.return_value = {"service1": entry1, "service2": entry2}
 
         services = await adapter.list_all()
         assert len(services) == 1
@@ -142,6 +142,35 @@ class TestServiceInstanceRepositoryAdapter:
         assert instances[0].service_name == "test-service"
         mock_kv_store.keys.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_dual_written_instances_are_read_once(
+        self,
+        repository_adapter: ServiceInstanceRepositoryAdapter,
+        mock_kv_store: Mock,
+        sample_instance: ServiceInstance,
+    ) -> None:
+        """Test instances written under both key layouts are only read from the dotted key."""
+        # Arrange
+        instance_data = sample_instance.model_dump(mode="json")
+        mock_kv_store.keys.return_value = [
+            "service-instances.test-service.test-123",
+            "service-instances__test-service__test-123",
+            "service-instances__test-service__test-456",
+        ]
+        mock_entry = Mock()
+        mock_entry.value = json.dumps(instance_data).encode()
+        mock_kv_store.get.return_value = mock_entry
+
+        # Act
+        all_instances = await repository_adapter.get_all_instances()
+        service_instances = await repository_adapter.get_instances_by_service("test-service")
+
+        # Assert
+        assert len(all_instances) == 2
+        assert len(service_instances) == 2
+        read_keys = [call.args[0] for call in mock_kv_store.get.call_args_list]
+        assert "service-instances__test-service__test-123" not in read_keys
+
     @pytest.mark.asyncio
     async def test_get_instances_by_service_not_found(
         self,
@@ -1,7 +1,19 @@
 """AegisSDK - Minimal IPC SDK based on pure NATS."""
 
-from .application.service import Service
-from .infrastructure.nats_adapter import NATSAdapter
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .application.service import Service
+    from .infrastructure.nats_adapter import NATSAdapter
+
+_EXPORTS = {
+    "Service": ".application.service",
+    "NATSAdapter": ".infrastructure.nats_adapter",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["NATSAdapter", "Service"]
 __version__ = "0.1.0"
@@ -0,0 +1,40 @@
+"""Lazy package exports (PEP 562).
+
+Package ``__init__`` modules list what they export and from which submodule;
+the submodule is imported the first time one of its names is accessed. A
+process that only needs ``aegis_sdk.domain.patterns`` then no longer pays for
+nats, msgpack and every pydantic model in the SDK.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's ``__getattr__`` and ``__dir__``.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name to the relative submodule defining it
+
+    Returns:
+        The module-level ``__getattr__`` and ``__dir__`` functions
+    """
+
+    def module_getattr(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Later lookups find the name directly and skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return module_getattr, module_dir
@@ -1,6 +1,19 @@
 """Application layer - Service orchestration and use cases."""
 
-from .service import Service
-from .single_active_service import SingleActiveService, exclusive_rpc
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .service import Service
+    from .single_active_service import SingleActiveService, exclusive_rpc
+
+_EXPORTS = {
+    "Service": ".service",
+    "SingleActiveService": ".single_active_service",
+    "exclusive_rpc": ".single_active_service",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["Service", "SingleActiveService", "exclusive_rpc"]
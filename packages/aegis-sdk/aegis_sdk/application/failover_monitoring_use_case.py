@@ -2,6 +2,8 @@
 
 This module provides a monitoring use case that integrates HeartbeatMonitor
 and ElectionCoordinator for automatic failover with sub-2-second recovery time.
+Instances hosting many groups can instead share one ElectionScheduler per
+instance, which renews a single lease for all of the groups it leads.
 """
 
 from __future__ import annotations
@@ -19,7 +21,8 @@ from ..domain.value_objects import (
     InstanceId,
     ServiceName,
 )
-from ..infrastructure.election_coordinator import ElectionCoordinator
+from ..infrastructure.election_coordinator import LEADER_TTL_SECONDS, ElectionCoordinator
+from ..infrastructure.election_scheduler import ElectionScheduler
 from ..infrastructure.heartbeat_monitor import HeartbeatMonitor
 from ..ports.kv_store import KVStorePort
 from ..ports.logger import LoggerPort
@@ -47,6 +50,7 @@ class FailoverMonitoringUseCase:
         logger: LoggerPort,
         failover_policy: FailoverPolicy | None = None,
         status_callback: Callable[[bool], None] | None = None,
+        shared_elections: bool = False,
     ):
         """Initialize the failover monitoring use case.
 
@@ -58,6 +62,9 @@ class FailoverMonitoringUseCase:
             logger: Logger port
             failover_policy: Failover behavior configuration
             status_callback: Optional callback for status changes (True=active, False=standby)
+            shared_elections: Run the groups of each instance through one
+                ElectionScheduler instead of a monitor and coordinator per
+                group. All instances of a service must use the same setting.
         """
         self._kv_store = kv_store
         self._service_registry = service_registry
@@ -66,12 +73,17 @@ class FailoverMonitoringUseCase:
         self._logger = logger
         self._failover_policy = failover_policy or FailoverPolicy.balanced()
         self._status_callback = status_callback
+        self._shared_elections = shared_elections
 
         # Component instances (created per service)
         self._monitors: dict[str, HeartbeatMonitor] = {}
         self._coordinators: dict[str, ElectionCoordinator] = {}
         self._monitoring_tasks: dict[str, asyncio.Task] = {}
 
+        # Shared schedulers (one per service instance) and the groups they run
+        self._schedulers: dict[str, ElectionScheduler] = {}
+        self._scheduled: set[str] = set()
+
     async def start_monitoring(
         self,
         service_name: str,
@@ -88,13 +100,43 @@ class FailoverMonitoringUseCase:
         key = f"{service_name}/{instance_id}/{group_id}"
 
         # Cancel existing monitoring if any
-        if key in self._monitoring_tasks:
+        if key in self._monitoring_tasks or key in self._scheduled:
             await self.stop_monitoring(service_name, instance_id, group_id)
 
         # Create value objects
         service_name_vo = ServiceName(value=service_name)
         instance_id_vo = InstanceId(value=instance_id)
 
+        if self._shared_elections:
+            await self._schedule_group(service_name_vo, instance_id_vo, group_id)
+        else:
+            await self._monitor_group(service_name_vo, instance_id_vo, group_id)
+
+        self._logger.info(
+            "Started failover monitoring",
+            service=service_name,
+            instance=instance_id,
+            group=group_id,
+            failover_policy=self._failover_policy.mode,
+        )
+
+        # Track metrics
+        self._metrics.increment("failover.monitoring.started")
+
+    async def _monitor_group(
+        self, service_name_vo: ServiceName, instance_id_vo: InstanceId, group_id: str
+    ) -> None:
+        """Run a group's election with its own heartbeat monitor and coordinator.
+
+        Args:
+            service_name_vo: Name of the service
+            instance_id_vo: Instance identifier
+            group_id: Sticky active group identifier
+        """
+        service_name = service_name_vo.value
+        instance_id = str(instance_id_vo)
+        key = f"{service_name}/{instance_id}/{group_id}"
+
         # Create HeartbeatMonitor
         heartbeat_monitor = HeartbeatMonitor(
             kv_store=self._kv_store,
@@ -137,16 +179,38 @@ class FailoverMonitoringUseCase:
             election_coordinator, service_name, instance_id, group_id
         )
 
-        await self._logger.info(
-            "Started failover monitoring",
-            service=service_name,
-            instance=instance_id,
-            group=group_id,
-            failover_policy=self._failover_policy.mode,
-        )
+    async def _schedule_group(
+        self, service_name_vo: ServiceName, instance_id_vo: InstanceId, group_id: str
+    ) -> None:
+        """Add a group to the instance's shared election scheduler.
 
-        # Track metrics
-        self._metrics.increment("failover.monitoring.started")
+        Args:
+            service_name_vo: Name of the service
+            instance_id_vo: Instance identifier
+            group_id: Sticky active group identifier
+        """
+        service_name = service_name_vo.value
+        instance_id = str(instance_id_vo)
+        scheduler_key = f"{service_name}/{instance_id}"
+
+        scheduler = self._schedulers.get(scheduler_key)
+        if scheduler is None:
+            scheduler = ElectionScheduler(
+                kv_store=self._kv_store,
+                service_name=service_name_vo,
+                instance_id=instance_id_vo,
+                failover_policy=self._failover_policy,
+                logger=self._logger,
+            )
+            self._schedulers[scheduler_key] = scheduler
+            await scheduler.start()
+
+        scheduler.add_group(
+            group_id,
+            on_elected=lambda group: self._on_elected(service_name, instance_id, group),
+            on_lost=lambda group: self._on_lost(service_name, instance_id, group),
+        )
+        self._scheduled.add(f"{scheduler_key}/{group_id}")
 
     async def stop_monitoring(
         self,
@@ -163,6 +227,16 @@ class FailoverMonitoringUseCase:
         """
         key = f"{service_name}/{instance_id}/{group_id}"
 
+        # Remove the group from the shared scheduler, stopping it with the last group
+        if key in self._scheduled:
+            self._scheduled.discard(key)
+            scheduler_key = f"{service_name}/{instance_id}"
+            scheduler = self._schedulers[scheduler_key]
+            await scheduler.remove_group(group_id)
+            if not any(k.startswith(f"{scheduler_key}/") for k in self._scheduled):
+                await scheduler.stop()
+                del self._schedulers[scheduler_key]
+
         # Stop heartbeat monitor
         if key in self._monitors:
             monitor = self._monitors[key]
@@ -186,7 +260,7 @@ class FailoverMonitoringUseCase:
                 pass
             del self._monitoring_tasks[key]
 
-        await self._logger.info(
+        self._logger.info(
             "Stopped failover monitoring",
             service=service_name,
             instance=instance_id,
@@ -203,7 +277,7 @@ class FailoverMonitoringUseCase:
         and cancels all monitoring tasks.
         """
         # Get all keys to stop
-        keys_to_stop = list(self._monitoring_tasks.keys())
+        keys_to_stop = list(self._monitoring_tasks.keys()) + list(self._scheduled)
 
         # Stop each monitoring task
         for key in keys_to_stop:
@@ -213,7 +287,7 @@ class FailoverMonitoringUseCase:
                 service_name, instance_id, group_id = parts
                 await self.stop_monitoring(service_name, instance_id, group_id)
 
-        await self._logger.info("Stopped all monitoring tasks")
+        self._logger.info("Stopped all monitoring tasks")
 
     async def get_status(
         self,
@@ -233,6 +307,12 @@ class FailoverMonitoringUseCase:
         """
         key = f"{service_name}/{instance_id}/{group_id}"
 
+        if key in self._scheduled:
+            scheduler = self._schedulers[f"{service_name}/{instance_id}"]
+            if scheduler.is_leader(group_id):
+                return StickyActiveStatus.ACTIVE
+            return StickyActiveStatus.STANDBY
+
         # Check if coordinator exists
         coordinator = self._coordinators.get(key)
         if not coordinator:
@@ -266,7 +346,7 @@ class FailoverMonitoringUseCase:
 
         if not is_leader_present:
             # No leader exists - participate in election
-            await self._logger.info(
+            self._logger.info(
                 "No leader detected, initiating election",
                 service=service_name,
                 instance=instance_id,
@@ -277,14 +357,14 @@ class FailoverMonitoringUseCase:
             elected = await coordinator.start_election()
 
             if elected:
-                await self._logger.info(
+                self._logger.info(
                     "Won initial election",
                     service=service_name,
                     instance=instance_id,
                     group=group_id,
                 )
             else:
-                await self._logger.info(
+                self._logger.info(
                     "Lost initial election",
                     service=service_name,
                     instance=instance_id,
@@ -339,13 +419,30 @@ class FailoverMonitoringUseCase:
         self._metrics.increment("failover.election.won")
         self._metrics.gauge("failover.active_instances", 1)
 
-        await self._logger.info(
+        # Keep the leader key alive for as long as we hold it
+        key = f"{service_name}/{instance_id}/{group_id}"
+        coordinator = self._coordinators.get(key)
+        renewal = self._monitoring_tasks.get(key)
+        if coordinator and (renewal is None or renewal.done()):
+            self._monitoring_tasks[key] = asyncio.create_task(self._renew_leadership(coordinator))
+
+        self._logger.info(
             "Became active leader",
             service=service_name,
             instance=instance_id,
             group=group_id,
         )
 
+    async def _renew_leadership(self, coordinator: ElectionCoordinator) -> None:
+        """Renew the leader key several times per TTL while elected.
+
+        Args:
+            coordinator: Election coordinator holding the leader key
+        """
+        while coordinator.is_elected():
+            await asyncio.sleep(LEADER_TTL_SECONDS / 3)
+            await coordinator.renew_leadership()
+
     async def _on_lost(self, service_name: str, instance_id: str, group_id: str) -> None:
         """Handle loss of leadership.
 
@@ -395,7 +492,7 @@ class FailoverMonitoringUseCase:
         self._metrics.increment("failover.leadership.lost")
         self._metrics.gauge("failover.active_instances", 0)
 
-        await self._logger.info(
+        self._logger.info(
             "Lost leadership",
             service=service_name,
             instance=instance_id,
@@ -423,19 +520,19 @@ class FailoverMonitoringUseCase:
                 instance.last_heartbeat = datetime.now(UTC)
                 await self._service_registry.update_instance(instance)
 
-                await self._logger.debug(
+                self._logger.debug(
                     f"Updated instance status to {sticky_status}",
                     service=service_name,
                     instance=instance_id,
                 )
             else:
-                await self._logger.warning(
+                self._logger.warning(
                     "Instance not found in registry",
                     service=service_name,
                     instance=instance_id,
                 )
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Failed to update instance status: {e}",
                 service=service_name,
                 instance=instance_id,
@@ -490,7 +587,7 @@ class FailoverMonitoringUseCase:
 
         coordinator = self._coordinators.get(key)
         if not coordinator:
-            await self._logger.warning(
+            self._logger.warning(
                 "No coordinator found for manual election",
                 service=service_name,
                 instance=instance_id,
@@ -498,7 +595,7 @@ class FailoverMonitoringUseCase:
             )
             return False
 
-        await self._logger.info(
+        self._logger.info(
             "Manually triggering election",
             service=service_name,
             instance=instance_id,
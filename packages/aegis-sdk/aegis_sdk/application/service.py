@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -18,13 +19,21 @@ from aegis_sdk.domain.enums import (
     SubscriptionMode,
 )
 from aegis_sdk.domain.exceptions import ServiceUnavailableError
-from aegis_sdk.domain.models import Command, Event, RPCRequest, ServiceInfo, ServiceInstance
+from aegis_sdk.domain.models import (
+    Command,
+    Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
+    RPCRequest,
+    ServiceInfo,
+    ServiceInstance,
+)
 from aegis_sdk.domain.patterns import SubjectPatterns
 from aegis_sdk.domain.types import CommandHandler, EventHandler, RPCHandler
 
 if TYPE_CHECKING:
     from aegis_sdk.ports.logger import LoggerPort
-    from aegis_sdk.ports.message_bus import MessageBusPort
+    from aegis_sdk.ports.message_bus import CommandHandle, MessageBusPort
     from aegis_sdk.ports.service_discovery import SelectionStrategy, ServiceDiscoveryPort
     from aegis_sdk.ports.service_registry import ServiceRegistryPort
 
@@ -55,35 +64,66 @@ class HandlerRegistry:
     def __init__(self) -> None:
         """Initialize handler registry."""
         self._rpc_handlers: dict[str, RPCHandler] = {}
+        self._rpc_options: dict[str, RPCHandlerOptions] = {}
         self._event_handlers: dict[str, list[tuple[EventHandler, str]]] = {}
+        self._event_options: dict[str, EventSubscriptionOptions] = {}
         self._command_handlers: dict[str, CommandHandler] = {}
         self._lock = asyncio.Lock()
 
-    async def register_rpc(self, method: str, handler: RPCHandler) -> None:
+    async def register_rpc(
+        self, method: str, handler: RPCHandler, options: RPCHandlerOptions | None = None
+    ) -> None:
         """Register RPC handler."""
         if not SubjectPatterns.is_valid_method_name(method):
             raise ValueError(f"Invalid method name: {method}")
         async with self._lock:
-            self._rpc_handlers[method] = handler
+            self._set_rpc(method, handler, options)
+
+    def _set_rpc(self, method: str, handler: RPCHandler, options: RPCHandlerOptions | None) -> None:
+        """Store an RPC handler and its execution options."""
+        if options and options.offload and inspect.iscoroutinefunction(handler):
+            raise ValueError(f"Offloaded RPC handler for {method} must be a regular function")
+        self._rpc_handlers[method] = handler
+        if options:
+            self._rpc_options[method] = options
+        else:
+            self._rpc_options.pop(method, None)
 
     async def unregister_rpc(self, method: str) -> bool:
         """Unregister RPC handler."""
         async with self._lock:
             if method in self._rpc_handlers:
                 del self._rpc_handlers[method]
+                self._rpc_options.pop(method, None)
                 return True
             return False
 
     async def register_event(
-        self, pattern: str, handler: EventHandler, mode: SubscriptionMode
+        self,
+        pattern: str,
+        handler: EventHandler,
+        mode: SubscriptionMode,
+        options: EventSubscriptionOptions | None = None,
     ) -> None:
         """Register event handler."""
         if not SubjectPatterns.is_valid_event_pattern(pattern):
             raise ValueError(f"Invalid event pattern: {pattern}")
         async with self._lock:
-            if pattern not in self._event_handlers:
-                self._event_handlers[pattern] = []
-            self._event_handlers[pattern].append((handler, mode.value))
+            self._add_event(pattern, handler, mode, options)
+
+    def _add_event(
+        self,
+        pattern: str,
+        handler: EventHandler,
+        mode: SubscriptionMode,
+        options: EventSubscriptionOptions | None,
+    ) -> None:
+        """Store an event handler; delivery options apply to the whole pattern."""
+        if pattern not in self._event_handlers:
+            self._event_handlers[pattern] = []
+        self._event_handlers[pattern].append((handler, mode.value))
+        if options:
+            self._event_options[pattern] = options
 
     async def unregister_event(self, pattern: str, handler: EventHandler | None = None) -> bool:
         """Unregister event handler."""
@@ -93,6 +133,7 @@ class HandlerRegistry:
 
             if handler is None:
                 del self._event_handlers[pattern]
+                self._event_options.pop(pattern, None)
                 return True
             else:
                 handlers = self._event_handlers[pattern]
@@ -100,6 +141,7 @@ class HandlerRegistry:
                 self._event_handlers[pattern] = [(h, m) for h, m in handlers if h != handler]
                 if not self._event_handlers[pattern]:
                     del self._event_handlers[pattern]
+                    self._event_options.pop(pattern, None)
                 return len(self._event_handlers.get(pattern, [])) < original_count
 
     async def register_command(self, command_name: str, handler: CommandHandler) -> None:
@@ -120,11 +162,21 @@ class HandlerRegistry:
         """Get RPC handlers."""
         return self._rpc_handlers.copy()
 
+    @property
+    def rpc_options(self) -> dict[str, RPCHandlerOptions]:
+        """Get execution options of RPC handlers that have them."""
+        return self._rpc_options.copy()
+
     @property
     def event_handlers(self) -> dict[str, list[tuple[EventHandler, str]]]:
         """Get event handlers."""
         return self._event_handlers.copy()
 
+    @property
+    def event_options(self) -> dict[str, EventSubscriptionOptions]:
+        """Get delivery options of event patterns that have them."""
+        return self._event_options.copy()
+
     @property
     def command_handlers(self) -> dict[str, CommandHandler]:
         """Get command handlers."""
@@ -464,16 +516,32 @@ class Service:
         await self._bus.register_service(self.service_name, self.instance_id)
 
         # Register RPC handlers
+        rpc_options = self._handler_registry.rpc_options
         for method, handler in self._handler_registry.rpc_handlers.items():
-            await self._bus.register_rpc_handler(self.service_name, method, handler)
+            if method in rpc_options:
+                await self._bus.register_rpc_handler(
+                    self.service_name, method, handler, rpc_options[method]
+                )
+            else:
+                await self._bus.register_rpc_handler(self.service_name, method, handler)
 
         # Register event subscriptions
+        event_options = self._handler_registry.event_options
         for pattern, handler_tuples in self._handler_registry.event_handlers.items():
             for event_handler, mode in handler_tuples:
                 durable_name = (
                     f"{self.service_name}-{pattern.replace('*', 'star').replace('.', '-')}"
                 )
-                await self._bus.subscribe_event(pattern, event_handler, durable_name, mode=mode)
+                if pattern in event_options:
+                    await self._bus.subscribe_event(
+                        pattern,
+                        event_handler,
+                        durable_name,
+                        mode=mode,
+                        options=event_options[pattern],
+                    )
+                else:
+                    await self._bus.subscribe_event(pattern, event_handler, durable_name, mode=mode)
 
         # Register command handlers
         for command_name, cmd_handler in self._handler_registry.command_handlers.items():
@@ -550,14 +618,29 @@ class Service:
                 await self._status_update_task
 
     # RPC Methods
-    def rpc(self, method: str) -> Callable[[RPCHandler], RPCHandler]:
-        """Decorator to register RPC handler."""
+    def rpc(
+        self,
+        method: str,
+        max_concurrency: int | None = None,
+        offload: str | None = None,
+    ) -> Callable[[RPCHandler], RPCHandler]:
+        """Decorator to register RPC handler.
+
+        Args:
+            method: RPC method name
+            max_concurrency: Handle up to this many requests for the method
+                concurrently instead of one at a time
+            offload: Run a synchronous handler in a "thread" or "process" pool
+        """
+        options = None
+        if max_concurrency is not None or offload is not None:
+            options = RPCHandlerOptions(max_concurrency=max_concurrency, offload=offload)
 
         def decorator(handler: RPCHandler) -> RPCHandler:
             # Use synchronous registration for decorators (called at definition time)
             if not SubjectPatterns.is_valid_method_name(method):
                 raise ValueError(f"Invalid method name: {method}")
-            self._handler_registry._rpc_handlers[method] = handler
+            self._handler_registry._set_rpc(method, handler, options)
             return handler
 
         return decorator
@@ -566,6 +649,7 @@ class Service:
         """Unregister RPC handler."""
         if method in self._handler_registry._rpc_handlers:
             del self._handler_registry._rpc_handlers[method]
+            self._handler_registry._rpc_options.pop(method, None)
             return True
         return False
 
@@ -575,42 +659,64 @@ class Service:
         discovery_enabled: bool = True,
         selection_strategy: SelectionStrategy | None = None,
         preferred_instance_id: str | None = None,
+        route_to_instance: bool = False,
     ) -> Any:
-        """Call RPC method on another service."""
+        """Call RPC method on another service.
+
+        Args:
+            request: The RPC request to send
+            discovery_enabled: Whether to resolve the target through service discovery
+            selection_strategy: Strategy used to select an instance
+            preferred_instance_id: Preferred instance for sticky selection
+            route_to_instance: Send the request to the selected instance's own
+                subject instead of the service-wide queue group
+        """
         if request.source is None:
             request.source = self.instance_id
 
         target = request.target
-        if discovery_enabled and self._discovery and target:
-            if await self._resolver.is_service_name(target):
-                from aegis_sdk.ports.service_discovery import SelectionStrategy
-
-                strategy = selection_strategy or SelectionStrategy.ROUND_ROBIN
-                instance = await self._discovery.select_instance(
-                    target,
-                    strategy=strategy,
-                    preferred_instance_id=preferred_instance_id,
+        selected_instance_id: str | None = None
+        # Resolved once; the failure path below needs the same answer
+        targets_service = bool(
+            discovery_enabled
+            and self._discovery
+            and target
+            and await self._resolver.is_service_name(target)
+        )
+        if targets_service and self._discovery and target:
+            from aegis_sdk.ports.service_discovery import SelectionStrategy
+
+            strategy = selection_strategy or SelectionStrategy.ROUND_ROBIN
+            instance = await self._discovery.select_instance(
+                target,
+                strategy=strategy,
+                preferred_instance_id=preferred_instance_id,
+            )
+            if not instance:
+                raise ServiceUnavailableError(target)
+
+            if self._logger:
+                self._logger.debug(
+                    "Selected instance for RPC",
+                    service=target,
+                    instance=instance.instance_id,
+                    method=request.method,
                 )
-                if not instance:
-                    raise ServiceUnavailableError(target)
 
-                if self._logger:
-                    self._logger.debug(
-                        "Selected instance for RPC",
-                        service=target,
-                        instance=instance.instance_id,
-                        method=request.method,
-                    )
+            if route_to_instance:
+                selected_instance_id = instance.instance_id
 
         try:
-            response = await self._bus.call_rpc(request)
+            if selected_instance_id:
+                response = await self._bus.call_rpc(request, instance_id=selected_instance_id)
+            else:
+                response = await self._bus.call_rpc(request)
             if not response.success:
                 raise Exception(f"RPC failed: {response.error}")
             return response.result
         except Exception:
-            if discovery_enabled and self._discovery and target:
-                if await self._resolver.is_service_name(target):
-                    await self._discovery.invalidate_cache(target)
+            if targets_service and self._discovery and target:
+                await self._discovery.invalidate_cache(target)
             raise
 
     def create_rpc_request(
@@ -631,9 +737,18 @@ class Service:
 
     # Event Methods
     def subscribe(
-        self, pattern: str, mode: SubscriptionMode | str = SubscriptionMode.COMPETE
+        self,
+        pattern: str,
+        mode: SubscriptionMode | str = SubscriptionMode.COMPETE,
+        options: EventSubscriptionOptions | None = None,
     ) -> Callable[[EventHandler], EventHandler]:
-        """Decorator to subscribe to events."""
+        """Decorator to subscribe to events.
+
+        Args:
+            pattern: Event pattern to subscribe to
+            mode: Compete (load balanced) or broadcast (every instance)
+            options: Delivery options for the pattern, e.g. batched pull fetching
+        """
         if isinstance(mode, str):
             mode = SubscriptionMode(mode)
 
@@ -642,9 +757,7 @@ class Service:
 
         def decorator(handler: EventHandler) -> EventHandler:
             # Use synchronous registration for decorators
-            if pattern not in self._handler_registry._event_handlers:
-                self._handler_registry._event_handlers[pattern] = []
-            self._handler_registry._event_handlers[pattern].append((handler, mode.value))
+            self._handler_registry._add_event(pattern, handler, mode, options)
             return handler
 
         return decorator
@@ -656,6 +769,7 @@ class Service:
 
         if handler is None:
             del self._handler_registry._event_handlers[pattern]
+            self._handler_registry._event_options.pop(pattern, None)
             return True
         else:
             handlers = self._handler_registry._event_handlers[pattern]
@@ -665,6 +779,7 @@ class Service:
             ]
             if not self._handler_registry._event_handlers[pattern]:
                 del self._handler_registry._event_handlers[pattern]
+                self._handler_registry._event_options.pop(pattern, None)
             return len(self._handler_registry._event_handlers.get(pattern, [])) < original_count
 
     async def publish_event(self, event: Event) -> None:
@@ -677,6 +792,21 @@ class Service:
             event.source = self.instance_id
         await self._bus.publish_event(event)
 
+    async def publish_events_batch(self, events: Sequence[Event]) -> dict[str, str]:
+        """Publish domain events without waiting for each one in turn.
+
+        Returns:
+            Error messages keyed by message id of events that were not published
+        """
+        if not self.is_operational():
+            raise RuntimeError(
+                f"Cannot publish events while service is in {self._lifecycle.state.value} state"
+            )
+        for event in events:
+            if event.source is None:
+                event.source = self.instance_id
+        return await self._bus.publish_events_batch(events)
+
     def create_event(
         self, domain: str, event_type: str, payload: dict[str, Any] | None = None
     ) -> Event:
@@ -712,6 +842,16 @@ class Service:
             command.source = self.instance_id
         return await self._bus.send_command(command, track_progress)
 
+    async def start_command(self, command: Command) -> CommandHandle:
+        """Send command to another service and return a handle to track it.
+
+        The handle can be iterated for progress updates, awaited for the final
+        result and used to cancel the command.
+        """
+        if command.source is None:
+            command.source = self.instance_id
+        return await self._bus.start_command(command)
+
     def create_command(
         self,
         service: str,
@@ -820,9 +960,11 @@ class Service:
         pass
 
     # Helper methods for backward compatibility
-    async def register_rpc_method(self, method: str, handler: RPCHandler) -> None:
+    async def register_rpc_method(
+        self, method: str, handler: RPCHandler, options: RPCHandlerOptions | None = None
+    ) -> None:
         """Register an RPC method handler."""
-        await self._handler_registry.register_rpc(method, handler)
+        await self._handler_registry.register_rpc(method, handler, options)
 
     async def register_command_handler(self, command_name: str, handler: CommandHandler) -> None:
         """Register a command handler."""
@@ -834,12 +976,13 @@ class Service:
         event_type: str,
         handler: EventHandler,
         mode: SubscriptionMode | str = SubscriptionMode.COMPETE,
+        options: EventSubscriptionOptions | None = None,
     ) -> None:
         """Subscribe to an event pattern."""
         if isinstance(mode, str):
             mode = SubscriptionMode(mode)
         pattern = SubjectPatterns.event(domain, event_type)
-        await self._handler_registry.register_event(pattern, handler, mode)
+        await self._handler_registry.register_event(pattern, handler, mode, options)
 
     async def _is_service_name(self, target: str) -> bool:
         """Check if target is a service name (backward compatibility)."""
@@ -13,7 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 class SingleActiveConfig(BaseModel):
     """Configuration DTO for SingleActiveService with strict validation."""
 
-    model_config = ConfigDict(strict=True, validate_assignment=True)
+    model_config = ConfigDict(strict=True, validate_assignment=True, defer_build=True)
 
     # Service configuration
     service_name: str = Field(
@@ -65,6 +65,22 @@ class SingleActiveConfig(BaseModel):
         description="TTL for leader key in seconds",
     )
 
+    # Exclusive RPC routing
+    forward_to_leader: bool = Field(
+        default=True,
+        description="Whether standbys forward exclusive calls to the current leader",
+    )
+    max_forward_hops: int = Field(
+        default=1,
+        ge=0,
+        le=5,
+        description="How many times an exclusive call may be forwarded",
+    )
+    active_only_queue: bool = Field(
+        default=False,
+        description="Whether only the active instance joins the queue group for exclusive methods",
+    )
+
     @field_validator("service_name")
     @classmethod
     def validate_service_name(cls, v: str) -> str:
@@ -119,7 +135,7 @@ class SingleActiveConfig(BaseModel):
 class ExclusiveRPCResponse(BaseModel):
     """Response model for exclusive RPC calls."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, defer_build=True)
 
     success: bool = Field(..., description="Whether the RPC was successful")
     error: str | None = Field(default=None, description="Error code if failed")
@@ -130,7 +146,7 @@ class ExclusiveRPCResponse(BaseModel):
 class SingleActiveStatus(BaseModel):
     """Status information for a single active service instance."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, defer_build=True)
 
     service_name: str = Field(..., description="Name of the service")
     instance_id: str = Field(..., description="Instance identifier")
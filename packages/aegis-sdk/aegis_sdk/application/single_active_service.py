@@ -1,8 +1,9 @@
 """Single active service implementation for exclusive RPC execution.
 
 This service provides leader election to ensure only one instance
-processes exclusive RPC methods at a time. Sticky behavior is achieved
-through client-side retry configuration, not a separate service class.
+processes exclusive RPC methods at a time. Standbys forward exclusive calls
+to the leader they last saw on the leadership watch; client-side retry
+configuration covers the window in which no leader is known.
 Follows hexagonal architecture with dependency injection.
 """
 
@@ -14,6 +15,7 @@ from collections.abc import Callable
 from functools import wraps
 from typing import TYPE_CHECKING, Any, cast
 
+from ..domain.models import RPCHandlerOptions, RPCRequest
 from ..domain.value_objects import ServiceName
 from ..ports.election_repository import ElectionRepository
 from ..ports.factory_ports import ElectionRepositoryFactory, UseCaseFactory
@@ -36,13 +38,17 @@ from .sticky_active_use_cases import (
 if TYPE_CHECKING:
     pass
 
+# Request parameter counting how often an exclusive call has been forwarded
+FORWARD_HOPS_PARAM = "_forward_hops"
+
 
 class SingleActiveService(Service):
     """Service with single active instance support for exclusive processing.
 
     Only one instance (leader) can execute exclusive RPC methods at a time.
-    Sticky behavior is achieved when clients configure retry policies for
-    NOT_ACTIVE errors, not through a separate service type.
+    Standbys forward exclusive calls to the leader, and answer NOT_ACTIVE
+    only when no leader is known or the hop limit is reached, so clients
+    retrying NOT_ACTIVE errors rarely have to.
     Follows hexagonal architecture with proper dependency injection.
     """
 
@@ -107,6 +113,12 @@ class SingleActiveService(Service):
 
         # Election state
         self._monitoring_task: asyncio.Task | None = None
+        self._leader_id: str | None = None
+
+        # Queue group membership of exclusive methods in active-only mode
+        self._queue_joined = False
+        self._queue_lock = asyncio.Lock()
+        self._membership_tasks: set[asyncio.Task] = set()
 
         # RPC handlers registry (for exclusive RPC)
         self._rpc_handlers: dict[str, Callable] = {}
@@ -118,6 +130,23 @@ class SingleActiveService(Service):
             is_active: True if this instance is the active leader
         """
         self.is_active = is_active
+        if is_active:
+            self._leader_id = self.instance_id
+        elif self._leader_id == self.instance_id:
+            # Demoted; forward to whichever leader the monitor reports next
+            self._leader_id = None
+        if self._config.active_only_queue:
+            task = asyncio.create_task(self._sync_queue_membership())
+            self._membership_tasks.add(task)
+            task.add_done_callback(self._membership_tasks.discard)
+
+    def _update_leader(self, leader_id: str | None) -> None:
+        """Callback for leader changes seen by the monitoring use case.
+
+        Args:
+            leader_id: Current leader instance, or None if there is none
+        """
+        self._leader_id = leader_id
 
     async def start(self) -> None:
         """Start service and sticky active election process."""
@@ -172,6 +201,7 @@ class SingleActiveService(Service):
             logger=self._logger,
             status_callback=self._update_active_status,
         )
+        self._monitoring_use_case.set_leader_callback(self._update_leader)
 
         # Call parent start to register handlers
         await super().start()
@@ -191,6 +221,9 @@ class SingleActiveService(Service):
             try:
                 response = await self._registration_use_case.execute(request)
                 self.is_active = response.is_leader
+                if response.is_leader:
+                    self._leader_id = self.instance_id
+                await self._sync_queue_membership()
 
                 if self._logger:
                     self._logger.info(
@@ -227,6 +260,9 @@ class SingleActiveService(Service):
                 self._config.group_id,
             )
 
+        # Stop taking load-balanced exclusive calls before giving up leadership
+        await self._sync_queue_membership(joined=False)
+
         # Release leadership if we are the leader
         if self.is_active and self._election_repository:
             try:
@@ -270,11 +306,15 @@ class SingleActiveService(Service):
                 leader_ttl_seconds=self._config.leader_ttl_seconds,
             )
 
-            success = await self._heartbeat_use_case.execute(request)
+            # Hand over our own entry so the registry is not read back each tick
+            success = await self._heartbeat_use_case.execute(request, self._service_instance)
 
             # Update our active status based on heartbeat result
             if not success and self.is_active:
                 self.is_active = False
+                if self._leader_id == self.instance_id:
+                    self._leader_id = None
+                await self._sync_queue_membership()
                 if self._logger:
                     self._logger.warning(
                         "Lost leadership during heartbeat",
@@ -283,17 +323,127 @@ class SingleActiveService(Service):
                         group_id=self._config.group_id,
                     )
 
+    async def _register_with_infrastructure(self) -> None:
+        """Register handlers, keeping exclusive methods out of the queue group.
+
+        In active-only mode exclusive methods are only served on this
+        instance's own subject until it wins the election.
+        """
+        if self._config.active_only_queue:
+            registry = self._handler_registry
+            for method in self._exclusive_methods():
+                options = registry._rpc_options.get(method, RPCHandlerOptions())
+                registry._rpc_options[method] = options.model_copy(
+                    update={"join_queue_group": False}
+                )
+
+        await super()._register_with_infrastructure()
+
+    def _exclusive_methods(self) -> list[str]:
+        """Get registered RPC methods wrapped by an exclusive_rpc decorator."""
+        return [
+            method
+            for method, handler in self._handler_registry.rpc_handlers.items()
+            if getattr(handler, "_exclusive", False) is True
+        ]
+
+    async def _sync_queue_membership(self, joined: bool | None = None) -> None:
+        """Join or leave the queue group of exclusive methods to match our status.
+
+        Only applies in active-only mode. Leaving drains the subscriptions, so
+        calls already delivered are still answered.
+
+        Args:
+            joined: Desired membership; follows the active status if omitted
+        """
+        if not self._config.active_only_queue:
+            return
+
+        async with self._queue_lock:
+            target = self.is_active if joined is None else joined
+            if target == self._queue_joined:
+                return
+
+            for method in self._exclusive_methods():
+                try:
+                    if target:
+                        await self._bus.join_rpc_queue_group(self.service_name, method)
+                    else:
+                        await self._bus.leave_rpc_queue_group(self.service_name, method)
+                except Exception as e:
+                    if self._logger:
+                        self._logger.warning(
+                            f"Failed to update queue group membership for {method}: {e}"
+                        )
+            self._queue_joined = target
+
+            if self._logger:
+                self._logger.info(
+                    "Joined exclusive queue group" if target else "Left exclusive queue group",
+                    service=self.service_name,
+                    instance=self.instance_id,
+                    group_id=self._config.group_id,
+                )
+
+    async def _forward_to_leader(self, method: str, params: dict, hops: int) -> dict | None:
+        """Forward an exclusive call to the current leader's own subject.
+
+        Args:
+            method: Exclusive RPC method name
+            params: Request parameters, without the hop count
+            hops: How often the call has been forwarded already
+
+        Returns:
+            The leader's response, or None if the call cannot be forwarded
+        """
+        leader_id = self._leader_id
+        if (
+            not self._config.forward_to_leader
+            or not leader_id
+            or leader_id == self.instance_id
+            or hops >= self._config.max_forward_hops
+        ):
+            return None
+
+        request = RPCRequest(
+            method=method,
+            params={**params, FORWARD_HOPS_PARAM: hops + 1},
+            source=self.instance_id,
+            target=self.service_name,
+        )
+        try:
+            response = await self._bus.call_rpc(request, instance_id=leader_id)
+        except Exception as e:
+            if self._logger:
+                self._logger.warning(f"Failed to forward {method} to leader {leader_id}: {e}")
+            response = None
+
+        if response is None or not response.success or not isinstance(response.result, dict):
+            if self._metrics:
+                self._metrics.increment("sticky_active.rpc.forward_failed")
+            return None
+
+        if self._metrics:
+            self._metrics.increment("sticky_active.rpc.forwarded")
+        return response.result
+
     def exclusive_rpc(self, method: str) -> Callable:
         """Instance method decorator for exclusive RPC handlers.
 
-        This ensures only the active leader instance processes the RPC call.
-        Returns standardized ExclusiveRPCResponse.
+        This ensures only the active leader instance processes the RPC call;
+        standbys forward it to the leader when one is known. Returns
+        standardized ExclusiveRPCResponse.
         """
 
         def decorator(handler: Callable) -> Callable:
             @wraps(handler)
             async def wrapper(params: dict) -> dict:
+                hops = params.pop(FORWARD_HOPS_PARAM, 0)
                 if not self.is_active:
+                    forwarded = await self._forward_to_leader(method, params, hops)
+                    if isinstance(forwarded, dict):
+                        return forwarded
+
                     if self._metrics:
                         self._metrics.increment("sticky_active.rpc.not_active")
 
@@ -328,6 +478,7 @@ class SingleActiveService(Service):
                     return response.model_dump()
 
             # Register with parent class
+            cast(Any, wrapper)._exclusive = True
             self._rpc_handlers[method] = wrapper
             return wrapper
 
@@ -382,9 +533,16 @@ def exclusive_rpc(method: str | Callable[..., Any] | None = None) -> Callable[..
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        method_name = method if isinstance(method, str) else func.__name__
+
         @wraps(func)
         async def wrapper(self: SingleActiveService, params: dict) -> dict:
+            hops = params.pop(FORWARD_HOPS_PARAM, 0)
             if isinstance(self, SingleActiveService) and not self.is_active:
+                forwarded = await self._forward_to_leader(method_name, params, hops)
+                if isinstance(forwarded, dict):
+                    return forwarded
+
                 if hasattr(self, "_metrics") and self._metrics:
                     self._metrics.increment("sticky_active.rpc.not_active")
 
@@ -30,7 +30,7 @@ from ..ports.service_registry import ServiceRegistryPort
 class StickyActiveRegistrationRequest(BaseModel):
     """Request model for sticky active service registration with strict validation."""
 
-    model_config = ConfigDict(strict=True, validate_assignment=True)
+    model_config = ConfigDict(strict=True, validate_assignment=True, defer_build=True)
 
     service_name: str = Field(
         ...,
@@ -89,7 +89,7 @@ class StickyActiveRegistrationRequest(BaseModel):
 class StickyActiveRegistrationResponse(BaseModel):
     """Response model for sticky active service registration with strict validation."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, defer_build=True)
 
     service_name: str = Field(..., description="Name of the service")
     instance_id: str = Field(..., description="Instance identifier")
@@ -280,7 +280,7 @@ class StickyActiveRegistrationUseCase:
 class StickyActiveHeartbeatRequest(BaseModel):
     """Request model for sticky active heartbeat with strict validation."""
 
-    model_config = ConfigDict(strict=True, validate_assignment=True)
+    model_config = ConfigDict(strict=True, validate_assignment=True, defer_build=True)
 
     service_name: str = Field(
         ...,
@@ -334,11 +334,22 @@ class StickyActiveHeartbeatUseCase:
         self._metrics = metrics
         self._logger = logger
 
-    async def execute(self, request: StickyActiveHeartbeatRequest) -> bool:
+    async def execute(
+        self,
+        request: StickyActiveHeartbeatRequest,
+        instance: ServiceInstance | None = None,
+    ) -> bool:
         """Update heartbeat for both service instance and leader key.
 
+        A leader refreshes its key with a single revision-checked update, whose
+        outcome also decides the registry status, so the leader key is not read
+        back. The registry entry and the election state are then written
+        concurrently.
+
         Args:
             request: Heartbeat request with validated parameters
+            instance: The caller's own registry entry. When given, the registry
+                is written without being read first.
 
         Returns:
             True if heartbeat was successful, False otherwise
@@ -386,48 +397,58 @@ class StickyActiveHeartbeatUseCase:
                 election.step_down("Failed to update heartbeat")
                 self._metrics.increment("sticky_active.leader.lost")
 
-        # Get current leader for status update
-        leader_id, _ = await self._election_repo.get_current_leader(service_name, request.group_id)
+        status = "ACTIVE" if election.is_leader else "STANDBY"
 
-        # Update service instance
-        try:
-            # Get current instance from registry with proper error handling
-            current_instance = await self._service_registry.get_instance(
-                request.service_name, request.instance_id
-            )
+        # Always save election state, even if the registry update fails
+        registered, _ = await asyncio.gather(
+            self._write_registry_entry(request, instance, status),
+            self._save_election_state(election),
+        )
 
-            if current_instance:
-                # Update sticky active status based on current state
-                if election.is_leader and leader_id == instance_id:
-                    current_instance.sticky_active_status = "ACTIVE"
-                else:
-                    current_instance.sticky_active_status = "STANDBY"
+        if registered:
+            self._metrics.increment("sticky_active.heartbeat.success")
+        return registered
 
-                # Update heartbeat
-                await self._service_registry.update_heartbeat(current_instance, request.ttl_seconds)
+    async def _write_registry_entry(
+        self,
+        request: StickyActiveHeartbeatRequest,
+        instance: ServiceInstance | None,
+        status: str,
+    ) -> bool:
+        """Write the instance's registry entry with its sticky active status."""
+        try:
+            if instance is None:
+                instance = await self._service_registry.get_instance(
+                    request.service_name, request.instance_id
+                )
+                if not instance:
+                    if self._logger:
+                        self._logger.error(
+                            "Service instance not found in registry: "
+                            f"{request.service_name}/{request.instance_id}"
+                        )
+                    return False
 
-                self._metrics.increment("sticky_active.heartbeat.success")
-                return True
-            else:
-                if self._logger:
-                    self._logger.error(
-                        f"Service instance not found in registry: {service_name}/{instance_id}"
-                    )
-                return False
+            instance.sticky_active_status = status
+            instance.update_heartbeat()
+
+            # A full put refreshes the entry; no read-before-write is needed
+            await self._service_registry.register(instance, request.ttl_seconds)
+            return True
 
         except Exception as e:
             if self._logger:
                 self._logger.exception(f"Failed to update heartbeat: {e}")
             self._metrics.increment("sticky_active.heartbeat.error")
             return False
-        finally:
-            # Always save election state, even on error
-            try:
-                await self._election_repo.save_election_state(election)
-            except Exception as save_error:
-                if self._logger:
-                    self._logger.error(f"Failed to save election state: {save_error}")
-                # Don't fail the heartbeat if save fails
+
+    async def _save_election_state(self, election: StickyActiveElection) -> None:
+        """Persist election state without failing the heartbeat."""
+        try:
+            await self._election_repo.save_election_state(election)
+        except Exception as save_error:
+            if self._logger:
+                self._logger.error(f"Failed to save election state: {save_error}")
 
 
 class StickyActiveMonitoringUseCase:
@@ -462,8 +483,18 @@ class StickyActiveMonitoringUseCase:
         self._metrics = metrics
         self._logger = logger
         self._status_callback = status_callback
+        self._leader_callback: Callable[[str | None], None] | None = None
         self._monitoring_tasks: dict[str, asyncio.Task] = {}
 
+    def set_leader_callback(self, callback: Callable[[str | None], None]) -> None:
+        """Set callback to invoke with the leader ID whenever it changes.
+
+        Args:
+            callback: Function called with the new leader ID, or None when
+                the group has no leader
+        """
+        self._leader_callback = callback
+
     async def start_monitoring(
         self,
         service_name: str,
@@ -521,6 +552,8 @@ class StickyActiveMonitoringUseCase:
                     self._logger.info(
                         f"Leadership event: {event['type']} for {service_name}/{group_id}"
                     )
+                if self._leader_callback:
+                    self._leader_callback(event.get("leader_id"))
 
                 # Load election state
                 election = await self._election_repo.get_election_state(
@@ -635,6 +668,8 @@ class StickyActiveMonitoringUseCase:
             # Notify status change via callback
             if self._status_callback:
                 self._status_callback(True)
+            if self._leader_callback:
+                self._leader_callback(str(instance_id))
 
             # Publish event
             await self._publish_leader_elected_event(service_name, instance_id, group_id, election)
@@ -11,6 +11,9 @@ This module will be removed in a future version.
 from __future__ import annotations
 
 import warnings
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 
 warnings.warn(
     "aegis_sdk.developer is deprecated. Please use aegis-sdk-dev package instead.",
@@ -18,19 +21,30 @@ warnings.warn(
     stacklevel=2,
 )
 
-from aegis_sdk.developer.config_helper import (
-    K8sNATSConfig,
-    SDKConfig,
-    create_external_client,
-    create_service,
-    discover_k8s_config,
-    quick_setup,
-)
-from aegis_sdk.developer.environment import (
-    Environment,
-    detect_environment,
-    is_kubernetes_available,
-)
+if TYPE_CHECKING:
+    from .config_helper import (
+        K8sNATSConfig,
+        SDKConfig,
+        create_external_client,
+        create_service,
+        discover_k8s_config,
+        quick_setup,
+    )
+    from .environment import Environment, detect_environment, is_kubernetes_available
+
+_EXPORTS = {
+    "K8sNATSConfig": ".config_helper",
+    "SDKConfig": ".config_helper",
+    "create_external_client": ".config_helper",
+    "create_service": ".config_helper",
+    "discover_k8s_config": ".config_helper",
+    "quick_setup": ".config_helper",
+    "Environment": ".environment",
+    "detect_environment": ".environment",
+    "is_kubernetes_available": ".environment",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Environment",
@@ -1,38 +1,92 @@
 """Domain layer - Core business logic and entities."""
 
-from .enums import CommandPriority, ServiceStatus, StickyActiveStatus, SubscriptionMode
-from .exceptions import (
-    AegisError,
-    CommandError,
-    ConnectionError,
-    EventError,
-    KVKeyAlreadyExistsError,
-    KVKeyNotFoundError,
-    KVNotConnectedError,
-    KVRevisionMismatchError,
-    KVStoreError,
-    KVTTLNotSupportedError,
-    MessageBusError,
-    RPCError,
-    SerializationError,
-    ServiceError,
-    TimeoutError,
-    ValidationError,
-)
-from .models import (
-    Command,
-    Event,
-    KVEntry,
-    KVOptions,
-    KVWatchEvent,
-    Message,
-    RPCRequest,
-    RPCResponse,
-    ServiceInfo,
-    ServiceInstance,
-)
-from .patterns import SubjectPatterns
-from .types import CommandHandler, EventHandler, ProgressCallback, RPCHandler
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .enums import CommandPriority, ServiceStatus, StickyActiveStatus, SubscriptionMode
+    from .exceptions import (
+        AegisError,
+        CommandCancelledError,
+        CommandError,
+        ConnectionError,
+        EventError,
+        KVKeyAlreadyExistsError,
+        KVKeyNotFoundError,
+        KVNotConnectedError,
+        KVRevisionMismatchError,
+        KVStoreError,
+        KVTTLNotSupportedError,
+        MessageBusError,
+        RPCError,
+        SerializationError,
+        ServiceError,
+        TimeoutError,
+        ValidationError,
+    )
+    from .models import (
+        Command,
+        Event,
+        EventSubscriptionOptions,
+        KVBatchResult,
+        KVEntry,
+        KVOptions,
+        KVWatchEvent,
+        Message,
+        RPCHandlerOptions,
+        RPCRequest,
+        RPCResponse,
+        ServiceInfo,
+        ServiceInstance,
+    )
+    from .patterns import SubjectPatterns
+    from .types import CancellationToken, CommandHandler, EventHandler, ProgressCallback, RPCHandler
+
+_EXPORTS = {
+    "CommandPriority": ".enums",
+    "ServiceStatus": ".enums",
+    "StickyActiveStatus": ".enums",
+    "SubscriptionMode": ".enums",
+    "AegisError": ".exceptions",
+    "CommandCancelledError": ".exceptions",
+    "CommandError": ".exceptions",
+    "ConnectionError": ".exceptions",
+    "EventError": ".exceptions",
+    "KVKeyAlreadyExistsError": ".exceptions",
+    "KVKeyNotFoundError": ".exceptions",
+    "KVNotConnectedError": ".exceptions",
+    "KVRevisionMismatchError": ".exceptions",
+    "KVStoreError": ".exceptions",
+    "KVTTLNotSupportedError": ".exceptions",
+    "MessageBusError": ".exceptions",
+    "RPCError": ".exceptions",
+    "SerializationError": ".exceptions",
+    "ServiceError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "Command": ".models",
+    "Event": ".models",
+    "EventSubscriptionOptions": ".models",
+    "KVBatchResult": ".models",
+    "KVEntry": ".models",
+    "KVOptions": ".models",
+    "KVWatchEvent": ".models",
+    "Message": ".models",
+    "RPCHandlerOptions": ".models",
+    "RPCRequest": ".models",
+    "RPCResponse": ".models",
+    "ServiceInfo": ".models",
+    "ServiceInstance": ".models",
+    "SubjectPatterns": ".patterns",
+    "CancellationToken": ".types",
+    "CommandHandler": ".types",
+    "EventHandler": ".types",
+    "ProgressCallback": ".types",
+    "RPCHandler": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Enums
@@ -42,11 +96,15 @@ __all__ = [
     "SubscriptionMode",
     # Exceptions
     "AegisError",
+    "CancellationToken",
     "Command",
+    "CommandCancelledError",
     "CommandError",
     "ConnectionError",
     "Event",
     "EventError",
+    "EventSubscriptionOptions",
+    "KVBatchResult",
     "KVEntry",
     "KVKeyAlreadyExistsError",
     "KVKeyNotFoundError",
@@ -60,6 +118,7 @@ __all__ = [
     "Message",
     "MessageBusError",
     "RPCError",
+    "RPCHandlerOptions",
     "RPCRequest",
     "RPCResponse",
     "SerializationError",
@@ -29,7 +29,7 @@ class ServiceStatus(str, Enum):
 class ServiceLifecycleEvent(BaseModel):
     """Domain event for service lifecycle changes."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     service_name: ServiceName
     instance_id: InstanceId
@@ -48,6 +48,7 @@ class ServiceAggregate(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,  # Allow value objects
         validate_assignment=True,
+        defer_build=True,
     )
 
     # Identity
@@ -231,7 +232,7 @@ class StickyActiveElectionState(str, Enum):
 class StickyActiveElectionEvent(BaseModel):
     """Domain event for sticky active election changes."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     service_name: ServiceName
     instance_id: InstanceId
@@ -251,6 +252,7 @@ class StickyActiveElection(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         validate_assignment=True,
+        defer_build=True,
     )
 
     # Identity
@@ -22,6 +22,7 @@ class DomainEvent(BaseModel):
         str_strip_whitespace=True,
         strict=True,
         validate_assignment=True,
+        defer_build=True,
     )
 
     event_id: str = Field(
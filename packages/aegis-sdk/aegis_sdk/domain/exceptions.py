@@ -90,6 +90,14 @@ class CommandError(AegisError):
             self.details["command_id"] = command_id
 
 
+class CommandCancelledError(CommandError):
+    """Raised by a command handler that stopped because the sender cancelled it."""
+
+    def __init__(self, command_id: str | None = None, reason: str | None = None):
+        super().__init__(reason or "Command cancelled", command_id)
+        self.reason = reason
+
+
 class EventError(AegisError):
     """Event processing errors."""
 
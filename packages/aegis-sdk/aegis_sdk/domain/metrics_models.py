@@ -1,12 +1,16 @@
 """Domain models for metrics data following DDD principles."""
 
+import math
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
 class MetricsSummaryData(BaseModel):
     """Summary statistics for a metric - Value Object."""
 
-    model_config = ConfigDict(extra="forbid", strict=True, validate_assignment=True, frozen=True)
+    model_config = ConfigDict(
+        extra="forbid", strict=True, validate_assignment=True, frozen=True, defer_build=True
+    )
 
     count: int = Field(default=0, ge=0, description="Number of values recorded")
     average: float = Field(default=0.0, description="Average value")
@@ -20,7 +24,9 @@ class MetricsSummaryData(BaseModel):
 class MetricsSnapshot(BaseModel):
     """Complete metrics snapshot - Entity representing system metrics at a point in time."""
 
-    model_config = ConfigDict(extra="forbid", strict=True, validate_assignment=True)
+    model_config = ConfigDict(
+        extra="forbid", strict=True, validate_assignment=True, defer_build=True
+    )
 
     uptime_seconds: float = Field(ge=0, description="Service uptime in seconds")
     counters: dict[str, int] = Field(default_factory=dict, description="Counter metrics")
@@ -28,3 +34,121 @@ class MetricsSnapshot(BaseModel):
     summaries: dict[str, MetricsSummaryData] = Field(
         default_factory=dict, description="Summary statistics"
     )
+
+
+class StreamingHistogram:
+    """Fixed-size log-bucketed histogram for streaming percentile estimates.
+
+    Values are mapped to logarithmically spaced buckets (DDSketch-style) so that
+    any reported percentile is within ``relative_accuracy`` of the true value.
+    Recording is O(1) and memory is bounded by ``max_buckets``: when the limit is
+    reached the lowest buckets are collapsed together, which only affects the
+    accuracy of the smallest values and leaves tail percentiles untouched.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+        min_indexable: float = 1e-9,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            relative_accuracy: Maximum relative error of percentile estimates (0-1)
+            max_buckets: Upper bound on the number of buckets kept per sign
+            min_indexable: Absolute values below this are counted as zero
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 2:
+            raise ValueError("max_buckets must be at least 2")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._min_indexable = min_indexable
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def _add_to(self, store: dict[int, int], index: int, count: int = 1) -> None:
+        store[index] = store.get(index, 0) + count
+        if len(store) > self.max_buckets:
+            # Collapse the two lowest buckets to keep memory bounded
+            collapsed = store.pop(min(store))
+            store[min(store)] += collapsed
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        self.count += 1
+        if value > self._min_indexable:
+            self._add_to(self._positive, self._index(value))
+        elif value < -self._min_indexable:
+            self._add_to(self._negative, self._index(-value))
+        else:
+            self._zero_count += 1
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Add all values recorded by another histogram with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        for index, bucket_count in other._positive.items():
+            self._add_to(self._positive, index, bucket_count)
+        for index, bucket_count in other._negative.items():
+            self._add_to(self._negative, index, bucket_count)
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0-1)."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: list[float]) -> list[float]:
+        """Estimate several quantiles in a single pass over the buckets.
+
+        Uses the same rank convention as a sorted list indexed by ``int(q * count)``.
+        """
+        if self.count == 0:
+            return [0.0 for _ in qs]
+
+        ranks = sorted(
+            (min(int(q * self.count), self.count - 1), position) for position, q in enumerate(qs)
+        )
+        results = [0.0] * len(qs)
+        pending = iter(ranks)
+        rank, position = next(pending)
+        cumulative = 0
+
+        buckets: list[tuple[float, int]] = [
+            (-self._bucket_value(index), self._negative[index])
+            for index in sorted(self._negative, reverse=True)
+        ]
+        buckets.append((0.0, self._zero_count))
+        buckets.extend(
+            (self._bucket_value(index), self._positive[index]) for index in sorted(self._positive)
+        )
+
+        for value, bucket_count in buckets:
+            cumulative += bucket_count
+            while rank < cumulative:
+                results[position] = value
+                next_rank = next(pending, None)
+                if next_rank is None:
+                    return results
+                rank, position = next_rank
+
+        return results
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of buckets currently allocated."""
+        return len(self._positive) + len(self._negative) + (1 if self._zero_count else 0)
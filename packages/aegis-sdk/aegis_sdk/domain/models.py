@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .enums import CommandPriority, ServiceStatus
+from .patterns import SubjectPatterns
+
+_VERSION = re.compile(r"^\d+\.\d+(\.\d+)?$")
+_SEMANTIC_VERSION = re.compile(r"^\d+\.\d+\.\d+$")
+_INSTANCE_ID = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$")
 
 
 class Message(BaseModel):
@@ -95,9 +101,7 @@ class Event(Message):
     @classmethod
     def validate_version(cls, v: str) -> str:
         """Validate version format (semantic versioning)."""
-        import re
-
-        if not re.match(r"^\d+\.\d+(\.\d+)?$", v):
+        if not _VERSION.match(v):
             raise ValueError(f"Invalid version format: {v}. Use semantic versioning (e.g., 1.0.0)")
         return v
 
@@ -126,11 +130,94 @@ class Command(Message):
         return v
 
 
+class RPCHandlerOptions(BaseModel):
+    """Execution options for an RPC handler.
+
+    By default a handler processes requests for its method one at a time, in
+    arrival order. Setting ``max_concurrency`` dispatches each request into its
+    own task, with at most that many running at once. ``offload`` runs a
+    synchronous handler in a thread or process pool so CPU-bound work does not
+    block the event loop; process-offloaded handlers must be picklable.
+    Clearing ``join_queue_group`` serves only the instance's own subject until
+    the handler is added to the service-wide queue group explicitly.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        strict=True,
+        frozen=True,
+    )
+
+    max_concurrency: int | None = Field(
+        None, ge=1, le=10000, description="Maximum requests handled concurrently"
+    )
+    offload: Literal["thread", "process"] | None = Field(
+        None, description="Worker pool used to run a synchronous handler"
+    )
+    join_queue_group: bool = Field(
+        True, description="Receive requests load-balanced across the service's instances"
+    )
+
+
+class EventSubscriptionOptions(BaseModel):
+    """Delivery options for an event subscription.
+
+    By default events are pushed to the handler one at a time. With ``pull``
+    set they are fetched from a durable pull consumer in batches of up to
+    ``batch_size``, which also makes wildcard patterns durable through the
+    consumer's filter subject. Up to ``max_concurrency`` events of a batch are
+    handled at once, and the server stops handing out events while
+    ``max_ack_pending`` of them are unacknowledged. An ``ordered`` consumer
+    handles each batch in sequence and acknowledges it with a single ack-all,
+    so it needs a broadcast subscription, where each instance owns its
+    consumer. With ``lazy_payload`` set, events sent in the header envelope
+    reach the handler as an EventView that decodes the payload on first
+    access, so the handler must accept both Event and EventView.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        strict=True,
+        frozen=True,
+    )
+
+    pull: bool = Field(False, description="Fetch events in batches from a pull consumer")
+    batch_size: int = Field(100, ge=1, le=10000, description="Maximum events per fetch")
+    max_concurrency: int = Field(
+        1, ge=1, le=10000, description="Maximum events of a batch handled concurrently"
+    )
+    max_ack_pending: int = Field(
+        1000, ge=1, le=1_000_000, description="Unacknowledged events before delivery pauses"
+    )
+    fetch_timeout: float = Field(
+        1.0, gt=0, le=60, description="Seconds a fetch waits for the first event"
+    )
+    ordered: bool = Field(False, description="Handle events in order and acknowledge per batch")
+    lazy_payload: bool = Field(
+        False, description="Hand envelope events to the handler without decoding the payload"
+    )
+
+    @model_validator(mode="after")
+    def validate_ordering(self) -> EventSubscriptionOptions:
+        """Ensure ordered delivery is only requested for sequential pull consumers."""
+        if self.ordered and not self.pull:
+            raise ValueError("ordered requires pull")
+        if self.ordered and self.max_concurrency > 1:
+            raise ValueError("ordered cannot be combined with max_concurrency above 1")
+        if self.max_ack_pending < self.batch_size:
+            raise ValueError("max_ack_pending must be at least batch_size")
+        return self
+
+
 class ServiceInfo(BaseModel):
     """Service instance information."""
 
     model_config = ConfigDict(
-        extra="forbid", str_strip_whitespace=True, strict=True, validate_assignment=True
+        extra="forbid",
+        str_strip_whitespace=True,
+        strict=True,
+        validate_assignment=True,
+        defer_build=True,
     )
 
     service_name: str = Field(..., min_length=1, description="Service name")
@@ -155,9 +242,7 @@ class ServiceInfo(BaseModel):
     @classmethod
     def validate_version(cls, v: str) -> str:
         """Validate version format (semantic versioning)."""
-        import re
-
-        if not re.match(r"^\d+\.\d+\.\d+$", v):
+        if not _SEMANTIC_VERSION.match(v):
             raise ValueError(f"Invalid version format: {v}. Use semantic versioning (e.g., 1.0.0)")
         return v
 
@@ -165,9 +250,7 @@ class ServiceInfo(BaseModel):
     @classmethod
     def validate_service_name(cls, v: str) -> str:
         """Validate service name format - no dots allowed."""
-        import re
-
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9-_]*$", v):
+        if not SubjectPatterns.is_valid_service_name(v):
             raise ValueError(
                 f"Invalid service name: {v}. Must start with letter, "
                 "can only contain letters, numbers, hyphens, underscores."
@@ -178,9 +261,7 @@ class ServiceInfo(BaseModel):
     @classmethod
     def validate_instance_id(cls, v: str) -> str:
         """Validate instance ID format - no dots allowed."""
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$", v):
+        if not _INSTANCE_ID.match(v):
             raise ValueError(
                 f"Invalid instance ID: {v}. "
                 "Can only contain letters, numbers, hyphens, underscores."
@@ -285,6 +366,7 @@ class KVWatchEvent(BaseModel):
 
     operation: str = Field(..., pattern="^(PUT|DELETE|PURGE)$", description="The operation type")
     entry: KVEntry | None = Field(None, description="The entry (None for DELETE/PURGE operations)")
+    key: str | None = Field(None, description="The key affected by the operation")
     timestamp: str = Field(
         default_factory=lambda: datetime.now(UTC).isoformat(),
         description="Event timestamp",
@@ -308,6 +390,29 @@ class KVWatchEvent(BaseModel):
         return self
 
 
+class KVBatchResult(BaseModel):
+    """Per-key outcome of a batched KV operation."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        strict=True,
+        validate_assignment=True,
+        defer_build=True,
+    )
+
+    results: dict[str, Any] = Field(
+        default_factory=dict, description="Successful results keyed by KV key"
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Error messages for keys that failed"
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether every key in the batch succeeded."""
+        return not self.errors
+
+
 class ServiceInstance(BaseModel):
     """Service instance domain entity for service registration.
 
@@ -323,6 +428,8 @@ class ServiceInstance(BaseModel):
         validate_assignment=True,
         # Use snake_case internally, can serialize to camelCase if needed
         alias_generator=None,
+        # Built on first use; processes that never touch the registry skip it
+        defer_build=True,
         populate_by_name=True,
     )
 
@@ -374,9 +481,7 @@ class ServiceInstance(BaseModel):
     @classmethod
     def validate_version(cls, v: str) -> str:
         """Validate version format (semantic versioning)."""
-        import re
-
-        if not re.match(r"^\d+\.\d+\.\d+$", v):
+        if not _SEMANTIC_VERSION.match(v):
             raise ValueError(f"Invalid version format: {v}. Use semantic versioning (e.g., 1.0.0)")
         return v
 
@@ -384,9 +489,6 @@ class ServiceInstance(BaseModel):
     @classmethod
     def validate_service_name(cls, v: str) -> str:
         """Validate service name format."""
-        # Import here to avoid circular imports
-        from aegis_sdk.domain.patterns import SubjectPatterns
-
         if not SubjectPatterns.is_valid_service_name(v):
             raise ValueError(f"Invalid service name format: {v}")
         return v
@@ -395,9 +497,7 @@ class ServiceInstance(BaseModel):
     @classmethod
     def validate_instance_id(cls, v: str) -> str:
         """Validate instance ID format - no dots or special chars allowed."""
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$", v):
+        if not _INSTANCE_ID.match(v):
             raise ValueError(
                 f"Invalid instance ID format: {v}. "
                 "Instance IDs can only contain letters, numbers, hyphens, and underscores."
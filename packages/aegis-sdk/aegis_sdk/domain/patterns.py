@@ -1,4 +1,20 @@
-"""Subject pattern management for NATS messaging."""
+"""Subject pattern management for NATS messaging.
+
+Subjects for RPC, events and commands are built for the same few service and
+method names over and over, so those builders and the validators are memoized.
+Built subjects are interned, so repeated builds share one string object
+instead of allocating a new one each time.
+"""
+
+import re
+import sys
+from functools import lru_cache
+
+# Distinct names a process uses are few; the caches only bound pathological input
+_CACHE_SIZE = 4096
+
+_SERVICE_NAME = re.compile(r"^[a-zA-Z][a-zA-Z0-9-_]*$")
+_METHOD_NAME = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
 
 
 class SubjectPatterns:
@@ -6,25 +22,34 @@ class SubjectPatterns:
 
     # Application communication patterns
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def rpc(service: str, method: str) -> str:
         """Generate RPC subject pattern."""
-        return f"rpc.{service}.{method}"
+        return sys.intern(f"rpc.{service}.{method}")
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def event(domain: str, event_type: str) -> str:
         """Generate event subject pattern."""
-        return f"events.{domain}.{event_type}"
+        return sys.intern(f"events.{domain}.{event_type}")
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def command(service: str, command: str) -> str:
         """Generate command subject pattern."""
-        return f"commands.{service}.{command}"
+        return sys.intern(f"commands.{service}.{command}")
 
     @staticmethod
     def service_instance(service: str, instance: str) -> str:
         """Generate service instance subject."""
         return f"service.{service}.{instance}"
 
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def rpc_instance(service: str, instance: str, method: str) -> str:
+        """Generate RPC subject addressed to a single service instance."""
+        return sys.intern(f"{SubjectPatterns.service_instance(service, instance)}.{method}")
+
     # Internal system patterns
     @staticmethod
     def heartbeat(service: str) -> str:
@@ -48,36 +73,54 @@ class SubjectPatterns:
 
     # Command lifecycle patterns
     @staticmethod
-    def command_progress(command_id: str) -> str:
-        """Command progress update subject."""
+    def command_progress(command_id: str, scope: str | None = None) -> str:
+        """Command progress update subject, optionally scoped to the sender's inbox."""
+        if scope:
+            return f"commands.progress.{scope}.{command_id}"
         return f"commands.progress.{command_id}"
 
     @staticmethod
-    def command_callback(command_id: str) -> str:
-        """Command completion callback subject."""
+    def command_callback(command_id: str, scope: str | None = None) -> str:
+        """Command completion callback subject, optionally scoped to the sender's inbox."""
+        if scope:
+            return f"commands.callback.{scope}.{command_id}"
         return f"commands.callback.{command_id}"
 
+    @staticmethod
+    def command_progress_inbox(scope: str) -> str:
+        """Wildcard subject for all progress updates sent to one sender."""
+        return f"commands.progress.{scope}.*"
+
+    @staticmethod
+    def command_callback_inbox(scope: str) -> str:
+        """Wildcard subject for all completion callbacks sent to one sender."""
+        return f"commands.callback.{scope}.*"
+
     @staticmethod
     def command_cancel(command_id: str) -> str:
         """Command cancellation subject."""
         return f"commands.cancel.{command_id}"
 
+    @staticmethod
+    def command_cancel_inbox() -> str:
+        """Wildcard subject for cancellation requests of any command."""
+        return "commands.cancel.*"
+
     # Pattern validation
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def is_valid_service_name(name: str) -> bool:
         """Validate service name format."""
-        import re
-
-        return bool(re.match(r"^[a-zA-Z][a-zA-Z0-9-_]*$", name))
+        return _SERVICE_NAME.match(name) is not None
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def is_valid_method_name(name: str) -> bool:
         """Validate method name format."""
-        import re
-
-        return bool(re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", name))
+        return _METHOD_NAME.match(name) is not None
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def is_valid_event_pattern(pattern: str) -> bool:
         """Validate event pattern format.
 
@@ -95,8 +138,6 @@ class SubjectPatterns:
         - "order.*.*.created" - multiple wildcards in sequence
         - "*order" - wildcard not as complete token
         """
-        import re
-
         if not pattern:
             return False
 
@@ -127,7 +168,7 @@ class SubjectPatterns:
                 return False
 
             # Check if it's a valid identifier
-            if not re.match(r"^[a-zA-Z][a-zA-Z0-9-_]*$", part):
+            if not _SERVICE_NAME.match(part):
                 return False
 
         # Check that '>' only appears at the end if present
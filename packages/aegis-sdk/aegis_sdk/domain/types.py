@@ -4,9 +4,11 @@ This module provides Protocol classes and type aliases to ensure
 type safety when working with handlers and callbacks.
 """
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any, Protocol
 
+from .exceptions import CommandCancelledError
 from .models import Command, Event
 
 
@@ -49,7 +51,8 @@ class CommandHandler(Protocol):
     """Protocol for command handlers.
 
     Command handlers receive a command and a progress callback.
-    They can report progress and must return a result.
+    They can report progress and must return a result. Handlers declaring a
+    third parameter also receive a CancellationToken.
     """
 
     async def __call__(
@@ -67,6 +70,41 @@ class CommandHandler(Protocol):
         ...
 
 
+class CancellationToken:
+    """Cooperative cancellation signal handed to command handlers.
+
+    Handlers that accept a third argument receive a token which is cancelled
+    when the sender calls ``cancel()`` on its command handle. Long-running
+    handlers should check it between units of work.
+    """
+
+    def __init__(self, command_id: str | None = None) -> None:
+        """Initialize an uncancelled token."""
+        self.command_id = command_id
+        self.reason: str | None = None
+        self._event = asyncio.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str | None = None) -> None:
+        """Request cancellation."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    async def wait(self) -> None:
+        """Wait until cancellation is requested."""
+        await self._event.wait()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise CommandCancelledError if cancellation has been requested."""
+        if self._event.is_set():
+            raise CommandCancelledError(self.command_id, self.reason)
+
+
 # Type aliases for common patterns
 ProgressCallback = Callable[[float, str], Awaitable[None]]
 """Progress callback type: (percentage: float, message: str) -> Awaitable[None]"""
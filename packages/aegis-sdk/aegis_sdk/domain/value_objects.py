@@ -2,6 +2,8 @@
 
 These value objects encapsulate domain concepts and provide type safety,
 validation, and clear business meaning to what would otherwise be primitive types.
+Their validators are built on first use (``defer_build``), so processes that
+never touch leader election do not pay for them at import time.
 """
 
 import re
@@ -12,6 +14,10 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .enums import CommandPriority
 
+_SERVICE_NAME = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*[a-zA-Z0-9]$|^[a-zA-Z]$")
+_EVENT_TYPE = re.compile(r"^[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)*$")
+_METHOD_NAME = re.compile(r"^[a-z][a-z0-9_]*$")
+
 
 class ServiceName(BaseModel):
     """Value object representing a service name.
@@ -20,7 +26,7 @@ class ServiceName(BaseModel):
     provides type safety for service identification.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: str = Field(..., min_length=1, max_length=64, description="The service name")
 
@@ -34,8 +40,7 @@ class ServiceName(BaseModel):
         - Contain only letters, numbers, hyphens, and underscores
         - Not end with a hyphen or underscore
         """
-        pattern = r"^[a-zA-Z][a-zA-Z0-9_-]*[a-zA-Z0-9]$|^[a-zA-Z]$"
-        if not re.match(pattern, v):
+        if not _SERVICE_NAME.match(v):
             raise ValueError(
                 f"Invalid service name '{v}'. Must start with a letter, "
                 "contain only letters, numbers, hyphens, and underscores, "
@@ -66,7 +71,7 @@ class InstanceId(BaseModel):
     Provides type safety and validation for instance identification.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: str = Field(..., min_length=1, max_length=128, description="The instance identifier")
 
@@ -107,7 +112,7 @@ class EventType(BaseModel):
     provides type safety for event handling.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: str = Field(..., min_length=1, max_length=64, description="The event type")
 
@@ -121,8 +126,7 @@ class EventType(BaseModel):
         - Not start or end with a dot
         - Not contain consecutive dots
         """
-        pattern = r"^[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)*$"
-        if not re.match(pattern, v):
+        if not _EVENT_TYPE.match(v):
             raise ValueError(
                 f"Invalid event type '{v}'. Must contain only letters, numbers, "
                 "dots, and underscores, and follow dot notation (e.g., 'order.created')"
@@ -170,7 +174,7 @@ class MethodName(BaseModel):
     Ensures method names follow consistent conventions.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: str = Field(..., min_length=1, max_length=64, description="The method name")
 
@@ -184,8 +188,7 @@ class MethodName(BaseModel):
         - Contain only letters, numbers, and underscores
         - Follow snake_case convention
         """
-        pattern = r"^[a-z][a-z0-9_]*$"
-        if not re.match(pattern, v):
+        if not _METHOD_NAME.match(v):
             raise ValueError(
                 f"Invalid method name '{v}'. Must start with a lowercase letter "
                 "and follow snake_case convention."
@@ -215,7 +218,7 @@ class Priority(BaseModel):
     Encapsulates priority levels with type safety.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     LOW: ClassVar[str] = CommandPriority.LOW.value
     NORMAL: ClassVar[str] = CommandPriority.NORMAL.value
@@ -259,7 +262,7 @@ class Version(BaseModel):
     following semantic versioning principles.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     major: int = Field(..., ge=0, description="Major version number")
     minor: int = Field(default=0, ge=0, description="Minor version number")
@@ -370,7 +373,7 @@ class Duration(BaseModel):
     arithmetic operations. Always non-negative.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     seconds: float = Field(..., ge=0, description="Duration in seconds")
 
@@ -523,7 +526,7 @@ class StickyActiveStatus(BaseModel):
     Encapsulates the election state for sticky single-active pattern.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     ACTIVE: ClassVar[str] = "ACTIVE"
     STANDBY: ClassVar[str] = "STANDBY"
@@ -570,7 +573,7 @@ class LeaderKey(BaseModel):
     Encapsulates the key used for leader election in NATS KV Store.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     service_name: ServiceName
     group_id: str = Field(default="default", description="Service group identifier")
@@ -590,7 +593,7 @@ class ElectionTimeout(BaseModel):
     Encapsulates timing parameters for leader election and failover.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     leader_ttl: Duration = Field(
         default_factory=lambda: Duration(seconds=5),
@@ -626,7 +629,7 @@ class ServiceGroupId(BaseModel):
     Used to group service instances for sticky active election.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: str = Field(
         ...,
@@ -676,7 +679,7 @@ class RetryPolicy(BaseModel):
     particularly NOT_ACTIVE errors in sticky active pattern.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     max_retries: int = Field(
         default=3,
@@ -791,7 +794,7 @@ class Timestamp(BaseModel):
     for conversion and manipulation. Always requires timezone information.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     value: datetime = Field(..., description="The timestamp value")
 
@@ -967,7 +970,7 @@ class ElectionState(BaseModel):
     including timing and error information for diagnostics.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     IDLE: ClassVar[str] = "IDLE"
     DETECTING: ClassVar[str] = "DETECTING"
@@ -1027,7 +1030,7 @@ class HeartbeatStatus(BaseModel):
     detecting failures and triggering failover.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     instance_id: str = Field(..., min_length=1, description="Instance being monitored")
     last_seen: datetime = Field(..., description="Last heartbeat timestamp")
@@ -1078,7 +1081,7 @@ class FailoverPolicy(BaseModel):
     should behave in different scenarios.
     """
 
-    model_config = ConfigDict(frozen=True, strict=True)
+    model_config = ConfigDict(frozen=True, strict=True, defer_build=True)
 
     AGGRESSIVE: ClassVar[str] = "aggressive"
     CONSERVATIVE: ClassVar[str] = "conservative"
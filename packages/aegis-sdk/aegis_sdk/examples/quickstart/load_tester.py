@@ -4,18 +4,27 @@ Load Testing Client for Performance Validation
 
 Comprehensive load testing tool for validating service performance,
 scalability, and resource utilization under various load patterns.
+
+The generator is open-loop: requests start on schedule even while earlier
+ones are outstanding, latency is measured from the scheduled start, and
+results are kept in fixed-memory histograms with a per-second timeline.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import math
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from statistics import mean, median, stdev
+from statistics import median
 
+import nats
+from nats.aio.client import Client as NATSClient
 from pydantic import BaseModel, Field
 from rich.console import Console
 from rich.panel import Panel
@@ -23,7 +32,23 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRe
 from rich.table import Table
 
 from aegis_sdk.domain.enums import RPCErrorCode
-from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+from aegis_sdk.domain.metrics_models import StreamingHistogram
+from aegis_sdk.domain.models import RPCRequest, RPCResponse
+from aegis_sdk.domain.patterns import SubjectPatterns
+from aegis_sdk.infrastructure.serialization import detect_and_deserialize, serialize_to_msgpack
+
+# Relative accuracy of the overall latency histogram and of each timeline second
+LATENCY_ACCURACY = 0.01
+TIMELINE_ACCURACY = 0.02
+
+# Schedule step while the target rate is zero
+IDLE_STEP_SECONDS = 0.01
+
+# Head start given to generator processes before the shared schedule begins
+PROCESS_START_SECONDS = 2.0
+
+# Error type of requests not sent because max_in_flight requests were outstanding
+DROPPED_ERROR = "CLIENT_DROPPED"
 
 
 class LoadPattern(str, Enum):
@@ -56,7 +81,16 @@ class LoadTestConfig(BaseModel):
     duration_seconds: int = Field(default=60, description="Test duration")
     initial_rps: float = Field(default=10.0, description="Initial requests per second")
     max_rps: float = Field(default=100.0, description="Maximum RPS for patterns")
-    concurrent_connections: int = Field(default=10, description="Number of concurrent workers")
+    concurrent_connections: int = Field(
+        default=4, ge=1, description="NATS connections per generator process"
+    )
+    processes: int = Field(default=1, ge=1, description="Generator processes")
+    max_in_flight: int = Field(
+        default=50000,
+        ge=1,
+        description="Outstanding requests per generator process; later ones are dropped",
+    )
+    nats_url: str = Field(default="nats://localhost:4222", description="NATS server URL")
     payload_size: PayloadSize = Field(default=PayloadSize.SMALL)
     timeout_seconds: float = Field(default=5.0, description="Request timeout")
     warmup_seconds: int = Field(default=5, description="Warmup period")
@@ -64,21 +98,105 @@ class LoadTestConfig(BaseModel):
 
 
 @dataclass
-class RequestResult:
-    """Result of a single request."""
+class SecondStats:
+    """Requests whose intended start fell in one second of the test."""
+
+    requests: int = 0
+    successful: int = 0
+    failed: int = 0
+    latency: StreamingHistogram = field(
+        default_factory=lambda: StreamingHistogram(relative_accuracy=TIMELINE_ACCURACY)
+    )
 
-    timestamp: float
-    worker_id: int
-    latency_ms: float
-    success: bool
-    error_code: RPCErrorCode | None = None
-    error_message: str | None = None
-    response_size: int = 0
+    def merge(self, other: SecondStats) -> None:
+        """Add another generator's counts for the same second."""
+        self.requests += other.requests
+        self.successful += other.successful
+        self.failed += other.failed
+        self.latency.merge(other.latency)
+
+
+class LatencyRecorder:
+    """Fixed-memory record of a load test.
+
+    Latencies go into a log-bucketed histogram instead of a list of results,
+    so memory depends on the value range and the test duration, not on the
+    number of requests. Each second of the schedule keeps its own counts and
+    a coarser histogram for the timelines.
+    """
+
+    def __init__(self, worker_id: int = 0):
+        """Initialize an empty recorder for one generator."""
+        self.worker_id = worker_id
+        self.latency = StreamingHistogram(relative_accuracy=LATENCY_ACCURACY)
+        self.successful = 0
+        self.failed = 0
+        self.total_latency_ms = 0.0
+        self.total_squared_latency_ms = 0.0
+        self.min_latency_ms = float("inf")
+        self.max_latency_ms = 0.0
+        self.max_send_lag_ms = 0.0
+        self.errors_by_type: dict[str, int] = {}
+        self.seconds: list[SecondStats] = []
+
+    def _second(self, offset: float) -> SecondStats:
+        index = int(offset)
+        while len(self.seconds) <= index:
+            self.seconds.append(SecondStats())
+        return self.seconds[index]
+
+    def record(
+        self, offset: float, latency_ms: float, success: bool, error_type: str | None = None
+    ) -> None:
+        """Record a completed request.
+
+        Args:
+            offset: Intended start of the request in seconds since the test began
+            latency_ms: Time from the intended start to the response
+            success: Whether the call succeeded
+            error_type: Error classification of a failed call
+        """
+        second = self._second(offset)
+        second.requests += 1
+        if success:
+            self.successful += 1
+            second.successful += 1
+            self.latency.add(latency_ms)
+            second.latency.add(latency_ms)
+            self.total_latency_ms += latency_ms
+            self.total_squared_latency_ms += latency_ms * latency_ms
+            self.min_latency_ms = min(self.min_latency_ms, latency_ms)
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        else:
+            self.failed += 1
+            second.failed += 1
+            key = error_type or "Unknown"
+            self.errors_by_type[key] = self.errors_by_type.get(key, 0) + 1
+
+    def merge(self, other: LatencyRecorder) -> None:
+        """Add the results of another generator."""
+        self.latency.merge(other.latency)
+        self.successful += other.successful
+        self.failed += other.failed
+        self.total_latency_ms += other.total_latency_ms
+        self.total_squared_latency_ms += other.total_squared_latency_ms
+        self.min_latency_ms = min(self.min_latency_ms, other.min_latency_ms)
+        self.max_latency_ms = max(self.max_latency_ms, other.max_latency_ms)
+        self.max_send_lag_ms = max(self.max_send_lag_ms, other.max_send_lag_ms)
+        for error_type, count in other.errors_by_type.items():
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + count
+        for index, second in enumerate(other.seconds):
+            self._second(index).merge(second)
+
+    @property
+    def requests(self) -> int:
+        """Number of completed requests."""
+        return self.successful + self.failed
 
 
 @dataclass
 class WorkerStats:
-    """Statistics for a worker."""
+    """Statistics for a generator process."""
 
     worker_id: int
     requests_sent: int = 0
@@ -106,7 +224,7 @@ class LoadTestResults:
     peak_rps: float = 0.0
     sustained_rps: float = 0.0
 
-    # Latency metrics (successful requests only)
+    # Latency metrics (successful requests only, measured from intended start)
     mean_latency_ms: float = 0.0
     median_latency_ms: float = 0.0
     stddev_latency_ms: float = 0.0
@@ -115,9 +233,13 @@ class LoadTestResults:
     p90_latency_ms: float = 0.0
     p95_latency_ms: float = 0.0
     p99_latency_ms: float = 0.0
+    p999_latency_ms: float = 0.0
     min_latency_ms: float = 0.0
     max_latency_ms: float = 0.0
 
+    # How far the generator fell behind its own schedule
+    max_send_lag_ms: float = 0.0
+
     # Error analysis
     errors_by_type: dict[str, int] = field(default_factory=dict)
     error_rate_by_second: list[float] = field(default_factory=list)
@@ -128,37 +250,48 @@ class LoadTestResults:
     # Time series data (for graphs)
     rps_timeline: list[float] = field(default_factory=list)
     latency_timeline: list[float] = field(default_factory=list)
+    p99_timeline: list[float] = field(default_factory=list)
     error_timeline: list[float] = field(default_factory=list)
 
 
+def _run_generator(
+    config: LoadTestConfig, worker_id: int, share: float, start_at: float
+) -> LatencyRecorder:
+    """Run one generator in a worker process."""
+    return asyncio.run(LoadTester(config).generate(worker_id, share, start_at))
+
+
 class LoadTester:
     """
-    Load testing client following DDD principles.
-
-    Validates service performance under various load patterns
-    and provides comprehensive performance metrics.
+    Open-loop load testing client following DDD principles.
+
+    Requests are issued at the times the load pattern dictates, whether or
+    not earlier requests have completed, and latency is measured from that
+    intended start. A slow service therefore shows up as queueing delay in
+    the tail instead of silently lowering the offered load (coordinated
+    omission). Generation can be split across processes to exceed what a
+    single event loop can send.
     """
 
     def __init__(self, config: LoadTestConfig):
         """Initialize the load tester."""
         self.config = config
         self.console = Console()
-        self.nats_adapter: NATSAdapter | None = None
-        self.results: list[RequestResult] = []
+        self.recorder = LatencyRecorder()
         self.worker_stats: dict[int, WorkerStats] = {}
         self.start_time: float = 0
+        self.end_time: float = 0
         self.running = False
         self.current_rps = 0.0
-        self.request_counter = 0
 
     async def connect(self) -> None:
-        """Connect to NATS."""
-        self.nats_adapter = NATSAdapter()
-        await self.nats_adapter.connect("nats://localhost:4222")
+        """Check that NATS is reachable before starting the test."""
+        nc = await nats.connect(self.config.nats_url)
+        await nc.close()
         self.console.print("[green]✓ Connected to NATS[/green]")
 
     def generate_payload(self) -> bytes:
-        """Generate request payload based on configured size."""
+        """Generate the serialized RPC request sent by every call."""
         sizes = {
             PayloadSize.TINY: 10,
             PayloadSize.SMALL: 100,
@@ -168,14 +301,14 @@ class LoadTester:
         }
 
         size = sizes[self.config.payload_size]
-        data = {
-            "request_id": self.request_counter,
-            "timestamp": time.time(),
-            "data": "x" * (size - 50),  # Adjust for JSON overhead
-        }
-
-        self.request_counter += 1
-        return json.dumps(data).encode()
+        request = RPCRequest(
+            method=self.config.method_name,
+            target=self.config.service_name,
+            params={"data": "x" * max(size - 50, 0)},  # Adjust for envelope overhead
+            timeout=self.config.timeout_seconds,
+        )
+        # Encoded once: the generator must not spend its budget serializing
+        return serialize_to_msgpack(request)
 
     def calculate_target_rps(self, elapsed: float) -> float:
         """Calculate target RPS based on load pattern and elapsed time."""
@@ -198,8 +331,6 @@ class LoadTester:
 
         elif self.config.pattern == LoadPattern.WAVE:
             # Sinusoidal pattern
-            import math
-
             amplitude = (self.config.max_rps - self.config.initial_rps) / 2
             midpoint = (self.config.max_rps + self.config.initial_rps) / 2
             return midpoint + amplitude * math.sin(progress * 4 * math.pi)
@@ -216,94 +347,104 @@ class LoadTester:
 
         return self.config.initial_rps
 
-    async def worker(self, worker_id: int) -> None:
-        """Worker coroutine that sends requests."""
-        stats = WorkerStats(worker_id=worker_id)
-        self.worker_stats[worker_id] = stats
-
-        while self.running:
-            try:
-                # Calculate if this worker should send a request
-                workers_rps = self.current_rps / self.config.concurrent_connections
-                if workers_rps > 0:
-                    interval = 1.0 / workers_rps
-                else:
-                    interval = 1.0
-
-                # Send request
-                start_time = time.perf_counter()
-                payload = self.generate_payload()
-
-                try:
-                    response = await self.nats_adapter.request(
-                        f"rpc.{self.config.service_name}.{self.config.method_name}",
-                        payload,
-                        timeout=self.config.timeout_seconds,
-                    )
+    async def generate(self, worker_id: int, share: float, start_at: float) -> LatencyRecorder:
+        """Issue this generator's share of the schedule and record the results.
 
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-                    success = True
-                    error_code = None
-                    error_message = None
-                    response_size = len(response.data) if response else 0
-
-                    # Check for application-level errors
-                    if response:
-                        try:
-                            response_data = json.loads(response.data.decode())
-                            if response_data.get("error"):
-                                success = False
-                                error_code = response_data.get("error_code")
-                                error_message = response_data.get("error_message")
-                        except:
-                            pass
-
-                except asyncio.TimeoutError:
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-                    success = False
-                    error_code = RPCErrorCode.TIMEOUT
-                    error_message = "Request timeout"
-                    response_size = 0
-
-                except Exception as e:
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-                    success = False
-                    error_code = RPCErrorCode.INTERNAL_ERROR
-                    error_message = str(e)
-                    response_size = 0
-
-                # Record result
-                result = RequestResult(
-                    timestamp=time.time(),
-                    worker_id=worker_id,
-                    latency_ms=latency_ms,
-                    success=success,
-                    error_code=error_code,
-                    error_message=error_message,
-                    response_size=response_size,
-                )
-                self.results.append(result)
-
-                # Update worker stats
-                stats.requests_sent += 1
-                if success:
-                    stats.requests_successful += 1
-                    stats.total_latency_ms += latency_ms
-                    stats.min_latency_ms = min(stats.min_latency_ms, latency_ms)
-                    stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
-                else:
-                    stats.requests_failed += 1
-                    error_type = str(error_code) if error_code else "Unknown"
-                    if error_type not in stats.errors_by_type:
-                        stats.errors_by_type[error_type] = 0
-                    stats.errors_by_type[error_type] += 1
-
-                # Rate limiting
-                await asyncio.sleep(interval)
-
-            except Exception as e:
-                self.console.print(f"[red]Worker {worker_id} error: {e}[/red]")
-                await asyncio.sleep(1)
+        Args:
+            worker_id: Index of the generator
+            share: Fraction of the target rate this generator sends
+            start_at: Wall-clock time at which every generator starts its schedule
+
+        Returns:
+            The generator's recorder
+        """
+        recorder = LatencyRecorder(worker_id)
+        connections = [
+            await nats.connect(self.config.nats_url)
+            for _ in range(self.config.concurrent_connections)
+        ]
+        subject = SubjectPatterns.rpc(self.config.service_name, self.config.method_name)
+        payload = self.generate_payload()
+        in_flight = asyncio.Semaphore(self.config.max_in_flight)
+        tasks: set[asyncio.Task] = set()
+        duration = self.config.duration_seconds
+
+        # Intended times are offsets from a shared origin, so processes stay in step
+        origin = time.perf_counter() + (start_at - time.time())
+        intended = 0.0
+        sent = 0
+        try:
+            while intended < duration:
+                now = time.perf_counter() - origin
+                if intended > now:
+                    await asyncio.sleep(intended - now)
+                    continue
+
+                # Issue every request that is due, however far behind we are. With
+                # every slot taken the request is dropped rather than delayed, so
+                # an overloaded service cannot slow the schedule down
+                while intended <= now and intended < duration:
+                    if in_flight.locked():
+                        recorder.record(intended, 0.0, False, DROPPED_ERROR)
+                    else:
+                        await in_flight.acquire()
+                        lag_ms = (time.perf_counter() - origin - intended) * 1000
+                        recorder.max_send_lag_ms = max(recorder.max_send_lag_ms, lag_ms)
+                        task = asyncio.create_task(
+                            self._send(
+                                connections[sent % len(connections)],
+                                subject,
+                                payload,
+                                origin,
+                                intended,
+                                recorder,
+                                in_flight,
+                            )
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                        sent += 1
+
+                    rate = self.calculate_target_rps(intended) * share
+                    intended += 1.0 / rate if rate > 0 else IDLE_STEP_SECONDS
+                await asyncio.sleep(0)
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for nc in connections:
+                await nc.close()
+        return recorder
+
+    async def _send(
+        self,
+        nc: NATSClient,
+        subject: str,
+        payload: bytes,
+        origin: float,
+        intended: float,
+        recorder: LatencyRecorder,
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        """Send one request and record its latency from its intended start."""
+        error_type = None
+        try:
+            response = await nc.request(subject, payload, timeout=self.config.timeout_seconds)
+            rpc_response = detect_and_deserialize(response.data, RPCResponse, validate=False)
+            success = rpc_response.success
+            if not success:
+                error_type = str(RPCErrorCode.INTERNAL_ERROR)
+        except TimeoutError:
+            success = False
+            error_type = str(RPCErrorCode.TIMEOUT)
+        except Exception:
+            success = False
+            error_type = str(RPCErrorCode.INTERNAL_ERROR)
+        finally:
+            in_flight.release()
+
+        latency_ms = (time.perf_counter() - origin - intended) * 1000
+        recorder.record(intended, latency_ms, success, error_type)
 
     async def run_load_test(self) -> None:
         """Run the load test with configured parameters."""
@@ -311,7 +452,8 @@ class LoadTester:
         self.console.print(f"Service: {self.config.service_name}.{self.config.method_name}")
         self.console.print(f"Pattern: {self.config.pattern.value}")
         self.console.print(f"Duration: {self.config.duration_seconds}s")
-        self.console.print(f"Workers: {self.config.concurrent_connections}")
+        self.console.print(f"Generator processes: {self.config.processes}")
+        self.console.print(f"Connections per process: {self.config.concurrent_connections}")
         self.console.print(f"Payload: {self.config.payload_size.value}\n")
 
         # Warmup phase
@@ -319,14 +461,27 @@ class LoadTester:
             self.console.print(f"[yellow]Warming up for {self.config.warmup_seconds}s...[/yellow]")
             await asyncio.sleep(self.config.warmup_seconds)
 
-        # Start workers
+        # Give worker processes time to start before the shared schedule begins
+        processes = self.config.processes
+        share = 1.0 / processes
+        self.start_time = time.time() + (PROCESS_START_SECONDS if processes > 1 else 0.0)
         self.running = True
-        self.start_time = time.time()
-        workers = []
 
-        for i in range(self.config.concurrent_connections):
-            worker = asyncio.create_task(self.worker(i))
-            workers.append(worker)
+        loop = asyncio.get_running_loop()
+        executor: ProcessPoolExecutor | None = None
+        generators: list[asyncio.Future[LatencyRecorder]]
+        if processes == 1:
+            generators = [asyncio.ensure_future(self.generate(0, share, self.start_time))]
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            generators = [
+                loop.run_in_executor(
+                    executor, _run_generator, self.config, worker_id, share, self.start_time
+                )
+                for worker_id in range(processes)
+            ]
 
         # Progress tracking
         progress = Progress(
@@ -337,27 +492,36 @@ class LoadTester:
             TimeRemainingColumn(),
         )
 
-        # Metrics collection task
-        metrics_task = asyncio.create_task(self._collect_metrics())
-
-        with progress:
-            task = progress.add_task("Running load test...", total=self.config.duration_seconds)
-
-            # Run for configured duration
-            start = time.time()
-            while time.time() - start < self.config.duration_seconds:
-                elapsed = time.time() - start
-
-                # Update target RPS
-                self.current_rps = self.calculate_target_rps(elapsed)
-
-                # Update progress
-                progress.update(task, completed=elapsed)
-
-                await asyncio.sleep(0.1)
-
-        # Stop workers
-        self.running = False
+        try:
+            with progress:
+                task = progress.add_task("Running load test...", total=self.config.duration_seconds)
+                while not all(generator.done() for generator in generators):
+                    elapsed = max(time.time() - self.start_time, 0.0)
+                    self.current_rps = self.calculate_target_rps(
+                        min(elapsed, self.config.duration_seconds)
+                    )
+                    progress.update(task, completed=min(elapsed, self.config.duration_seconds))
+                    await asyncio.sleep(0.1)
+
+            recorders = await asyncio.gather(*generators)
+        finally:
+            self.running = False
+            if executor:
+                executor.shutdown()
+        self.end_time = time.time()
+
+        for recorder in recorders:
+            self.recorder.merge(recorder)
+            self.worker_stats[recorder.worker_id] = WorkerStats(
+                worker_id=recorder.worker_id,
+                requests_sent=recorder.requests,
+                requests_successful=recorder.successful,
+                requests_failed=recorder.failed,
+                total_latency_ms=recorder.total_latency_ms,
+                min_latency_ms=recorder.min_latency_ms,
+                max_latency_ms=recorder.max_latency_ms,
+                errors_by_type=dict(recorder.errors_by_type),
+            )
 
         # Cooldown phase
         if self.config.cooldown_seconds > 0:
@@ -366,112 +530,64 @@ class LoadTester:
             )
             await asyncio.sleep(self.config.cooldown_seconds)
 
-        # Wait for workers to finish
-        await asyncio.gather(*workers, return_exceptions=True)
-        metrics_task.cancel()
-
         self.console.print("[green]Load test completed[/green]")
 
-    async def _collect_metrics(self) -> None:
-        """Collect metrics during the test."""
-        rps_timeline = []
-        latency_timeline = []
-        error_timeline = []
-
-        last_count = 0
-        last_time = time.time()
-
-        while self.running:
-            await asyncio.sleep(1)
-
-            current_time = time.time()
-            current_count = len(self.results)
-
-            # Calculate RPS
-            rps = (current_count - last_count) / (current_time - last_time)
-            rps_timeline.append(rps)
-
-            # Calculate average latency for last second
-            recent_results = [r for r in self.results[last_count:current_count] if r.success]
-            if recent_results:
-                avg_latency = mean([r.latency_ms for r in recent_results])
-                latency_timeline.append(avg_latency)
-            else:
-                latency_timeline.append(0)
-
-            # Calculate error rate
-            recent_errors = sum(1 for r in self.results[last_count:current_count] if not r.success)
-            error_rate = (recent_errors / max(current_count - last_count, 1)) * 100
-            error_timeline.append(error_rate)
-
-            last_count = current_count
-            last_time = current_time
-
-        # Store in results (simplified - would be passed to calculate_results)
-        self.rps_timeline = rps_timeline
-        self.latency_timeline = latency_timeline
-        self.error_timeline = error_timeline
-
     def calculate_results(self) -> LoadTestResults:
         """Calculate aggregated test results."""
-        if not self.results:
-            return LoadTestResults()
+        recorder = self.recorder
+        results = LoadTestResults()
+        if recorder.requests == 0:
+            return results
+
+        results.total_requests = recorder.requests
+        results.successful_requests = recorder.successful
+        results.failed_requests = recorder.failed
+        results.success_rate = (recorder.successful / recorder.requests) * 100
+        results.duration_seconds = (self.end_time or time.time()) - self.start_time
+        results.max_send_lag_ms = recorder.max_send_lag_ms
+
+        # Throughput metrics
+        results.mean_rps = recorder.requests / max(results.duration_seconds, 1e-9)
+        results.rps_timeline = [float(second.requests) for second in recorder.seconds]
+        if results.rps_timeline:
+            results.peak_rps = max(results.rps_timeline)
+            results.sustained_rps = median(results.rps_timeline)
+
+        # Latency metrics
+        if recorder.successful:
+            count = recorder.successful
+            results.mean_latency_ms = recorder.total_latency_ms / count
+            variance = recorder.total_squared_latency_ms / count - results.mean_latency_ms**2
+            results.stddev_latency_ms = math.sqrt(max(variance, 0.0))
+            (
+                results.p50_latency_ms,
+                results.p75_latency_ms,
+                results.p90_latency_ms,
+                results.p95_latency_ms,
+                results.p99_latency_ms,
+                results.p999_latency_ms,
+            ) = (
+                min(max(value, recorder.min_latency_ms), recorder.max_latency_ms)
+                for value in recorder.latency.quantiles([0.5, 0.75, 0.9, 0.95, 0.99, 0.999])
+            )
+            results.median_latency_ms = results.p50_latency_ms
+            results.min_latency_ms = recorder.min_latency_ms
+            results.max_latency_ms = recorder.max_latency_ms
 
-        # Separate successful and failed requests
-        successful = [r for r in self.results if r.success]
-        failed = [r for r in self.results if not r.success]
+        # Error analysis
+        results.errors_by_type = dict(recorder.errors_by_type)
 
-        # Calculate latency percentiles
-        latencies = sorted([r.latency_ms for r in successful])
-        results = LoadTestResults()
+        # Worker stats
+        results.worker_stats = list(self.worker_stats.values())
 
-        if latencies:
-            results.total_requests = len(self.results)
-            results.successful_requests = len(successful)
-            results.failed_requests = len(failed)
-            results.success_rate = (len(successful) / len(self.results)) * 100
-            results.duration_seconds = time.time() - self.start_time
-
-            # Throughput metrics
-            results.mean_rps = len(self.results) / results.duration_seconds
-            if hasattr(self, "rps_timeline") and self.rps_timeline:
-                results.peak_rps = max(self.rps_timeline)
-                results.sustained_rps = median(self.rps_timeline)
-
-            # Latency metrics
-            results.mean_latency_ms = mean(latencies)
-            results.median_latency_ms = median(latencies)
-            if len(latencies) > 1:
-                results.stddev_latency_ms = stdev(latencies)
-
-            # Percentiles
-            def percentile(data: list, p: float) -> float:
-                index = int(len(data) * p)
-                return data[min(index, len(data) - 1)]
-
-            results.p50_latency_ms = percentile(latencies, 0.50)
-            results.p75_latency_ms = percentile(latencies, 0.75)
-            results.p90_latency_ms = percentile(latencies, 0.90)
-            results.p95_latency_ms = percentile(latencies, 0.95)
-            results.p99_latency_ms = percentile(latencies, 0.99)
-            results.min_latency_ms = min(latencies)
-            results.max_latency_ms = max(latencies)
-
-            # Error analysis
-            for result in failed:
-                error_type = str(result.error_code) if result.error_code else "Unknown"
-                if error_type not in results.errors_by_type:
-                    results.errors_by_type[error_type] = 0
-                results.errors_by_type[error_type] += 1
-
-            # Worker stats
-            results.worker_stats = list(self.worker_stats.values())
-
-            # Timeline data
-            if hasattr(self, "rps_timeline"):
-                results.rps_timeline = self.rps_timeline
-                results.latency_timeline = self.latency_timeline
-                results.error_timeline = self.error_timeline
+        # Timeline data
+        for second in recorder.seconds:
+            p50, p99 = second.latency.quantiles([0.5, 0.99])
+            results.latency_timeline.append(p50)
+            results.p99_timeline.append(p99)
+            error_rate = (second.failed / max(second.requests, 1)) * 100
+            results.error_timeline.append(error_rate)
+        results.error_rate_by_second = list(results.error_timeline)
 
         return results
 
@@ -491,6 +607,7 @@ Failed: {results.failed_requests:,}
 Mean RPS: {results.mean_rps:.2f}
 Peak RPS: {results.peak_rps:.2f}
 Sustained RPS: {results.sustained_rps:.2f}
+Max send lag: {results.max_send_lag_ms:.2f}ms
         """
         self.console.print(
             Panel(summary.strip(), title="Performance Summary", border_style="green")
@@ -508,6 +625,7 @@ Sustained RPS: {results.sustained_rps:.2f}
             latency_table.add_row("P90", f"{results.p90_latency_ms:.2f}")
             latency_table.add_row("P95", f"{results.p95_latency_ms:.2f}")
             latency_table.add_row("P99", f"{results.p99_latency_ms:.2f}")
+            latency_table.add_row("P99.9", f"{results.p999_latency_ms:.2f}")
             latency_table.add_row("Max", f"{results.max_latency_ms:.2f}")
             latency_table.add_row("", "")
             latency_table.add_row("Mean", f"{results.mean_latency_ms:.2f}")
@@ -531,8 +649,8 @@ Sustained RPS: {results.sustained_rps:.2f}
 
         # Worker distribution
         if results.worker_stats:
-            worker_table = Table(title="Worker Performance", show_header=True)
-            worker_table.add_column("Worker", style="cyan")
+            worker_table = Table(title="Generator Performance", show_header=True)
+            worker_table.add_column("Generator", style="cyan")
             worker_table.add_column("Requests", justify="right")
             worker_table.add_column("Success Rate", justify="right")
             worker_table.add_column("Avg Latency", justify="right")
@@ -541,7 +659,7 @@ Sustained RPS: {results.sustained_rps:.2f}
                 success_rate = (stats.requests_successful / max(stats.requests_sent, 1)) * 100
                 avg_latency = stats.total_latency_ms / max(stats.requests_successful, 1)
                 worker_table.add_row(
-                    f"Worker {stats.worker_id}",
+                    f"Generator {stats.worker_id}",
                     str(stats.requests_sent),
                     f"{success_rate:.1f}%",
                     f"{avg_latency:.2f}ms",
@@ -580,9 +698,11 @@ Sustained RPS: {results.sustained_rps:.2f}
                     "p90_ms": results.p90_latency_ms,
                     "p95_ms": results.p95_latency_ms,
                     "p99_ms": results.p99_latency_ms,
+                    "p999_ms": results.p999_latency_ms,
                     "min_ms": results.min_latency_ms,
                     "max_ms": results.max_latency_ms,
                 },
+                "max_send_lag_ms": results.max_send_lag_ms,
                 "errors": results.errors_by_type,
                 "worker_stats": [
                     {
@@ -596,7 +716,8 @@ Sustained RPS: {results.sustained_rps:.2f}
                 ],
                 "timelines": {
                     "rps": results.rps_timeline,
-                    "latency": results.latency_timeline,
+                    "latency_p50": results.latency_timeline,
+                    "latency_p99": results.p99_timeline,
                     "error_rate": results.error_timeline,
                 },
             },
@@ -623,7 +744,8 @@ async def main():
         duration_seconds=30,
         initial_rps=10.0,
         max_rps=100.0,
-        concurrent_connections=10,
+        concurrent_connections=4,
+        processes=1,
         payload_size=PayloadSize.SMALL,
         timeout_seconds=5.0,
         warmup_seconds=2,
@@ -658,8 +780,6 @@ async def main():
 
         traceback.print_exc()
     finally:
-        if tester.nats_adapter:
-            await tester.nats_adapter.disconnect()
         console.print("[green]Disconnected[/green]")
 
 
@@ -1,28 +1,67 @@
 """Infrastructure layer - Concrete implementations of ports."""
 
-from .application_factories import (
-    DefaultElectionRepositoryFactory,
-    DefaultKVStoreFactory,
-    DefaultUseCaseFactory,
-    RedisElectionRepositoryFactory,
-)
-from .basic_service_discovery import BasicServiceDiscovery
-from .cached_service_discovery import CacheConfig, CachedServiceDiscovery
-from .config import KVStoreConfig, LogContext, NATSConnectionConfig
-from .factories import (
-    DiscoveryRequestFactory,
-    KVOptionsFactory,
-    SerializationFactory,
-)
-from .in_memory_metrics import InMemoryMetrics
-from .kv_service_registry import KVServiceRegistry
-from .nats_adapter import NATSAdapter
-from .nats_kv_store import NATSKVStore
-from .watchable_cached_service_discovery import (
-    WatchableCacheConfig,
-    WatchableCachedServiceDiscovery,
-    WatchConfig,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .application_factories import (
+        DefaultElectionRepositoryFactory,
+        DefaultKVStoreFactory,
+        DefaultUseCaseFactory,
+        RedisElectionRepositoryFactory,
+    )
+    from .basic_service_discovery import BasicServiceDiscovery
+    from .cached_service_discovery import CacheConfig, CachedServiceDiscovery
+    from .config import KVStoreConfig, LogContext, NATSConnectionConfig
+    from .factories import DiscoveryRequestFactory, KVOptionsFactory, SerializationFactory
+    from .in_memory_kv_store import InMemoryKVServer, InMemoryKVStore
+    from .in_memory_message_bus import InMemoryBroker, InMemoryMessageBus
+    from .in_memory_metrics import InMemoryMetrics
+    from .kv_service_registry import KVServiceRegistry
+    from .manual_clock import ManualClock
+    from .materialized_service_registry import MaterializedServiceRegistry
+    from .nats_adapter import NATSAdapter
+    from .nats_kv_store import NATSKVStore
+    from .prometheus_metrics import MetricsHTTPServer, PrometheusMetrics
+    from .watchable_cached_service_discovery import (
+        WatchableCacheConfig,
+        WatchableCachedServiceDiscovery,
+        WatchConfig,
+    )
+
+_EXPORTS = {
+    "DefaultElectionRepositoryFactory": ".application_factories",
+    "DefaultKVStoreFactory": ".application_factories",
+    "DefaultUseCaseFactory": ".application_factories",
+    "RedisElectionRepositoryFactory": ".application_factories",
+    "BasicServiceDiscovery": ".basic_service_discovery",
+    "CacheConfig": ".cached_service_discovery",
+    "CachedServiceDiscovery": ".cached_service_discovery",
+    "KVStoreConfig": ".config",
+    "LogContext": ".config",
+    "NATSConnectionConfig": ".config",
+    "DiscoveryRequestFactory": ".factories",
+    "KVOptionsFactory": ".factories",
+    "SerializationFactory": ".factories",
+    "InMemoryKVServer": ".in_memory_kv_store",
+    "InMemoryKVStore": ".in_memory_kv_store",
+    "InMemoryBroker": ".in_memory_message_bus",
+    "InMemoryMessageBus": ".in_memory_message_bus",
+    "InMemoryMetrics": ".in_memory_metrics",
+    "KVServiceRegistry": ".kv_service_registry",
+    "ManualClock": ".manual_clock",
+    "MaterializedServiceRegistry": ".materialized_service_registry",
+    "NATSAdapter": ".nats_adapter",
+    "NATSKVStore": ".nats_kv_store",
+    "MetricsHTTPServer": ".prometheus_metrics",
+    "PrometheusMetrics": ".prometheus_metrics",
+    "WatchableCacheConfig": ".watchable_cached_service_discovery",
+    "WatchableCachedServiceDiscovery": ".watchable_cached_service_discovery",
+    "WatchConfig": ".watchable_cached_service_discovery",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BasicServiceDiscovery",
@@ -32,14 +71,22 @@ __all__ = [
     "DefaultKVStoreFactory",
     "DefaultUseCaseFactory",
     "DiscoveryRequestFactory",
+    "InMemoryBroker",
+    "InMemoryKVServer",
+    "InMemoryKVStore",
+    "InMemoryMessageBus",
     "InMemoryMetrics",
     "KVOptionsFactory",
     "KVServiceRegistry",
     "KVStoreConfig",
     "LogContext",
+    "ManualClock",
+    "MaterializedServiceRegistry",
+    "MetricsHTTPServer",
     "NATSAdapter",
     "NATSConnectionConfig",
     "NATSKVStore",
+    "PrometheusMetrics",
     "RedisElectionRepositoryFactory",
     "SerializationFactory",
     "WatchConfig",
@@ -0,0 +1,231 @@
+"""Non-blocking logger that writes from a background thread."""
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Any, TextIO
+
+from ..ports.logger import LoggerPort
+from ..ports.metrics import MetricsPort
+
+# Keyword naming the rate-limit key of a record; defaults to the message text
+SAMPLE_KEY = "sample_key"
+
+# Rate-limit windows kept before old keys are forgotten
+MAX_SAMPLE_KEYS = 1024
+
+
+class AsyncLogger(LoggerPort):
+    """Logger that hands records to a background writer thread.
+
+    The calling thread only checks the level and rate limit and puts the
+    record on a bounded queue without blocking; a daemon thread formats the
+    records and writes them to the stream, so a slow terminal or pipe never
+    stalls the event loop. When the queue is full a record is dropped.
+
+    Records sharing a key (``sample_key=...``, or else the message text) are
+    limited to ``rate_limit`` per ``rate_window`` seconds. The first record
+    after a suppressed stretch carries the number of records skipped.
+    Dropped and suppressed records are counted as ``logging.dropped`` and
+    ``logging.suppressed`` on the metrics port.
+    """
+
+    def __init__(
+        self,
+        name: str = "aegis_sdk",
+        level: int = logging.INFO,
+        stream: TextIO | None = None,
+        queue_size: int = 10000,
+        rate_limit: int = 100,
+        rate_window: float = 1.0,
+        metrics: MetricsPort | None = None,
+    ):
+        """Initialize the logger and start its writer thread.
+
+        Args:
+            name: Logger name shown in every line
+            level: Minimum level written
+            stream: Output stream (default: stderr at write time)
+            queue_size: Records buffered before new ones are dropped
+            rate_limit: Records per key and window; 0 disables rate limiting
+            rate_window: Length of a rate-limit window in seconds
+            metrics: Optional metrics port for drop counters
+        """
+        self._name = name
+        self._level = level
+        self._stream = stream
+        self._rate_limit = rate_limit
+        self._rate_window = rate_window
+        self._metrics = metrics
+        self._queue: queue.Queue[tuple[Any, ...] | None] = queue.Queue(queue_size)
+        # Per key: [window start, records written, records suppressed]
+        self._windows: dict[str, list[Any]] = {}
+        self.dropped = 0
+        self.suppressed = 0
+
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"{name}-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        """Log a debug message."""
+        self._log(logging.DEBUG, message, kwargs)
+
+    def info(self, message: str, **kwargs: Any) -> None:
+        """Log an info message."""
+        self._log(logging.INFO, message, kwargs)
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        """Log a warning message."""
+        self._log(logging.WARNING, message, kwargs)
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        """Log an error message."""
+        self._log(logging.ERROR, message, kwargs)
+
+    def exception(self, message: str, exc_info: Exception | None = None, **kwargs: Any) -> None:
+        """Log an exception with traceback."""
+        self._log(logging.ERROR, message, kwargs, exc_info or sys.exc_info()[1])
+
+    def _log(
+        self,
+        level: int,
+        message: str,
+        kwargs: dict[str, Any],
+        exc: BaseException | None = None,
+    ) -> None:
+        """Queue a record unless it is filtered, rate limited or the queue is full."""
+        if level < self._level or self._closed:
+            return
+        key = kwargs.pop(SAMPLE_KEY, None) or message
+        if self._rate_limit:
+            suppressed = self._sample(key)
+            if suppressed is None:
+                return
+            if suppressed:
+                kwargs["suppressed"] = suppressed
+
+        try:
+            self._queue.put_nowait((time.time(), level, message, kwargs, exc))
+        except queue.Full:
+            self.dropped += 1
+            if self._metrics:
+                self._metrics.increment("logging.dropped")
+
+    def _sample(self, key: str) -> int | None:
+        """Apply the rate limit to a key.
+
+        Returns:
+            None to suppress the record, else the records suppressed since the
+            key's previous record
+        """
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self._rate_window:
+            skipped = window[2] if window else 0
+            if window is None and len(self._windows) >= MAX_SAMPLE_KEYS:
+                self._windows.clear()
+            self._windows[key] = [now, 1, 0]
+            return skipped
+
+        if window[1] >= self._rate_limit:
+            window[2] += 1
+            self.suppressed += 1
+            if self._metrics:
+                self._metrics.increment("logging.suppressed")
+            return None
+        window[1] += 1
+        return 0
+
+    def _format(self, record: tuple[Any, ...]) -> str:
+        """Format a record in SimpleLogger's layout, followed by its fields."""
+        created, level, message, kwargs, exc = record
+        asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        line = (
+            f"{asctime},{int(created % 1 * 1000):03d} - {self._name} - "
+            f"{logging.getLevelName(level)} - {message}"
+        )
+        if kwargs:
+            line += " " + " ".join(f"{key}={value}" for key, value in kwargs.items())
+        if exc is not None:
+            line += "\n" + "".join(traceback.format_exception(exc)).rstrip()
+        return line + "\n"
+
+    def _run(self) -> None:
+        """Write queued records until the closing sentinel arrives."""
+        while True:
+            record = self._queue.get()
+            batch = [record]
+            # Write whatever else is already queued in one go
+            while record is not None and len(batch) < 512:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(record)
+
+            lines = []
+            for item in batch:
+                if item is not None:
+                    try:
+                        lines.append(self._format(item))
+                    except Exception:
+                        # A field that cannot be formatted must not stop the writer
+                        continue
+            if lines:
+                stream = self._stream or sys.stderr
+                try:
+                    stream.write("".join(lines))
+                    stream.flush()
+                except Exception:
+                    pass
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every queued record is written.
+
+        Returns:
+            Whether the queue was drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline or not self._thread.is_alive():
+                return False
+            time.sleep(0.001)
+        return True
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Write the remaining records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+
+_default_logger: LoggerPort | None = None
+
+
+def get_default_logger() -> LoggerPort:
+    """Get the logger infrastructure components use when none is injected."""
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = AsyncLogger("aegis_sdk")
+    return _default_logger
+
+
+def set_default_logger(logger: LoggerPort | None) -> None:
+    """Replace the default infrastructure logger; None restores the built-in one."""
+    global _default_logger
+    _default_logger = logger
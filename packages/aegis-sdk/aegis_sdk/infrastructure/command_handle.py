@@ -0,0 +1,84 @@
+"""Command handle shared by the message bus adapters.
+
+An adapter keeps the handles of its in-flight commands in
+``_pending_commands`` keyed by command id, feeds them progress and completion
+messages from its command inbox, and publishes cancellation requests through
+``_request_cancel``.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
+
+from ..domain.models import Command
+from ..ports.message_bus import CommandHandle
+
+
+class CommandSender(Protocol):
+    """What a pending command handle needs from the adapter that sent it."""
+
+    _pending_commands: dict[str, "PendingCommandHandle"]
+
+    async def _request_cancel(self, command_id: str, reason: str | None) -> None: ...
+
+
+class PendingCommandHandle(CommandHandle):
+    """Tracks a sent command until it completes or times out."""
+
+    def __init__(self, adapter: CommandSender, command: Command):
+        """Initialize the handle and start the command's timeout."""
+        loop = asyncio.get_running_loop()
+        self.command_id = command.message_id
+        self._adapter = adapter
+        self._future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._updates: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._timer = loop.call_later(command.timeout, self._finish, {"error": "Command timeout"})
+
+    @property
+    def done(self) -> bool:
+        """Whether the final result is available."""
+        return self._future.done()
+
+    async def progress(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate progress updates until the command finishes.
+
+        Updates are queued from the moment the command is sent, so none are
+        missed by starting to iterate late. Intended for a single consumer.
+        """
+        while True:
+            update = await self._updates.get()
+            if update is None:
+                return
+            yield update
+
+    async def result(self) -> dict[str, Any]:
+        """Wait for the completion result (or a timeout error result)."""
+        # Shielded so that a caller giving up does not discard the result
+        return await asyncio.shield(self._future)
+
+    async def cancel(self, reason: str | None = None) -> None:
+        """Ask the handler to stop; the result reports whether it did."""
+        if not self.done:
+            await self._adapter._request_cancel(self.command_id, reason)
+
+    def _on_progress(self, update: dict[str, Any]) -> None:
+        """Queue a progress update from the handler."""
+        if not self.done:
+            self._updates.put_nowait(update)
+
+    def _finish(self, result: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        """Resolve the handle and end the progress stream."""
+        if self.done:
+            return
+        self._timer.cancel()
+        if error is not None:
+            self._future.set_exception(error)
+        else:
+            self._future.set_result(result or {})
+        self._updates.put_nowait(None)
+        self._adapter._pending_commands.pop(self.command_id, None)
+
+    def _discard(self) -> None:
+        """Stop tracking a command that was never sent."""
+        self._timer.cancel()
+        self._adapter._pending_commands.pop(self.command_id, None)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -35,6 +35,14 @@ class NATSConnectionConfig(BaseModel):
         le=10,
         description="Number of connections in the pool",
     )
+    subscription_strategy: Literal["single", "replicate", "hash"] = Field(
+        default="replicate",
+        description=(
+            "How inbound subscriptions use the pool: 'single' keeps them all on the "
+            "first connection, 'replicate' joins the queue group from every "
+            "connection, 'hash' pins each subject to one connection"
+        ),
+    )
     max_reconnect_attempts: int = Field(
         default=10,
         ge=0,
@@ -55,6 +63,27 @@ class NATSConnectionConfig(BaseModel):
         default=True,
         description="Whether to initialize JetStream",
     )
+    publish_window: int = Field(
+        default=256,
+        ge=1,
+        le=4000,
+        description="Maximum batched events waiting for a JetStream PubAck",
+    )
+    publish_flush_size: int = Field(
+        default=64,
+        ge=1,
+        description="Buffered events that trigger sending a batch",
+    )
+    publish_flush_interval: float = Field(
+        default=0.001,
+        gt=0,
+        description="Seconds a buffered event waits before the batch is sent anyway",
+    )
+    publish_ack_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for the PubAck of a batched event",
+    )
 
     # Service identification
     service_name: ServiceName | None = Field(
@@ -71,6 +100,28 @@ class NATSConnectionConfig(BaseModel):
         default=True,
         description="Use MessagePack for serialization (faster than JSON)",
     )
+    header_envelope: bool = Field(
+        default=False,
+        description=(
+            "Publish events with their metadata in NATS headers and only the payload "
+            "in the body, so receivers can route on metadata without decoding"
+        ),
+    )
+    legacy_command_replies: bool = Field(
+        default=True,
+        description=(
+            "Also listen for command progress and completions on the unscoped "
+            "subjects used by handlers that predate reply scopes. Disable once every "
+            "command handler in the deployment sends scoped replies"
+        ),
+    )
+    validate_messages: bool = Field(
+        default=True,
+        description=(
+            "Fully validate incoming messages. Disable only when all peers are "
+            "trusted services using this SDK to skip validation on the hot path"
+        ),
+    )
 
     @field_validator("servers")
     @classmethod
@@ -146,6 +197,16 @@ class KVStoreConfig(BaseModel):
         le=100,
         description="Number of historical revisions to keep",
     )
+    batch_window: int = Field(
+        default=64,
+        ge=1,
+        le=4096,
+        description="Maximum number of in-flight requests for batch operations",
+    )
+    direct_get_batch: bool = Field(
+        default=False,
+        description="Fetch get_many batches with a single multi-subject direct get",
+    )
 
     @field_validator("bucket")
     @classmethod
@@ -8,11 +8,18 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 from ..domain.enums import StickyActiveStatus
+from ..domain.exceptions import (
+    KVKeyAlreadyExistsError,
+    KVKeyNotFoundError,
+    KVRevisionMismatchError,
+)
+from ..domain.models import KVOptions
 from ..domain.value_objects import (
     ElectionState,
     FailoverPolicy,
@@ -23,6 +30,9 @@ from ..ports.kv_store import KVStorePort as KVStore
 from ..ports.logger import LoggerPort
 from ..ports.service_registry import ServiceRegistryPort
 
+# TTL advertised on the leader key; leaders renew well within it
+LEADER_TTL_SECONDS = 5
+
 
 class ElectionCoordinator:
     """Coordinates leader election for sticky active services.
@@ -64,6 +74,9 @@ class ElectionCoordinator:
         self._election_task: asyncio.Task | None = None
         self._on_elected_callback: Callable[[], Any] | None = None
         self._on_lost_callback: Callable[[], Any] | None = None
+        # Revision of the leader key while we hold it, for conditional writes
+        self._leader_revision: int | None = None
+        self._elected_at: str | None = None
 
     def _create_default_logger(self) -> LoggerPort:
         """Create a default logger if none provided."""
@@ -97,7 +110,7 @@ class ElectionCoordinator:
             group_id: Group identifier (should match our group)
         """
         if service_name != str(self._service_name) or group_id != self._group_id:
-            await self._logger.warning(
+            self._logger.warning(
                 "Election triggered for different service/group",
                 requested_service=service_name,
                 requested_group=group_id,
@@ -116,7 +129,7 @@ class ElectionCoordinator:
         """
         # Check if election already in progress
         if self._election_task and not self._election_task.done():
-            await self._logger.warning(
+            self._logger.warning(
                 "Election already in progress",
                 instance=str(self._instance_id),
                 state=self._election_state.state,
@@ -131,7 +144,7 @@ class ElectionCoordinator:
             attempts=0,
         )
 
-        await self._logger.info(
+        self._logger.info(
             "Starting leader election",
             service=str(self._service_name),
             instance=str(self._instance_id),
@@ -148,7 +161,7 @@ class ElectionCoordinator:
             )
             return result
         except asyncio.TimeoutError:
-            await self._logger.error(
+            self._logger.error(
                 "Election timed out",
                 instance=str(self._instance_id),
                 timeout=f"{self._failover_policy.max_election_time.seconds}s",
@@ -185,7 +198,7 @@ class ElectionCoordinator:
             delay = base_delay * (2**attempt) + jitter
 
             if attempt > 0:
-                await self._logger.debug(
+                self._logger.debug(
                     f"Election attempt {attempt + 1}/{max_attempts}",
                     instance=str(self._instance_id),
                     delay=f"{delay:.3f}s",
@@ -206,7 +219,7 @@ class ElectionCoordinator:
                         instance_id=str(self._instance_id),
                     )
 
-                    await self._logger.info(
+                    self._logger.info(
                         "Won leader election",
                         service=str(self._service_name),
                         instance=str(self._instance_id),
@@ -225,7 +238,7 @@ class ElectionCoordinator:
                             if asyncio.iscoroutine(result):
                                 await result
                         except Exception as e:
-                            await self._logger.error(
+                            self._logger.error(
                                 f"Error in on_elected callback: {e}",
                                 instance=str(self._instance_id),
                             )
@@ -234,7 +247,7 @@ class ElectionCoordinator:
 
                 else:
                     # Someone else won
-                    await self._logger.info(
+                    self._logger.info(
                         "Lost leader election",
                         service=str(self._service_name),
                         instance=str(self._instance_id),
@@ -243,7 +256,7 @@ class ElectionCoordinator:
                     )
 
             except Exception as e:
-                await self._logger.error(
+                self._logger.error(
                     f"Election attempt failed: {e}",
                     instance=str(self._instance_id),
                     attempt=attempt + 1,
@@ -266,7 +279,7 @@ class ElectionCoordinator:
             instance_id=str(self._instance_id),
         )
 
-        await self._logger.error(
+        self._logger.error(
             "Failed to win election after all attempts",
             instance=str(self._instance_id),
             attempts=max_attempts,
@@ -277,82 +290,106 @@ class ElectionCoordinator:
     async def _try_acquire_leadership(self) -> bool:
         """Try to atomically acquire the leader key.
 
+        The create is attempted directly; the key is only read when it
+        already exists, to find out whether we hold it from an earlier term.
+
         Returns:
             True if leadership acquired, False otherwise
         """
         leader_key = self._get_leader_key()
 
         try:
-            # Check if leader key already exists
-            current_leader = await self._kv_store.get(leader_key)
-
-            if current_leader:
-                # Leader exists - check if it's us
-                leader_data = (
-                    current_leader.value if hasattr(current_leader, "value") else current_leader
-                )
-                leader_id = (
-                    leader_data.get("instance_id") if isinstance(leader_data, dict) else None
-                )
-                if leader_id == str(self._instance_id):
-                    # We're already the leader
-                    await self._logger.debug(
-                        "Already the leader",
-                        instance=str(self._instance_id),
-                    )
-                    return True
-                else:
-                    # Someone else is leader
-                    await self._logger.debug(
-                        f"Leader exists: {leader_id}",
-                        instance=str(self._instance_id),
-                    )
-                    return False
-
-            # No leader exists - try to become leader
-            leader_data = {
-                "instance_id": str(self._instance_id),
-                "service_name": str(self._service_name),
-                "group_id": self._group_id,
-                "elected_at": datetime.now(UTC).isoformat(),
-                "ttl": 5,  # 5 second TTL
-            }
-
-            # Import KVOptions for create_only flag
-            from ..domain.models import KVOptions
-
             # Use create_only option for atomic CAS operation
-            options = KVOptions(create_only=True, ttl=5)
+            options = KVOptions(create_only=True, ttl=LEADER_TTL_SECONDS)
+            self._elected_at = datetime.now(UTC).isoformat()
 
             try:
-                await self._kv_store.put(leader_key, leader_data, options)
-                await self._logger.debug(
+                revision = await self._kv_store.put(leader_key, self._leader_value(), options)
+                self._leader_revision = revision if isinstance(revision, int) else None
+                self._logger.debug(
                     "Successfully acquired leader key",
                     instance=str(self._instance_id),
                     key=leader_key,
                 )
                 return True
             except Exception as e:
-                # Check if it's a key already exists error
-                if "already exists" in str(e).lower() or "duplicate" in str(e).lower():
-                    await self._logger.debug(
-                        "Failed to acquire leader key (lost race)",
-                        instance=str(self._instance_id),
-                        key=leader_key,
-                    )
-                    return False
-                else:
-                    # Re-raise other errors
+                # Anything other than an existing key is a real failure
+                if not isinstance(e, KVKeyAlreadyExistsError) and not (
+                    "already exists" in str(e).lower() or "duplicate" in str(e).lower()
+                ):
                     raise
 
+            # Leader exists - check if it's us
+            current_leader = await self._kv_store.get(leader_key)
+            leader_data = (
+                current_leader.value if hasattr(current_leader, "value") else current_leader
+            )
+            leader_id = leader_data.get("instance_id") if isinstance(leader_data, dict) else None
+
+            if leader_id == str(self._instance_id):
+                # We're already the leader
+                self._leader_revision = getattr(current_leader, "revision", None)
+                self._logger.debug(
+                    "Already the leader",
+                    instance=str(self._instance_id),
+                )
+                return True
+
+            # Someone else is leader, or won the race
+            self._logger.debug(
+                f"Failed to acquire leader key, leader is {leader_id}",
+                instance=str(self._instance_id),
+                key=leader_key,
+            )
+            return False
+
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Error acquiring leader key: {e}",
                 instance=str(self._instance_id),
                 key=leader_key,
             )
             raise
 
+    async def renew_leadership(self) -> bool:
+        """Renew the leader key with a single conditional write.
+
+        The write only succeeds if the key is still at the revision we last
+        wrote. A mismatch means the key expired or another instance took it
+        over, and we step down immediately.
+
+        Returns:
+            True if the key was renewed, False otherwise
+        """
+        if not self.is_elected() or self._leader_revision is None:
+            return False
+
+        leader_key = self._get_leader_key()
+        options = KVOptions(
+            update_only=True, revision=self._leader_revision, ttl=LEADER_TTL_SECONDS
+        )
+
+        try:
+            self._leader_revision = await self._kv_store.put(
+                leader_key, self._leader_value(), options
+            )
+            return True
+        except (KVRevisionMismatchError, KVKeyNotFoundError) as e:
+            self._logger.warning(
+                f"Leader key changed, stepping down: {e}",
+                instance=str(self._instance_id),
+                key=leader_key,
+            )
+            await self._step_down()
+            return False
+        except Exception as e:
+            self._logger.error(
+                f"Failed to renew leadership: {e}",
+                instance=str(self._instance_id),
+                key=leader_key,
+            )
+            return False
+
     async def release_leadership(self) -> None:
         """Release leadership voluntarily."""
         leader_key = self._get_leader_key()
@@ -369,37 +406,61 @@ class ElectionCoordinator:
                 )
 
                 if leader_id == str(self._instance_id):
-                    # Delete the leader key
-                    await self._kv_store.delete(leader_key)
+                    # Only delete the revision we read, never a successor's key
+                    await self._kv_store.delete(
+                        leader_key, getattr(current_leader, "revision", None)
+                    )
 
-                    await self._logger.info(
+                    self._logger.info(
                         "Released leadership",
                         service=str(self._service_name),
                         instance=str(self._instance_id),
                         group=self._group_id,
                     )
 
-                    # Update our status
-                    await self._update_instance_status(StickyActiveStatus.STANDBY.value)
-
-                    # Invoke callback if set
-                    if self._on_lost_callback:
-                        try:
-                            result = self._on_lost_callback()
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except Exception as e:
-                            await self._logger.error(
-                                f"Error in on_lost callback: {e}",
-                                instance=str(self._instance_id),
-                            )
+                    await self._step_down()
 
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Error releasing leadership: {e}",
                 instance=str(self._instance_id),
             )
 
+    async def _step_down(self) -> None:
+        """Give up leadership locally and notify listeners."""
+        self._leader_revision = None
+        if self._election_state.is_elected():
+            self._election_state = ElectionState(
+                state=ElectionState.IDLE,
+                instance_id=str(self._instance_id),
+            )
+
+        # Update our status
+        await self._update_instance_status(StickyActiveStatus.STANDBY.value)
+
+        # Invoke callback if set
+        if self._on_lost_callback:
+            try:
+                result = self._on_lost_callback()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self._logger.error(
+                    f"Error in on_lost callback: {e}",
+                    instance=str(self._instance_id),
+                )
+
+    def _leader_value(self) -> dict[str, Any]:
+        """Build the leader key value, stamped with the current heartbeat."""
+        return {
+            "instance_id": str(self._instance_id),
+            "service_name": str(self._service_name),
+            "group_id": self._group_id,
+            "elected_at": self._elected_at or datetime.now(UTC).isoformat(),
+            "last_heartbeat": time.time(),
+            "ttl": LEADER_TTL_SECONDS,
+        }
+
     async def _update_instance_status(self, sticky_status: str) -> None:
         """Update instance status in the service registry.
 
@@ -420,20 +481,20 @@ class ElectionCoordinator:
                 # Update in registry
                 await self._service_registry.update_instance(instance)
 
-                await self._logger.debug(
+                self._logger.debug(
                     f"Updated instance status to {sticky_status}",
                     service=str(self._service_name),
                     instance=str(self._instance_id),
                 )
             else:
-                await self._logger.warning(
+                self._logger.warning(
                     "Instance not found in registry",
                     service=str(self._service_name),
                     instance=str(self._instance_id),
                 )
 
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Failed to update instance status: {e}",
                 instance=str(self._instance_id),
                 new_status=sticky_status,
@@ -483,7 +544,7 @@ class ElectionCoordinator:
                 return leader_id == str(self._instance_id)
             return False
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Error checking leadership: {e}",
                 instance=str(self._instance_id),
             )
@@ -0,0 +1,658 @@
+"""Shared leader election for many sticky-active groups in one process.
+
+A process hosting many sticky-active groups (for example one per instrument
+shard) would otherwise run an election coordinator, a heartbeat monitor and a
+renewal timer per group. ElectionScheduler owns every group of a service
+instance instead: one prefix watch follows all leader keys of the service and
+one timer renews leadership and contests vacant groups.
+
+Leadership is tied to a per-instance lease key. A leader key names the
+instance holding it and is only written on acquisition; the holder keeps all
+of its groups alive by renewing its lease once per tick. Standbys track one
+deadline per leader instance, and when a lease lapses they take over that
+instance's groups with compare-and-set writes at the last observed revision.
+KV writes per tick therefore do not grow with the number of groups held, and
+standbys issue none at all.
+
+A leader does not wait for a renewal to fail before giving up: a local timer
+steps it down half a renewal interval before its lease could lapse, so a
+renewal stuck in a partition cannot leave it leading next to the standby that
+takes over. Renewals time out by that same deadline.
+
+All instances of a service must use the scheduler for its groups: the leader
+keys it writes carry no running heartbeat, so a per-group HeartbeatMonitor
+would consider them stale. FailoverMonitoringUseCase runs its groups through
+a scheduler when created with ``shared_elections=True``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from ..domain.exceptions import (
+    KVKeyAlreadyExistsError,
+    KVKeyNotFoundError,
+    KVRevisionMismatchError,
+)
+from ..domain.models import KVOptions, KVWatchEvent
+from ..domain.value_objects import FailoverPolicy, InstanceId, ServiceName
+from ..ports.kv_store import KVStorePort as KVStore
+from ..ports.logger import LoggerPort
+from .election_coordinator import LEADER_TTL_SECONDS
+
+GroupCallback = Callable[[str], Any]
+
+
+class _GroupState:
+    """Election bookkeeping for one sticky-active group."""
+
+    def __init__(
+        self,
+        group_id: str,
+        on_elected: GroupCallback | None = None,
+        on_lost: GroupCallback | None = None,
+    ) -> None:
+        self.group_id = group_id
+        self.on_elected = on_elected
+        self.on_lost = on_lost
+        # Leader as last seen on the watch, and the leader key revision
+        self.leader_id: str | None = None
+        self.revision: int | None = None
+        self.held = False
+        self.acquiring = False
+
+
+class ElectionScheduler:
+    """Runs leader elections for all sticky-active groups of an instance.
+
+    Groups are registered with per-group callbacks that fire when this
+    instance wins or loses the group.
+    """
+
+    def __init__(
+        self,
+        kv_store: KVStore,
+        service_name: ServiceName,
+        instance_id: InstanceId,
+        failover_policy: FailoverPolicy | None = None,
+        logger: LoggerPort | None = None,
+        lease_ttl_seconds: float = LEADER_TTL_SECONDS,
+    ) -> None:
+        """Initialize election scheduler.
+
+        Args:
+            kv_store: KV Store for leader and lease keys
+            service_name: Service name participating in elections
+            instance_id: This instance's identifier
+            failover_policy: Failover behavior configuration
+            logger: Logger for election events
+            lease_ttl_seconds: Time after which an unrenewed lease has lapsed
+        """
+        self._kv_store = kv_store
+        self._service_name = service_name
+        self._instance_id = str(instance_id)
+        self._failover_policy = failover_policy or FailoverPolicy.balanced()
+        self._logger = logger or self._create_default_logger()
+        self._lease_ttl = lease_ttl_seconds
+        self._renew_interval = lease_ttl_seconds / 3
+        self._lease_margin = self._renew_interval / 2
+        self._prefix = f"sticky-active.{service_name.value}."
+
+        self._groups: dict[str, _GroupState] = {}
+        self._held: set[str] = set()
+        # Groups to contest, with the loop time at which to contest them
+        self._vacant: dict[str, float] = {}
+        # Groups held by other instances, and when their leases lapse
+        self._led_by: dict[str, set[str]] = {}
+        self._lease_deadlines: dict[str, float] = {}
+
+        self._lease_revision: int | None = None
+        self._lease_renewed_at = 0.0
+        self._next_renewal = 0.0
+        self._lease_expiry: asyncio.TimerHandle | None = None
+        self._expiry_tasks: set[asyncio.Task] = set()
+        self._synced = False
+        self._wake = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def _create_default_logger(self) -> LoggerPort:
+        """Create a default logger if none provided."""
+        from .simple_logger import SimpleLogger
+
+        return SimpleLogger()
+
+    def add_group(
+        self,
+        group_id: str,
+        on_elected: GroupCallback | None = None,
+        on_lost: GroupCallback | None = None,
+    ) -> None:
+        """Register a group to run elections for.
+
+        Args:
+            group_id: Sticky active group identifier
+            on_elected: Called with the group ID when this instance wins it
+            on_lost: Called with the group ID when this instance loses it
+
+        Raises:
+            ValueError: If the group is already registered
+        """
+        if group_id in self._groups:
+            raise ValueError(f"Group {group_id} is already registered")
+
+        self._groups[group_id] = _GroupState(group_id, on_elected, on_lost)
+        self._vacant[group_id] = asyncio.get_running_loop().time()
+        self._wake.set()
+
+    async def remove_group(self, group_id: str) -> None:
+        """Stop running elections for a group, releasing it if held.
+
+        Args:
+            group_id: Sticky active group identifier
+        """
+        state = self._groups.pop(group_id, None)
+        if state is None:
+            return
+
+        self._vacant.pop(group_id, None)
+        if state.leader_id in self._led_by:
+            self._led_by[state.leader_id].discard(group_id)
+        if state.held:
+            await self._release(state)
+
+    def is_leader(self, group_id: str) -> bool:
+        """Check if this instance currently leads a group.
+
+        Args:
+            group_id: Sticky active group identifier
+
+        Returns:
+            True if this instance holds the group, False otherwise
+        """
+        return group_id in self._held
+
+    def get_leader(self, group_id: str) -> str | None:
+        """Get the instance currently leading a group, as last observed.
+
+        Args:
+            group_id: Sticky active group identifier
+
+        Returns:
+            Leader instance ID, or None if the group is vacant or unknown
+        """
+        state = self._groups.get(group_id)
+        return state.leader_id if state else None
+
+    def held_groups(self) -> list[str]:
+        """Get the groups this instance currently leads.
+
+        Returns:
+            Sorted list of group IDs
+        """
+        return sorted(self._held)
+
+    async def start(self) -> None:
+        """Start the shared watch and election timer."""
+        if self._tasks:
+            return
+
+        self._stop_event.clear()
+        self._tasks = [
+            asyncio.create_task(self._watch_loop()),
+            asyncio.create_task(self._tick_loop()),
+        ]
+
+        self._logger.info(
+            "Started election scheduler",
+            service=self._service_name.value,
+            instance=self._instance_id,
+            groups=len(self._groups),
+        )
+
+    async def stop(self) -> None:
+        """Stop scheduling and release every held group and the lease."""
+        self._stop_event.set()
+        self._wake.set()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._disarm_lease_expiry()
+        if self._expiry_tasks:
+            await asyncio.gather(*self._expiry_tasks, return_exceptions=True)
+
+        lease_revision = self._lease_revision
+        held = [self._groups[group_id] for group_id in list(self._held)]
+        await asyncio.gather(*(self._release(state) for state in held))
+
+        if lease_revision is not None:
+            with contextlib.suppress(Exception):
+                await self._kv_store.delete(self._lease_key(), lease_revision)
+
+        self._logger.info(
+            "Stopped election scheduler",
+            service=self._service_name.value,
+            instance=self._instance_id,
+        )
+
+    async def _pause(self, seconds: float) -> None:
+        """Sleep for the given time unless scheduling is stopped first."""
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), seconds)
+
+    async def _watch_loop(self) -> None:
+        """Follow all leader and lease keys of the service."""
+        while not self._stop_event.is_set():
+            try:
+                async for event in self._kv_store.watch(
+                    prefix=self._prefix, on_synced=self._on_synced
+                ):
+                    await self._handle_event(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error(
+                    f"Election watch failed: {e}",
+                    service=self._service_name.value,
+                    instance=self._instance_id,
+                )
+
+            # The watch ended; re-establish it shortly
+            await self._pause(self._renew_interval)
+
+    def _on_synced(self) -> None:
+        """Allow contests once the current leaders have been replayed."""
+        self._synced = True
+        self._wake.set()
+
+    async def _tick_loop(self) -> None:
+        """Renew the lease and contest groups, sleeping until the next due time."""
+        loop = asyncio.get_running_loop()
+        while not self._stop_event.is_set():
+            try:
+                await self._tick()
+            except Exception as e:
+                self._logger.error(
+                    f"Election tick failed: {e}",
+                    service=self._service_name.value,
+                    instance=self._instance_id,
+                )
+
+            self._wake.clear()
+            timeout = max(self._next_wake(loop.time()) - loop.time(), 0)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout)
+
+    async def _tick(self) -> None:
+        """Run one scheduling round for every group."""
+        now = asyncio.get_running_loop().time()
+
+        if self._held and now >= self._next_renewal:
+            await self._renew_lease()
+
+        if not self._synced:
+            return
+
+        # Groups whose leader's lease lapsed become vacant
+        for leader_id, groups in list(self._led_by.items()):
+            if groups and self._lease_deadlines.get(leader_id, now) <= now:
+                self._logger.warning(
+                    "Leader lease lapsed",
+                    service=self._service_name.value,
+                    leader=leader_id,
+                    groups=len(groups),
+                )
+                contest_at = now + self._failover_policy.election_delay.seconds
+                for group_id in groups:
+                    self._vacant[group_id] = contest_at
+                del self._led_by[leader_id]
+                self._lease_deadlines.pop(leader_id, None)
+
+        contested = [
+            self._groups[group_id]
+            for group_id, contest_at in list(self._vacant.items())
+            if contest_at <= now and self._is_contestable(group_id, now)
+        ]
+        if contested:
+            await self._ensure_lease()
+            await asyncio.gather(*(self._acquire(state) for state in contested))
+
+    def _next_wake(self, now: float) -> float:
+        """Get the loop time at which the next renewal or contest is due."""
+        wake = now + self._renew_interval
+        if self._held:
+            wake = min(wake, self._next_renewal)
+        if self._vacant:
+            wake = min(wake, min(self._vacant.values()))
+        for leader_id, groups in self._led_by.items():
+            if groups:
+                wake = min(wake, self._lease_deadlines.get(leader_id, now))
+        return wake
+
+    def _is_contestable(self, group_id: str, now: float) -> bool:
+        """Check that a vacant group is not held by us or a live leader."""
+        state = self._groups.get(group_id)
+        if state is None:
+            self._vacant.pop(group_id, None)
+            return False
+        if state.held or state.acquiring:
+            return False
+        leader_id = state.leader_id
+        if leader_id is None or leader_id == self._instance_id:
+            return True
+        return self._lease_deadlines.get(leader_id, now) <= now
+
+    async def _handle_event(self, event: KVWatchEvent) -> None:
+        """Dispatch a change to a leader or lease key.
+
+        Args:
+            event: Change to a key under the service prefix
+        """
+        key = event.key or (event.entry.key if event.entry else None)
+        if not key or not key.startswith(self._prefix):
+            return
+
+        value = event.entry.value if event.operation == "PUT" and event.entry else None
+        if key.endswith(".lease"):
+            self._observe_lease(key[len(self._prefix) : -len(".lease")], value)
+            return
+
+        if not key.endswith(".leader"):
+            return
+        state = self._groups.get(key[len(self._prefix) : -len(".leader")])
+        if state is None:
+            return
+
+        leader_id = value.get("instance_id") if isinstance(value, dict) else None
+        revision = event.entry.revision if leader_id and event.entry else None
+        await self._observe_leader(state, leader_id, revision)
+
+    def _observe_lease(self, instance_id: str, value: Any) -> None:
+        """Move another instance's lease deadline.
+
+        Args:
+            instance_id: Instance owning the lease
+            value: Lease value, or None if the lease was deleted
+        """
+        if instance_id == self._instance_id:
+            return
+
+        now = asyncio.get_running_loop().time()
+        if not isinstance(value, dict):
+            self._lease_deadlines[instance_id] = now
+        elif self._synced:
+            self._lease_deadlines[instance_id] = now + self._lease_ttl
+        else:
+            # Replayed leases may be long dead; judge them by their own stamp
+            remaining = float(value.get("last_heartbeat", 0)) + self._lease_ttl - time.time()
+            self._lease_deadlines[instance_id] = now + max(remaining, 0.0)
+        self._wake.set()
+
+    async def _observe_leader(
+        self, state: _GroupState, leader_id: str | None, revision: int | None
+    ) -> None:
+        """Track the leader of a group from a watch event.
+
+        Args:
+            state: Group whose leader key changed
+            leader_id: New leader, or None if the key was deleted
+            revision: Revision of the leader key
+        """
+        group_id = state.group_id
+        if state.leader_id in self._led_by:
+            self._led_by[state.leader_id].discard(group_id)
+
+        if state.held and state.revision == revision and leader_id == self._instance_id:
+            return
+
+        state.leader_id = leader_id
+        state.revision = revision
+        if state.held:
+            await self._step_down(state, "Leader key changed by another writer")
+
+        now = asyncio.get_running_loop().time()
+        if leader_id is None:
+            self._vacant[group_id] = now + self._failover_policy.election_delay.seconds
+        elif leader_id == self._instance_id:
+            if not state.acquiring:
+                # Left over from an earlier run of this instance
+                self._vacant[group_id] = now
+        else:
+            self._vacant.pop(group_id, None)
+            self._led_by.setdefault(leader_id, set()).add(group_id)
+            # Give a leader whose lease we have not seen yet one TTL of grace
+            self._lease_deadlines.setdefault(leader_id, now + self._lease_ttl)
+        self._wake.set()
+
+    async def _ensure_lease(self) -> None:
+        """Create this instance's lease before it claims any group."""
+        if self._lease_revision is not None:
+            return
+
+        self._lease_revision = await self._kv_store.put(
+            self._lease_key(), self._lease_value(), self._lease_options()
+        )
+        now = asyncio.get_running_loop().time()
+        self._lease_renewed_at = now
+        self._next_renewal = now + self._renew_interval
+        self._arm_lease_expiry()
+
+    async def _renew_lease(self) -> None:
+        """Renew the lease covering every held group with one conditional write."""
+        now = asyncio.get_running_loop().time()
+        self._next_renewal = now + self._renew_interval
+        lease_revision = self._lease_revision
+        if lease_revision is None:
+            await self._step_down_all("Lease missing")
+            return
+
+        options = self._lease_options(update_only=True, revision=lease_revision)
+        try:
+            # Give up on the write by the time the lease expiry steps us down
+            revision = await asyncio.wait_for(
+                self._kv_store.put(self._lease_key(), self._lease_value(), options),
+                max(self._lease_deadline() - now, 0.0),
+            )
+        except (KVRevisionMismatchError, KVKeyNotFoundError) as e:
+            await self._step_down_all(f"Lease changed by another writer: {e}")
+            return
+        except Exception as e:
+            self._logger.error(
+                f"Failed to renew lease: {e}",
+                service=self._service_name.value,
+                instance=self._instance_id,
+            )
+            return
+
+        if self._lease_revision != lease_revision:
+            # Stepped down while the write was in flight; do not revive the lease
+            with contextlib.suppress(Exception):
+                await self._kv_store.delete(self._lease_key(), revision)
+            return
+
+        self._lease_revision = revision
+        self._lease_renewed_at = now
+        self._arm_lease_expiry()
+
+    def _lease_deadline(self) -> float:
+        """Get the loop time by which this instance must consider its lease lost."""
+        return self._lease_renewed_at + self._lease_ttl - self._lease_margin
+
+    def _arm_lease_expiry(self) -> None:
+        """Schedule the local step-down for the current lease deadline."""
+        self._disarm_lease_expiry()
+        loop = asyncio.get_running_loop()
+        self._lease_expiry = loop.call_at(self._lease_deadline(), self._expire_lease)
+
+    def _disarm_lease_expiry(self) -> None:
+        """Cancel the pending local step-down, if any."""
+        if self._lease_expiry:
+            self._lease_expiry.cancel()
+            self._lease_expiry = None
+
+    def _expire_lease(self) -> None:
+        """Step down from every group once the lease went unrenewed too long."""
+        self._lease_expiry = None
+        if not self._held:
+            return
+        task = asyncio.create_task(self._step_down_all("Lease lapsed"))
+        self._expiry_tasks.add(task)
+        task.add_done_callback(self._expiry_tasks.discard)
+
+    async def _acquire(self, state: _GroupState) -> None:
+        """Try to take a vacant group.
+
+        Args:
+            state: Group to claim
+        """
+        group_id = state.group_id
+        self._vacant.pop(group_id, None)
+        state.acquiring = True
+        try:
+            if state.revision is None:
+                options = KVOptions(create_only=True)
+            else:
+                # Take over from a lapsed leader at the revision we observed
+                options = KVOptions(revision=state.revision)
+
+            revision = await self._kv_store.put(
+                self._leader_key(group_id), self._leader_value(group_id), options
+            )
+        except (KVKeyAlreadyExistsError, KVRevisionMismatchError):
+            # Another instance got there first; the watch reports who
+            return
+        except Exception as e:
+            self._logger.error(
+                f"Failed to claim group: {e}",
+                service=self._service_name.value,
+                instance=self._instance_id,
+                group=group_id,
+            )
+            self._vacant[group_id] = asyncio.get_running_loop().time() + self._renew_interval
+            return
+        finally:
+            state.acquiring = False
+
+        if self._groups.get(group_id) is not state:
+            return
+
+        state.held = True
+        state.leader_id = self._instance_id
+        state.revision = revision
+        self._held.add(group_id)
+
+        self._logger.info(
+            "Won leader election",
+            service=self._service_name.value,
+            instance=self._instance_id,
+            group=group_id,
+        )
+        await self._notify(state.on_elected, group_id)
+
+    async def _release(self, state: _GroupState) -> None:
+        """Delete a held leader key, provided nobody has replaced it.
+
+        Args:
+            state: Held group to give up
+        """
+        try:
+            await self._kv_store.delete(self._leader_key(state.group_id), state.revision)
+        except Exception as e:
+            self._logger.error(
+                f"Error releasing group: {e}",
+                instance=self._instance_id,
+                group=state.group_id,
+            )
+        await self._step_down(state, "Released leadership")
+
+    async def _step_down_all(self, reason: str) -> None:
+        """Give up every held group locally.
+
+        Args:
+            reason: Why leadership was lost
+        """
+        self._lease_revision = None
+        self._disarm_lease_expiry()
+        for group_id in list(self._held):
+            await self._step_down(self._groups[group_id], reason)
+
+    async def _step_down(self, state: _GroupState, reason: str) -> None:
+        """Give up a group locally and notify its listener.
+
+        Args:
+            state: Group no longer held
+            reason: Why leadership was lost
+        """
+        state.held = False
+        self._held.discard(state.group_id)
+        if not self._held and self._lease_revision is not None:
+            # Nothing left to cover; a fresh lease is taken for the next claim
+            lease_revision, self._lease_revision = self._lease_revision, None
+            self._disarm_lease_expiry()
+            with contextlib.suppress(Exception):
+                await self._kv_store.delete(self._lease_key(), lease_revision)
+
+        self._logger.warning(
+            reason,
+            service=self._service_name.value,
+            instance=self._instance_id,
+            group=state.group_id,
+        )
+        await self._notify(state.on_lost, state.group_id)
+
+    async def _notify(self, callback: GroupCallback | None, group_id: str) -> None:
+        """Invoke a group callback, awaiting it if it is a coroutine."""
+        if callback is None:
+            return
+        try:
+            result = callback(group_id)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            self._logger.error(
+                f"Error in election callback: {e}",
+                instance=self._instance_id,
+                group=group_id,
+            )
+
+    def _lease_options(self, update_only: bool = False, revision: int | None = None) -> KVOptions:
+        """Build options for writing the lease key."""
+        return KVOptions(
+            update_only=update_only, revision=revision, ttl=max(1, math.ceil(self._lease_ttl))
+        )
+
+    def _lease_value(self) -> dict[str, Any]:
+        """Build the lease value, stamped with the current time."""
+        return {
+            "instance_id": self._instance_id,
+            "service_name": self._service_name.value,
+            "last_heartbeat": time.time(),
+            "ttl": self._lease_ttl,
+        }
+
+    def _leader_value(self, group_id: str) -> dict[str, Any]:
+        """Build the leader key value for a group."""
+        return {
+            "instance_id": self._instance_id,
+            "service_name": self._service_name.value,
+            "group_id": group_id,
+            "elected_at": datetime.now(UTC).isoformat(),
+            "lease": self._lease_key(),
+        }
+
+    def _leader_key(self, group_id: str) -> str:
+        """Get the leader key for a group."""
+        return f"{self._prefix}{group_id}.leader"
+
+    def _lease_key(self) -> str:
+        """Get this instance's lease key."""
+        return f"{self._prefix}{self._instance_id}.lease"
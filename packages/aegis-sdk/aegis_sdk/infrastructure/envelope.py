@@ -0,0 +1,159 @@
+"""Header envelope: event metadata in NATS headers, payload as the raw body.
+
+In the envelope format an event's routing and trace fields travel as
+``Aegis-*`` message headers and the body holds only the encoded payload. The
+``Aegis-Envelope`` header marks such messages and names the payload encoding.
+Receivers decode them into an Event, or, for subscriptions that opt in, wrap
+them in an EventView, which reads metadata straight from the headers and
+decodes the body only when the payload is first accessed.
+"""
+
+import json
+from typing import Any
+
+import msgpack
+from pydantic_core import to_jsonable_python
+
+from ..domain.exceptions import SerializationError
+from ..domain.models import Event
+from .serialization import get_codec
+
+# Marks an envelope message; the value is the payload encoding
+ENVELOPE_HEADER = "Aegis-Envelope"
+
+# Event fields carried as headers
+EVENT_HEADERS = {
+    "message_id": "Aegis-Message-Id",
+    "trace_id": "Aegis-Trace-Id",
+    "correlation_id": "Aegis-Correlation-Id",
+    "timestamp": "Aegis-Timestamp",
+    "source": "Aegis-Source",
+    "target": "Aegis-Target",
+    "domain": "Aegis-Domain",
+    "event_type": "Aegis-Event-Type",
+    "version": "Aegis-Version",
+}
+
+_REQUIRED_HEADERS = (
+    EVENT_HEADERS["message_id"],
+    EVENT_HEADERS["domain"],
+    EVENT_HEADERS["event_type"],
+)
+
+
+def encode_event(event: Event, use_msgpack: bool = True) -> tuple[dict[str, str], bytes]:
+    """Encode an event as envelope headers and a payload-only body."""
+    headers = {ENVELOPE_HEADER: "msgpack" if use_msgpack else "json"}
+    for field, header in EVENT_HEADERS.items():
+        value = getattr(event, field)
+        if value is not None:
+            headers[header] = value
+    try:
+        if use_msgpack:
+            body = msgpack.packb(event.payload, use_bin_type=True, default=to_jsonable_python)
+        else:
+            body = json.dumps(event.payload, default=to_jsonable_python).encode()
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize event payload: {e}") from e
+    return headers, bytes(body)
+
+
+def is_envelope(headers: dict[str, str] | None) -> bool:
+    """Whether a message's headers mark it as an envelope message."""
+    return bool(headers) and ENVELOPE_HEADER in headers  # type: ignore[operator]
+
+
+def _header_field(field: str, default: str | None = None) -> property:
+    """Expose an event field stored in a header."""
+    header = EVENT_HEADERS[field]
+
+    def getter(self: "EventView") -> str | None:
+        return self._headers.get(header, default)
+
+    return property(getter, doc=f"The event's {field}, read from the {header} header.")
+
+
+class EventView:
+    """Read-only event backed by envelope headers and an undecoded body.
+
+    Metadata attributes are read from the message headers, so consumers can
+    filter on them without decoding anything. ``payload`` decodes the body on
+    first access and caches it; ``raw_payload`` exposes the encoded body as a
+    ``memoryview`` without copying. ``to_event`` builds a full Event.
+    """
+
+    __slots__ = ("_data", "_headers", "_payload")
+
+    message_id = _header_field("message_id")
+    trace_id = _header_field("trace_id")
+    correlation_id = _header_field("correlation_id")
+    timestamp = _header_field("timestamp")
+    source = _header_field("source")
+    target = _header_field("target")
+    domain = _header_field("domain")
+    event_type = _header_field("event_type")
+    version = _header_field("version", "1.0")
+
+    def __init__(self, headers: dict[str, str], data: bytes):
+        """Wrap an envelope message.
+
+        Args:
+            headers: Message headers, including the envelope header
+            data: Encoded payload
+        """
+        missing = [header for header in _REQUIRED_HEADERS if header not in headers]
+        if missing:
+            raise SerializationError(f"Envelope is missing headers: {', '.join(missing)}")
+        self._headers = headers
+        self._data = data
+        self._payload: dict[str, Any] | None = None
+
+    @property
+    def raw_payload(self) -> memoryview:
+        """The encoded payload, without decoding or copying it."""
+        return memoryview(self._data)
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """The decoded payload; decoded on first access."""
+        if self._payload is None:
+            try:
+                if self._headers[ENVELOPE_HEADER] == "json":
+                    payload = json.loads(self._data) if self._data else {}
+                else:
+                    payload = msgpack.unpackb(self._data, raw=False) if self._data else {}
+            except Exception as e:
+                raise SerializationError(f"Failed to deserialize event payload: {e}") from e
+            if not isinstance(payload, dict):
+                raise SerializationError("Event payload must be a mapping")
+            self._payload = payload
+        return self._payload
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the payload has been decoded."""
+        return self._payload is not None
+
+    def to_event(self, validate: bool = True) -> Event:
+        """Decode the whole message into an Event.
+
+        Args:
+            validate: Run full model validation (disable only for trusted peers)
+        """
+        data: dict[str, Any] = {
+            field: self._headers[header]
+            for field, header in EVENT_HEADERS.items()
+            if header in self._headers
+        }
+        data["payload"] = self.payload
+        try:
+            event: Event = get_codec(Event).from_dict(data, validate)
+        except Exception as e:
+            raise SerializationError(f"Invalid event envelope: {e}") from e
+        return event
+
+    def __repr__(self) -> str:
+        return (
+            f"EventView(domain={self.domain!r}, event_type={self.event_type!r}, "
+            f"message_id={self.message_id!r})"
+        )
@@ -0,0 +1,175 @@
+"""Windowed asynchronous JetStream publishing for events."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from nats.js import JetStreamContext
+
+from ..domain.models import Event
+from ..domain.patterns import SubjectPatterns
+from ..ports.metrics import CounterHandle, MetricsPort
+
+# Header JetStream uses to drop messages it has already stored
+MSG_ID_HEADER = "Nats-Msg-Id"
+
+
+class JetStreamEventPublisher:
+    """Publishes events to JetStream without waiting for each PubAck.
+
+    ``publish`` buffers an event and returns a future that resolves once the
+    stream has stored it. The buffer is sent when it holds ``flush_size``
+    events, or ``flush_interval`` seconds after the first of them arrived. At
+    most ``max_pending`` events are buffered or waiting for their PubAck at a
+    time; further publishes wait for acks to come back. Every event carries its
+    message id as ``Nats-Msg-Id``, so the stream drops duplicates when a batch
+    is published again after a partial failure.
+    """
+
+    def __init__(
+        self,
+        jetstream_for: Callable[[str], JetStreamContext | None],
+        encode: Callable[[Event], tuple[dict[str, str], bytes]],
+        metrics: MetricsPort,
+        max_pending: int = 256,
+        flush_size: int = 64,
+        flush_interval: float = 0.001,
+        ack_timeout: float = 5.0,
+    ):
+        """Initialize the publisher.
+
+        Args:
+            jetstream_for: Returns the JetStream context that owns a subject
+            encode: Encodes an event as message headers and body
+            metrics: Metrics port for publish counters
+            max_pending: Maximum events buffered or waiting for a PubAck
+            flush_size: Buffered events that trigger sending them
+            flush_interval: Seconds before a partial buffer is sent
+            ack_timeout: Seconds to wait for each PubAck
+        """
+        self._jetstream_for = jetstream_for
+        self._encode = encode
+        self._metrics = metrics
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._ack_timeout = ack_timeout
+        self._window = asyncio.Semaphore(max_pending)
+        self._buffer: list[tuple[Event, asyncio.Future[None]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._pending: set[asyncio.Future[None]] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._published: dict[tuple[str, str], CounterHandle] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of events buffered or waiting for their PubAck."""
+        return len(self._pending)
+
+    async def publish(self, event: Event) -> asyncio.Future[None]:
+        """Queue an event for publishing.
+
+        Waits while the window is full, sending the buffer first so the
+        events holding the window can be acknowledged.
+
+        Returns:
+            Future that resolves when the stream has stored the event
+        """
+        if self._window.locked():
+            await self.flush()
+        await self._window.acquire()
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._release)
+        self._buffer.append((event, future))
+
+        if len(self._buffer) >= self._flush_size:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self._flush_interval, self._flush_soon)
+        return future
+
+    async def flush(self) -> None:
+        """Send every buffered event without waiting for the acks."""
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch, self._buffer = self._buffer, []
+        for event, future in batch:
+            try:
+                await self._send(event, future)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                self._metrics.increment("events.publish.errors")
+        if batch:
+            self._metrics.record("events.publish.batch_size", len(batch))
+
+    async def close(self) -> None:
+        """Send what is buffered and wait until every event is settled."""
+        await self.flush()
+        # Timed flushes still sending their batch must finish, or their
+        # events would never be published nor settled
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _release(self, future: asyncio.Future[None]) -> None:
+        """Free the window slot of a settled event."""
+        self._pending.discard(future)
+        self._window.release()
+
+    def _flush_soon(self) -> None:
+        """Send a partial buffer once the flush interval has passed."""
+        self._flush_timer = None
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, event: Event, future: asyncio.Future[None]) -> None:
+        """Publish one event and settle its future when the PubAck arrives."""
+        subject = SubjectPatterns.event(event.domain, event.event_type)
+        js = self._jetstream_for(subject)
+        if not js:
+            raise Exception("JetStream not initialized")
+
+        headers, data = self._encode(event)
+        headers[MSG_ID_HEADER] = event.message_id
+        ack = await js.publish_async(subject, data, headers=headers)
+        timer = asyncio.get_running_loop().call_later(self._ack_timeout, ack.cancel)
+        ack.add_done_callback(lambda done: self._settle(done, future, event, timer))
+
+    def _settle(
+        self,
+        ack: asyncio.Future[Any],
+        future: asyncio.Future[None],
+        event: Event,
+        timer: asyncio.TimerHandle,
+    ) -> None:
+        """Resolve an event's future from its PubAck."""
+        timer.cancel()
+        if future.done():
+            return
+        if ack.cancelled():
+            self._metrics.increment("events.publish.timeouts")
+            future.set_exception(TimeoutError(f"No PubAck for event {event.message_id}"))
+        elif ack.exception():
+            self._metrics.increment("events.publish.errors")
+            future.set_exception(ack.exception())
+        else:
+            if getattr(ack.result(), "duplicate", False):
+                self._metrics.increment("events.publish.duplicates")
+            key = (event.domain, event.event_type)
+            counter = self._published.get(key)
+            if counter is None:
+                counter = self._metrics.counter(
+                    "events.published.{domain}.{event_type}",
+                    domain=event.domain,
+                    event_type=event.event_type,
+                )
+                self._published[key] = counter
+            counter.inc()
+            future.set_result(None)
@@ -1,15 +1,18 @@
 """NATS-based heartbeat monitoring implementation.
 
 Monitors the health of active service instances by watching their
-heartbeat keys in NATS KV Store and detecting TTL expiration.
+leader keys in NATS KV Store and detecting TTL expiration.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import math
 from datetime import UTC, datetime
-from typing import Protocol
+from typing import Any, Protocol
 
+from ..domain.models import KVWatchEvent
 from ..domain.value_objects import (
     Duration,
     FailoverPolicy,
@@ -20,6 +23,9 @@ from ..domain.value_objects import (
 from ..ports.kv_store import KVStorePort as KVStore
 from ..ports.logger import LoggerPort
 
+# Leader TTL assumed when the leader value does not advertise one
+DEFAULT_LEADER_TTL_SECONDS = 5.0
+
 
 class ElectionTrigger(Protocol):
     """Protocol for triggering leader election."""
@@ -37,8 +43,11 @@ class ElectionTrigger(Protocol):
 class HeartbeatMonitor:
     """Monitors heartbeats of active service instances.
 
-    Watches the KV Store for heartbeat key expiration and triggers
-    failover when the active instance is detected as failed.
+    Watches the leader key in the KV Store. Every leader heartbeat rewrites
+    that key, so each observed PUT resets a local deadline of one leader TTL.
+    Failover is triggered when the key is deleted or the deadline passes
+    without a heartbeat, so detection takes at most one TTL and standbys
+    do not read the KV Store while the leader is healthy.
     """
 
     def __init__(
@@ -73,6 +82,9 @@ class HeartbeatMonitor:
         self._current_leader: str | None = None
         self._last_heartbeat: datetime | None = None
         self._heartbeat_interval = Duration(seconds=0.5)  # Default 500ms
+        self._events: asyncio.Queue[KVWatchEvent | None] = asyncio.Queue()
+        self._deadline: float | None = None
+        self._leader_ttl = DEFAULT_LEADER_TTL_SECONDS
 
     def _create_default_logger(self) -> LoggerPort:
         """Create a default logger if none provided."""
@@ -89,10 +101,10 @@ class HeartbeatMonitor:
         self._election_trigger = trigger
 
     def set_heartbeat_interval(self, interval: Duration) -> None:
-        """Configure the heartbeat check interval.
+        """Configure the delay before re-establishing a closed watch.
 
         Args:
-            interval: Duration between heartbeat checks
+            interval: Duration to wait before watching the leader key again
         """
         if interval.seconds < 0.1:
             raise ValueError("Heartbeat interval must be at least 100ms")
@@ -107,16 +119,17 @@ class HeartbeatMonitor:
         election if the heartbeat expires or key is deleted.
         """
         if self._monitor_task and not self._monitor_task.done():
-            await self._logger.warning(
+            self._logger.warning(
                 "Heartbeat monitor already running",
                 instance_id=str(self._instance_id),
             )
             return
 
         self._stop_event.clear()
+        self._events = asyncio.Queue()
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
-        await self._logger.info(
+        self._logger.info(
             "Started heartbeat monitoring",
             service=str(self._service_name),
             instance=str(self._instance_id),
@@ -130,6 +143,8 @@ class HeartbeatMonitor:
         Gracefully stops the monitoring loop and cleans up resources.
         """
         self._stop_event.set()
+        # Wake the loop if it is waiting for the next leader event
+        self._events.put_nowait(None)
 
         if self._monitor_task and not self._monitor_task.done():
             try:
@@ -141,53 +156,30 @@ class HeartbeatMonitor:
                 except asyncio.CancelledError:
                     pass
 
-        await self._logger.info(
+        self._logger.info(
             "Stopped heartbeat monitoring",
             service=str(self._service_name),
             instance=str(self._instance_id),
         )
 
     async def _monitor_loop(self) -> None:
-        """Main monitoring loop that watches for heartbeat expiration."""
+        """Main monitoring loop that keeps the leader watch running."""
         consecutive_failures = 0
         max_consecutive_failures = 3
 
         while not self._stop_event.is_set():
             try:
-                # Check current leader
-                leader_key = self._get_leader_key()
-                leader_info = await self._kv_store.get(leader_key)
-
-                if not leader_info:
-                    # No leader exists
-                    if self._current_leader:
-                        await self._handle_leader_loss(self._current_leader)
-                    self._current_leader = None
-                else:
-                    # Leader exists - check heartbeat
-                    current_leader_id = leader_info.get("instance_id")
-
-                    if current_leader_id != str(self._instance_id):
-                        # We're not the leader - monitor their heartbeat
-                        heartbeat_status = await self._check_heartbeat(current_leader_id)
-
-                        if heartbeat_status and not heartbeat_status.is_healthy():
-                            # Heartbeat expired
-                            await self._handle_heartbeat_expiration(heartbeat_status)
-                        elif heartbeat_status:
-                            # Update tracking
-                            self._current_leader = current_leader_id
-                            self._last_heartbeat = heartbeat_status.last_seen
-                            consecutive_failures = 0
-
-                # Wait before next check
-                await asyncio.sleep(self._heartbeat_interval.seconds)
+                await self._watch_leader()
+                consecutive_failures = 0
+
+                # The watch ended on its own; re-establish it shortly
+                await self._pause(self._heartbeat_interval.seconds)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 consecutive_failures += 1
-                await self._logger.error(
+                self._logger.error(
                     f"Error in heartbeat monitor loop: {e}",
                     service=str(self._service_name),
                     instance=str(self._instance_id),
@@ -195,7 +187,7 @@ class HeartbeatMonitor:
                 )
 
                 if consecutive_failures >= max_consecutive_failures:
-                    await self._logger.error(
+                    self._logger.error(
                         "Too many consecutive monitoring failures, stopping monitor",
                         service=str(self._service_name),
                         instance=str(self._instance_id),
@@ -203,11 +195,105 @@ class HeartbeatMonitor:
                     break
 
                 # Exponential backoff on errors
-                await asyncio.sleep(min(2**consecutive_failures, 30))
+                await self._pause(min(2**consecutive_failures, 30))
+
+    async def _pause(self, seconds: float) -> None:
+        """Sleep for the given time unless monitoring is stopped first."""
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), seconds)
+
+    async def _watch_leader(self) -> None:
+        """Follow the leader key until the watch ends or monitoring stops.
+
+        Watch events are pumped into a queue so that waiting for the next one
+        can time out at the leader's deadline without tearing down the watch.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def pump() -> None:
+            try:
+                async for event in self._kv_store.watch(self._get_leader_key()):
+                    self._events.put_nowait(event)
+            finally:
+                self._events.put_nowait(None)
+
+        pump_task = asyncio.create_task(pump())
+        try:
+            while not self._stop_event.is_set():
+                timeout = None
+                if self._deadline is not None:
+                    timeout = max(self._deadline - loop.time(), 0)
+
+                try:
+                    event = await asyncio.wait_for(self._events.get(), timeout)
+                except asyncio.TimeoutError:
+                    await self._handle_deadline()
+                    continue
+
+                if event is None:
+                    if pump_task.done():
+                        # Surface watch errors to the monitor loop
+                        pump_task.result()
+                        return
+                    continue
+
+                await self._handle_leader_event(event)
+        finally:
+            pump_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pump_task
+
+    async def _handle_leader_event(self, event: KVWatchEvent) -> None:
+        """Track the leader from a watch event and reset its deadline.
+
+        Args:
+            event: Change to the leader key
+        """
+        if event.operation == "PUT" and event.entry:
+            value = event.entry.value if isinstance(event.entry.value, dict) else {}
+            leader_id = value.get("instance_id")
+            self._current_leader = leader_id
+
+            if not leader_id or leader_id == str(self._instance_id):
+                # Nothing to monitor while we hold leadership ourselves
+                self._deadline = None
+                return
+
+            self._leader_ttl = float(value.get("ttl") or DEFAULT_LEADER_TTL_SECONDS)
+            self._last_heartbeat = self._parse_heartbeat_time(value) or datetime.now(UTC)
+            self._deadline = asyncio.get_running_loop().time() + self._leader_ttl
+            return
+
+        # DELETE or PURGE: the leader released the key or it expired
+        previous_leader = self._current_leader
+        self._current_leader = None
+        self._deadline = None
+        if previous_leader and previous_leader != str(self._instance_id):
+            await self._handle_leader_loss(previous_leader)
+
+    async def _handle_deadline(self) -> None:
+        """Handle a leader that has not been seen for a full TTL."""
+        leader_id = self._current_leader
+        self._deadline = None
+        if not leader_id:
+            return
+
+        since = self._last_heartbeat or datetime.now(UTC)
+        await self._handle_heartbeat_expiration(
+            HeartbeatStatus(
+                instance_id=leader_id,
+                last_seen=since,
+                ttl_seconds=max(1, math.ceil(self._leader_ttl)),
+                is_expired=True,
+                time_since_last=max((datetime.now(UTC) - since).total_seconds(), 0.0),
+            )
+        )
 
     async def _check_heartbeat(self, leader_id: str) -> HeartbeatStatus | None:
         """Check the heartbeat status of the current leader.
 
+        Reads the leader key once; its value carries the last heartbeat.
+
         Args:
             leader_id: Instance ID of the current leader
 
@@ -215,12 +301,10 @@ class HeartbeatMonitor:
             HeartbeatStatus if found, None otherwise
         """
         try:
-            # Get heartbeat key
-            heartbeat_key = f"service.{self._service_name.value}.{leader_id}.heartbeat"
-            heartbeat_data = await self._kv_store.get(heartbeat_key)
+            leader_info = await self._kv_store.get(self._get_leader_key())
 
-            if not heartbeat_data:
-                # No heartbeat key found
+            if not leader_info:
+                # No leader key found
                 return HeartbeatStatus(
                     instance_id=leader_id,
                     last_seen=datetime.now(UTC),
@@ -229,27 +313,26 @@ class HeartbeatMonitor:
                     time_since_last=float("inf"),
                 )
 
-            # Parse heartbeat timestamp
-            last_heartbeat_str = heartbeat_data.get("timestamp")
-            if not last_heartbeat_str:
+            value = leader_info.value if hasattr(leader_info, "value") else leader_info
+            if not isinstance(value, dict):
                 return None
 
-            last_heartbeat = datetime.fromisoformat(last_heartbeat_str)
-            if last_heartbeat.tzinfo is None:
-                last_heartbeat = last_heartbeat.replace(tzinfo=UTC)
+            last_heartbeat = self._parse_heartbeat_time(value)
+            if not last_heartbeat:
+                return None
 
             # Calculate time since last heartbeat
             now = datetime.now(UTC)
-            time_since_last = (now - last_heartbeat).total_seconds()
+            time_since_last = max((now - last_heartbeat).total_seconds(), 0.0)
 
-            # Get TTL from heartbeat data
-            ttl_seconds = heartbeat_data.get("ttl", 5)
+            # Get TTL from leader value
+            ttl_seconds = max(1, math.ceil(value.get("ttl") or DEFAULT_LEADER_TTL_SECONDS))
 
             # Check if expired
             is_expired = time_since_last > ttl_seconds
 
             return HeartbeatStatus(
-                instance_id=leader_id,
+                instance_id=value.get("instance_id") or leader_id,
                 last_seen=last_heartbeat,
                 ttl_seconds=ttl_seconds,
                 is_expired=is_expired,
@@ -257,20 +340,41 @@ class HeartbeatMonitor:
             )
 
         except Exception as e:
-            await self._logger.error(
+            self._logger.error(
                 f"Failed to check heartbeat: {e}",
                 service=str(self._service_name),
                 leader_id=leader_id,
             )
             return None
 
+    @staticmethod
+    def _parse_heartbeat_time(value: dict[str, Any]) -> datetime | None:
+        """Extract the last heartbeat time from a leader value.
+
+        Args:
+            value: Leader value as stored in the KV Store
+
+        Returns:
+            Timezone-aware heartbeat time, or None if the value has none
+        """
+        raw = value.get("last_heartbeat") or value.get("timestamp") or value.get("elected_at")
+        if raw is None:
+            return None
+        if isinstance(raw, int | float):
+            return datetime.fromtimestamp(raw, UTC)
+
+        parsed = datetime.fromisoformat(raw)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return parsed
+
     async def _handle_heartbeat_expiration(self, heartbeat_status: HeartbeatStatus) -> None:
         """Handle detection of expired heartbeat.
 
         Args:
             heartbeat_status: Status of the expired heartbeat
         """
-        await self._logger.warning(
+        self._logger.warning(
             "Heartbeat expired for active instance",
             service=str(self._service_name),
             expired_instance=heartbeat_status.instance_id,
@@ -278,17 +382,17 @@ class HeartbeatMonitor:
             ttl=f"{heartbeat_status.ttl_seconds}s",
         )
 
-        # Apply detection threshold from failover policy
-        await asyncio.sleep(self._failover_policy.detection_threshold.seconds)
-
-        # Re-check to avoid false positive
+        # Re-check once to avoid a false positive from a stalled watch
         recheck = await self._check_heartbeat(heartbeat_status.instance_id)
         if recheck and recheck.is_healthy():
-            await self._logger.info(
-                "Heartbeat recovered during detection threshold",
+            self._logger.info(
+                "Heartbeat recovered before failover",
                 service=str(self._service_name),
-                instance=heartbeat_status.instance_id,
+                instance=recheck.instance_id,
             )
+            self._current_leader = recheck.instance_id
+            self._last_heartbeat = recheck.last_seen
+            self._deadline = asyncio.get_running_loop().time() + recheck.time_remaining()
             return
 
         # Apply election delay from failover policy
@@ -303,7 +407,7 @@ class HeartbeatMonitor:
         Args:
             previous_leader: ID of the previous leader
         """
-        await self._logger.warning(
+        self._logger.warning(
             "Leader key lost",
             service=str(self._service_name),
             previous_leader=previous_leader,
@@ -319,7 +423,7 @@ class HeartbeatMonitor:
     async def _trigger_election_if_configured(self) -> None:
         """Trigger election if an election trigger is configured."""
         if self._election_trigger:
-            await self._logger.info(
+            self._logger.info(
                 "Triggering leader election",
                 service=str(self._service_name),
                 instance=str(self._instance_id),
@@ -330,13 +434,13 @@ class HeartbeatMonitor:
                     str(self._service_name), self._group_id
                 )
             except Exception as e:
-                await self._logger.error(
+                self._logger.error(
                     f"Failed to trigger election: {e}",
                     service=str(self._service_name),
                     instance=str(self._instance_id),
                 )
         else:
-            await self._logger.warning(
+            self._logger.warning(
                 "No election trigger configured, cannot initiate failover",
                 service=str(self._service_name),
                 instance=str(self._instance_id),
@@ -0,0 +1,319 @@
+"""In-process implementation of KVStorePort for tests, benchmarks and simulation.
+
+Follows the semantics of ``NATSKVStore``: revisions come from one sequence
+per bucket, ``create_only`` and ``options.revision`` are checked atomically,
+values round-trip through JSON, and watches replay current values before
+streaming live changes.
+
+Buckets live in an ``InMemoryKVServer``, which plays the part of the NATS
+server: any number of store objects, one per simulated instance, can open
+the same bucket. The server reads time from a ``ClockPort``, so with a
+``ManualClock`` TTL expiry happens when the test advances the clock rather
+than after a real wait.
+"""
+
+import asyncio
+import heapq
+import json
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from ..domain.exceptions import (
+    KVKeyAlreadyExistsError,
+    KVKeyNotFoundError,
+    KVNotConnectedError,
+    KVRevisionMismatchError,
+)
+from ..domain.models import KVEntry, KVOptions, KVWatchEvent
+from ..ports.clock import ClockPort
+from ..ports.kv_store import KVStorePort
+from .manual_clock import ManualClock
+from .system_clock import SystemClock
+
+DEFAULT_HISTORY = 10
+# Characters the NATS server rejects in keys; dotted keys such as the
+# election's ``sticky-active.<service>.<group>.leader`` are valid
+INVALID_KEY_CHARS = frozenset({"*", ">", " ", "\t"})
+
+
+class _Watcher:
+    """Live change queue for one watch, filtered by key or prefixes."""
+
+    __slots__ = ("key", "prefixes", "queue")
+
+    def __init__(self, key: str | None, prefixes: tuple[str, ...]):
+        self.key = key
+        self.prefixes = prefixes
+        self.queue: asyncio.Queue[KVWatchEvent] = asyncio.Queue()
+
+    def wants(self, key: str) -> bool:
+        if self.key is not None:
+            return key == self.key
+        return not self.prefixes or key.startswith(self.prefixes)
+
+
+class _Bucket:
+    """State of one bucket: entries, per-key history, watchers and expiries."""
+
+    def __init__(self, name: str, server: "InMemoryKVServer"):
+        self.name = name
+        self.server = server
+        self.entries: dict[str, KVEntry] = {}
+        self.history: dict[str, list[KVEntry]] = {}
+        self.watchers: list[_Watcher] = []
+        self.sequence = 0
+        # (expires_at, revision, key); stale items are skipped when popped
+        self._expiry: list[tuple[float, int, str]] = []
+
+    def notify(self, event: KVWatchEvent) -> None:
+        key = event.key or ""
+        for watcher in self.watchers:
+            if watcher.wants(key):
+                watcher.queue.put_nowait(event)
+
+    def remove(self, key: str, operation: str) -> None:
+        self.entries.pop(key, None)
+        self.sequence += 1
+        self.notify(KVWatchEvent(operation=operation, key=key))
+
+    def schedule_expiry(self, entry: KVEntry, ttl: float) -> None:
+        if self.server.manual_time:
+            expires_at = self.server.clock.now().timestamp() + ttl
+            heapq.heappush(self._expiry, (expires_at, entry.revision, entry.key))
+        else:
+            asyncio.get_running_loop().call_later(ttl, self.expire, entry.key, entry.revision)
+
+    def expire(self, key: str, revision: int) -> None:
+        """Delete an entry whose TTL elapsed; watchers see a DELETE."""
+        current = self.entries.get(key)
+        # A later write replaced the entry and its TTL
+        if current is not None and current.revision == revision:
+            self.remove(key, "DELETE")
+
+    def expire_due(self) -> None:
+        """Expire every entry whose TTL has elapsed on the manual clock."""
+        now = self.server.clock.now().timestamp()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, revision, key = heapq.heappop(self._expiry)
+            self.expire(key, revision)
+
+
+class InMemoryKVServer:
+    """Named in-memory buckets shared by the stores that open them."""
+
+    def __init__(self, clock: ClockPort | None = None, history: int = DEFAULT_HISTORY):
+        """Initialize the server.
+
+        Args:
+            clock: Time source for timestamps and TTLs; a ManualClock makes
+                entries expire only when it is advanced
+            history: Revisions kept per key for ``history()``
+        """
+        self.clock = clock or SystemClock()
+        self.history_size = history
+        self.manual_time = isinstance(self.clock, ManualClock)
+        self._buckets: dict[str, _Bucket] = {}
+        if isinstance(self.clock, ManualClock):
+            # Timers would fire on real time; expire when the clock moves instead
+            self.clock.add_listener(self.expire_due)
+
+    def bucket(self, name: str) -> _Bucket:
+        """Get a bucket, creating it on first use."""
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = _Bucket(name, self)
+        return bucket
+
+    def expire_due(self) -> None:
+        """Expire entries in every bucket whose TTL has elapsed."""
+        for bucket in list(self._buckets.values()):
+            bucket.expire_due()
+
+
+class InMemoryKVStore(KVStorePort):
+    """KV store backed by a bucket of an ``InMemoryKVServer``.
+
+    Keys written with a TTL are removed when it elapses, and watchers see a
+    DELETE for them as with NATS per-message TTL.
+    """
+
+    def __init__(self, server: InMemoryKVServer | None = None, history: int = DEFAULT_HISTORY):
+        """Initialize the store.
+
+        Args:
+            server: Server holding the buckets; a private one if omitted
+            history: Revisions kept per key, used when creating a private server
+        """
+        self._server = server or InMemoryKVServer(history=history)
+        self._bucket: _Bucket | None = None
+
+    async def connect(self, bucket: str, ttl: int | None = None) -> None:
+        """Open the bucket; ``ttl`` is accepted for interface compatibility."""
+        self._bucket = self._server.bucket(bucket)
+
+    async def disconnect(self) -> None:
+        """Close the bucket; stored entries are kept."""
+        self._bucket = None
+
+    async def is_connected(self) -> bool:
+        """Check if a bucket is open."""
+        return self._bucket is not None
+
+    def _open(self, operation: str, key: str | None = None) -> _Bucket:
+        bucket = self._bucket
+        if bucket is None:
+            raise KVNotConnectedError(operation)
+        if key is not None:
+            invalid = INVALID_KEY_CHARS.intersection(key)
+            if invalid:
+                raise ValueError(
+                    f"Key '{key}' contains invalid character '{min(invalid)}'. "
+                    f"NATS KV keys cannot contain: {', '.join(sorted(INVALID_KEY_CHARS))}"
+                )
+        return bucket
+
+    # Basic Operations
+    async def get(self, key: str) -> KVEntry | None:
+        """Get a value by key."""
+        return self._open("get", key).entries.get(key)
+
+    async def put(self, key: str, value: Any, options: KVOptions | None = None) -> int:
+        """Put a value with optional TTL, create-only or revision check."""
+        bucket = self._open("put", key)
+        current = bucket.entries.get(key)
+
+        if options:
+            if options.create_only and current is not None:
+                raise KVKeyAlreadyExistsError(key)
+            if options.revision is not None:
+                actual = current.revision if current else 0
+                if actual != options.revision:
+                    raise KVRevisionMismatchError(key, options.revision, actual)
+            elif options.update_only and current is None:
+                raise KVKeyNotFoundError(key, bucket.name)
+
+        bucket.sequence += 1
+        now = self._server.clock.now().isoformat()
+        entry = KVEntry(
+            key=key,
+            value=json.loads(json.dumps(value)),
+            revision=bucket.sequence,
+            created_at=current.created_at if current else now,
+            updated_at=now,
+            ttl=options.ttl if options else None,
+        )
+        bucket.entries[key] = entry
+        history = bucket.history.setdefault(key, [])
+        history.append(entry)
+        del history[: -self._server.history_size]
+
+        if entry.ttl:
+            bucket.schedule_expiry(entry, entry.ttl)
+
+        bucket.notify(KVWatchEvent(operation="PUT", entry=entry, key=key))
+        return entry.revision
+
+    async def delete(self, key: str, revision: int | None = None) -> bool:
+        """Delete a key, only at ``revision`` if given."""
+        bucket = self._open("delete", key)
+        current = bucket.entries.get(key)
+        if current is None or (revision is not None and current.revision != revision):
+            return False
+        bucket.remove(key, "DELETE")
+        return True
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return key in self._open("exists", key).entries
+
+    # Batch Operations
+    async def keys(self, prefix: str = "") -> list[str]:
+        """List all keys with optional prefix filter."""
+        return [key for key in self._open("keys").entries if key.startswith(prefix)]
+
+    async def get_many(self, keys: list[str]) -> dict[str, KVEntry]:
+        """Get multiple values by keys."""
+        entries = self._open("get_many").entries
+        return {key: entries[key] for key in keys if key in entries}
+
+    async def put_many(
+        self, entries: dict[str, Any], options: KVOptions | None = None
+    ) -> dict[str, int]:
+        """Put multiple key-value pairs, raising the first failure after all are tried."""
+        results: dict[str, int] = {}
+        first_error: Exception | None = None
+        for key, value in entries.items():
+            try:
+                results[key] = await self.put(key, value, options)
+            except Exception as e:
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return results
+
+    async def delete_many(self, keys: list[str]) -> dict[str, bool]:
+        """Delete multiple keys."""
+        return {key: await self.delete(key) for key in keys}
+
+    # Advanced Operations
+    async def watch(  # type: ignore[override,misc]
+        self,
+        key: str | None = None,
+        prefix: str | list[str] | None = None,
+        on_synced: Callable[[], None] | None = None,
+    ) -> AsyncIterator[KVWatchEvent]:
+        """Replay the current values of matching keys, then stream changes."""
+        if key and prefix:
+            raise ValueError("Cannot specify both key and prefix")
+        bucket = self._open("watch", key)
+
+        prefixes: tuple[str, ...] = ()
+        if prefix:
+            prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+        watcher = _Watcher(key or None, prefixes)
+        # Register before replaying so no change falls between the two
+        bucket.watchers.append(watcher)
+        try:
+            for entry in [e for k, e in bucket.entries.items() if watcher.wants(k)]:
+                yield KVWatchEvent(operation="PUT", entry=entry, key=entry.key)
+            if on_synced is not None:
+                on_synced()
+            while True:
+                yield await watcher.queue.get()
+        finally:
+            bucket.watchers.remove(watcher)
+
+    async def history(self, key: str, limit: int = 10) -> list[KVEntry]:
+        """Get revision history for a key, newest first."""
+        bucket = self._open("history", key)
+        return list(reversed(bucket.history.get(key, [])))[:limit]
+
+    async def purge(self, key: str) -> None:
+        """Remove a key together with its history."""
+        bucket = self._open("purge", key)
+        bucket.history.pop(key, None)
+        bucket.remove(key, "PURGE")
+
+    async def clear(self, prefix: str = "") -> int:
+        """Clear all keys with optional prefix filter."""
+        results = await self.delete_many(await self.keys(prefix))
+        return sum(1 for success in results.values() if success)
+
+    # Status and Maintenance
+    async def status(self) -> dict[str, Any]:
+        """Get KV store status information.
+
+        Besides the fields ``NATSKVStore`` reports, ``revision`` is the
+        bucket's last sequence, which grows with every write and delete, and
+        ``watchers`` the number of open watches on the bucket.
+        """
+        bucket = self._bucket
+        return {
+            "connected": bucket is not None,
+            "bucket": bucket.name if bucket else None,
+            "values": len(bucket.entries) if bucket else 0,
+            "history": self._server.history_size,
+            "bytes": 0,
+            "revision": bucket.sequence if bucket else 0,
+            "watchers": len(bucket.watchers) if bucket else 0,
+        }
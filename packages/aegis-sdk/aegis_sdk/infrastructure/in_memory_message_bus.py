@@ -0,0 +1,791 @@
+"""In-process implementation of MessageBusPort for tests, benchmarks and simulation.
+
+Several ``InMemoryMessageBus`` instances share an ``InMemoryBroker``, which
+plays the part of the NATS server: each bus stands for one service process.
+Messages are encoded with the same serializers as ``NATSAdapter``, so codec
+cost is still paid, but nothing crosses a socket.
+"""
+
+import asyncio
+import inspect
+import json
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..domain.exceptions import CommandCancelledError
+from ..domain.models import (
+    Command,
+    Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
+    RPCRequest,
+    RPCResponse,
+)
+from ..domain.patterns import SubjectPatterns
+from ..domain.types import CancellationToken
+from ..ports.message_bus import MessageBusPort
+from ..ports.metrics import CounterHandle, MetricsPort, TimerHandle
+from .command_handle import PendingCommandHandle
+from .factories import SerializationFactory
+from .in_memory_metrics import InMemoryMetrics
+from .serialization import deserialize_params, detect_and_deserialize, serialize_dict
+
+REPLY_SCOPE_HEADER = "Aegis-Reply-Scope"
+
+# Cancellations that arrive before their command starts are remembered this long
+MAX_EARLY_CANCELLATIONS = 1024
+
+MessageCallback = Callable[["InMemoryMsg"], Awaitable[None]]
+
+
+class NoRespondersError(Exception):
+    """Raised when a request is published to a subject nobody subscribes to."""
+
+    def __init__(self, subject: str):
+        super().__init__(f"No responders available for request on {subject}")
+        self.subject = subject
+
+
+def subject_matches(pattern: str, subject: str) -> bool:
+    """Match a subject against a NATS pattern (``*`` one token, ``>`` the rest)."""
+    pattern_tokens = pattern.split(".")
+    subject_tokens = subject.split(".")
+    for index, token in enumerate(pattern_tokens):
+        if token == ">":
+            return len(subject_tokens) > index
+        if index >= len(subject_tokens):
+            return False
+        if token != "*" and token != subject_tokens[index]:
+            return False
+    return len(pattern_tokens) == len(subject_tokens)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """The tokens of a wildcard pattern before its first wildcard."""
+    prefix: list[str] = []
+    for token in pattern.split("."):
+        if token in ("*", ">"):
+            break
+        prefix.append(token)
+    return ".".join(prefix)
+
+
+class InMemoryMsg:
+    """A message delivered by the broker, shaped like ``nats.aio.msg.Msg``."""
+
+    __slots__ = ("_broker", "data", "headers", "reply", "subject")
+
+    def __init__(
+        self,
+        subject: str,
+        data: bytes,
+        reply: str = "",
+        headers: dict[str, str] | None = None,
+        broker: "InMemoryBroker | None" = None,
+    ):
+        self.subject = subject
+        self.data = data
+        self.reply = reply
+        self.headers = headers
+        self._broker = broker
+
+    async def respond(self, data: bytes) -> None:
+        """Send a reply to the requester."""
+        if self._broker and self.reply:
+            self._broker.publish(self.reply, data)
+
+
+class InMemorySubscription:
+    """A subscription whose messages are handled one at a time, in order."""
+
+    def __init__(
+        self,
+        broker: "InMemoryBroker",
+        subject: str,
+        callback: MessageCallback,
+        queue: str | None,
+    ):
+        self.subject = subject
+        self.queue = queue
+        self.wildcard = "*" in subject or ">" in subject
+        self._broker = broker
+        self._callback = callback
+        self._pending: asyncio.Queue[InMemoryMsg] = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            msg = await self._pending.get()
+            try:
+                await self._callback(msg)
+            except Exception:
+                # A failing callback must not stop the subscription, as in nats-py
+                pass
+            finally:
+                self._pending.task_done()
+
+    def deliver(self, msg: InMemoryMsg) -> None:
+        """Queue a message for the callback."""
+        self._pending.put_nowait(msg)
+
+    async def unsubscribe(self) -> None:
+        """Stop receiving messages; queued messages are dropped."""
+        self._broker._remove(self)
+        self._task.cancel()
+
+    async def drain(self) -> None:
+        """Stop receiving messages after handling the queued ones."""
+        self._broker._remove(self)
+        await self._pending.join()
+        self._task.cancel()
+
+
+class _Interest:
+    """Subscriptions on one literal subject, split into plain and queue groups."""
+
+    __slots__ = ("groups", "plain")
+
+    def __init__(self) -> None:
+        self.plain: list[InMemorySubscription] = []
+        self.groups: dict[str, list[InMemorySubscription]] = {}
+
+    def add(self, subscription: InMemorySubscription) -> None:
+        if subscription.queue is None:
+            self.plain.append(subscription)
+        else:
+            self.groups.setdefault(subscription.queue, []).append(subscription)
+
+    def remove(self, subscription: InMemorySubscription) -> bool:
+        if subscription.queue is None:
+            if subscription in self.plain:
+                self.plain.remove(subscription)
+        else:
+            members = self.groups.get(subscription.queue, [])
+            if subscription in members:
+                members.remove(subscription)
+            if not members:
+                self.groups.pop(subscription.queue, None)
+        return not self.plain and not self.groups
+
+
+class InMemoryBroker:
+    """Subject space shared by in-memory buses, standing in for a NATS server.
+
+    Literal subscriptions are indexed by subject and wildcard subscriptions by
+    the literal tokens before their first wildcard, so a publish costs a few
+    dict lookups no matter how many instances are subscribed. Among the
+    subscriptions of a queue group that match a message, exactly one receives
+    it, in round-robin order.
+
+    Messages published with ``retain=True`` that nobody receives are kept and
+    handed to the first matching subscription, the way a JetStream work queue
+    holds commands until a consumer appears.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty broker."""
+        self._literal: dict[str, _Interest] = {}
+        self._wildcard: dict[str, list[InMemorySubscription]] = {}
+        self._cursors: dict[str, int] = {}
+        self._replies: dict[str, asyncio.Future[InMemoryMsg]] = {}
+        self._retained: list[InMemoryMsg] = []
+        self.published = 0
+
+    def subscribe(
+        self,
+        subject: str,
+        callback: MessageCallback,
+        queue: str | None = None,
+    ) -> InMemorySubscription:
+        """Subscribe a callback to a subject or wildcard pattern."""
+        subscription = InMemorySubscription(self, subject, callback, queue)
+        if subscription.wildcard:
+            self._wildcard.setdefault(_literal_prefix(subject), []).append(subscription)
+        else:
+            self._literal.setdefault(subject, _Interest()).add(subscription)
+        if self._retained:
+            self._release_retained(subscription)
+        return subscription
+
+    def _remove(self, subscription: InMemorySubscription) -> None:
+        if subscription.wildcard:
+            prefix = _literal_prefix(subscription.subject)
+            subscribers = self._wildcard.get(prefix, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._wildcard.pop(prefix, None)
+            return
+        interest = self._literal.get(subscription.subject)
+        if interest is not None and interest.remove(subscription):
+            del self._literal[subscription.subject]
+
+    def _release_retained(self, subscription: InMemorySubscription) -> None:
+        keep = []
+        for msg in self._retained:
+            if subject_matches(subscription.subject, msg.subject):
+                subscription.deliver(msg)
+            else:
+                keep.append(msg)
+        self._retained = keep
+
+    def _wildcard_matches(self, subject: str) -> list[InMemorySubscription]:
+        tokens = subject.split(".")
+        matching: list[InMemorySubscription] = []
+        for length in range(len(tokens)):
+            candidates = self._wildcard.get(".".join(tokens[:length]))
+            if candidates:
+                matching.extend(sub for sub in candidates if subject_matches(sub.subject, subject))
+        return matching
+
+    def _pick(self, queue: str, members: list[InMemorySubscription]) -> InMemorySubscription:
+        cursor = self._cursors.get(queue, 0)
+        self._cursors[queue] = cursor + 1
+        return members[cursor % len(members)]
+
+    def publish(
+        self,
+        subject: str,
+        data: bytes,
+        reply: str = "",
+        headers: dict[str, str] | None = None,
+        retain: bool = False,
+    ) -> int:
+        """Deliver a message to matching subscribers; returns how many received it."""
+        self.published += 1
+        future = self._replies.pop(subject, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(InMemoryMsg(subject, data, headers=headers))
+            return 1
+
+        msg = InMemoryMsg(subject, data, reply, headers, self)
+        interest = self._literal.get(subject)
+        wildcard = self._wildcard_matches(subject) if self._wildcard else None
+
+        if not wildcard:
+            if interest is None:
+                if retain:
+                    self._retained.append(msg)
+                return 0
+            plain = interest.plain
+            groups = interest.groups
+        else:
+            plain = list(interest.plain) if interest else []
+            groups = {q: list(m) for q, m in interest.groups.items()} if interest else {}
+            for subscription in wildcard:
+                if subscription.queue is None:
+                    plain.append(subscription)
+                else:
+                    groups.setdefault(subscription.queue, []).append(subscription)
+
+        for subscription in plain:
+            subscription.deliver(msg)
+        for queue, members in groups.items():
+            self._pick(queue, members).deliver(msg)
+        return len(plain) + len(groups)
+
+    async def request(
+        self,
+        subject: str,
+        data: bytes,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+    ) -> InMemoryMsg:
+        """Publish a request and wait for the first reply.
+
+        Raises:
+            NoRespondersError: If no subscription matches the subject
+            TimeoutError: If no reply arrives within ``timeout`` seconds
+        """
+        inbox = f"_INBOX.{uuid.uuid4().hex}"
+        future: asyncio.Future[InMemoryMsg] = asyncio.get_running_loop().create_future()
+        self._replies[inbox] = future
+        try:
+            if not self.publish(subject, data, inbox, headers):
+                raise NoRespondersError(subject)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._replies.pop(inbox, None)
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of active subscriptions."""
+        literal = sum(
+            len(i.plain) + sum(len(m) for m in i.groups.values()) for i in self._literal.values()
+        )
+        return literal + sum(len(subs) for subs in self._wildcard.values())
+
+
+class InMemoryMessageBus(MessageBusPort):
+    """MessageBusPort backed by an in-process broker.
+
+    RPC, events and commands use the same subjects, queue groups and
+    payloads as ``NATSAdapter``: RPC requests are load balanced across a
+    service's instances and can address one instance directly, compete-mode
+    event subscriptions share a queue group per service, each command is
+    handled by one instance, and command progress, completion and
+    cancellation travel through the same inboxes.
+
+    Differences from NATS, on purpose:
+
+    - Events are not persisted, so there is no replay or redelivery.
+    - Commands sent before any handler exists wait in the broker. A
+      handler that raises completes its command with status "failed"
+      instead of being redelivered.
+    - Event patterns without the ``events.`` prefix are taken as
+      ``<domain>.<event_type>`` patterns.
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryBroker | None = None,
+        service_name: str | None = None,
+        instance_id: str | None = None,
+        use_msgpack: bool = True,
+        metrics: MetricsPort | None = None,
+    ):
+        """Initialize the bus.
+
+        Args:
+            broker: Broker shared with the other buses; a private one if omitted
+            service_name: Service this bus belongs to, used for queue groups
+            instance_id: Instance this bus belongs to, used for direct RPC subjects
+            use_msgpack: Encode messages with MessagePack instead of JSON
+            metrics: Optional metrics port
+        """
+        self.broker = broker or InMemoryBroker()
+        self._service_name = service_name
+        self._instance_id = instance_id
+        self._use_msgpack = use_msgpack
+        self._serializer = SerializationFactory.create_serializer(use_msgpack)
+        self._metrics = metrics or InMemoryMetrics()
+        self._connected = False
+        self._subscriptions: list[InMemorySubscription] = []
+        self._rpc_callbacks: dict[tuple[str, str], MessageCallback] = {}
+        self._rpc_queue_subscriptions: dict[tuple[str, str], InMemorySubscription] = {}
+        self._client_rpc_metrics: dict[
+            tuple[str, str], tuple[TimerHandle, CounterHandle, CounterHandle, CounterHandle]
+        ] = {}
+        self._event_counters: dict[tuple[str, str, str], CounterHandle] = {}
+        self._handler_tasks: set[asyncio.Task] = set()
+
+        # Commands sent from here and commands running here
+        self._reply_scope = uuid.uuid4().hex
+        self._pending_commands: dict[str, PendingCommandHandle] = {}
+        self._command_inbox: list[InMemorySubscription] = []
+        self._running_commands: dict[str, CancellationToken] = {}
+        self._early_cancellations: OrderedDict[str, str | None] = OrderedDict()
+        self._cancel_inbox: InMemorySubscription | None = None
+
+    async def connect(self, servers: list[str] | None = None) -> None:
+        """Mark the bus as connected; ``servers`` is ignored."""
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        """Drop every subscription of this bus and fail its pending commands."""
+        for subscription in self._subscriptions:
+            await subscription.unsubscribe()
+        self._subscriptions.clear()
+        self._rpc_callbacks.clear()
+        self._rpc_queue_subscriptions.clear()
+        for task in list(self._handler_tasks):
+            task.cancel()
+        self._handler_tasks.clear()
+
+        for handle in list(self._pending_commands.values()):
+            handle._finish(error=Exception("Disconnected from broker"))
+        self._pending_commands.clear()
+        self._command_inbox.clear()
+        self._cancel_inbox = None
+        self._connected = False
+
+    async def is_connected(self) -> bool:
+        """Check if the bus is connected."""
+        return self._connected
+
+    def _subscribe(
+        self,
+        subject: str,
+        callback: MessageCallback,
+        queue: str | None = None,
+    ) -> InMemorySubscription:
+        subscription = self.broker.subscribe(subject, callback, queue)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    # RPC Implementation
+    async def register_rpc_handler(
+        self,
+        service: str,
+        method: str,
+        handler: Callable[[dict[str, Any]], Any],
+        options: RPCHandlerOptions | None = None,
+    ) -> None:
+        """Register an RPC handler on the service and instance subjects."""
+        options = options or RPCHandlerOptions()
+        offload = options.offload
+        labels = {"service": service, "method": method}
+        timer = self._metrics.timer_handle("rpc.{service}.{method}", **labels)
+        succeeded = self._metrics.counter("rpc.{service}.{method}.success", **labels)
+        failed = self._metrics.counter("rpc.{service}.{method}.error", **labels)
+        serialize = self._serializer.serialize
+
+        async def process(msg: InMemoryMsg) -> None:
+            request = None
+            with timer.time():
+                try:
+                    request = detect_and_deserialize(msg.data, RPCRequest, validate=False)
+                    if offload:
+                        # Both offload kinds use a thread here; nothing needs pickling
+                        result = await asyncio.to_thread(handler, request.params)
+                    else:
+                        result = handler(request.params)
+                        if inspect.isawaitable(result):
+                            result = await result
+                    response = RPCResponse(
+                        correlation_id=request.message_id, success=True, result=result
+                    )
+                    succeeded.inc()
+                except Exception as e:
+                    response = RPCResponse(
+                        correlation_id=request.message_id if request else None,
+                        success=False,
+                        error=str(e),
+                    )
+                    failed.inc()
+                await msg.respond(serialize(response))
+
+        callback: MessageCallback
+        if options.max_concurrency is None:
+            callback = process
+        else:
+            semaphore = asyncio.Semaphore(options.max_concurrency)
+
+            async def run(msg: InMemoryMsg) -> None:
+                try:
+                    await process(msg)
+                finally:
+                    semaphore.release()
+
+            async def dispatch(msg: InMemoryMsg) -> None:
+                await semaphore.acquire()
+                self._spawn(run(msg))
+
+            callback = dispatch
+
+        self._rpc_callbacks[(service, method)] = callback
+        if options.join_queue_group:
+            await self.join_rpc_queue_group(service, method)
+        if self._instance_id:
+            self._subscribe(
+                SubjectPatterns.rpc_instance(service, self._instance_id, method), callback
+            )
+
+    async def join_rpc_queue_group(self, service: str, method: str) -> None:
+        """Start receiving a registered method's load-balanced requests."""
+        callback = self._rpc_callbacks.get((service, method))
+        if callback is None:
+            raise ValueError(f"No RPC handler registered for {service}.{method}")
+        if (service, method) not in self._rpc_queue_subscriptions:
+            self._rpc_queue_subscriptions[(service, method)] = self._subscribe(
+                SubjectPatterns.rpc(service, method), callback, queue=f"rpc.{service}"
+            )
+
+    async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+        """Stop receiving a method's load-balanced requests."""
+        subscription = self._rpc_queue_subscriptions.pop((service, method), None)
+        if subscription is not None:
+            self._subscriptions.remove(subscription)
+            await subscription.drain()
+
+    def _rpc_client_metrics(
+        self, service: str, method: str
+    ) -> tuple[TimerHandle, CounterHandle, CounterHandle, CounterHandle]:
+        """Handles for the client side of one RPC method, bound on first use."""
+        handles = self._client_rpc_metrics.get((service, method))
+        if handles is None:
+            labels = {"service": service, "method": method}
+            handles = self._client_rpc_metrics[(service, method)] = (
+                self._metrics.timer_handle("rpc.client.{service}.{method}", **labels),
+                self._metrics.counter("rpc.client.{service}.{method}.success", **labels),
+                self._metrics.counter("rpc.client.{service}.{method}.timeout", **labels),
+                self._metrics.counter("rpc.client.{service}.{method}.error", **labels),
+            )
+        return handles
+
+    async def call_rpc(self, request: RPCRequest, instance_id: str | None = None) -> RPCResponse:
+        """Make an RPC call through the broker."""
+        service = (request.target or "unknown").split(".")[0]
+        method = request.method
+        if instance_id:
+            subject = SubjectPatterns.rpc_instance(service, instance_id, method)
+        else:
+            subject = SubjectPatterns.rpc(service, method)
+
+        timer, succeeded, timed_out, failed = self._rpc_client_metrics(service, method)
+        with timer.time():
+            try:
+                reply = await self.broker.request(
+                    subject, self._serializer.serialize(request), request.timeout
+                )
+                response = detect_and_deserialize(reply.data, RPCResponse, validate=False)
+                succeeded.inc()
+                return response
+            except TimeoutError:
+                timed_out.inc()
+                return RPCResponse(
+                    correlation_id=request.message_id,
+                    success=False,
+                    error=f"Timeout calling {service}.{method}",
+                )
+            except Exception as e:
+                failed.inc()
+                return RPCResponse(correlation_id=request.message_id, success=False, error=str(e))
+
+    # Event Implementation
+    def _event_counter(self, template: str, domain: str, event_type: str) -> CounterHandle:
+        counter = self._event_counters.get((template, domain, event_type))
+        if counter is None:
+            counter = self._event_counters[(template, domain, event_type)] = self._metrics.counter(
+                template, domain=domain, event_type=event_type
+            )
+        return counter
+
+    async def subscribe_event(
+        self,
+        pattern: str,
+        handler: Callable[[Event], Awaitable[None]],
+        durable: str | None = None,
+        mode: str = "compete",
+        options: EventSubscriptionOptions | None = None,
+    ) -> None:
+        """Subscribe to events in compete (queue group) or broadcast mode."""
+        valid_modes = ["compete", "broadcast"]
+        if mode not in valid_modes:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {valid_modes}")
+        if not pattern.startswith("events."):
+            pattern = f"events.{pattern}"
+
+        async def callback(msg: InMemoryMsg) -> None:
+            try:
+                event = detect_and_deserialize(msg.data, Event, validate=False)
+                await handler(event)
+                self._event_counter(
+                    "events.processed.{domain}.{event_type}", event.domain, event.event_type
+                ).inc()
+            except Exception:
+                self._metrics.increment("events.errors")
+
+        queue = None
+        if mode == "compete":
+            queue = self._service_name or durable
+        self._subscribe(pattern, callback, queue=queue)
+
+    async def publish_event(self, event: Event) -> None:
+        """Publish an event to its subject."""
+        if not self._connected:
+            raise Exception("Not connected")
+        self.broker.publish(
+            SubjectPatterns.event(event.domain, event.event_type),
+            self._serializer.serialize(event),
+        )
+        self._event_counter(
+            "events.published.{domain}.{event_type}", event.domain, event.event_type
+        ).inc()
+
+    # Command Implementation
+    async def _ensure_cancel_inbox(self) -> None:
+        """Subscribe once to cancellation requests for commands handled here."""
+        if self._cancel_inbox is not None:
+            return
+
+        async def cancel_handler(msg: InMemoryMsg) -> None:
+            request = deserialize_params(msg.data, self._use_msgpack)
+            command_id = msg.subject.rsplit(".", 1)[-1]
+            reason = request.get("reason")
+
+            token = self._running_commands.get(command_id)
+            if token:
+                token.cancel(reason)
+            else:
+                # The command may still be waiting in the broker
+                self._early_cancellations[command_id] = reason
+                while len(self._early_cancellations) > MAX_EARLY_CANCELLATIONS:
+                    self._early_cancellations.popitem(last=False)
+
+        self._cancel_inbox = self._subscribe(SubjectPatterns.command_cancel_inbox(), cancel_handler)
+
+    async def _request_cancel(self, command_id: str, reason: str | None) -> None:
+        """Publish a cancellation request for a command."""
+        cancel_data = {"command_id": command_id, "reason": reason, "timestamp": time.time()}
+        self.broker.publish(
+            SubjectPatterns.command_cancel(command_id),
+            serialize_dict(cancel_data, self._use_msgpack),
+        )
+        self._metrics.increment("commands.cancel_requested")
+
+    async def register_command_handler(
+        self, service: str, command: str, handler: Callable[..., Any]
+    ) -> None:
+        """Register a command handler; each command is handled by one instance.
+
+        Handlers declaring a third parameter receive a CancellationToken, as
+        with ``NATSAdapter``.
+        """
+        pass_token = _accepts_cancellation(handler)
+        await self._ensure_cancel_inbox()
+        labels = {"service": service, "command": command}
+        timer = self._metrics.timer_handle("commands.{service}.{command}", **labels)
+        processed = self._metrics.counter("commands.processed.{service}.{command}", **labels)
+        cancelled = self._metrics.counter("commands.cancelled.{service}.{command}", **labels)
+
+        async def callback(msg: InMemoryMsg) -> None:
+            cmd = detect_and_deserialize(msg.data, Command, validate=False)
+            reply_scope = msg.headers.get(REPLY_SCOPE_HEADER) if msg.headers else None
+
+            async def report_progress(percent: float, status: str = "processing") -> None:
+                progress_data = {
+                    "command_id": cmd.message_id,
+                    "progress": percent,
+                    "status": status,
+                    "timestamp": time.time(),
+                }
+                self.broker.publish(
+                    SubjectPatterns.command_progress(cmd.message_id, reply_scope),
+                    serialize_dict(progress_data, self._use_msgpack),
+                )
+
+            token = CancellationToken(cmd.message_id)
+            if cmd.message_id in self._early_cancellations:
+                token.cancel(self._early_cancellations.pop(cmd.message_id))
+            self._running_commands[cmd.message_id] = token
+
+            completion: dict[str, Any]
+            try:
+                with timer.time():
+                    if pass_token:
+                        result = await handler(cmd, report_progress, token)
+                    else:
+                        result = await handler(cmd, report_progress)
+                completion = {"command_id": cmd.message_id, "status": "completed", "result": result}
+                processed.inc()
+            except CommandCancelledError as e:
+                completion = {
+                    "command_id": cmd.message_id,
+                    "status": "cancelled",
+                    "reason": e.reason,
+                }
+                cancelled.inc()
+            except Exception as e:
+                completion = {"command_id": cmd.message_id, "status": "failed", "error": str(e)}
+                self._metrics.increment("commands.errors")
+            finally:
+                self._running_commands.pop(cmd.message_id, None)
+
+            self.broker.publish(
+                SubjectPatterns.command_callback(cmd.message_id, reply_scope),
+                serialize_dict(completion, self._use_msgpack),
+            )
+
+        self._subscribe(
+            SubjectPatterns.command(service, command), callback, queue=f"commands.{service}"
+        )
+
+    def _ensure_command_inbox(self) -> None:
+        """Subscribe this bus's progress and completion inboxes once."""
+        if self._command_inbox:
+            return
+
+        async def progress_handler(msg: InMemoryMsg) -> None:
+            handle = self._pending_commands.get(msg.subject.rsplit(".", 1)[-1])
+            if handle:
+                handle._on_progress(deserialize_params(msg.data, self._use_msgpack))
+
+        async def completion_handler(msg: InMemoryMsg) -> None:
+            handle = self._pending_commands.get(msg.subject.rsplit(".", 1)[-1])
+            if handle:
+                handle._finish(deserialize_params(msg.data, self._use_msgpack))
+
+        self._command_inbox = [
+            self._subscribe(
+                SubjectPatterns.command_progress_inbox(self._reply_scope), progress_handler
+            ),
+            self._subscribe(
+                SubjectPatterns.command_callback_inbox(self._reply_scope), completion_handler
+            ),
+        ]
+
+    def _publish_command(self, command: Command, headers: dict[str, str] | None) -> None:
+        service = command.target or "unknown"
+        self.broker.publish(
+            SubjectPatterns.command(service, command.command),
+            self._serializer.serialize(command),
+            headers=headers,
+            retain=True,
+        )
+
+    async def start_command(self, command: Command) -> PendingCommandHandle:
+        """Send a command and return a handle for streaming its progress."""
+        self._ensure_command_inbox()
+        handle = PendingCommandHandle(self, command)
+        self._pending_commands[command.message_id] = handle
+        self._publish_command(command, {REPLY_SCOPE_HEADER: self._reply_scope})
+        return handle
+
+    async def send_command(self, command: Command, track_progress: bool = True) -> dict[str, Any]:
+        """Send a command, optionally waiting for its completion."""
+        if track_progress:
+            handle = await self.start_command(command)
+            return await handle.result()
+
+        self._publish_command(command, None)
+        return {"command_id": command.message_id}
+
+    # Service Registration
+    async def register_service(self, service_name: str, instance_id: str) -> None:
+        """Announce a service instance."""
+        self._publish_json(
+            SubjectPatterns.registry_register(),
+            {"service_name": service_name, "instance_id": instance_id, "timestamp": time.time()},
+        )
+
+    async def unregister_service(self, service_name: str, instance_id: str) -> None:
+        """Announce that a service instance is leaving."""
+        self._publish_json(
+            SubjectPatterns.registry_unregister(),
+            {"service_name": service_name, "instance_id": instance_id, "timestamp": time.time()},
+        )
+
+    async def send_heartbeat(self, service_name: str, instance_id: str) -> None:
+        """Publish a service heartbeat."""
+        self._publish_json(
+            SubjectPatterns.heartbeat(service_name),
+            {"instance_id": instance_id, "timestamp": time.time()},
+        )
+        self._metrics.increment("heartbeats.sent")
+
+    def _publish_json(self, subject: str, data: dict[str, Any]) -> None:
+        self.broker.publish(subject, json.dumps(data).encode())
+
+
+def _accepts_cancellation(handler: Callable[..., Any]) -> bool:
+    """Whether a command handler declares a parameter for a cancellation token."""
+    try:
+        parameters = inspect.signature(handler).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = [
+        p
+        for p in parameters
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    return len(positional) >= 3
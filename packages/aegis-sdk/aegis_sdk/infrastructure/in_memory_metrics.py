@@ -1,35 +1,44 @@
 """In-memory metrics implementation following hexagonal architecture.
 
-This is a pure infrastructure implementation that doesn't depend on
-application or domain layers, only on the metrics port interface.
+This is a pure infrastructure implementation that doesn't depend on the
+application layer, only on the metrics port interface and the domain
+streaming histogram used for bounded-memory percentiles.
 """
 
 import time
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import partial
 from typing import Any
 
+from ..domain.metrics_models import StreamingHistogram
 from ..ports.metrics import MetricsPort
 
 
 class MetricsSummary:
     """Summary statistics for a metric."""
 
-    def __init__(self):
-        """Initialize metrics summary."""
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize metrics summary.
+
+        Args:
+            relative_accuracy: Maximum relative error of percentile estimates
+        """
         self.count: int = 0
         self.total: float = 0.0
         self.min: float = float("inf")
         self.max: float = float("-inf")
-        self.values: list[float] = []
+        self._histogram = StreamingHistogram(relative_accuracy=relative_accuracy)
 
     def add(self, value: float) -> None:
         """Add a value to the summary."""
         self.count += 1
         self.total += value
-        self.min = min(self.min, value)
-        self.max = max(self.max, value)
-        self.values.append(value)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._histogram.add(value)
 
     @property
     def average(self) -> float:
@@ -37,23 +46,28 @@ class MetricsSummary:
         return self.total / self.count if self.count > 0 else 0.0
 
     def percentile(self, p: float) -> float:
-        """Calculate percentile (0-100)."""
-        if not self.values:
-            return 0.0
-        sorted_values = sorted(self.values)
-        index = int((p / 100) * len(sorted_values))
-        return sorted_values[min(index, len(sorted_values) - 1)]
+        """Estimate percentile (0-100) within the configured relative accuracy."""
+        return self.percentiles([p])[0]
+
+    def percentiles(self, ps: list[float]) -> list[float]:
+        """Estimate several percentiles (0-100) in a single pass."""
+        if self.count == 0:
+            return [0.0 for _ in ps]
+        estimates = self._histogram.quantiles([p / 100 for p in ps])
+        # Clamp to the exact extremes so p0/p100 report real observed values
+        return [min(max(value, self.min), self.max) for value in estimates]
 
     def to_dict(self) -> dict[str, float]:
         """Convert to dictionary format."""
+        p50, p90, p99 = self.percentiles([50, 90, 99])
         return {
             "count": self.count,
             "average": round(self.average, 2),
             "min": round(self.min, 2) if self.count > 0 else 0,
             "max": round(self.max, 2) if self.count > 0 else 0,
-            "p50": round(self.percentile(50), 2),
-            "p90": round(self.percentile(90), 2),
-            "p99": round(self.percentile(99), 2),
+            "p50": round(p50, 2),
+            "p90": round(p90, 2),
+            "p99": round(p99, 2),
         }
 
 
@@ -64,11 +78,17 @@ class InMemoryMetrics(MetricsPort):
     in memory without any dependencies on application or domain layers.
     """
 
-    def __init__(self):
-        """Initialize in-memory metrics collector."""
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize in-memory metrics collector.
+
+        Args:
+            relative_accuracy: Maximum relative error of summary percentiles
+        """
         self._counters: dict[str, int] = defaultdict(int)
         self._gauges: dict[str, float] = {}
-        self._summaries: dict[str, MetricsSummary] = defaultdict(MetricsSummary)
+        self._summaries: dict[str, MetricsSummary] = defaultdict(
+            partial(MetricsSummary, relative_accuracy)
+        )
         self._start_time = time.time()
 
     def increment(self, name: str, value: int = 1) -> None:
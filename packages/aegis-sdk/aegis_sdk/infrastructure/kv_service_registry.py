@@ -8,24 +8,42 @@ from ..ports.kv_store import KVStorePort
 from ..ports.logger import LoggerPort
 from ..ports.service_registry import ServiceRegistryPort
 
+# Separator of registry keys written before keys became dot-separated tokens;
+# still read so instances on older releases stay discoverable
+LEGACY_SEPARATOR = "__"
+
 
 class KVServiceRegistry(ServiceRegistryPort):
     """Service registry implementation using KV Store.
 
     This adapter implements service registration using a key-value store
     with TTL support for automatic expiration of stale registrations.
+
+    Instances are registered under ``service-instances.{service}.{instance}``.
+    Releases before the dotted layout only list
+    ``service-instances__{service}__{instance}`` keys, so while ``legacy_keys``
+    is set every registration is written under both keys. Reads accept both
+    layouts. Once every client in the deployment reads dotted keys, turn
+    ``legacy_keys`` off to stop writing the legacy copies.
     """
 
-    def __init__(self, kv_store: KVStorePort, logger: LoggerPort | None = None):
+    def __init__(
+        self,
+        kv_store: KVStorePort,
+        logger: LoggerPort | None = None,
+        legacy_keys: bool = True,
+    ):
         """Initialize KV-based service registry.
 
         Args:
             kv_store: The KV store port implementation
             logger: Optional logger for debugging
+            legacy_keys: Also write registrations under the legacy key layout
         """
         self._kv_store = kv_store
         self._logger = logger
         self._key_prefix = "service-instances"
+        self._legacy_keys = legacy_keys
 
     def _make_key(self, service_name: str, instance_id: str) -> str:
         """Generate registry key for a service instance.
@@ -34,11 +52,62 @@ class KVServiceRegistry(ServiceRegistryPort):
             service_name: Name of the service
             instance_id: Instance identifier
 
+        Returns:
+            Registry key following pattern: service-instances.{service}.{instance}
+        """
+        # Dot-separated tokens, so watches can filter by service on the server
+        return f"{self._key_prefix}.{service_name}.{instance_id}"
+
+    def _make_legacy_key(self, service_name: str, instance_id: str) -> str:
+        """Generate the registry key older releases read and write.
+
         Returns:
             Registry key following pattern: service-instances__{service}__{instance}
         """
-        # Use double underscore as separator to avoid conflicts
-        return f"{self._key_prefix}__{service_name}__{instance_id}"
+        return LEGACY_SEPARATOR.join((self._key_prefix, service_name, instance_id))
+
+    def _write_keys(self, service_name: str, instance_id: str) -> list[str]:
+        """Keys a registration is written under."""
+        key = self._make_key(service_name, instance_id)
+        if not self._legacy_keys:
+            return [key]
+        return [key, self._make_legacy_key(service_name, instance_id)]
+
+    def _parse_key(self, key: str) -> tuple[str, str] | None:
+        """Split a registry key into service name and instance id.
+
+        Keys in the legacy ``service-instances__{service}__{instance}`` layout
+        are recognized as well.
+
+        Returns:
+            Tuple of (service_name, instance_id), or None for non-registry keys
+        """
+        for separator in (".", LEGACY_SEPARATOR):
+            head = f"{self._key_prefix}{separator}"
+            if key.startswith(head):
+                service_name, _, instance_id = key[len(head) :].partition(separator)
+                if service_name and instance_id:
+                    return service_name, instance_id
+        return None
+
+    @staticmethod
+    def _to_instance(data: object) -> ServiceInstance | None:
+        """Convert a stored registry value to a ServiceInstance."""
+        if not isinstance(data, dict):
+            return None
+
+        # Normalize field names to snake_case
+        # Handle both snake_case and camelCase for compatibility
+        if "serviceName" in data and "service_name" not in data:
+            data["service_name"] = data.pop("serviceName")
+        if "instanceId" in data and "instance_id" not in data:
+            data["instance_id"] = data.pop("instanceId")
+        if "lastHeartbeat" in data and "last_heartbeat" not in data:
+            data["last_heartbeat"] = data.pop("lastHeartbeat")
+        if "stickyActiveGroup" in data and "sticky_active_group" not in data:
+            data["sticky_active_group"] = data.pop("stickyActiveGroup")
+
+        return ServiceInstance(**data)
 
     async def register(self, instance: ServiceInstance, ttl_seconds: int) -> None:
         """Register a service instance with TTL.
@@ -54,11 +123,7 @@ class KVServiceRegistry(ServiceRegistryPort):
 
         # Store instance data with TTL
         try:
-            await self._kv_store.put(
-                key,
-                instance.model_dump(by_alias=True),  # Use camelCase for compatibility
-                options=KVOptions(ttl=int(ttl_seconds)),  # Convert to int for KVOptions
-            )
+            await self._put_instance(instance, int(ttl_seconds))  # Convert to int for KVOptions
 
             if self._logger:
                 self._logger.info(
@@ -105,11 +170,7 @@ class KVServiceRegistry(ServiceRegistryPort):
                 return
 
             # Update with TTL (heartbeat timestamp already updated by caller)
-            await self._kv_store.put(
-                key,
-                instance.model_dump(by_alias=True),
-                options=KVOptions(ttl=ttl_seconds),
-            )
+            await self._put_instance(instance, ttl_seconds)
 
             if self._logger:
                 self._logger.debug(
@@ -136,12 +197,20 @@ class KVServiceRegistry(ServiceRegistryPort):
                 key=key,
             ) from e
 
+    async def _put_instance(self, instance: ServiceInstance, ttl_seconds: int) -> None:
+        """Write an instance under each of its registry keys."""
+        data = instance.model_dump(by_alias=True)  # Use camelCase for compatibility
+        for key in self._write_keys(instance.service_name, instance.instance_id):
+            await self._kv_store.put(key, data, options=KVOptions(ttl=ttl_seconds))
+
     async def deregister(self, service_name: str, instance_id: str) -> None:
         """Remove a service instance from the registry."""
         key = self._make_key(service_name, instance_id)
 
         try:
-            success = await self._kv_store.delete(key)
+            success = False
+            for write_key in self._write_keys(service_name, instance_id):
+                success = await self._kv_store.delete(write_key) or success
 
             if self._logger:
                 if success:
@@ -172,63 +241,66 @@ class KVServiceRegistry(ServiceRegistryPort):
             ) from e
 
     async def get_instance(self, service_name: str, instance_id: str) -> ServiceInstance | None:
-        """Get a specific service instance."""
-        key = self._make_key(service_name, instance_id)
+        """Get a specific service instance, falling back to its legacy key."""
+        return await self._get_at(
+            self._make_key(service_name, instance_id),
+            self._make_legacy_key(service_name, instance_id),
+        )
 
-        try:
-            entry = await self._kv_store.get(key)
-            if not entry:
-                return None
-
-            # Convert from stored format to ServiceInstance
-            # Handle both snake_case and camelCase for compatibility
-            data = entry.value
-            if isinstance(data, dict):
-                # Normalize field names to snake_case
-                if "serviceName" in data and "service_name" not in data:
-                    data["service_name"] = data.pop("serviceName")
-                if "instanceId" in data and "instance_id" not in data:
-                    data["instance_id"] = data.pop("instanceId")
-                if "lastHeartbeat" in data and "last_heartbeat" not in data:
-                    data["last_heartbeat"] = data.pop("lastHeartbeat")
-                if "stickyActiveGroup" in data and "sticky_active_group" not in data:
-                    data["sticky_active_group"] = data.pop("stickyActiveGroup")
-
-                return ServiceInstance(**data)
+    async def _get_at(self, *keys: str) -> ServiceInstance | None:
+        """Get the instance stored under the first registry key that exists.
 
+        Returns:
+            The instance, or None if no key exists or the value is unreadable
+        """
+        try:
+            for key in keys:
+                entry = await self._kv_store.get(key)
+                if entry:
+                    # Convert from stored format to ServiceInstance
+                    return self._to_instance(entry.value)
             return None
 
         except Exception as e:
             if self._logger:
+                parsed = self._parse_key(keys[0]) or ("", "")
                 self._logger.error(
                     "Failed to get service instance",
-                    service=service_name,
-                    instance=instance_id,
+                    service=parsed[0],
+                    instance=parsed[1],
                     error=str(e),
                 )
             return None
 
+    async def _read_instances(
+        self, service_name: str | None = None
+    ) -> list[tuple[str, ServiceInstance]]:
+        """Fetch registered instances, of one service or of all.
+
+        Returns:
+            (service_name, instance) pairs in key order
+        """
+        found = []
+        # One listing covers both the current and the legacy key layout
+        keys = await self._kv_store.keys(self._key_prefix)
+        listed = set(keys)
+        for key in keys:
+            parsed = self._parse_key(key)
+            if not parsed or (service_name is not None and parsed[0] != service_name):
+                continue
+            # Instances written under both layouts are read from the current key
+            current = self._make_key(*parsed)
+            if key != current and current in listed:
+                continue
+            instance = await self._get_at(key)
+            if instance:
+                found.append((parsed[0], instance))
+        return found
+
     async def list_instances(self, service_name: str) -> list[ServiceInstance]:
         """List all instances of a service."""
-        prefix = f"{self._key_prefix}__{service_name}__"
-        instances = []
-
         try:
-            # Get all keys with the service prefix
-            keys = await self._kv_store.keys(prefix)
-
-            # Fetch all instances
-            for key in keys:
-                # Extract instance_id from key
-                # Format: service-instances__{service}__{instance}
-                parts = key.split("__")
-                if len(parts) >= 3:
-                    instance_id = parts[-1]
-                    instance = await self.get_instance(service_name, instance_id)
-                    if instance:
-                        instances.append(instance)
-
-            return instances
+            return [instance for _, instance in await self._read_instances(service_name)]
 
         except Exception as e:
             if self._logger:
@@ -244,29 +316,8 @@ class KVServiceRegistry(ServiceRegistryPort):
         services: dict[str, list[ServiceInstance]] = {}
 
         try:
-            # Get all registry keys
-            all_keys = await self._kv_store.keys(f"{self._key_prefix}__")
-
-            # Group by service name
-            for key in all_keys:
-                # Key format: service-instances__{service_name}__{instance_id}
-                # Split by double underscore separator
-                if key.startswith(f"{self._key_prefix}__"):
-                    remainder = key[len(f"{self._key_prefix}__") :]
-                    # Split by double underscore to get service_name and instance_id
-                    parts = remainder.split("__")
-                    if len(parts) >= 2:
-                        service_name = parts[0]
-                        instance_id = "__".join(
-                            parts[1:]
-                        )  # Handle instance IDs that might contain double underscores
-
-                        instance = await self.get_instance(service_name, instance_id)
-                        if instance:
-                            if service_name not in services:
-                                services[service_name] = []
-                            services[service_name].append(instance)
-
+            for service_name, instance in await self._read_instances():
+                services.setdefault(service_name, []).append(instance)
             return services
 
         except Exception as e:
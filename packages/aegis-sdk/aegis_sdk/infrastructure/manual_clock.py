@@ -0,0 +1,55 @@
+"""Clock that only moves when told to, for tests and simulation."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from ..ports.clock import ClockPort
+
+
+class ManualClock(ClockPort):
+    """Clock whose time is advanced explicitly.
+
+    Components that schedule work against the clock, such as TTL expiry in
+    ``InMemoryKVStore``, register a listener and are called after every
+    change of time, so expiring a thousand leases is one ``advance()``
+    instead of a real wait.
+    """
+
+    def __init__(self, start: datetime | None = None):
+        """Initialize the clock.
+
+        Args:
+            start: Initial time (timezone-aware); the current UTC time if omitted
+        """
+        if start is not None and start.tzinfo is None:
+            raise ValueError("ManualClock requires a timezone-aware start time")
+        self._now = start or datetime.now(UTC)
+        self._listeners: list[Callable[[], None]] = []
+
+    def now(self) -> datetime:
+        """Get the clock's current time."""
+        return self._now
+
+    def advance(self, seconds: float) -> datetime:
+        """Move the clock forward and notify listeners."""
+        if seconds < 0:
+            raise ValueError("ManualClock cannot move backwards")
+        return self.set(self._now + timedelta(seconds=seconds))
+
+    def set(self, when: datetime) -> datetime:
+        """Move the clock to a given time and notify listeners."""
+        if when < self._now:
+            raise ValueError("ManualClock cannot move backwards")
+        self._now = when
+        for listener in list(self._listeners):
+            listener()
+        return self._now
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` after every change of time."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """Stop calling ``listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
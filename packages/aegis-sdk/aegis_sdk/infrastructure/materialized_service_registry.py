@@ -0,0 +1,252 @@
+"""Service registry backed by a watch-driven in-memory view of the KV Store."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+from ..domain.models import KVWatchEvent, ServiceInstance
+from ..ports.kv_store import KVStorePort
+from ..ports.logger import LoggerPort
+from .kv_service_registry import KVServiceRegistry
+
+
+class MaterializedServiceRegistry(KVServiceRegistry):
+    """Service registry that answers reads from a materialized view.
+
+    The view is seeded once from a watch of the registry prefix, which
+    replays the current value of every registry key, and is then kept up to
+    date by applying PUT/DELETE/PURGE events as they arrive. Reads are served
+    from memory instead of listing the bucket and fetching each key. While
+    ``legacy_keys`` is set the watch also covers the legacy
+    ``service-instances__`` layout, so instances on older releases stay in the
+    view; once it is off only ``service-instances.`` is watched, which the KV
+    Store filters on the server.
+
+    Writes still go straight to the KV Store through ``KVServiceRegistry``.
+    Until the initial snapshot has loaded, reads fall back to KV scans so the
+    registry is usable immediately after ``start()``. Entries can expire by
+    the stream's max age without a delete marker, so reads drop instances
+    whose last heartbeat is older than ``instance_ttl``, as the KV Store
+    would have.
+    """
+
+    def __init__(
+        self,
+        kv_store: KVStorePort,
+        logger: LoggerPort | None = None,
+        reconnect_delay: float = 1.0,
+        instance_ttl: float = 30.0,
+        legacy_keys: bool = True,
+    ):
+        """Initialize the materialized registry.
+
+        Args:
+            kv_store: The KV store port implementation
+            logger: Optional logger for debugging
+            reconnect_delay: Seconds to wait before re-establishing a failed watch
+            instance_ttl: Registration TTL in seconds; instances whose heartbeat
+                is older are treated as expired
+            legacy_keys: Also write and watch registrations under the legacy
+                key layout
+        """
+        super().__init__(kv_store, logger, legacy_keys)
+        self._reconnect_delay = reconnect_delay
+        self._instance_ttl = instance_ttl
+        self._instances: dict[str, dict[str, ServiceInstance]] = {}
+        self._revisions: dict[str, int] = {}
+        self._revision = 0
+        self._ready = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._watch_task: asyncio.Task | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the initial snapshot has been loaded."""
+        return self._ready.is_set()
+
+    @property
+    def revision(self) -> int:
+        """Highest KV revision applied to the view."""
+        return self._revision
+
+    async def start(self) -> None:
+        """Start watching the registry prefix in the background."""
+        if self._watch_task and not self._watch_task.done():
+            return
+
+        self._stop_event.clear()
+        self._watch_task = asyncio.create_task(self._watch_loop())
+
+        if self._logger:
+            self._logger.info("Started materialized service registry watch")
+
+    async def stop(self) -> None:
+        """Stop the background watch."""
+        if not self._watch_task:
+            return
+
+        self._stop_event.set()
+        self._watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._watch_task
+
+        self._watch_task = None
+        self._ready.clear()
+
+        if self._logger:
+            self._logger.info("Stopped materialized service registry watch")
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait until the initial snapshot has loaded.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the view is ready, False if the timeout expired
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def __aenter__(self) -> MaterializedServiceRegistry:
+        """Async context manager entry - start the watch."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - stop the watch."""
+        await self.stop()
+
+    async def _watch_loop(self) -> None:
+        """Keep the view in sync, re-seeding it whenever the watch restarts."""
+        while not self._stop_event.is_set():
+            try:
+                await self._watch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._logger:
+                    self._logger.error("Service registry watch error", error=str(e))
+
+            if not self._stop_event.is_set():
+                await asyncio.sleep(self._reconnect_delay)
+
+    async def _watch_once(self) -> None:
+        """Run a single watch: load the snapshot, then apply live changes."""
+        # Replayed values are collected separately so that keys deleted while the
+        # watch was down do not linger in the view after a restart
+        snapshot: dict[str, dict[str, ServiceInstance]] = {}
+        snapshot_revisions: dict[str, int] = {}
+        loading = True
+
+        def on_synced() -> None:
+            nonlocal loading
+            loading = False
+            self._instances = snapshot
+            self._revisions = snapshot_revisions
+            self._ready.set()
+            if self._logger:
+                self._logger.info(
+                    "Service registry snapshot loaded",
+                    instances=len(snapshot_revisions),
+                    revision=self._revision,
+                )
+
+        # The legacy layout has no dot after the prefix, so watching both
+        # layouts cannot be narrowed to a whole subject token
+        prefix = self._key_prefix if self._legacy_keys else f"{self._key_prefix}."
+        async for event in self._kv_store.watch(prefix=prefix, on_synced=on_synced):
+            if loading:
+                self._apply(event, snapshot, snapshot_revisions)
+            else:
+                self._apply(event, self._instances, self._revisions)
+
+    def _apply(
+        self,
+        event: KVWatchEvent,
+        instances: dict[str, dict[str, ServiceInstance]],
+        revisions: dict[str, int],
+    ) -> None:
+        """Apply a single watch event to a view."""
+        key = event.key or (event.entry.key if event.entry else None)
+        parsed = self._parse_key(key) if key else None
+        if not key or not parsed:
+            return
+        service_name, instance_id = parsed
+        keys = self._instance_keys(service_name, instance_id)
+
+        if event.operation == "PUT" and event.entry:
+            # Ignore replays of revisions the view has already seen, under either key
+            if event.entry.revision <= max(revisions.get(k, 0) for k in keys):
+                return
+            try:
+                instance = self._to_instance(event.entry.value)
+            except Exception as e:
+                if self._logger:
+                    self._logger.warning("Skipping invalid service instance", key=key, error=str(e))
+                return
+            if instance is None:
+                return
+            instances.setdefault(service_name, {})[instance_id] = instance
+            revisions[key] = event.entry.revision
+            self._revision = max(self._revision, event.entry.revision)
+        else:
+            # DELETE and PURGE both remove the instance from the view, unless
+            # it is still registered under its key in the other layout
+            revisions.pop(key, None)
+            if any(k in revisions for k in keys):
+                return
+            service_instances = instances.get(service_name)
+            if service_instances is not None:
+                service_instances.pop(instance_id, None)
+                if not service_instances:
+                    del instances[service_name]
+
+    def _instance_keys(self, service_name: str, instance_id: str) -> tuple[str, str]:
+        """Registry keys an instance can be stored under, in either layout."""
+        return (
+            self._make_key(service_name, instance_id),
+            self._make_legacy_key(service_name, instance_id),
+        )
+
+    def _live_instances(self, service_name: str) -> dict[str, ServiceInstance]:
+        """Instances of a service in the view, dropping those whose TTL elapsed."""
+        instances = self._instances.get(service_name, {})
+        expired = [
+            instance_id
+            for instance_id, instance in instances.items()
+            if instance.seconds_since_heartbeat() > self._instance_ttl
+        ]
+        for instance_id in expired:
+            del instances[instance_id]
+            for key in self._instance_keys(service_name, instance_id):
+                self._revisions.pop(key, None)
+        if expired and not instances:
+            del self._instances[service_name]
+        return instances
+
+    async def get_instance(self, service_name: str, instance_id: str) -> ServiceInstance | None:
+        """Get a specific service instance from the view."""
+        if not self.is_ready:
+            return await super().get_instance(service_name, instance_id)
+        return self._live_instances(service_name).get(instance_id)
+
+    async def list_instances(self, service_name: str) -> list[ServiceInstance]:
+        """List all instances of a service from the view."""
+        if not self.is_ready:
+            return await super().list_instances(service_name)
+        return list(self._live_instances(service_name).values())
+
+    async def list_all_services(self) -> dict[str, list[ServiceInstance]]:
+        """List all services and their instances from the view."""
+        if not self.is_ready:
+            return await super().list_all_services()
+        services = {
+            service_name: list(self._live_instances(service_name).values())
+            for service_name in list(self._instances)
+        }
+        return {service_name: found for service_name, found in services.items() if found}
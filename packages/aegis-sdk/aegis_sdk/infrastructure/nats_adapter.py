@@ -1,24 +1,43 @@
 """NATS adapter - Concrete implementation of MessageBusPort."""
 
 import asyncio
+import inspect
 import json
 import os
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any
+import uuid
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, cast
 
 import nats
 from nats.aio.client import Client as NATSClient
 from nats.aio.msg import Msg
 from nats.js import JetStreamContext
-
-from ..domain.metrics_models import MetricsSnapshot
-from ..domain.models import Command, Event, RPCRequest, RPCResponse
+from nats.js.api import AckPolicy, ConsumerConfig
+
+from ..domain.exceptions import CommandCancelledError
+from ..domain.models import (
+    Command,
+    Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
+    RPCRequest,
+    RPCResponse,
+)
 from ..domain.patterns import SubjectPatterns
+from ..domain.types import CancellationToken
 from ..domain.value_objects import InstanceId, ServiceName
+from ..ports.logger import LoggerPort
 from ..ports.message_bus import MessageBusPort
-from ..ports.metrics import MetricsPort
+from ..ports.metrics import CounterHandle, MetricsPort, TimerHandle
+from .async_logger import get_default_logger
+from .command_handle import PendingCommandHandle
 from .config import LogContext, NATSConnectionConfig
+from .envelope import EventView, encode_event, is_envelope
+from .event_publisher import MSG_ID_HEADER, JetStreamEventPublisher
 from .factories import SerializationFactory
 from .in_memory_metrics import InMemoryMetrics
 from .serialization import (
@@ -29,6 +48,19 @@ from .serialization import (
     serialize_dict,
 )
 
+# Header telling command handlers which sender inbox to report progress to
+REPLY_SCOPE_HEADER = "Aegis-Reply-Scope"
+
+# Cancellations that arrive before their command starts are remembered this long
+MAX_EARLY_CANCELLATIONS = 1024
+
+# Handlers of lazy event subscriptions are handed EventViews as well as Events
+EventCallback = Callable[[Event | EventView], Awaitable[None]]
+
+
+class NATSCommandHandle(PendingCommandHandle):
+    """Tracks a command sent through NATSAdapter until it completes or times out."""
+
 
 class NATSAdapter(MessageBusPort):
     """NATS implementation of the message bus port."""
@@ -37,19 +69,47 @@ class NATSAdapter(MessageBusPort):
         self,
         config: NATSConnectionConfig | None = None,
         metrics: MetricsPort | None = None,
+        logger: LoggerPort | None = None,
     ):
         """Initialize NATS adapter with configuration.
 
         Args:
             config: Connection configuration. If not provided, uses defaults.
             metrics: Optional metrics port. If not provided, uses default adapter.
+            logger: Optional logger. If not provided, uses the non-blocking default.
         """
         self._config = config or NATSConnectionConfig()
         self._connections: list[NATSClient] = []
         self._js: JetStreamContext | None = None
+        self._js_contexts: list[JetStreamContext] = []
         self._current_conn = 0
+        self._handler_tasks: set[asyncio.Task] = set()
+
+        # One wildcard inbox per adapter multiplexes all tracked commands
+        self._reply_scope = uuid.uuid4().hex
+        self._pending_commands: dict[str, PendingCommandHandle] = {}
+        self._command_inbox: list[Any] = []
+        self._command_inbox_lock = asyncio.Lock()
+
+        # Cancellation tokens of commands this adapter is handling
+        self._running_commands: dict[str, CancellationToken] = {}
+        self._early_cancellations: OrderedDict[str, str | None] = OrderedDict()
+        self._cancel_inbox: Any | None = None
+        self._executors: dict[str, Executor] = {}
+
+        # RPC callbacks by (service, method), and their queue group subscriptions
+        self._rpc_callbacks: dict[tuple[str, str], Callable[[Msg], Any]] = {}
+        self._rpc_queue_subscriptions: dict[tuple[str, str], list[Any]] = {}
         self._metrics = metrics or InMemoryMetrics()
+        # Metric handles bound on first use of a label set, so hot paths skip name formatting
+        self._client_rpc_metrics: dict[
+            tuple[str, str], tuple[TimerHandle, CounterHandle, CounterHandle, CounterHandle]
+        ] = {}
+        self._event_counters: dict[tuple[str, str, str], CounterHandle] = {}
+        self._event_timers: dict[tuple[str, str, str], TimerHandle] = {}
+        self._logger = logger or get_default_logger()
         self._serializer = SerializationFactory.create_serializer(self._config.use_msgpack)
+        self._event_publisher: JetStreamEventPublisher | None = None
 
         # Extract service identification from config
         self._service_name = str(self._config.service_name) if self._config.service_name else None
@@ -73,14 +133,15 @@ class NATSAdapter(MessageBusPort):
             nc = await nats.connect(**conn_params)
             self._connections.append(nc)
 
-        # Initialize JetStream on first connection
+        # Initialize a JetStream context per connection; the first one is the default
         if self._connections and self._config.enable_jetstream:
             # Use JS domain from config or environment
             js_domain = self._config.js_domain or os.getenv("NATS_JS_DOMAIN")
             if js_domain:
-                self._js = self._connections[0].jetstream(domain=js_domain)
+                self._js_contexts = [nc.jetstream(domain=js_domain) for nc in self._connections]
             else:
-                self._js = self._connections[0].jetstream()
+                self._js_contexts = [nc.jetstream() for nc in self._connections]
+            self._js = self._js_contexts[0]
 
             # Ensure streams exist
             await self._ensure_streams()
@@ -94,16 +155,35 @@ class NATSAdapter(MessageBusPort):
             operation="connect",
             component="NATSAdapter",
         )
-        print(
-            f"✅ Connected to NATS cluster with {len(self._connections)} connections - {log_ctx.to_dict()}"
+        self._logger.info(
+            "Connected to NATS cluster", connections=len(self._connections), **log_ctx.to_dict()
         )
 
     async def disconnect(self) -> None:
         """Disconnect from NATS."""
+        if self._event_publisher:
+            await self._event_publisher.close()
+            self._event_publisher = None
+        for task in list(self._handler_tasks):
+            task.cancel()
+        self._handler_tasks.clear()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+        self._rpc_callbacks.clear()
+        self._rpc_queue_subscriptions.clear()
+
+        for handle in list(self._pending_commands.values()):
+            handle._finish(error=Exception("Disconnected from NATS"))
+        self._pending_commands.clear()
+        self._command_inbox.clear()
+        self._cancel_inbox = None
+
         for nc in self._connections:
             if nc.is_connected:
                 await nc.close()
         self._connections.clear()
+        self._js_contexts.clear()
         self._metrics.gauge("nats.connections", 0)
 
     async def is_connected(self) -> bool:
@@ -131,6 +211,32 @@ class NATSAdapter(MessageBusPort):
 
         return conn
 
+    def _connection_index(self, subject: str) -> int:
+        """Get the index of the pooled connection that owns a subject."""
+        if self._config.subscription_strategy == "single" or len(self._connections) < 2:
+            return 0
+        # crc32 is stable across processes, unlike the salted built-in hash
+        return zlib.crc32(subject.encode()) % len(self._connections)
+
+    def _subscription_connections(self, subject: str) -> list[NATSClient]:
+        """Get the connections that should carry a queue subscription for a subject.
+
+        With the "replicate" strategy every pooled connection joins the queue
+        group, so the server balances messages across all of their read loops.
+        Otherwise the subject is owned by a single connection.
+        """
+        if not self._connections:
+            raise Exception("Not connected to NATS")
+        if self._config.subscription_strategy == "replicate":
+            return list(self._connections)
+        return [self._connections[self._connection_index(subject)]]
+
+    def _jetstream_for(self, subject: str) -> JetStreamContext | None:
+        """Get the JetStream context on the connection that owns a subject."""
+        if len(self._js_contexts) < 2:
+            return self._js
+        return self._js_contexts[self._connection_index(subject)]
+
     async def _ensure_streams(self) -> None:
         """Ensure JetStream streams exist."""
         if not self._js:
@@ -159,17 +265,111 @@ class NATSAdapter(MessageBusPort):
             )
 
     # RPC Implementation
+    def _get_executor(self, kind: str) -> Executor:
+        """Get the worker pool used to offload synchronous handlers."""
+        if kind not in self._executors:
+            if kind == "process":
+                self._executors[kind] = ProcessPoolExecutor()
+            else:
+                self._executors[kind] = ThreadPoolExecutor(thread_name_prefix="aegis-rpc")
+        return self._executors[kind]
+
+    def _bind_rpc_handler(
+        self, handler: Callable[[dict[str, Any]], Any], options: RPCHandlerOptions
+    ) -> Callable[[dict[str, Any]], Awaitable[Any]]:
+        """Wrap a handler so it runs in the worker pool selected by its options."""
+        if not options.offload:
+            return handler
+        if inspect.iscoroutinefunction(handler):
+            raise ValueError("Offloaded RPC handlers must be regular functions")
+
+        executor = self._get_executor(options.offload)
+
+        async def offloaded(params: dict[str, Any]) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, handler, params)
+
+        return offloaded
+
+    def _dispatch_concurrently(
+        self,
+        process: Callable[[Msg], Awaitable[None]],
+        max_concurrency: int,
+        service: str,
+        method: str,
+    ) -> Callable[[Msg], Awaitable[None]]:
+        """Run each request in its own task, bounded by a semaphore.
+
+        The subscription callback only returns once a slot is free, so while
+        the method is saturated further messages stay in the subscription's
+        pending buffer and NATS slow-consumer limits still apply.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        in_flight = 0
+        in_flight_gauge = self._metrics.gauge_handle(
+            "rpc.{service}.{method}.in_flight", service=service, method=method
+        )
+        queue_wait_gauge = self._metrics.gauge_handle(
+            "rpc.{service}.{method}.queue_wait_ms", service=service, method=method
+        )
+
+        async def run(msg: Msg) -> None:
+            nonlocal in_flight
+            try:
+                await process(msg)
+            finally:
+                in_flight -= 1
+                in_flight_gauge.set(in_flight)
+                semaphore.release()
+
+        async def wrapper(msg: Msg) -> None:
+            nonlocal in_flight
+            received = time.perf_counter()
+            await semaphore.acquire()
+            queue_wait_gauge.set((time.perf_counter() - received) * 1000)
+            in_flight += 1
+            in_flight_gauge.set(in_flight)
+
+            task = asyncio.create_task(run(msg))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
+        return wrapper
+
     async def register_rpc_handler(
-        self, service: str, method: str, handler: Callable[[dict[str, Any]], Any]
+        self,
+        service: str,
+        method: str,
+        handler: Callable[[dict[str, Any]], Any],
+        options: RPCHandlerOptions | None = None,
     ) -> None:
-        """Register an RPC handler."""
+        """Register an RPC handler.
 
-        async def wrapper(msg: Msg) -> None:
-            with self._metrics.timer(f"rpc.{service}.{method}"):
+        Args:
+            service: Service name the method belongs to
+            method: RPC method name
+            handler: Handler called with the request params
+            options: Optional concurrency and offload settings. Without them
+                requests for the method are handled one at a time.
+        """
+        options = options or RPCHandlerOptions()
+        handler = self._bind_rpc_handler(handler, options)
+        timer = self._metrics.timer_handle("rpc.{service}.{method}", service=service, method=method)
+        successes = self._metrics.counter(
+            "rpc.{service}.{method}.success", service=service, method=method
+        )
+        errors = self._metrics.counter(
+            "rpc.{service}.{method}.error", service=service, method=method
+        )
+
+        async def process(msg: Msg) -> None:
+            with timer.time():
                 try:
                     # Parse request - msg.data is always bytes in NATS
                     try:
-                        request = detect_and_deserialize(msg.data, RPCRequest)
+                        request = detect_and_deserialize(
+                            msg.data, RPCRequest, self._config.validate_messages
+                        )
                     except SerializationError:
                         # Try the other format if auto-detection fails
                         data = msg.data.decode()
@@ -187,7 +387,7 @@ class NATSAdapter(MessageBusPort):
 
                     # Send response
                     await msg.respond(self._serializer.serialize(response))
-                    self._metrics.increment(f"rpc.{service}.{method}.success")
+                    successes.inc()
 
                 except Exception as e:
                     # Error response
@@ -197,16 +397,123 @@ class NATSAdapter(MessageBusPort):
                         error=str(e),
                     )
                     await msg.respond(self._serializer.serialize(response))
-                    self._metrics.increment(f"rpc.{service}.{method}.error")
+                    errors.inc()
+
+        if options.max_concurrency is None:
+            wrapper = process
+        else:
+            wrapper = self._dispatch_concurrently(process, options.max_concurrency, service, method)
+
+        self._rpc_callbacks[(service, method)] = wrapper
+        if options.join_queue_group:
+            await self.join_rpc_queue_group(service, method)
+        queue_group = f"rpc.{service}"
+
+        # Also listen on the per-instance subject so callers can address this
+        # instance directly after selecting it through service discovery
+        if self._instance_id:
+            instance_subject = SubjectPatterns.rpc_instance(service, self._instance_id, method)
+            connections = self._subscription_connections(instance_subject)
+            if len(connections) == 1:
+                await connections[0].subscribe(instance_subject, cb=wrapper)
+            else:
+                # A queue group private to this instance keeps delivery exactly-once
+                # while still spreading direct calls over the pool
+                for nc in connections:
+                    await nc.subscribe(
+                        instance_subject,
+                        queue=f"{queue_group}.{self._instance_id}",
+                        cb=wrapper,
+                    )
 
-        # Subscribe with queue group for load balancing
+    async def join_rpc_queue_group(self, service: str, method: str) -> None:
+        """Start receiving a registered method's load-balanced requests.
+
+        Args:
+            service: Service name the method belongs to
+            method: RPC method name
+        """
+        key = (service, method)
+        if key in self._rpc_queue_subscriptions:
+            return
+        if key not in self._rpc_callbacks:
+            raise ValueError(f"No RPC handler registered for {service}.{method}")
+
+        # Subscribe with queue group for load balancing across instances and,
+        # depending on the strategy, across this adapter's pooled connections
         subject = SubjectPatterns.rpc(service, method)
         queue_group = f"rpc.{service}"
-        # Only subscribe on first connection with queue group
-        await self._connections[0].subscribe(subject, queue=queue_group, cb=wrapper)
+        self._rpc_queue_subscriptions[key] = [
+            await nc.subscribe(subject, queue=queue_group, cb=self._rpc_callbacks[key])
+            for nc in self._subscription_connections(subject)
+        ]
+
+    async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+        """Stop receiving a method's load-balanced requests.
 
-    async def call_rpc(self, request: RPCRequest) -> RPCResponse:
-        """Make an RPC call."""
+        The queue group subscriptions are drained, so requests already
+        delivered to this instance are still answered.
+
+        Args:
+            service: Service name the method belongs to
+            method: RPC method name
+        """
+        for sub in self._rpc_queue_subscriptions.pop((service, method), []):
+            await sub.drain()
+
+    def _rpc_client_metrics(
+        self, service: str, method: str
+    ) -> tuple[TimerHandle, CounterHandle, CounterHandle, CounterHandle]:
+        """Get the timer and success/timeout/error counters for calls to a method."""
+        handles = self._client_rpc_metrics.get((service, method))
+        if handles is None:
+            handles = (
+                self._metrics.timer_handle(
+                    "rpc.client.{service}.{method}", service=service, method=method
+                ),
+                self._metrics.counter(
+                    "rpc.client.{service}.{method}.success", service=service, method=method
+                ),
+                self._metrics.counter(
+                    "rpc.client.{service}.{method}.timeout", service=service, method=method
+                ),
+                self._metrics.counter(
+                    "rpc.client.{service}.{method}.error", service=service, method=method
+                ),
+            )
+            self._client_rpc_metrics[(service, method)] = handles
+        return handles
+
+    def _event_counter(self, template: str, event: Event | EventView) -> CounterHandle:
+        """Get the counter for an event name template and the event's type."""
+        key = (template, event.domain, event.event_type)
+        counter = self._event_counters.get(key)
+        if counter is None:
+            counter = self._metrics.counter(
+                template, domain=event.domain, event_type=event.event_type
+            )
+            self._event_counters[key] = counter
+        return counter
+
+    def _event_timer(self, template: str, event: Event) -> TimerHandle:
+        """Get the timer for an event name template and the event's type."""
+        key = (template, event.domain, event.event_type)
+        timer = self._event_timers.get(key)
+        if timer is None:
+            timer = self._metrics.timer_handle(
+                template, domain=event.domain, event_type=event.event_type
+            )
+            self._event_timers[key] = timer
+        return timer
+
+    async def call_rpc(self, request: RPCRequest, instance_id: str | None = None) -> RPCResponse:
+        """Make an RPC call.
+
+        Args:
+            request: The RPC request to send
+            instance_id: Optional instance to address directly instead of the
+                service-wide queue group
+        """
         nc = self._get_connection()
 
         # Extract service and method from request
@@ -223,9 +530,13 @@ class NATSAdapter(MessageBusPort):
             service = "unknown"
             method = request.method
 
-        subject = SubjectPatterns.rpc(service, method)
+        if instance_id:
+            subject = SubjectPatterns.rpc_instance(service, instance_id, method)
+        else:
+            subject = SubjectPatterns.rpc(service, method)
 
-        with self._metrics.timer(f"rpc.client.{service}.{method}"):
+        timer, successes, timeouts, errors = self._rpc_client_metrics(service, method)
+        with timer.time():
             try:
                 # Send request
                 request_data = self._serializer.serialize(request)
@@ -237,19 +548,21 @@ class NATSAdapter(MessageBusPort):
                 )
 
                 # Parse response - response_msg.data is always bytes in NATS
-                response = detect_and_deserialize(response_msg.data, RPCResponse)
-                self._metrics.increment(f"rpc.client.{service}.{method}.success")
+                response = detect_and_deserialize(
+                    response_msg.data, RPCResponse, self._config.validate_messages
+                )
+                successes.inc()
                 return response
 
             except TimeoutError:
-                self._metrics.increment(f"rpc.client.{service}.{method}.timeout")
+                timeouts.inc()
                 return RPCResponse(
                     correlation_id=request.message_id,
                     success=False,
                     error=f"Timeout calling {service}.{method}",
                 )
             except Exception as e:
-                self._metrics.increment(f"rpc.client.{service}.{method}.error")
+                errors.inc()
                 return RPCResponse(
                     correlation_id=request.message_id,
                     success=False,
@@ -263,6 +576,7 @@ class NATSAdapter(MessageBusPort):
         handler: Callable[[Event], Awaitable[None]],
         durable: str | None = None,
         mode: str = "compete",
+        options: EventSubscriptionOptions | None = None,
     ) -> None:
         """Subscribe to events with compete or broadcast mode.
 
@@ -271,6 +585,12 @@ class NATSAdapter(MessageBusPort):
             handler: Handler function for events
             durable: Base durable subscription name
             mode: "compete" for load balanced or "broadcast" for all instances
+            options: Delivery options; ``pull`` fetches events in batches and
+                ``lazy_payload`` hands envelope events over as EventViews
+
+        Raises:
+            ValueError: If the mode is unknown, or ``ordered`` is requested in
+                compete mode
         """
         if not self._js:
             raise Exception("JetStream not initialized")
@@ -280,21 +600,32 @@ class NATSAdapter(MessageBusPort):
         if mode not in valid_modes:
             raise ValueError(f"Invalid mode: {mode}. Must be one of {valid_modes}")
 
+        if options and options.ordered and mode == "compete":
+            # Competing instances share one consumer; an ack-all from one would
+            # acknowledge events still being handled by another
+            raise ValueError("ordered delivery requires broadcast mode")
+
+        # Only lazy subscriptions are ever handed an EventView
+        callback = cast(EventCallback, handler)
+        if options and options.pull:
+            await self._subscribe_pull(pattern, callback, durable, mode, options)
+            return
+        lazy = bool(options and options.lazy_payload)
+
         async def wrapper(msg: Msg) -> None:
             try:
-                # Parse event - msg.data is always bytes in NATS
-                event = detect_and_deserialize(msg.data, Event)
+                event = self._decode_event(msg, lazy)
 
                 # Call handler
-                await handler(event)
+                await callback(event)
 
                 # Acknowledge only if JetStream message
                 if hasattr(msg, "ack"):
                     await msg.ack()
-                self._metrics.increment(f"events.processed.{event.domain}.{event.event_type}")
+                self._event_counter("events.processed.{domain}.{event_type}", event).inc()
 
             except Exception as e:
-                print(f"Event handler error: {e}")
+                self._logger.error("Event handler error", error=str(e), subject=msg.subject)
 
                 if hasattr(msg, "nak"):
                     await msg.nak()
@@ -304,13 +635,15 @@ class NATSAdapter(MessageBusPort):
         # For event patterns, use core NATS if pattern contains wildcards
         if "*" in pattern or ">" in pattern:
             # Use core NATS for wildcard subscriptions
-            nc = self._get_connection()
 
             # For compete mode with wildcards, use queue group
             if mode == "compete" and self._service_name:
-                await nc.subscribe(pattern, queue=self._service_name, cb=wrapper)
+                for nc in self._subscription_connections(pattern):
+                    await nc.subscribe(pattern, queue=self._service_name, cb=wrapper)
             else:
-                # Broadcast mode or no service name
+                # Broadcast mode or no service name - a plain subscription must only
+                # exist once per adapter or every event would be delivered repeatedly
+                nc = self._connections[self._connection_index(pattern)]
                 await nc.subscribe(pattern, cb=wrapper)
         else:
             # Use JetStream for specific subjects
@@ -338,7 +671,137 @@ class NATSAdapter(MessageBusPort):
                     subscribe_kwargs["durable"] = durable
                 # No queue for broadcast
 
-            await self._js.subscribe(**subscribe_kwargs)
+            await self._jetstream_for(pattern).subscribe(**subscribe_kwargs)
+
+    async def _subscribe_pull(
+        self,
+        pattern: str,
+        handler: EventCallback,
+        durable: str | None,
+        mode: str,
+        options: EventSubscriptionOptions,
+    ) -> None:
+        """Consume events from a durable pull consumer in flow-controlled batches.
+
+        Compete mode shares one consumer between the service's instances and
+        broadcast mode gives each instance its own. The pattern becomes the
+        consumer's filter subject, so wildcard subscriptions are as durable as
+        specific ones. The next batch is only fetched once the current one is
+        handled, and the server holds events back while ``max_ack_pending`` are
+        unacknowledged, so bursts wait in the stream rather than in the client.
+        """
+        name = durable or f"{self._service_name or 'events'}-{pattern}"
+        if mode == "broadcast" and self._instance_id:
+            name = f"{name}-{self._instance_id}"
+        # Consumer names may not contain subject tokens
+        name = name.replace("*", "star").replace(">", "all").replace(".", "-")
+
+        config = ConsumerConfig(
+            durable_name=name,
+            filter_subject=pattern,
+            ack_policy=AckPolicy.ALL if options.ordered else AckPolicy.EXPLICIT,
+            max_ack_pending=options.max_ack_pending,
+        )
+        subscription = await self._jetstream_for(pattern).pull_subscribe(
+            pattern, durable=name, config=config
+        )
+
+        task = asyncio.create_task(self._fetch_events(subscription, handler, options))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _fetch_events(
+        self,
+        subscription: Any,
+        handler: EventCallback,
+        options: EventSubscriptionOptions,
+    ) -> None:
+        """Fetch and handle batches from a pull subscription until cancelled."""
+        while True:
+            try:
+                msgs = await subscription.fetch(options.batch_size, timeout=options.fetch_timeout)
+            except TimeoutError:
+                continue
+            except Exception as e:
+                self._logger.error("Event fetch error", error=str(e))
+                self._metrics.increment("events.fetch_errors")
+                await asyncio.sleep(options.fetch_timeout)
+                continue
+
+            self._metrics.record("events.batch_size", len(msgs))
+            if options.ordered:
+                await self._handle_ordered_batch(msgs, handler, options.lazy_payload)
+            else:
+                await self._handle_batch(
+                    msgs, handler, options.max_concurrency, options.lazy_payload
+                )
+
+    async def _handle_event_msg(self, msg: Msg, handler: EventCallback, lazy: bool) -> bool:
+        """Deserialize and handle one event message; return whether it succeeded."""
+        try:
+            event = self._decode_event(msg, lazy)
+            await handler(event)
+            self._event_counter("events.processed.{domain}.{event_type}", event).inc()
+            return True
+        except Exception as e:
+            self._logger.error("Event handler error", error=str(e), subject=msg.subject)
+            self._metrics.increment("events.errors")
+            return False
+
+    async def _handle_batch(
+        self,
+        msgs: list[Msg],
+        handler: EventCallback,
+        max_concurrency: int,
+        lazy: bool,
+    ) -> None:
+        """Handle a fetched batch with bounded concurrency, acking each event.
+
+        Acks are fire-and-forget publishes to the reply subject, so no event
+        waits for a server round-trip before the next one is handled.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(msg: Msg) -> None:
+            async with semaphore:
+                handled = await self._handle_event_msg(msg, handler, lazy)
+            try:
+                if handled:
+                    await msg.ack()
+                else:
+                    await msg.nak()
+            except Exception:
+                self._metrics.increment("events.ack_errors")
+
+        if max_concurrency == 1:
+            for msg in msgs:
+                await run(msg)
+        else:
+            await asyncio.gather(*(run(msg) for msg in msgs))
+
+    async def _handle_ordered_batch(
+        self, msgs: list[Msg], handler: EventCallback, lazy: bool
+    ) -> None:
+        """Handle a fetched batch in order and acknowledge it with one ack-all.
+
+        On a failure the events handled so far are acknowledged and the rest
+        of the batch is rejected, so it is redelivered in its original order.
+        """
+        handled: Msg | None = None
+        failed_at = len(msgs)
+        for index, msg in enumerate(msgs):
+            if not await self._handle_event_msg(msg, handler, lazy):
+                failed_at = index
+                break
+            handled = msg
+
+        try:
+            if handled is not None:
+                await handled.ack()
+            for msg in msgs[failed_at:]:
+                await msg.nak()
+        except Exception:
+            self._metrics.increment("events.ack_errors")
 
     async def publish_event(self, event: Event) -> None:
         """Publish an event with retry logic for NATS client issues."""
@@ -347,8 +810,9 @@ class NATSAdapter(MessageBusPort):
 
         subject = SubjectPatterns.event(event.domain, event.event_type)
 
-        with self._metrics.timer(f"events.publish.{event.domain}.{event.event_type}"):
-            event_data = self._serializer.serialize(event)
+        with self._event_timer("events.publish.{domain}.{event_type}", event).time():
+            headers, event_data = self._encode_event(event)
+            headers[MSG_ID_HEADER] = event.message_id
 
             # Retry logic for empty response issue in NATS client
             max_retries = 3
@@ -356,11 +820,12 @@ class NATSAdapter(MessageBusPort):
 
             for attempt in range(max_retries):
                 try:
-                    await self._js.publish(
+                    await self._jetstream_for(subject).publish(
                         subject,
                         event_data,
+                        headers=headers,
                     )
-                    self._metrics.increment(f"events.published.{event.domain}.{event.event_type}")
+                    self._event_counter("events.published.{domain}.{event_type}", event).inc()
                     return  # Success
                 except json.JSONDecodeError as e:
                     # This is the empty response issue from NATS server
@@ -378,19 +843,153 @@ class NATSAdapter(MessageBusPort):
                     # Other errors, don't retry
                     raise
 
+    def _encode_event(self, event: Event) -> tuple[dict[str, str], bytes]:
+        """Encode an event as message headers and body."""
+        if self._config.header_envelope:
+            return encode_event(event, self._config.use_msgpack)
+        return {}, self._serializer.serialize(event)
+
+    def _decode_event(self, msg: Msg, lazy: bool = False) -> Event | EventView:
+        """Decode an inbound event.
+
+        Envelope messages of lazy subscriptions become an EventView that leaves
+        the payload encoded; everything else is decoded into an Event.
+        """
+        if is_envelope(msg.headers):
+            view = EventView(msg.headers, msg.data)
+            return view if lazy else view.to_event(self._config.validate_messages)
+        # msg.data is always bytes in NATS
+        return detect_and_deserialize(msg.data, Event, self._config.validate_messages)
+
+    def _get_event_publisher(self) -> JetStreamEventPublisher:
+        """Get the windowed publisher shared by batched event publishes."""
+        if self._event_publisher is None:
+            self._event_publisher = JetStreamEventPublisher(
+                self._jetstream_for,
+                self._encode_event,
+                self._metrics,
+                max_pending=self._config.publish_window,
+                flush_size=self._config.publish_flush_size,
+                flush_interval=self._config.publish_flush_interval,
+                ack_timeout=self._config.publish_ack_timeout,
+            )
+        return self._event_publisher
+
+    async def publish_event_async(self, event: Event) -> asyncio.Future[None]:
+        """Queue an event without waiting for its PubAck.
+
+        Up to ``publish_window`` events are in flight at once; this waits while
+        the window is full.
+
+        Returns:
+            Future that resolves when the stream has stored the event
+        """
+        if not self._js:
+            raise Exception("JetStream not initialized")
+        return await self._get_event_publisher().publish(event)
+
+    async def publish_events_batch(self, events: Sequence[Event]) -> dict[str, str]:
+        """Publish events through the PubAck window and wait for all of them.
+
+        Returns:
+            Error messages keyed by message id of events that were not stored
+        """
+        futures = [await self.publish_event_async(event) for event in events]
+        await self._get_event_publisher().flush()
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        errors = {
+            event.message_id: str(result) or type(result).__name__
+            for event, result in zip(events, results, strict=True)
+            if isinstance(result, BaseException)
+        }
+        if errors:
+            self._metrics.increment("events.publish_batch.failed", len(errors))
+        return errors
+
     # Command Implementation
+    @staticmethod
+    def _accepts_cancellation(handler: Callable[..., Any]) -> bool:
+        """Whether a command handler declares a parameter for a cancellation token."""
+        try:
+            parameters = inspect.signature(handler).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        positional = [
+            p
+            for p in parameters
+            if p.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        return len(positional) >= 3
+
+    async def _ensure_cancel_inbox(self) -> None:
+        """Subscribe once to cancellation requests for commands handled here."""
+        if self._cancel_inbox is not None:
+            return
+
+        async def cancel_handler(msg: Msg) -> None:
+            try:
+                request = self._decode_command_reply(msg.data)
+            except Exception:
+                request = {}
+            command_id = msg.subject.rsplit(".", 1)[-1]
+            reason = request.get("reason")
+
+            token = self._running_commands.get(command_id)
+            if token:
+                token.cancel(reason)
+            else:
+                # The command may still be queued in the stream
+                self._early_cancellations[command_id] = reason
+                while len(self._early_cancellations) > MAX_EARLY_CANCELLATIONS:
+                    self._early_cancellations.popitem(last=False)
+
+        subject = SubjectPatterns.command_cancel_inbox()
+        nc = self._connections[self._connection_index(subject)]
+        self._cancel_inbox = await nc.subscribe(subject, cb=cancel_handler)
+
+    async def _request_cancel(self, command_id: str, reason: str | None) -> None:
+        """Publish a cancellation request for a command."""
+        cancel_data = {"command_id": command_id, "reason": reason, "timestamp": time.time()}
+        nc = self._get_connection()
+        await nc.publish(
+            SubjectPatterns.command_cancel(command_id),
+            serialize_dict(cancel_data, self._config.use_msgpack),
+        )
+        self._metrics.increment("commands.cancel_requested")
+
     async def register_command_handler(
-        self, service: str, command: str, handler: Callable[[Command, Callable], Any]
+        self, service: str, command: str, handler: Callable[..., Any]
     ) -> None:
-        """Register a command handler."""
+        """Register a command handler.
+
+        Handlers declaring a third parameter receive a CancellationToken that
+        is cancelled when the sender calls ``cancel()`` on its command handle.
+        A handler that stops by raising CommandCancelledError completes the
+        command with status "cancelled".
+        """
         if not self._js:
             raise Exception("JetStream not initialized")
 
+        pass_token = self._accepts_cancellation(handler)
+        await self._ensure_cancel_inbox()
+        timer = self._metrics.timer_handle(
+            "commands.{service}.{command}", service=service, command=command
+        )
+        processed = self._metrics.counter(
+            "commands.processed.{service}.{command}", service=service, command=command
+        )
+        cancelled = self._metrics.counter(
+            "commands.cancelled.{service}.{command}", service=service, command=command
+        )
+
         async def wrapper(msg: Msg) -> None:
             try:
                 # Parse command
                 # Parse command - msg.data is always bytes in NATS
-                cmd = detect_and_deserialize(msg.data, Command)
+                cmd = detect_and_deserialize(msg.data, Command, self._config.validate_messages)
+                reply_scope = msg.headers.get(REPLY_SCOPE_HEADER) if msg.headers else None
 
                 # Progress reporter
                 async def report_progress(percent: float, status: str = "processing"):
@@ -402,81 +1001,110 @@ class NATSAdapter(MessageBusPort):
                     }
                     nc = self._get_connection()
                     await nc.publish(
-                        SubjectPatterns.command_progress(cmd.message_id),
+                        SubjectPatterns.command_progress(cmd.message_id, reply_scope),
                         serialize_dict(progress_data, self._config.use_msgpack),
                     )
 
+                token = CancellationToken(cmd.message_id)
+                if cmd.message_id in self._early_cancellations:
+                    token.cancel(self._early_cancellations.pop(cmd.message_id))
+                self._running_commands[cmd.message_id] = token
+
                 # Call handler
-                with self._metrics.timer(f"commands.{service}.{command}"):
-                    result = await handler(cmd, report_progress)
+                try:
+                    with timer.time():
+                        if pass_token:
+                            result = await handler(cmd, report_progress, token)
+                        else:
+                            result = await handler(cmd, report_progress)
+
+                    completion_data = {
+                        "command_id": cmd.message_id,
+                        "status": "completed",
+                        "result": result,
+                    }
+                except CommandCancelledError as e:
+                    completion_data = {
+                        "command_id": cmd.message_id,
+                        "status": "cancelled",
+                        "reason": e.reason,
+                    }
+                    cancelled.inc()
+                finally:
+                    self._running_commands.pop(cmd.message_id, None)
 
                 # Send completion
-                completion_data = {
-                    "command_id": cmd.message_id,
-                    "status": "completed",
-                    "result": result,
-                }
 
                 nc = self._get_connection()
                 await nc.publish(
-                    SubjectPatterns.command_callback(cmd.message_id),
+                    SubjectPatterns.command_callback(cmd.message_id, reply_scope),
                     serialize_dict(completion_data, self._config.use_msgpack),
                 )
 
                 # Acknowledge
                 await msg.ack()
-                self._metrics.increment(f"commands.processed.{service}.{command}")
+                processed.inc()
 
             except Exception as e:
-                print(f"Command handler error: {e}")
+                self._logger.error(
+                    "Command handler error", error=str(e), service=service, command=command
+                )
                 await msg.nak()
                 self._metrics.increment("commands.errors")
 
         # Subscribe with JetStream
         subject = SubjectPatterns.command(service, command)
-        await self._js.subscribe(
+        await self._jetstream_for(subject).subscribe(
             subject,
             cb=wrapper,
             durable=f"{service}-{command}",
             manual_ack=True,
         )
 
-    async def send_command(self, command: Command, track_progress: bool = True) -> dict[str, Any]:
-        """Send a command."""
-        if not self._js:
-            raise Exception("JetStream not initialized")
+    async def _ensure_command_inbox(self) -> None:
+        """Subscribe this adapter's progress and completion inboxes once.
 
-        service = command.target or "unknown"
-        subject = SubjectPatterns.command(service, command.command)
-
-        # Track progress if requested
-        if track_progress:
-            progress_updates = []
-            completion_data = None
+        With ``legacy_command_replies`` the unscoped subjects are subscribed
+        too, so commands still complete against handlers that do not honour
+        the reply scope header during a rolling upgrade.
+        """
+        async with self._command_inbox_lock:
+            if self._command_inbox:
+                return
 
             async def progress_handler(msg: Msg) -> None:
-                if isinstance(msg.data, bytes) and is_msgpack(msg.data):
-                    progress_updates.append(deserialize_params(msg.data, self._config.use_msgpack))
-                else:
-                    progress_updates.append(json.loads(msg.data.decode()))
+                handle = self._pending_commands.get(msg.subject.rsplit(".", 1)[-1])
+                if handle:
+                    handle._on_progress(self._decode_command_reply(msg.data))
 
             async def completion_handler(msg: Msg) -> None:
-                nonlocal completion_data
-                if isinstance(msg.data, bytes) and is_msgpack(msg.data):
-                    completion_data = deserialize_params(msg.data, self._config.use_msgpack)
-                else:
-                    completion_data = json.loads(msg.data.decode())
+                handle = self._pending_commands.get(msg.subject.rsplit(".", 1)[-1])
+                if handle:
+                    handle._finish(self._decode_command_reply(msg.data))
+
+            subjects = [
+                (SubjectPatterns.command_progress_inbox(self._reply_scope), progress_handler),
+                (SubjectPatterns.command_callback_inbox(self._reply_scope), completion_handler),
+            ]
+            if self._config.legacy_command_replies:
+                subjects += [
+                    (SubjectPatterns.command_progress("*"), progress_handler),
+                    (SubjectPatterns.command_callback("*"), completion_handler),
+                ]
 
-            # Subscribe to progress
             nc = self._get_connection()
-            progress_sub = await nc.subscribe(
-                SubjectPatterns.command_progress(command.message_id),
-                cb=progress_handler,
-            )
-            completion_sub = await nc.subscribe(
-                SubjectPatterns.command_callback(command.message_id),
-                cb=completion_handler,
-            )
+            self._command_inbox = [await nc.subscribe(subject, cb=cb) for subject, cb in subjects]
+
+    def _decode_command_reply(self, data: bytes) -> dict[str, Any]:
+        """Decode a progress, completion or cancellation message."""
+        if isinstance(data, bytes) and is_msgpack(data):
+            return deserialize_params(data, self._config.use_msgpack)
+        return json.loads(data.decode())
+
+    async def _publish_command(self, command: Command, headers: dict[str, str] | None) -> Any:
+        """Publish a command to its JetStream subject and return the ack."""
+        service = command.target or "unknown"
+        subject = SubjectPatterns.command(service, command.command)
 
         # Send command with retry logic
         with self._metrics.timer(f"commands.send.{service}.{command.command}"):
@@ -488,11 +1116,11 @@ class NATSAdapter(MessageBusPort):
 
             for attempt in range(max_retries):
                 try:
-                    ack = await self._js.publish(
+                    return await self._jetstream_for(subject).publish(
                         subject,
                         command_data,
+                        headers=headers,
                     )
-                    break  # Success
                 except json.JSONDecodeError as e:
                     if attempt < max_retries - 1:
                         await asyncio.sleep(retry_delay * (2**attempt))
@@ -503,23 +1131,46 @@ class NATSAdapter(MessageBusPort):
                             f"JetStream publish failed after {max_retries} attempts: {e}"
                         ) from e
 
-        if track_progress:
-            # Wait for completion
-            start_time = time.time()
-            while completion_data is None and (time.time() - start_time) < command.timeout:
-                await asyncio.sleep(0.1)
+    async def start_command(self, command: Command) -> NATSCommandHandle:
+        """Send a command and return a handle for streaming its progress.
 
-            # Cleanup
-            await progress_sub.unsubscribe()
-            await completion_sub.unsubscribe()
+        Progress and completion are delivered through this adapter's command
+        inbox. The handle resolves with an error result once the command's
+        timeout expires without a completion.
+        """
+        if not self._js:
+            raise Exception("JetStream not initialized")
 
-            return completion_data or {"error": "Command timeout"}
-        else:
-            return {
-                "command_id": command.message_id,
-                "stream": ack.stream,
-                "seq": ack.seq,
-            }
+        await self._ensure_command_inbox()
+        handle = NATSCommandHandle(self, command)
+        self._pending_commands[command.message_id] = handle
+        try:
+            await self._publish_command(command, {REPLY_SCOPE_HEADER: self._reply_scope})
+        except Exception:
+            handle._discard()
+            raise
+        return handle
+
+    async def send_command(self, command: Command, track_progress: bool = True) -> dict[str, Any]:
+        """Send a command.
+
+        With ``track_progress`` the call waits for the handler's completion
+        callback, which is delivered through this adapter's command inbox and
+        resolves the call as soon as it arrives.
+        """
+        if not self._js:
+            raise Exception("JetStream not initialized")
+
+        if track_progress:
+            handle = await self.start_command(command)
+            return await handle.result()
+
+        ack = await self._publish_command(command, None)
+        return {
+            "command_id": command.message_id,
+            "stream": ack.stream,
+            "seq": ack.seq,
+        }
 
     # Service Registration
     async def register_service(self, service_name: str, instance_id: str) -> None:
@@ -570,23 +1221,10 @@ class NATSAdapter(MessageBusPort):
 
         nc = self._get_connection()
 
-        # Get metrics snapshot using proper domain model
-        metrics_data = self._metrics.get_all()
-        if isinstance(metrics_data, MetricsSnapshot):
-            metrics_snapshot = metrics_data
-        else:
-            # Legacy dict format
-            metrics_snapshot = MetricsSnapshot(
-                uptime_seconds=metrics_data.get("uptime", 0.0),
-                counters=metrics_data.get("counters", {}),
-                gauges=metrics_data.get("gauges", {}),
-                summaries=metrics_data.get("summaries", {}),
-            )
-
+        # Metrics are scraped through an exporter, so heartbeats stay small
         heartbeat_data = {
             "instance_id": str(instance),
             "timestamp": time.time(),
-            "metrics": metrics_snapshot.model_dump(),
         }
         await nc.publish(
             SubjectPatterns.heartbeat(str(service)),
@@ -51,6 +51,12 @@ class NatsKvElectionRepository(ElectionRepository):
         self._metrics = metrics or InMemoryMetrics()
         self._election_service = StickyActiveElectionService()
         self._watch_tasks: dict[str, asyncio.Task] = {}
+        # Leader keys held by this process: key -> (revision, instance_id, metadata).
+        # Lets a heartbeat refresh leadership with one revision-checked update.
+        self._held_leaderships: dict[str, tuple[int, str, dict[str, Any]]] = {}
+        # Last election state written or read per state key. State keys are
+        # per instance, so only this process writes them.
+        self._election_states: dict[str, dict[str, Any]] = {}
 
     async def attempt_leadership(
         self,
@@ -80,7 +86,8 @@ class NatsKvElectionRepository(ElectionRepository):
             # Try to create the leader key with TTL
             # This will only succeed if the key doesn't exist
             options = KVOptions(create_only=True, ttl=ttl_seconds)
-            await self._kv_store.put(leader_key, leader_value, options)
+            revision = await self._kv_store.put(leader_key, leader_value, options)
+            self._remember_leadership(leader_key, revision, str(instance_id), metadata)
 
             self._metrics.increment("election.leadership.acquired")
             self._logger.info(
@@ -119,6 +126,10 @@ class NatsKvElectionRepository(ElectionRepository):
 
         This refreshes the TTL and updates the last_heartbeat timestamp.
         Only succeeds if the instance is the current leader.
+
+        When this process acquired or last refreshed the key, the refresh is a
+        single update conditioned on the known revision. Otherwise, or if that
+        update is rejected, the current value is read and verified first.
         """
         leader_key = self._election_service.create_leader_key(str(service_name), group_id)
 
@@ -130,6 +141,33 @@ class NatsKvElectionRepository(ElectionRepository):
             group_id=group_id,
         )
 
+        held = self._held_leaderships.pop(leader_key, None)
+        if held and held[1] == str(instance_id):
+            revision, _, held_metadata = held
+            try:
+                updated_value = self._election_service.create_leader_value(
+                    str(instance_id), metadata or held_metadata
+                )
+                options = KVOptions(update_only=True, revision=revision, ttl=ttl_seconds)
+                new_revision = await self._kv_store.put(leader_key, updated_value, options)
+                self._remember_leadership(
+                    leader_key, new_revision, str(instance_id), metadata or held_metadata
+                )
+
+                self._metrics.increment("election.leadership.updated")
+                self._logger.debug(
+                    f"Leadership updated: {service_name}/{instance_id} in group {group_id}",
+                    extra=log_ctx.to_dict(),
+                )
+                return True
+            except Exception as e:
+                # Someone else wrote the key; fall back to a verified update
+                self._metrics.increment("election.leadership.revision_stale")
+                self._logger.debug(
+                    f"Cached leader revision rejected, re-reading: {e}",
+                    extra=log_ctx.to_dict(),
+                )
+
         try:
             # Get current leader value
             current_entry = await self._kv_store.get(leader_key)
@@ -163,7 +201,10 @@ class NatsKvElectionRepository(ElectionRepository):
                 revision=current_entry.revision,
                 ttl=ttl_seconds,
             )
-            await self._kv_store.put(leader_key, updated_value, options)
+            revision = await self._kv_store.put(leader_key, updated_value, options)
+            self._remember_leadership(
+                leader_key, revision, str(instance_id), metadata or current_metadata
+            )
 
             self._metrics.increment("election.leadership.updated")
             self._logger.debug(
@@ -218,6 +259,7 @@ class NatsKvElectionRepository(ElectionRepository):
     ) -> bool:
         """Release leadership voluntarily."""
         leader_key = self._election_service.create_leader_key(str(service_name), group_id)
+        self._held_leaderships.pop(leader_key, None)
 
         log_ctx = LogContext(
             operation="release_leadership",
@@ -324,9 +366,12 @@ class NatsKvElectionRepository(ElectionRepository):
         self,
         election: StickyActiveElection,
     ) -> None:
-        """Save the election aggregate state."""
-        # Create state key for this instance
-        state_key = f"election-state.{election.service_name.value}.{election.instance_id.value}.{election.group_id}"
+        """Save the election aggregate state.
+
+        The write is skipped when the state is unchanged since it was last
+        saved or loaded, which is the common case for standby heartbeats.
+        """
+        state_key = self._state_key(election.service_name, election.instance_id, election.group_id)
 
         # Serialize the election state
         state_data = {
@@ -356,7 +401,11 @@ class NatsKvElectionRepository(ElectionRepository):
             ),
         }
 
+        if self._election_states.get(state_key) == state_data:
+            return
+
         await self._kv_store.put(state_key, state_data)
+        self._election_states[state_key] = state_data
         self._logger.debug(f"Saved election state for {state_key}")
 
     async def get_election_state(
@@ -365,19 +414,23 @@ class NatsKvElectionRepository(ElectionRepository):
         instance_id: InstanceId,
         group_id: str,
     ) -> StickyActiveElection | None:
-        """Retrieve the election aggregate state."""
-        state_key = f"election-state.{service_name.value}.{instance_id.value}.{group_id}"
+        """Retrieve the election aggregate state.
+
+        Served from the last saved or loaded state when available.
+        """
+        state_key = self._state_key(service_name, instance_id, group_id)
 
         try:
-            entry = await self._kv_store.get(state_key)
-            if not entry:
-                return None
+            state_data = self._election_states.get(state_key)
+            if state_data is None:
+                entry = await self._kv_store.get(state_key)
+                if not entry:
+                    return None
+                state_data = entry.value
 
             # Deserialize state
             from datetime import datetime
 
-            state_data = entry.value
-
             # Convert ISO strings back to datetime objects
             def parse_datetime(iso_str: str | None) -> datetime | None:
                 if iso_str:
@@ -409,6 +462,7 @@ class NatsKvElectionRepository(ElectionRepository):
             # Clear initialization event since we're loading from storage
             election.mark_events_committed()
 
+            self._election_states[state_key] = state_data
             return election
 
         except Exception as e:
@@ -422,10 +476,27 @@ class NatsKvElectionRepository(ElectionRepository):
         group_id: str,
     ) -> None:
         """Delete the election aggregate state."""
-        state_key = f"election-state.{service_name.value}.{instance_id.value}.{group_id}"
+        state_key = self._state_key(service_name, instance_id, group_id)
+        self._election_states.pop(state_key, None)
 
         try:
             await self._kv_store.delete(state_key)
             self._logger.debug(f"Deleted election state for {state_key}")
         except Exception as e:
             self._logger.exception(f"Failed to delete election state: {e}")
+
+    def _remember_leadership(
+        self,
+        leader_key: str,
+        revision: int,
+        instance_id: str,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        """Record the revision of a leader key this process just wrote."""
+        if isinstance(revision, int):
+            self._held_leaderships[leader_key] = (revision, instance_id, metadata or {})
+
+    @staticmethod
+    def _state_key(service_name: ServiceName, instance_id: InstanceId, group_id: str) -> str:
+        """Build the KV key holding an instance's election state."""
+        return f"election-state.{service_name.value}.{instance_id.value}.{group_id}"
@@ -1,8 +1,10 @@
 """NATS KV Store adapter - Concrete implementation of KVStorePort."""
 
 import asyncio
+import contextlib
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
 from typing import Any
 
 from nats.js.kv import KeyValue
@@ -14,7 +16,7 @@ from ..domain.exceptions import (
     KVRevisionMismatchError,
     KVStoreError,
 )
-from ..domain.models import KVEntry, KVOptions, KVWatchEvent
+from ..domain.models import KVBatchResult, KVEntry, KVOptions, KVWatchEvent
 from ..ports.kv_store import KVStorePort
 from ..ports.logger import LoggerPort
 from ..ports.message_bus import MessageBusPort
@@ -24,6 +26,24 @@ from .in_memory_metrics import InMemoryMetrics
 from .nats_adapter import NATSAdapter
 from .simple_logger import SimpleLogger
 
+DEFAULT_BATCH_WINDOW = 64
+# Upper bound on subjects sent in a single multi_last direct get request
+DIRECT_GET_MAX_SUBJECTS = 1024
+# Marker passed through the watch pipeline once a watcher has replayed current values
+_WATCH_SYNCED = object()
+
+
+def _parse_nats_timestamp(value: str | None) -> str:
+    """Convert a NATS RFC 3339 timestamp (nanosecond precision) to ISO format."""
+    if not value:
+        return datetime.now(UTC).isoformat()
+    base, _, fraction = value.rstrip("Z").partition(".")
+    micros = fraction[:6].ljust(6, "0") if fraction else "000000"
+    try:
+        return datetime.fromisoformat(f"{base}.{micros}+00:00").isoformat()
+    except ValueError:
+        return datetime.now(UTC).isoformat()
+
 
 class NATSKVStore(KVStorePort):
     """NATS implementation of the KV Store port.
@@ -52,24 +72,34 @@ class NATSKVStore(KVStorePort):
         self._logger = logger or SimpleLogger("aegis_sdk.nats_kv_store")
         self._config: KVStoreConfig | None = config
         self._kv: KeyValue | None = None
+        self._kv_pool: list[KeyValue] = []
         self._bucket_name: str | None = None
 
     def _validate_key(self, key: str) -> None:
         """Validate a key for NATS compatibility.
 
+        Dots separate the tokens of the key's subject, so hierarchical keys
+        such as ``service-instances.<service>.<instance>`` can be watched by
+        prefix with a server-side filter. Tokens must not be empty.
+
         Args:
             key: The key to validate
 
         Raises:
-            ValueError: If key contains invalid characters
+            ValueError: If key contains invalid characters or an empty token
         """
-        invalid_chars = {".", "*", ">", "/", "\\", ":", " ", "\t"}
+        invalid_chars = {"*", ">", "/", "\\", ":", " ", "\t"}
         for char in invalid_chars:
             if char in key:
                 raise ValueError(
                     f"Key '{key}' contains invalid character '{char}'. "
                     f"NATS KV keys cannot contain: {', '.join(sorted(invalid_chars))}"
                 )
+        if "" in key.split("."):
+            raise ValueError(
+                f"Key '{key}' has an empty token. Dots separate key tokens and "
+                "cannot lead, trail or repeat."
+            )
 
     async def _create_kv_stream_with_ttl(self, bucket: str) -> bool:
         """Create a KV stream with per-message TTL enabled.
@@ -221,6 +251,7 @@ class NATSKVStore(KVStorePort):
                 self._kv = await self._nats_adapter._js.key_value(bucket)
 
             self._bucket_name = bucket
+            self._kv_pool = [self._kv, *await self._open_pool_handles(bucket)]
             self._metrics.gauge("kv.buckets.active", 1)
             self._logger.info(f"Connected to NATS KV bucket: {bucket}", extra=log_ctx.to_dict())
         except Exception as e:
@@ -235,9 +266,29 @@ class NATSKVStore(KVStorePort):
                 operation="connect",
             ) from e
 
+    async def _open_pool_handles(self, bucket: str) -> list[KeyValue]:
+        """Open bucket handles on the adapter's other pooled connections.
+
+        Batch operations spread their requests over these handles so a large
+        batch is not serialized through a single connection.
+        """
+        handles: list[KeyValue] = []
+        try:
+            contexts = list(self._nats_adapter._js_contexts[1:])  # type: ignore[attr-defined]
+        except Exception:
+            return handles
+
+        for js in contexts:
+            try:
+                handles.append(await js.key_value(bucket))
+            except Exception as e:
+                self._logger.debug(f"Skipping pooled connection for KV batches: {e}")
+        return handles
+
     async def disconnect(self) -> None:
         """Disconnect from the KV store."""
         self._kv = None
+        self._kv_pool = []
         self._bucket_name = None
         self._metrics.gauge("kv.buckets.active", 0)
 
@@ -254,9 +305,13 @@ class NATSKVStore(KVStorePort):
         # Validate key
         self._validate_key(key)
 
+        return await self._get_entry(self._kv, key)
+
+    async def _get_entry(self, kv: KeyValue, key: str) -> KVEntry | None:
+        """Fetch and convert a single entry using the given bucket handle."""
         with self._metrics.timer(f"kv.get.{self._bucket_name}"):
             try:
-                entry = await self._kv.get(key)
+                entry = await kv.get(key)
 
                 # Deserialize value
                 value = json.loads(entry.value.decode()) if entry.value else None
@@ -309,6 +364,12 @@ class NATSKVStore(KVStorePort):
         # Validate key
         self._validate_key(key)
 
+        return await self._put_entry(self._kv, key, value, options)
+
+    async def _put_entry(
+        self, kv: KeyValue, key: str, value: Any, options: KVOptions | None = None
+    ) -> int:
+        """Write a single entry using the given bucket handle."""
         with self._metrics.timer(f"kv.put.{self._bucket_name}"):
             try:
                 # Serialize value
@@ -319,45 +380,32 @@ class NATSKVStore(KVStorePort):
                     if options.create_only:
                         # Use create for exclusive creation
                         try:
-                            revision = await self._kv.create(key, serialized)
+                            revision = await kv.create(key, serialized)
                         except Exception as e:
                             # Convert NATS-specific error to domain exception
                             if "wrong last sequence" in str(e) or "duplicate" in str(e).lower():
                                 raise KVKeyAlreadyExistsError(key) from e
                             raise
+                    elif options.revision is not None:
+                        # Server-side compare-and-set: the write carries the
+                        # expected last subject sequence and is rejected if the
+                        # key has moved on, with no read beforehand
+                        revision = await self._compare_and_set(
+                            kv, key, serialized, options.revision
+                        )
                     elif options.update_only:
-                        # Use update for existing keys only
-                        # If no revision specified, get current revision
-                        if options.revision is None:
-                            try:
-                                current = await self._kv.get(key)
-                                last_revision = current.revision
-                            except Exception as err:
-                                raise KVKeyNotFoundError(key, self._bucket_name) from err
-                        else:
-                            last_revision = options.revision
-                        revision = await self._kv.update(key, serialized, last_revision)
+                        # JetStream has no "key must exist" precondition, so without
+                        # a known revision this costs a read to learn the current one
+                        # before the compare-and-set. Callers holding the revision
+                        # should pass it and take the single round-trip path above.
+                        try:
+                            current = await kv.get(key)
+                        except Exception as err:
+                            raise KVKeyNotFoundError(key, self._bucket_name) from err
+                        revision = await self._compare_and_set(
+                            kv, key, serialized, current.revision
+                        )
                     else:
-                        # Normal put with optional revision check
-                        # NATS KV doesn't support revision check on regular put
-                        if options.revision is not None:
-                            # Get current revision and verify
-                            try:
-                                current = await self._kv.get(key)
-                                if current.revision != options.revision:
-                                    raise KVRevisionMismatchError(
-                                        key, options.revision, current.revision or 0
-                                    )
-                            except KVRevisionMismatchError:
-                                # Re-raise revision mismatch as-is
-                                raise
-                            except Exception as err:
-                                if "not found" in str(err).lower():
-                                    raise KVKeyNotFoundError(key, self._bucket_name) from err
-                                raise KVStoreError(
-                                    "Revision check failed", key=key, operation="put"
-                                ) from err
-
                         # Put with TTL if specified
                         if options.ttl:
                             # IMPORTANT: Per-message TTL doesn't work reliably with KV stores
@@ -367,13 +415,13 @@ class NATSKVStore(KVStorePort):
                                 f"TTL requested ({options.ttl}s) but using stream-level TTL instead for key={key}"
                             )
                             # Use normal put - stream max_age will handle TTL
-                            revision = await self._kv.put(key, serialized)
+                            revision = await kv.put(key, serialized)
                             self._metrics.increment("kv.put.stream_ttl")
                         else:
-                            revision = await self._kv.put(key, serialized)
+                            revision = await kv.put(key, serialized)
                 else:
                     # Normal put without options
-                    revision = await self._kv.put(key, serialized)
+                    revision = await kv.put(key, serialized)
 
                 self._metrics.increment("kv.put.success")
                 assert isinstance(revision, int)  # mypy type narrowing
@@ -383,6 +431,21 @@ class NATSKVStore(KVStorePort):
                 self._metrics.increment("kv.put.error")
                 raise
 
+    async def _compare_and_set(
+        self, kv: KeyValue, key: str, serialized: bytes, expected: int
+    ) -> int:
+        """Write a key only if its latest revision is still ``expected``."""
+        try:
+            return await kv.update(key, serialized, last=expected)
+        except Exception as e:
+            if "wrong last sequence" not in str(e):
+                raise
+            # The server reports the actual sequence, e.g. "wrong last sequence: 12"
+            actual = str(e).rsplit(":", 1)[-1].strip()
+            raise KVRevisionMismatchError(
+                key, expected, int(actual) if actual.isdigit() else 0
+            ) from e
+
     async def delete(self, key: str, revision: int | None = None) -> bool:
         """Delete a key with optional revision check."""
         if not self._kv:
@@ -391,12 +454,16 @@ class NATSKVStore(KVStorePort):
         # Validate key
         self._validate_key(key)
 
+        return await self._delete_entry(self._kv, key, revision)
+
+    async def _delete_entry(self, kv: KeyValue, key: str, revision: int | None = None) -> bool:
+        """Delete a single entry using the given bucket handle."""
         with self._metrics.timer(f"kv.delete.{self._bucket_name}"):
             try:
                 if revision is not None:
-                    await self._kv.delete(key, last=revision)
+                    await kv.delete(key, last=revision)
                 else:
-                    await self._kv.delete(key)
+                    await kv.delete(key)
 
                 self._metrics.increment("kv.delete.success")
                 return True
@@ -436,43 +503,278 @@ class NATSKVStore(KVStorePort):
             # No keys found
             return []
 
+    @property
+    def batch_window(self) -> int:
+        """Maximum number of requests a batch operation keeps in flight."""
+        return self._config.batch_window if self._config else DEFAULT_BATCH_WINDOW
+
+    async def _run_batch(
+        self,
+        operation: str,
+        items: list[tuple[str, Any]],
+        handler: Callable[[KeyValue, str, Any], Awaitable[Any]],
+    ) -> tuple[dict[str, Any], dict[str, Exception]]:
+        """Pipeline ``handler`` over ``items`` with a bounded in-flight window.
+
+        A fixed number of workers pull from a shared iterator, so at most
+        ``batch_window`` requests are outstanding at any time. Workers are spread
+        round-robin over the pooled bucket handles.
+
+        Returns:
+            Tuple of (results, errors) keyed by KV key, in input order
+        """
+        if not self._kv:
+            raise KVNotConnectedError(f"{operation}_many")
+
+        results: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+        if not items:
+            return results, errors
+
+        pool = self._kv_pool or [self._kv]
+        pending = iter(items)
+
+        async def worker(kv: KeyValue) -> None:
+            for key, item in pending:
+                try:
+                    self._validate_key(key)
+                    results[key] = await handler(kv, key, item)
+                except Exception as e:
+                    errors[key] = e
+
+        window = min(self.batch_window, len(items))
+        with self._metrics.timer(f"kv.{operation}_many.{self._bucket_name}"):
+            await asyncio.gather(*(worker(pool[i % len(pool)]) for i in range(window)))
+
+        if errors:
+            self._metrics.increment(f"kv.{operation}_many.error", len(errors))
+
+        order = [key for key, _ in items]
+        return (
+            {key: results[key] for key in order if key in results},
+            {key: errors[key] for key in order if key in errors},
+        )
+
+    @staticmethod
+    def _to_batch_result(results: dict[str, Any], errors: dict[str, Exception]) -> KVBatchResult:
+        return KVBatchResult(
+            results=results,
+            errors={key: str(error) or type(error).__name__ for key, error in errors.items()},
+        )
+
+    async def get_batch(self, keys: list[str], direct: bool | None = None) -> KVBatchResult:
+        """Get many keys concurrently, reporting per-key results and errors.
+
+        Args:
+            keys: Keys to fetch
+            direct: Use a single multi-subject direct get instead of per-key
+                requests. Defaults to ``KVStoreConfig.direct_get_batch``.
+
+        Returns:
+            Batch result whose ``results`` only contain keys that were found
+        """
+        if direct is None:
+            direct = self._config.direct_get_batch if self._config else False
+
+        if direct:
+            try:
+                return await self._direct_get_batch(keys)
+            except KVNotConnectedError:
+                raise
+            except Exception as e:
+                self._logger.warning(
+                    f"Direct get batch failed, falling back to pipelined gets: {e}"
+                )
+
+        async def fetch(kv: KeyValue, key: str, _: Any) -> KVEntry | None:
+            return await self._get_entry(kv, key)
+
+        results, errors = await self._run_batch("get", [(key, None) for key in keys], fetch)
+        found = {key: entry for key, entry in results.items() if entry is not None}
+        return self._to_batch_result(found, errors)
+
+    async def _put_entries(
+        self, entries: dict[str, Any], options: KVOptions | None
+    ) -> tuple[dict[str, Any], dict[str, Exception]]:
+        async def store(kv: KeyValue, key: str, value: Any) -> int:
+            return await self._put_entry(kv, key, value, options)
+
+        return await self._run_batch("put", list(entries.items()), store)
+
+    async def put_batch(
+        self, entries: dict[str, Any], options: KVOptions | None = None
+    ) -> KVBatchResult:
+        """Put many entries concurrently, reporting per-key revisions and errors."""
+        results, errors = await self._put_entries(entries, options)
+        return self._to_batch_result(results, errors)
+
+    async def delete_batch(self, keys: list[str]) -> KVBatchResult:
+        """Delete many keys concurrently, reporting per-key outcomes and errors."""
+
+        async def remove(kv: KeyValue, key: str, _: Any) -> bool:
+            return await self._delete_entry(kv, key)
+
+        results, errors = await self._run_batch("delete", [(key, None) for key in keys], remove)
+        return self._to_batch_result(results, errors)
+
     async def get_many(self, keys: list[str]) -> dict[str, KVEntry]:
-        """Get multiple values by keys."""
-        results = {}
+        """Get multiple values by keys.
 
+        Raises:
+            ValueError: If any key is invalid; nothing is fetched then
+        """
         for key in keys:
-            entry = await self.get(key)
-            if entry:
-                results[key] = entry
-
-        return results
+            self._validate_key(key)
+        batch = await self.get_batch(keys)
+        return dict(batch.results)
 
     async def put_many(
         self, entries: dict[str, Any], options: KVOptions | None = None
     ) -> dict[str, int]:
-        """Put multiple key-value pairs."""
-        results = {}
+        """Put multiple key-value pairs.
 
-        for key, value in entries.items():
-            revision = await self.put(key, value, options)
-            results[key] = revision
+        All entries are attempted; if any of them fails, the first failure in
+        input order is raised after the batch completes.
 
+        Raises:
+            ValueError: If any key is invalid; nothing is written then
+        """
+        for key in entries:
+            self._validate_key(key)
+        results, errors = await self._put_entries(entries, options)
+        if errors:
+            raise next(iter(errors.values()))
         return results
 
     async def delete_many(self, keys: list[str]) -> dict[str, bool]:
-        """Delete multiple keys."""
-        results = {}
+        """Delete multiple keys.
 
+        Raises:
+            ValueError: If any key is invalid; nothing is deleted then
+        """
         for key in keys:
-            results[key] = await self.delete(key)
+            self._validate_key(key)
+        batch = await self.delete_batch(keys)
+        return {key: bool(batch.results.get(key, False)) for key in keys}
 
-        return results
+    async def _direct_get_batch(self, keys: list[str]) -> KVBatchResult:
+        """Fetch the latest value of many keys with multi-subject direct gets.
+
+        Relies on ``allow_direct`` being enabled on the bucket stream and a
+        server that supports ``multi_last`` direct get requests. Keys are sent
+        in chunks, spread over the adapter's pooled connections.
+        """
+        if not self._kv:
+            raise KVNotConnectedError("get_many")
+        if not isinstance(self._nats_adapter, NATSAdapter) or not self._nats_adapter._connections:
+            raise KVStoreError("Direct get requires a connected NATSAdapter", operation="get_many")
+
+        errors: dict[str, str] = {}
+        valid_keys: list[str] = []
+        for key in keys:
+            try:
+                self._validate_key(key)
+                valid_keys.append(key)
+            except ValueError as e:
+                errors[key] = str(e)
+
+        connections = self._nats_adapter._connections
+        chunks = [
+            valid_keys[i : i + DIRECT_GET_MAX_SUBJECTS]
+            for i in range(0, len(valid_keys), DIRECT_GET_MAX_SUBJECTS)
+        ]
+        with self._metrics.timer(f"kv.get_many.direct.{self._bucket_name}"):
+            found_chunks = await asyncio.gather(
+                *(
+                    self._direct_get_chunk(connections[i % len(connections)], chunk)
+                    for i, chunk in enumerate(chunks)
+                )
+            )
+
+        found: dict[str, KVEntry] = {}
+        for chunk_result in found_chunks:
+            found.update(chunk_result)
+        return KVBatchResult(
+            results={key: found[key] for key in valid_keys if key in found}, errors=errors
+        )
+
+    async def _direct_get_chunk(self, nc: Any, keys: list[str]) -> dict[str, KVEntry]:
+        """Issue one multi-subject direct get and collect the streamed replies."""
+        prefix = f"$KV.{self._bucket_name}."
+        inbox = nc.new_inbox()
+        sub = await nc.subscribe(inbox)
+        found: dict[str, KVEntry] = {}
+        try:
+            request = {"multi_last": [prefix + key for key in keys], "batch": len(keys)}
+            await nc.publish(
+                f"$JS.API.DIRECT.GET.KV_{self._bucket_name}",
+                json.dumps(request).encode(),
+                reply=inbox,
+            )
+            while True:
+                msg = await sub.next_msg(timeout=5.0)
+                headers = msg.headers or {}
+                status = headers.get("Status")
+                if status:
+                    # 204 marks the end of the batch, 404 means nothing matched
+                    if status in ("204", "404"):
+                        return found
+                    raise KVStoreError(
+                        f"Direct get failed: {status} {headers.get('Description', '')}".strip(),
+                        operation="get_many",
+                    )
+
+                # Skip delete/purge markers, they mean the key no longer exists
+                if headers.get("KV-Operation") in ("DEL", "PURGE"):
+                    continue
+
+                key = headers.get("Nats-Subject", "")[len(prefix) :]
+                if not key:
+                    continue
+                timestamp = _parse_nats_timestamp(headers.get("Nats-Time-Stamp"))
+                found[key] = KVEntry(
+                    key=key,
+                    value=json.loads(msg.data.decode()) if msg.data else None,
+                    revision=int(headers.get("Nats-Sequence", 0)) or 1,
+                    created_at=timestamp,
+                    updated_at=timestamp,
+                )
+        finally:
+            await sub.unsubscribe()
 
     # Advanced Operations
+    @staticmethod
+    def _prefix_subject_filter(prefix: str) -> tuple[str, bool]:
+        """Translate a key prefix into a KV subject filter.
+
+        NATS wildcards only match whole subject tokens, so the filter covers the
+        complete dot-separated tokens of the prefix. The returned flag tells
+        whether the filter selects exactly the keys starting with ``prefix``;
+        when it doesn't, the remainder must still be checked client-side.
+
+        Returns:
+            Tuple of (subject filter relative to the bucket, exact match)
+        """
+        if prefix.endswith("."):
+            return f"{prefix}>", True
+        head, dot, _ = prefix.rpartition(".")
+        if dot:
+            return f"{head}.>", False
+        return ">", False
+
     async def watch(  # type: ignore[override,misc]
-        self, key: str | None = None, prefix: str | None = None
+        self,
+        key: str | None = None,
+        prefix: str | list[str] | None = None,
+        on_synced: Callable[[], None] | None = None,
     ) -> AsyncIterator[KVWatchEvent]:
-        """Watch for changes to a key or prefix."""
+        """Watch for changes to a key or prefix.
+
+        Prefixes are turned into server-side subject filters on
+        ``$KV.<bucket>.<prefix>>`` wherever they end on a token boundary, so
+        updates for unrelated keys never reach this process. Several prefixes
+        can be given at once; each gets its own filtered watcher.
+        """
         if key and prefix:
             raise ValueError("Cannot specify both key and prefix")
 
@@ -480,32 +782,43 @@ class NATSKVStore(KVStorePort):
             raise KVNotConnectedError("watch")
 
         # Set up watch based on key or prefix
+        prefixes: tuple[str, ...] = ()
         if key:
             self._validate_key(key)
             # Watch only this specific key, don't include history
-            watcher = await self._kv.watch(key, include_history=False)
+            filters = [key]
         elif prefix:
-            # For prefix watching, watch all keys and filter in application
-            # This is a workaround for NATS KV pattern matching limitations
-            watcher = await self._kv.watch(">", include_history=False)
-            # Store the prefix for filtering later
-            self._watch_prefix = prefix
+            prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+            translated = [self._prefix_subject_filter(p) for p in prefixes]
+            filters = list(dict.fromkeys(subject for subject, _ in translated))
+            if ">" in filters:
+                filters = [">"]
+            if all(exact for _, exact in translated):
+                # Server-side filters already select exactly these keys
+                prefixes = ()
         else:
             # Watch all keys
-            watcher = await self._kv.watch(">", include_history=False)
+            filters = [">"]
+
+        self._logger.debug(f"Watching KV bucket {self._bucket_name} with filters {filters}")
+        watchers = [await self._kv.watch(subject, include_history=False) for subject in filters]
 
         # Track if we've seen the first update (which might be initial state)
         # For prefix watching, we need to track per key
         first_updates = {}  # key -> bool
 
         # Helper to continuously read from watcher even after None marker
-        async def watch_generator():
+        async def read_updates(watcher):
+            synced = False
             while True:
                 try:
                     # Use updates() method instead of async iteration to avoid StopAsyncIteration
                     update = await watcher.updates(timeout=5.0)  # 5 second timeout for debugging
                     if update is None:
                         # This is the initial "no pending updates" marker
+                        if not synced:
+                            synced = True
+                            yield _WATCH_SYNCED
                         continue
                     yield update
                 except asyncio.TimeoutError:
@@ -516,76 +829,124 @@ class NATSKVStore(KVStorePort):
                     # Error in watcher, stop watching
                     break
 
-        # Yield events
-        async for update in watch_generator():
-            original_key = update.key
+        async def watch_generator():
+            if len(watchers) == 1:
+                async for update in read_updates(watchers[0]):
+                    yield update
+                return
 
-            # Filter by prefix if specified
-            if prefix and not original_key.startswith(prefix):
-                continue
+            # Merge several filtered watchers into a single stream
+            queue: asyncio.Queue[Any] = asyncio.Queue()
+            done = object()
 
-            # Convert to domain event
-            # NATS KV might return operation as string or None
-            # None typically means initial value or PUT
-            operation = update.operation if hasattr(update, "operation") else None
+            async def pump(watcher):
+                try:
+                    async for update in read_updates(watcher):
+                        await queue.put(update)
+                finally:
+                    await queue.put(done)
 
-            # Check if this is an initial state update for this key
-            # Initial updates have delta=0 (no time since last update)
-            is_initial = False
-            if original_key not in first_updates:
-                first_updates[original_key] = True
-                is_initial = hasattr(update, "delta") and update.delta == 0
-            else:
-                is_initial = False
+            pumps = [asyncio.create_task(pump(watcher)) for watcher in watchers]
+            remaining = len(pumps)
+            try:
+                while remaining:
+                    update = await queue.get()
+                    if update is done:
+                        remaining -= 1
+                        continue
+                    yield update
+            finally:
+                for task in pumps:
+                    task.cancel()
+
+        # Yield events
+        synced_watchers = 0
+        try:
+            async for update in watch_generator():
+                if update is _WATCH_SYNCED:
+                    synced_watchers += 1
+                    if synced_watchers == len(watchers) and on_synced is not None:
+                        on_synced()
+                    continue
 
-            # Skip initial DELETE events (key doesn't exist initially)
-            if is_initial and operation in ("DELETE", "delete", "DEL", "del"):
-                continue
+                original_key = update.key
 
-            # Handle PUT operations (including initial values where operation is None)
-            if operation in (None, "PUT", "put"):
-                # Skip if no value (this can happen for the initial nil marker)
-                if update.value is None:
+                # Filter by prefix when the subject filter is broader than the prefix
+                if prefixes and not original_key.startswith(prefixes):
                     continue
 
-                value = json.loads(update.value.decode())
+                event = self._to_watch_event(update, original_key, first_updates)
+                if event is not None:
+                    yield event
+        finally:
+            for watcher in watchers:
+                with contextlib.suppress(Exception):
+                    await watcher.stop()
+
+    def _to_watch_event(
+        self, update: Any, original_key: str, first_updates: dict[str, bool]
+    ) -> KVWatchEvent | None:
+        """Convert a raw watcher update into a domain watch event."""
+        # Convert to domain event
+        # NATS KV might return operation as string or None
+        # None typically means initial value or PUT
+        operation = update.operation if hasattr(update, "operation") else None
+
+        # Check if this is an initial state update for this key
+        # Initial updates have delta=0 (no time since last update)
+        is_initial = False
+        if original_key not in first_updates:
+            first_updates[original_key] = True
+            is_initial = hasattr(update, "delta") and update.delta == 0
+        else:
+            is_initial = False
 
-                # Handle timestamp
-                from datetime import UTC, datetime
+        # Skip initial DELETE events (key doesn't exist initially)
+        if is_initial and operation in ("DELETE", "delete", "DEL", "del"):
+            return None
 
-                if update.created and hasattr(update.created, "isoformat"):
-                    created_at = update.created.isoformat()
-                    updated_at = update.created.isoformat()
-                else:
-                    now = datetime.now(UTC).isoformat()
-                    created_at = now
-                    updated_at = now
+        # Handle PUT operations (including initial values where operation is None)
+        if operation in (None, "PUT", "put"):
+            # Skip if no value (this can happen for the initial nil marker)
+            if update.value is None:
+                return None
 
-                entry = KVEntry(
-                    key=original_key,
-                    value=value,
-                    revision=update.revision,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    ttl=(
-                        update.delta
-                        if hasattr(update, "delta") and update.delta and update.delta > 0
-                        else None
-                    ),
-                )
-                event = KVWatchEvent(operation="PUT", entry=entry)
-            elif operation in ("DELETE", "delete", "DEL", "del"):
-                event = KVWatchEvent(operation="DELETE", entry=None)
-            elif operation in ("PURGE", "purge"):
-                event = KVWatchEvent(operation="PURGE", entry=None)
+            value = json.loads(update.value.decode())
+
+            # Handle timestamp
+            from datetime import UTC, datetime
+
+            if update.created and hasattr(update.created, "isoformat"):
+                created_at = update.created.isoformat()
+                updated_at = update.created.isoformat()
             else:
-                # Log unknown operation for debugging
-                self._logger.warning(
-                    f"Unknown KV watch operation: {operation} for key: {original_key}"
-                )
-                continue  # Skip unknown operations
+                now = datetime.now(UTC).isoformat()
+                created_at = now
+                updated_at = now
+
+            entry = KVEntry(
+                key=original_key,
+                value=value,
+                revision=update.revision,
+                created_at=created_at,
+                updated_at=updated_at,
+                ttl=(
+                    update.delta
+                    if hasattr(update, "delta") and update.delta and update.delta > 0
+                    else None
+                ),
+            )
+            event = KVWatchEvent(operation="PUT", entry=entry, key=original_key)
+        elif operation in ("DELETE", "delete", "DEL", "del"):
+            event = KVWatchEvent(operation="DELETE", entry=None, key=original_key)
+        elif operation in ("PURGE", "purge"):
+            event = KVWatchEvent(operation="PURGE", entry=None, key=original_key)
+        else:
+            # Log unknown operation for debugging
+            self._logger.warning(f"Unknown KV watch operation: {operation} for key: {original_key}")
+            return None  # Skip unknown operations
 
-            yield event
+        return event
 
     async def history(self, key: str, limit: int = 10) -> list[KVEntry]:
         """Get revision history for a key."""
@@ -0,0 +1,409 @@
+"""Prometheus/OpenMetrics metrics backend with pre-bound label handles."""
+
+import asyncio
+import bisect
+import re
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from ..ports.metrics import (
+    CounterHandle,
+    GaugeHandle,
+    MetricsPort,
+    TimerHandle,
+    format_metric_name,
+)
+
+# Content type of the OpenMetrics text exposition format
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Default histogram bucket bounds in milliseconds
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+_PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping integers free of a trailing ``.0``."""
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Counter(CounterHandle):
+    """Counter child that stores its value on the handle itself."""
+
+    __slots__ = ("labels", "value")
+
+    def __init__(self, name: str, labels: str):
+        self.name = name
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, value: int = 1) -> None:
+        """Increment the counter."""
+        self.value += value
+
+
+class _Gauge(GaugeHandle):
+    """Gauge child that stores its value on the handle itself."""
+
+    __slots__ = ("labels", "value")
+
+    def __init__(self, name: str, labels: str):
+        self.name = name
+        self.labels = labels
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        self.value = value
+
+
+class _Histogram(TimerHandle):
+    """Fixed-bucket histogram child; observations are O(log buckets)."""
+
+    __slots__ = ("bounds", "buckets", "count", "labels", "max", "min", "sum")
+
+    def __init__(self, name: str, labels: str, bounds: Sequence[float]):
+        self.name = name
+        self.labels = labels
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        """Record a value in its bucket."""
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile (0-1) by interpolating within its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else self.min
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def reset(self) -> None:
+        """Clear all observations."""
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+
+class _Family:
+    """All children of one exposed metric, keyed by label values."""
+
+    def __init__(self, name: str, kind: str, label_names: tuple[str, ...], template: str):
+        self.name = name
+        self.kind = kind
+        self.label_names = label_names
+        self.template = template
+        self.children: dict[tuple[str, ...], Any] = {}
+
+
+class PrometheusMetrics(MetricsPort):
+    """MetricsPort backend exposed in the OpenMetrics text format.
+
+    A dotted name template such as ``rpc.{service}.{method}.success`` maps to
+    the metric family ``aegis_rpc_success`` with ``service`` and ``method``
+    labels. ``counter``/``gauge_handle``/``timer_handle`` return the child
+    for one label set; the child holds its own value, so updating it is a
+    plain attribute write with no lookup, formatting, or lock. Handles are
+    meant to be created once and updated from the event loop thread.
+
+    The string API (``increment`` etc.) still works for names without
+    labels and caches one child per name. Timers and ``record`` feed
+    fixed-bucket histograms, so memory stays constant per label set.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "aegis",
+        buckets: Sequence[float] = DEFAULT_BUCKETS_MS,
+    ):
+        """Initialize the registry.
+
+        Args:
+            namespace: Prefix of every exposed family name
+            buckets: Histogram upper bounds in milliseconds, ascending
+        """
+        self._namespace = namespace
+        self._buckets = tuple(sorted(buckets))
+        self._families: dict[str, _Family] = {}
+        self._counters: dict[str, _Counter] = {}
+        self._gauges: dict[str, _Gauge] = {}
+        self._histograms: dict[str, _Histogram] = {}
+        self._start_time = time.time()
+
+    def _family(self, template: str, kind: str) -> _Family:
+        """Get or create the family a name template belongs to."""
+        parts = template.split(".")
+        label_names = tuple(match.group(1) for part in parts if (match := _PLACEHOLDER.match(part)))
+        base = "_".join(part for part in parts if not _PLACEHOLDER.match(part))
+        name = _INVALID_NAME_CHARS.sub(
+            "_", f"{self._namespace}_{base}" if base else self._namespace
+        )
+
+        family = self._families.get(name)
+        if family is None:
+            family = _Family(name, kind, label_names, template)
+            self._families[name] = family
+        elif family.kind != kind or family.label_names != label_names:
+            raise ValueError(
+                f"Metric {template!r} conflicts with {family.template!r} "
+                f"({family.kind} {family.name})"
+            )
+        return family
+
+    def _child(self, template: str, kind: str, labels: dict[str, str]) -> Any:
+        """Get or create the child of a family for one set of label values."""
+        family = self._family(template, kind)
+        try:
+            key = tuple(str(labels[label]) for label in family.label_names)
+        except KeyError as e:
+            raise ValueError(f"Missing label {e} for metric {template!r}") from None
+        child = family.children.get(key)
+        if child is None:
+            name = format_metric_name(template, labels)
+            rendered = ",".join(
+                f'{label}="{_escape_label_value(value)}"'
+                for label, value in zip(family.label_names, key, strict=True)
+            )
+            if kind == "counter":
+                child = _Counter(name, rendered)
+                self._counters[name] = child
+            elif kind == "gauge":
+                child = _Gauge(name, rendered)
+                self._gauges[name] = child
+            else:
+                child = _Histogram(name, rendered, self._buckets)
+                self._histograms[name] = child
+            family.children[key] = child
+        return child
+
+    def counter(self, template: str, **labels: str) -> CounterHandle:
+        """Create (or reuse) the counter child for a template and label values."""
+        child: _Counter = self._child(template, "counter", labels)
+        return child
+
+    def gauge_handle(self, template: str, **labels: str) -> GaugeHandle:
+        """Create (or reuse) the gauge child for a template and label values."""
+        child: _Gauge = self._child(template, "gauge", labels)
+        return child
+
+    def timer_handle(self, template: str, **labels: str) -> TimerHandle:
+        """Create (or reuse) the histogram child for a template and label values."""
+        child: _Histogram = self._child(template, "histogram", labels)
+        return child
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter metric."""
+        child = self._counters.get(name)
+        if child is None:
+            child = self._child(name, "counter", {})
+        child.value += value
+
+    def gauge(self, name: str, value: float) -> None:
+        """Set a gauge metric."""
+        child = self._gauges.get(name)
+        if child is None:
+            child = self._child(name, "gauge", {})
+        child.value = value
+
+    def record(self, name: str, value: float) -> None:
+        """Record a value in a histogram."""
+        child = self._histograms.get(name)
+        if child is None:
+            child = self._child(name, "histogram", {})
+        child.observe(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Context manager for timing operations."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def get_all(self) -> dict[str, Any]:
+        """Get all metrics as a dictionary keyed by resolved dotted names."""
+        summaries = {}
+        for name, histogram in self._histograms.items():
+            if histogram.count == 0:
+                continue
+            summaries[name] = {
+                "count": histogram.count,
+                "average": round(histogram.sum / histogram.count, 2),
+                "min": round(histogram.min, 2),
+                "max": round(histogram.max, 2),
+                "p50": round(histogram.quantile(0.5), 2),
+                "p90": round(histogram.quantile(0.9), 2),
+                "p99": round(histogram.quantile(0.99), 2),
+            }
+        return {
+            "uptime_seconds": round(time.time() - self._start_time, 2),
+            "counters": {name: child.value for name, child in self._counters.items()},
+            "gauges": {name: child.value for name, child in self._gauges.items()},
+            "summaries": summaries,
+        }
+
+    def reset(self) -> None:
+        """Reset all values; existing handles stay bound and valid."""
+        for counter in self._counters.values():
+            counter.value = 0
+        for gauge in self._gauges.values():
+            gauge.value = 0.0
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def render(self) -> str:
+        """Render every family in the OpenMetrics text format."""
+        uptime = f"{self._namespace}_uptime_seconds"
+        lines = [
+            f"# TYPE {uptime} gauge",
+            f"{uptime} {_format_value(round(time.time() - self._start_time, 3))}",
+        ]
+        for family in self._families.values():
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for child in family.children.values():
+                labels = f"{{{child.labels}}}" if child.labels else ""
+                if family.kind == "counter":
+                    lines.append(f"{family.name}_total{labels} {child.value}")
+                elif family.kind == "gauge":
+                    lines.append(f"{family.name}{labels} {_format_value(child.value)}")
+                else:
+                    prefix = f"{child.labels}," if child.labels else ""
+                    cumulative = 0
+                    for bound, bucket_count in zip(child.bounds, child.buckets, strict=False):
+                        cumulative += bucket_count
+                        lines.append(
+                            f'{family.name}_bucket{{{prefix}le="{_format_value(bound)}"}} '
+                            f"{cumulative}"
+                        )
+                    lines.append(f'{family.name}_bucket{{{prefix}le="+Inf"}} {child.count}')
+                    lines.append(f"{family.name}_count{labels} {child.count}")
+                    lines.append(f"{family.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsHTTPServer:
+    """Serves a PrometheusMetrics registry over HTTP from the service process.
+
+    Only ``GET`` on the configured path is answered; every other request gets
+    a 404. The body is rendered on each scrape, so nothing is precomputed on
+    the metrics hot path.
+    """
+
+    def __init__(
+        self,
+        metrics: PrometheusMetrics,
+        host: str = "0.0.0.0",
+        port: int = 9464,
+        path: str = "/metrics",
+    ):
+        """Initialize the server.
+
+        Args:
+            metrics: Registry to expose
+            host: Interface to listen on
+            port: TCP port; 0 picks a free one (see ``port`` after ``start``)
+            path: URL path answering scrapes
+        """
+        self._metrics = metrics
+        self._host = host
+        self._port = port
+        self._path = path
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """The port the server is bound to."""
+        if self._server and self._server.sockets:
+            return int(self._server.sockets[0].getsockname()[1])
+        return self._port
+
+    async def start(self) -> None:
+        """Start listening for scrapes."""
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def stop(self) -> None:
+        """Stop listening and close the socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer a single HTTP request and close the connection."""
+        try:
+            request_line = await reader.readline()
+            # Drain headers; the response does not depend on them
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            target = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+            if len(parts) >= 2 and parts[0] == "GET" and target == self._path:
+                status, content_type = "200 OK", OPENMETRICS_CONTENT_TYPE
+                body = self._metrics.render().encode()
+            else:
+                status, content_type = "404 Not Found", "text/plain; charset=utf-8"
+                body = b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -1,19 +1,119 @@
 """Serialization utilities for JSON and MessagePack."""
 
 import json
-from typing import Any, TypeVar
+from functools import cache
+from typing import Any, Generic, TypeVar
 
 import msgpack
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 from ..domain.exceptions import SerializationError
+from ..domain.models import Message
 
 T = TypeVar("T", bound=BaseModel)
 
 
+class MessageCodec(Generic[T]):
+    """Precompiled encoder/decoder for a single message model.
+
+    Message fields are plain JSON types, so encoding packs the model's field
+    values directly instead of going through ``model_dump``; anything else
+    (e.g. nested models in an RPC result) is converted with pydantic's JSON
+    rules, producing the same bytes as the generic path. Models that customize
+    serialization (serializers, computed or excluded fields, an overridden
+    ``model_dump``) keep using ``model_dump``.
+
+    Decoding validates by default. With ``validate=False`` the model is built
+    from the decoded fields without running validators, which is only safe
+    for trusted intra-cluster traffic produced by this SDK.
+    """
+
+    def __init__(self, model_class: type[T]):
+        """Compile the codec for a model class.
+
+        Args:
+            model_class: The Message subclass to encode and decode
+        """
+        self.model_class = model_class
+        self._fields = tuple(model_class.model_fields)
+        self._defaults = {
+            name: (field.default_factory, field.default)
+            for name, field in model_class.model_fields.items()
+        }
+        decorators = model_class.__pydantic_decorators__
+        self._direct_encode = (
+            model_class.model_dump is BaseModel.model_dump
+            and not decorators.field_serializers
+            and not decorators.model_serializers
+            and not model_class.model_computed_fields
+            and not any(field.exclude for field in model_class.model_fields.values())
+        )
+
+    def encode_msgpack(self, obj: T) -> bytes:
+        """Encode a model to MessagePack bytes."""
+        if self._direct_encode:
+            data = obj.__dict__
+            return bytes(msgpack.packb(data, use_bin_type=True, default=to_jsonable_python))
+        return bytes(msgpack.packb(obj.model_dump(mode="json"), use_bin_type=True))
+
+    def encode_json(self, obj: T) -> bytes:
+        """Encode a model to JSON bytes."""
+        return obj.model_dump_json().encode()
+
+    def from_dict(self, data: dict[str, Any], validate: bool = True) -> T:
+        """Build a model from decoded wire data.
+
+        Args:
+            data: Decoded field values
+            validate: Run full model validation (disable only for trusted peers)
+        """
+        if validate:
+            return self.model_class.model_validate(data)
+        return self._construct(data)
+
+    def _construct(self, data: dict[str, Any]) -> T:
+        """Build a model instance without validation."""
+        try:
+            values = {name: data[name] for name in self._fields}
+            fields_set = set(self._fields)
+        except KeyError:
+            values = {}
+            for name in self._fields:
+                if name in data:
+                    values[name] = data[name]
+                else:
+                    factory, default = self._defaults[name]
+                    values[name] = factory() if factory else default  # type: ignore[call-arg]
+            fields_set = {name for name in self._fields if name in data}
+
+        obj = self.model_class.__new__(self.model_class)
+        object.__setattr__(obj, "__dict__", values)
+        object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+        return obj
+
+    def decode_msgpack(self, data: bytes, validate: bool = True) -> T:
+        """Decode MessagePack bytes to a model."""
+        return self.from_dict(msgpack.unpackb(data, raw=False), validate)
+
+    def decode_json(self, data: bytes, validate: bool = True) -> T:
+        """Decode JSON bytes to a model."""
+        return self.from_dict(json.loads(data), validate)
+
+
+@cache
+def get_codec(model_class: type[T]) -> MessageCodec[T]:
+    """Get the compiled codec for a message model class."""
+    return MessageCodec(model_class)
+
+
 def serialize_to_msgpack(obj: BaseModel) -> bytes:
     """Serialize a Pydantic model to MessagePack bytes."""
     try:
+        if isinstance(obj, Message):
+            return get_codec(type(obj)).encode_msgpack(obj)
         # Convert to dict first, handling datetime objects
         data = obj.model_dump(mode="json")
         return bytes(msgpack.packb(data, use_bin_type=True))
@@ -21,10 +121,18 @@ def serialize_to_msgpack(obj: BaseModel) -> bytes:
         raise SerializationError(f"Failed to serialize to msgpack: {e}") from e
 
 
-def deserialize_from_msgpack(data: bytes, model_class: type[T]) -> T:
-    """Deserialize MessagePack bytes to a Pydantic model."""
+def deserialize_from_msgpack(data: bytes, model_class: type[T], validate: bool = True) -> T:
+    """Deserialize MessagePack bytes to a Pydantic model.
+
+    Args:
+        data: MessagePack bytes
+        model_class: Model class to build
+        validate: Run full validation; pass False only for trusted Message traffic
+    """
     try:
         unpacked = msgpack.unpackb(data, raw=False)
+        if issubclass(model_class, Message):
+            return get_codec(model_class).from_dict(unpacked, validate)
         result: T = model_class(**unpacked)
         return result
     except Exception as e:
@@ -40,12 +148,20 @@ def serialize_to_json(obj: BaseModel) -> bytes:
         raise SerializationError(f"Failed to serialize to JSON: {e}") from e
 
 
-def deserialize_from_json(data: bytes, model_class: type[T]) -> T:
-    """Deserialize JSON bytes to a Pydantic model."""
+def deserialize_from_json(data: bytes, model_class: type[T], validate: bool = True) -> T:
+    """Deserialize JSON bytes to a Pydantic model.
+
+    Args:
+        data: JSON bytes
+        model_class: Model class to build
+        validate: Run full validation; pass False only for trusted Message traffic
+    """
     try:
         json_str = data.decode() if isinstance(data, bytes) else data
         if not json_str or json_str.isspace():
             raise SerializationError("Empty or whitespace-only JSON data")
+        if issubclass(model_class, Message):
+            return get_codec(model_class).from_dict(json.loads(json_str), validate)
         result: T = model_class(**json.loads(json_str))
         return result
     except json.JSONDecodeError as e:
@@ -73,15 +189,15 @@ def is_msgpack(data: bytes) -> bool:
     )  # map16/map32
 
 
-def detect_and_deserialize(data: bytes, model_class: type[T]) -> T:
+def detect_and_deserialize(data: bytes, model_class: type[T], validate: bool = True) -> T:
     """Automatically detect format and deserialize."""
     if not data:
         raise SerializationError("Empty data received")
 
     if is_msgpack(data):
-        return deserialize_from_msgpack(data, model_class)
+        return deserialize_from_msgpack(data, model_class, validate)
     else:
-        return deserialize_from_json(data, model_class)
+        return deserialize_from_json(data, model_class, validate)
 
 
 def serialize_dict(data: dict[str, Any], use_msgpack: bool = True) -> bytes:
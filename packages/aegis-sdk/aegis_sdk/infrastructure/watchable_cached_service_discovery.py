@@ -150,8 +150,10 @@ class WatchableCachedServiceDiscovery(CachedServiceDiscovery):
         """
         # Extract service name from key
         # Key format: service-instances.{service_name}.{instance_id}
-        if event.entry and event.entry.key:
-            parts = event.entry.key.split(".")
+        # DELETE/PURGE events from NATSKVStore carry the key without an entry
+        key = event.key or (event.entry.key if event.entry else None)
+        if key:
+            parts = key.split(".")
             if len(parts) >= 3:
                 service_name = parts[1]
 
@@ -160,7 +162,7 @@ class WatchableCachedServiceDiscovery(CachedServiceDiscovery):
                         "Processing watch event",
                         operation=event.operation,
                         service=service_name,
-                        key=event.entry.key,
+                        key=key,
                     )
 
                 # Invalidate cache for the affected service
@@ -1,15 +1,43 @@
 """Ports layer - Interfaces for external communication."""
 
-from .factory_ports import ElectionRepositoryFactory, KVStoreFactory, UseCaseFactory
-from .kv_store import KVStorePort
-from .logger import LoggerPort
-from .message_bus import MessageBusPort
-from .metrics import MetricsPort
-from .service_discovery import InstanceSelector, SelectionStrategy, ServiceDiscoveryPort
-from .service_registry import ServiceRegistryPort
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .factory_ports import ElectionRepositoryFactory, KVStoreFactory, UseCaseFactory
+    from .kv_store import KVStorePort
+    from .logger import LoggerPort
+    from .message_bus import CommandHandle, MessageBusPort
+    from .metrics import CounterHandle, GaugeHandle, MetricsPort, TimerHandle
+    from .service_discovery import InstanceSelector, SelectionStrategy, ServiceDiscoveryPort
+    from .service_registry import ServiceRegistryPort
+
+_EXPORTS = {
+    "ElectionRepositoryFactory": ".factory_ports",
+    "KVStoreFactory": ".factory_ports",
+    "UseCaseFactory": ".factory_ports",
+    "KVStorePort": ".kv_store",
+    "LoggerPort": ".logger",
+    "CommandHandle": ".message_bus",
+    "MessageBusPort": ".message_bus",
+    "CounterHandle": ".metrics",
+    "GaugeHandle": ".metrics",
+    "MetricsPort": ".metrics",
+    "TimerHandle": ".metrics",
+    "InstanceSelector": ".service_discovery",
+    "SelectionStrategy": ".service_discovery",
+    "ServiceDiscoveryPort": ".service_discovery",
+    "ServiceRegistryPort": ".service_registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "CommandHandle",
+    "CounterHandle",
     "ElectionRepositoryFactory",
+    "GaugeHandle",
     "InstanceSelector",
     "KVStoreFactory",
     "KVStorePort",
@@ -19,5 +47,6 @@ __all__ = [
     "SelectionStrategy",
     "ServiceDiscoveryPort",
     "ServiceRegistryPort",
+    "TimerHandle",
     "UseCaseFactory",
 ]
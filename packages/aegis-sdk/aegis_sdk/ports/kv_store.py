@@ -1,7 +1,7 @@
 """Key-Value Store interface - Port definition for KV storage infrastructure."""
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 from ..domain.models import KVEntry, KVOptions, KVWatchEvent
@@ -151,13 +151,21 @@ class KVStorePort(ABC):
     # Advanced Operations
     @abstractmethod
     async def watch(
-        self, key: str | None = None, prefix: str | None = None
+        self,
+        key: str | None = None,
+        prefix: str | None = None,
+        on_synced: Callable[[], None] | None = None,
     ) -> AsyncIterator[KVWatchEvent]:
         """Watch for changes to a key or prefix.
 
+        The watch first replays the current value of every matching key and
+        then streams live changes.
+
         Args:
             key: Specific key to watch (mutually exclusive with prefix)
             prefix: Key prefix to watch (mutually exclusive with key)
+            on_synced: Optional callback invoked once the current values have
+                been replayed and only live changes follow
 
         Yields:
             KVWatchEvent for each change
@@ -1,13 +1,59 @@
 """Message bus interface - Port definition for messaging infrastructure."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Generator, Sequence
 from typing import Any
 
 from ..domain import SubscriptionMode
-from ..domain.models import Command, Event, RPCRequest, RPCResponse
+from ..domain.models import (
+    Command,
+    Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
+    RPCRequest,
+    RPCResponse,
+)
 from ..domain.types import CommandHandler, EventHandler, RPCHandler
 
 
+class CommandHandle(ABC):
+    """Handle to a command that has been sent and is still being tracked.
+
+    Iterating the handle yields progress updates as the handler reports them
+    and ends once the command has finished. Awaiting the handle returns the
+    final result, in the same form as ``MessageBusPort.send_command``.
+    """
+
+    command_id: str
+
+    @abstractmethod
+    def progress(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate progress updates until the command finishes."""
+        ...
+
+    @abstractmethod
+    async def result(self) -> dict[str, Any]:
+        """Wait for the completion result (or a timeout error result)."""
+        ...
+
+    @abstractmethod
+    async def cancel(self, reason: str | None = None) -> None:
+        """Ask the handler to stop; the result reports whether it did."""
+        ...
+
+    @property
+    @abstractmethod
+    def done(self) -> bool:
+        """Whether the final result is available."""
+        ...
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        return self.progress()
+
+    def __await__(self) -> Generator[Any, None, dict[str, Any]]:
+        return self.result().__await__()
+
+
 class MessageBusPort(ABC):
     """Abstract interface for message bus operations."""
 
@@ -28,13 +74,55 @@ class MessageBusPort(ABC):
 
     # RPC Operations
     @abstractmethod
-    async def register_rpc_handler(self, service: str, method: str, handler: RPCHandler) -> None:
-        """Register an RPC handler."""
+    async def register_rpc_handler(
+        self,
+        service: str,
+        method: str,
+        handler: RPCHandler,
+        options: RPCHandlerOptions | None = None,
+    ) -> None:
+        """Register an RPC handler.
+
+        Args:
+            service: Service name the method belongs to
+            method: RPC method name
+            handler: Handler called with the request params
+            options: Optional concurrency and offload settings for the handler
+        """
+        ...
+
+    @abstractmethod
+    async def join_rpc_queue_group(self, service: str, method: str) -> None:
+        """Start receiving a registered method's load-balanced requests.
+
+        Args:
+            service: Service name the method belongs to
+            method: RPC method registered with ``join_queue_group`` cleared
+        """
+        ...
+
+    @abstractmethod
+    async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+        """Stop receiving a method's load-balanced requests.
+
+        Requests already delivered are still handled, and the instance's own
+        subject keeps being served.
+
+        Args:
+            service: Service name the method belongs to
+            method: RPC method name
+        """
         ...
 
     @abstractmethod
-    async def call_rpc(self, request: RPCRequest) -> RPCResponse:
-        """Make an RPC call."""
+    async def call_rpc(self, request: RPCRequest, instance_id: str | None = None) -> RPCResponse:
+        """Make an RPC call.
+
+        Args:
+            request: The RPC request to send
+            instance_id: Optional instance to address directly, bypassing the
+                service-wide queue group
+        """
         ...
 
     # Event Operations
@@ -45,6 +133,7 @@ class MessageBusPort(ABC):
         handler: EventHandler,
         durable: str | None = None,
         mode: str = SubscriptionMode.COMPETE.value,
+        options: EventSubscriptionOptions | None = None,
     ) -> None:
         """Subscribe to events matching pattern.
 
@@ -53,6 +142,7 @@ class MessageBusPort(ABC):
             handler: Handler function for events
             durable: Durable subscription name
             mode: Subscription mode - "compete" (load balanced) or "broadcast" (all instances)
+            options: Delivery options such as batched pull fetching
         """
         ...
 
@@ -61,6 +151,27 @@ class MessageBusPort(ABC):
         """Publish an event."""
         ...
 
+    async def publish_events_batch(self, events: Sequence[Event]) -> dict[str, str]:
+        """Publish several events and wait until each is stored or failed.
+
+        Adapters may keep many publishes in flight; this default publishes the
+        events one at a time. Adapters that deduplicate by message id make it
+        safe to publish a partly failed batch again.
+
+        Args:
+            events: Events to publish, in order
+
+        Returns:
+            Error messages keyed by message id of events that were not published
+        """
+        errors: dict[str, str] = {}
+        for event in events:
+            try:
+                await self.publish_event(event)
+            except Exception as e:
+                errors[event.message_id] = str(e)
+        return errors
+
     # Command Operations
     @abstractmethod
     async def register_command_handler(
@@ -74,6 +185,11 @@ class MessageBusPort(ABC):
         """Send a command with optional progress tracking."""
         ...
 
+    @abstractmethod
+    async def start_command(self, command: Command) -> CommandHandle:
+        """Send a command and return a handle for streaming its progress."""
+        ...
+
     # Service Registration
     @abstractmethod
     async def register_service(self, service_name: str, instance_id: str) -> None:
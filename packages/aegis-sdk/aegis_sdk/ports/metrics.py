@@ -5,11 +5,85 @@ It allows the domain and application layers to collect metrics without depending
 on specific metrics implementation details.
 """
 
+import time
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 
+class CounterHandle:
+    """Counter bound to one metric name and label set.
+
+    Handles are created once (typically when a handler is registered) so the
+    hot path does no name formatting. This default forwards to the port's
+    string API; backends may return handles that update storage directly.
+    """
+
+    __slots__ = ("_metrics", "name")
+
+    def __init__(self, metrics: "MetricsPort", name: str):
+        """Bind the handle to a port and a resolved metric name."""
+        self._metrics = metrics
+        self.name = name
+
+    def inc(self, value: int = 1) -> None:
+        """Increment the counter."""
+        self._metrics.increment(self.name, value)
+
+
+class GaugeHandle:
+    """Gauge bound to one metric name and label set."""
+
+    __slots__ = ("_metrics", "name")
+
+    def __init__(self, metrics: "MetricsPort", name: str):
+        """Bind the handle to a port and a resolved metric name."""
+        self._metrics = metrics
+        self.name = name
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        self._metrics.gauge(self.name, value)
+
+
+class TimerHandle:
+    """Timer/summary bound to one metric name and label set."""
+
+    __slots__ = ("_metrics", "name")
+
+    def __init__(self, metrics: "MetricsPort", name: str):
+        """Bind the handle to a port and a resolved metric name."""
+        self._metrics = metrics
+        self.name = name
+
+    def observe(self, value: float) -> None:
+        """Record a value (milliseconds for timers)."""
+        self._metrics.record(self.name, value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Time the enclosed block and record its duration in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - start) * 1000)
+
+
+def format_metric_name(template: str, labels: dict[str, str]) -> str:
+    """Resolve a dotted metric name template such as ``rpc.{service}.{method}.success``.
+
+    Args:
+        template: Dotted name with ``{label}`` placeholders
+        labels: Values for every placeholder in the template
+
+    Returns:
+        The flat dotted name used by the string-keyed API
+    """
+    return template.format(**labels) if labels else template
+
+
 class MetricsPort(ABC):
     """Abstract interface for metrics collection.
 
@@ -59,6 +133,27 @@ class MetricsPort(ABC):
         """
         ...
 
+    def counter(self, template: str, **labels: str) -> CounterHandle:
+        """Create a counter handle for a name template and label values.
+
+        Args:
+            template: Dotted name with ``{label}`` placeholders
+                (e.g., "rpc.{service}.{method}.success")
+            **labels: Values for the placeholders
+
+        Returns:
+            A handle whose ``inc`` updates the counter
+        """
+        return CounterHandle(self, format_metric_name(template, labels))
+
+    def gauge_handle(self, template: str, **labels: str) -> GaugeHandle:
+        """Create a gauge handle for a name template and label values."""
+        return GaugeHandle(self, format_metric_name(template, labels))
+
+    def timer_handle(self, template: str, **labels: str) -> TimerHandle:
+        """Create a timer handle for a name template and label values."""
+        return TimerHandle(self, format_metric_name(template, labels))
+
     @abstractmethod
     def get_all(self) -> dict[str, Any]:
         """Get all metrics as a dictionary.
@@ -0,0 +1 @@
+"""Reproducible benchmarks for the SDK, runnable against nats-server or in memory."""
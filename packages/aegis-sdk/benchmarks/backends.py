@@ -0,0 +1,149 @@
+"""Transports the benchmarks run against.
+
+``nats`` starts a throwaway ``nats-server`` with JetStream and connects real
+``NATSAdapter`` and ``NATSKVStore`` instances to it. ``memory`` uses the
+in-process ``InMemoryMessageBus`` and ``InMemoryKVStore``, which measures the
+SDK's own overhead without a network. ``auto`` picks ``nats`` when the binary
+is on the PATH.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVServer, InMemoryKVStore
+from aegis_sdk.infrastructure.in_memory_message_bus import InMemoryBroker, InMemoryMessageBus
+from aegis_sdk.ports.kv_store import KVStorePort
+from aegis_sdk.ports.message_bus import MessageBusPort
+
+BACKEND_ENV = "AEGIS_BENCH_BACKEND"
+NATS_SERVER_ENV = "AEGIS_BENCH_NATS_SERVER"
+BACKENDS = ("auto", "nats", "memory")
+
+
+def resolve_backend(requested: str | None = None) -> str:
+    """Turn ``auto`` (the default) into a concrete backend name."""
+    requested = (requested or os.getenv(BACKEND_ENV) or "auto").lower()
+    if requested not in BACKENDS:
+        raise ValueError(f"Unknown benchmark backend {requested!r}; expected one of {BACKENDS}")
+    if requested == "auto":
+        return "nats" if nats_server_binary() else "memory"
+    return requested
+
+
+def nats_server_binary() -> str | None:
+    """Path of the nats-server binary, if one is available."""
+    return os.getenv(NATS_SERVER_ENV) or shutil.which("nats-server")
+
+
+class NATSServerProcess:
+    """A nats-server with JetStream on a free port, storing into a temp dir."""
+
+    def __init__(self, binary: str):
+        """Initialize without starting the server."""
+        self._binary = binary
+        self._process: subprocess.Popen[bytes] | None = None
+        self._store = tempfile.TemporaryDirectory(prefix="aegis-bench-")
+        self.port = _free_port()
+
+    @property
+    def url(self) -> str:
+        """Client URL of the server."""
+        return f"nats://127.0.0.1:{self.port}"
+
+    def start(self, timeout: float = 10.0) -> None:
+        """Start the server and wait until it accepts connections."""
+        self._process = subprocess.Popen(
+            [self._binary, "-js", "-a", "127.0.0.1", "-p", str(self.port), "-sd", self._store.name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"nats-server exited with code {self._process.returncode}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+                    return
+            except OSError:
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"nats-server did not start within {timeout}s")
+
+    def stop(self) -> None:
+        """Stop the server and remove its storage."""
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._store.cleanup()
+
+
+class BenchmarkBackend:
+    """Creates connected message buses and KV stores for one backend."""
+
+    def __init__(self, name: str, server: NATSServerProcess | None = None):
+        """Initialize the backend.
+
+        Args:
+            name: ``nats`` or ``memory``
+            server: The running server, for the ``nats`` backend
+        """
+        self.name = name
+        self._server = server
+        self._broker = InMemoryBroker()
+        self._kv_server = InMemoryKVServer()
+        self._buses: list[MessageBusPort] = []
+
+    async def message_bus(self, service_name: str, instance_id: str) -> MessageBusPort:
+        """Create a connected bus for one service instance."""
+        bus: MessageBusPort
+        if self._server is None:
+            bus = InMemoryMessageBus(self._broker, service_name, instance_id)
+            await bus.connect()
+        else:
+            from aegis_sdk.infrastructure.config import NATSConnectionConfig
+            from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+
+            bus = NATSAdapter(
+                config=NATSConnectionConfig(
+                    servers=[self._server.url],
+                    service_name=service_name,
+                    instance_id=instance_id,
+                )
+            )
+            await bus.connect()
+        self._buses.append(bus)
+        return bus
+
+    async def kv_store(self, bucket: str, bus: MessageBusPort | None = None) -> KVStorePort:
+        """Open a bucket with its own store object, as each service would."""
+        if self._server is None:
+            store = InMemoryKVStore(self._kv_server)
+            await store.connect(bucket)
+            return store
+
+        from aegis_sdk.infrastructure.nats_kv_store import NATSKVStore
+
+        kv = NATSKVStore(nats_adapter=bus or await self.message_bus("bench-kv", "kv-0"))
+        await kv.connect(bucket)
+        return kv
+
+    async def close(self) -> None:
+        """Disconnect every bus created by this backend."""
+        for bus in self._buses:
+            await bus.disconnect()
+        self._buses.clear()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
@@ -0,0 +1,110 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.10]
+
+Benchmarks are matched by name and backend. A benchmark regresses when its
+mean latency grows by more than ``--threshold`` or its p99 latency by more
+than ``--p99-threshold`` (tails are noisier, so the default is looser). The
+exit status is 1 if anything regressed, which lets CI gate on it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_P99_THRESHOLD = 0.25
+
+
+@dataclass
+class Comparison:
+    """Change of one benchmark between two runs."""
+
+    name: str
+    backend: str
+    baseline: dict[str, Any]
+    current: dict[str, Any]
+
+    def change(self, field: str) -> float:
+        """Relative change of a latency field (positive is slower)."""
+        before = self.baseline[field]
+        return (self.current[field] - before) / before if before else 0.0
+
+    def regressed(self, threshold: float, p99_threshold: float) -> bool:
+        """Whether mean or p99 latency grew beyond its threshold."""
+        return self.change("mean_us") > threshold or self.change("p99_us") > p99_threshold
+
+
+def load_results(path: Path) -> dict[tuple[str, str], dict[str, Any]]:
+    """Load a result file keyed by (name, backend)."""
+    document = json.loads(path.read_text())
+    return {(result["name"], result["backend"]): result for result in document["results"]}
+
+
+def compare(
+    baseline: dict[tuple[str, str], dict[str, Any]],
+    current: dict[tuple[str, str], dict[str, Any]],
+) -> list[Comparison]:
+    """Pair up benchmarks present in both runs."""
+    return [
+        Comparison(name, backend, baseline[(name, backend)], result)
+        for (name, backend), result in sorted(current.items())
+        if (name, backend) in baseline
+    ]
+
+
+def render(comparisons: list[Comparison], threshold: float, p99_threshold: float) -> str:
+    """Format comparisons as a fixed-width table."""
+    width = max((len(c.name) for c in comparisons), default=10)
+    lines = [
+        f"{'benchmark':<{width}}  {'backend':<7}  {'mean us':>19}  {'p99 us':>19}  status",
+    ]
+    for c in comparisons:
+        status = "REGRESSED" if c.regressed(threshold, p99_threshold) else "ok"
+        mean = f"{c.current['mean_us']:.1f} ({c.change('mean_us'):+.1%})"
+        p99 = f"{c.current['p99_us']:.1f} ({c.change('p99_us'):+.1%})"
+        lines.append(f"{c.name:<{width}}  {c.backend:<7}  {mean:>19}  {p99:>19}  {status}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compare two result files; returns 1 if any benchmark regressed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path, help="Result file of the reference commit")
+    parser.add_argument("current", type=Path, help="Result file to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative growth of mean latency (default {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--p99-threshold",
+        type=float,
+        default=DEFAULT_P99_THRESHOLD,
+        help=f"Allowed relative growth of p99 latency (default {DEFAULT_P99_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+
+    comparisons = compare(load_results(args.baseline), load_results(args.current))
+    if not comparisons:
+        print("No benchmarks in common between the two runs")
+        return 0
+
+    print(render(comparisons, args.threshold, args.p99_threshold))
+    regressions = [c for c in comparisons if c.regressed(args.threshold, args.p99_threshold)]
+    if regressions:
+        print(f"\n{len(regressions)} of {len(comparisons)} benchmarks regressed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
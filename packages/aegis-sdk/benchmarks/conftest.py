@@ -0,0 +1,90 @@
+"""Fixtures for the benchmark suite.
+
+Run with ``pytest benchmarks``. The backend is chosen with
+``--bench-backend`` or ``AEGIS_BENCH_BACKEND`` (``auto``, ``nats`` or
+``memory``), and results are written to ``--bench-output`` (default
+``benchmarks/results/latest.json``) when the session ends.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from .backends import (
+    BACKENDS,
+    BenchmarkBackend,
+    NATSServerProcess,
+    nats_server_binary,
+    resolve_backend,
+)
+from .harness import BenchmarkRecorder
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "latest.json"
+
+_recorder: BenchmarkRecorder | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "benchmark: recorded into the benchmark results file")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("aegis-benchmarks")
+    group.addoption(
+        "--bench-backend",
+        choices=BACKENDS,
+        default=None,
+        help="Transport to benchmark against (default: $AEGIS_BENCH_BACKEND or auto)",
+    )
+    group.addoption(
+        "--bench-output",
+        default=str(DEFAULT_OUTPUT),
+        help="Where to write the JSON results",
+    )
+
+
+@pytest.fixture(scope="session")
+def backend_name(request: pytest.FixtureRequest) -> str:
+    """Concrete backend for this session."""
+    name = resolve_backend(request.config.getoption("--bench-backend"))
+    if name == "nats" and not nats_server_binary():
+        pytest.skip("nats backend requested but nats-server is not on the PATH")
+    return name
+
+
+@pytest.fixture(scope="session")
+def nats_server(backend_name: str):
+    """A nats-server for the session, or None for the memory backend."""
+    if backend_name != "nats":
+        yield None
+        return
+    server = NATSServerProcess(nats_server_binary() or "nats-server")
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def bench(backend_name: str) -> BenchmarkRecorder:
+    """Recorder shared by every benchmark in the session."""
+    global _recorder
+    _recorder = BenchmarkRecorder(backend_name)
+    return _recorder
+
+
+@pytest_asyncio.fixture
+async def backend(backend_name: str, nats_server: NATSServerProcess | None):
+    """Backend for one benchmark; its buses are disconnected afterwards."""
+    instance = BenchmarkBackend(backend_name, nats_server)
+    yield instance
+    await instance.close()
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    if _recorder is not None and _recorder.results:
+        output = Path(session.config.getoption("--bench-output"))
+        _recorder.write(output)
+        print(f"\nBenchmark results written to {output}")
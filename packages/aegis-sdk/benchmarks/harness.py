@@ -0,0 +1,197 @@
+"""Timing harness shared by the benchmarks.
+
+Every operation is timed on its own and recorded in a StreamingHistogram, so
+results carry percentiles as well as throughput. Results are collected by a
+``BenchmarkRecorder`` and written as one JSON document per run, which
+``benchmarks.compare`` diffs against another run.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from aegis_sdk.domain.metrics_models import StreamingHistogram
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary of one benchmark."""
+
+    name: str
+    backend: str
+    operations: int
+    seconds: float
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        backend: str,
+        histogram: StreamingHistogram,
+        total_us: float,
+        max_us: float,
+        seconds: float,
+        **extra: Any,
+    ) -> BenchmarkResult:
+        """Summarize recorded per-operation latencies."""
+        operations = histogram.count
+        p50, p99 = histogram.quantiles([0.5, 0.99])
+        return cls(
+            name=name,
+            backend=backend,
+            operations=operations,
+            seconds=round(seconds, 6),
+            ops_per_sec=round(operations / seconds, 1) if seconds else 0.0,
+            mean_us=round(total_us / operations, 3) if operations else 0.0,
+            p50_us=round(p50, 3),
+            p99_us=round(p99, 3),
+            max_us=round(max_us, 3),
+            extra=extra,
+        )
+
+
+class _Timing:
+    """Accumulates per-operation latencies for one benchmark."""
+
+    def __init__(self) -> None:
+        self.histogram = StreamingHistogram(relative_accuracy=0.005)
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def add(self, elapsed_ns: int) -> None:
+        elapsed_us = elapsed_ns / 1000
+        self.histogram.add(elapsed_us)
+        self.total_us += elapsed_us
+        if elapsed_us > self.max_us:
+            self.max_us = elapsed_us
+
+
+class BenchmarkRecorder:
+    """Runs timed loops and collects their results for one session."""
+
+    def __init__(self, backend: str):
+        """Initialize the recorder.
+
+        Args:
+            backend: Name of the transport the benchmarks run against
+        """
+        self.backend = backend
+        self.results: list[BenchmarkResult] = []
+
+    def _finish(
+        self, name: str, timing: _Timing, seconds: float, extra: dict[str, Any]
+    ) -> BenchmarkResult:
+        result = BenchmarkResult.from_samples(
+            name,
+            self.backend,
+            timing.histogram,
+            timing.total_us,
+            timing.max_us,
+            seconds,
+            **extra,
+        )
+        self.results.append(result)
+        print(
+            f"\n{name} [{self.backend}]: {result.ops_per_sec:,.0f} ops/s, "
+            f"mean {result.mean_us:.1f}us, p50 {result.p50_us:.1f}us, p99 {result.p99_us:.1f}us"
+        )
+        return result
+
+    def measure(
+        self,
+        name: str,
+        operation: Callable[[], Any],
+        iterations: int,
+        warmup: int = 100,
+        **extra: Any,
+    ) -> BenchmarkResult:
+        """Time ``iterations`` calls of a synchronous operation."""
+        for _ in range(warmup):
+            operation()
+
+        timing = _Timing()
+        clock = time.perf_counter_ns
+        started = clock()
+        for _ in range(iterations):
+            begin = clock()
+            operation()
+            timing.add(clock() - begin)
+        return self._finish(name, timing, (clock() - started) / 1e9, extra)
+
+    async def measure_async(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[Any]],
+        iterations: int,
+        warmup: int = 100,
+        **extra: Any,
+    ) -> BenchmarkResult:
+        """Time ``iterations`` sequential awaits of an asynchronous operation."""
+        for _ in range(warmup):
+            await operation()
+
+        timing = _Timing()
+        clock = time.perf_counter_ns
+        started = clock()
+        for _ in range(iterations):
+            begin = clock()
+            await operation()
+            timing.add(clock() - begin)
+        return self._finish(name, timing, (clock() - started) / 1e9, extra)
+
+    def record(
+        self, name: str, latencies_us: list[float], seconds: float, **extra: Any
+    ) -> BenchmarkResult:
+        """Record latencies measured by the benchmark itself."""
+        timing = _Timing()
+        for latency in latencies_us:
+            timing.add(int(latency * 1000))
+        return self._finish(name, timing, seconds, extra)
+
+    def to_document(self) -> dict[str, Any]:
+        """Build the JSON document for this run."""
+        return {
+            "schema": SCHEMA_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "commit": _git_commit(),
+            "backend": self.backend,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "results": [asdict(result) for result in self.results],
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the run's results as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_document(), indent=2) + "\n")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,58 @@
+"""Instance selection through KVServiceRegistry and the discovery variants."""
+
+from __future__ import annotations
+
+import pytest
+
+from aegis_sdk.domain.models import ServiceInstance
+from aegis_sdk.infrastructure.basic_service_discovery import BasicServiceDiscovery
+from aegis_sdk.infrastructure.cached_service_discovery import CacheConfig, CachedServiceDiscovery
+from aegis_sdk.infrastructure.kv_service_registry import KVServiceRegistry
+from aegis_sdk.ports.service_discovery import SelectionStrategy
+
+ITERATIONS = 1_000
+INSTANCES = 50
+SERVICE = "bench-orders"
+
+
+async def populated_registry(backend, bucket: str) -> KVServiceRegistry:
+    registry = KVServiceRegistry(await backend.kv_store(bucket))
+    for index in range(INSTANCES):
+        instance = ServiceInstance(
+            service_name=SERVICE,
+            instance_id=f"orders-{index:03d}",
+            version="1.0.0",
+            status="ACTIVE",
+        )
+        await registry.register(instance, ttl_seconds=300)
+    return registry
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy", [SelectionStrategy.ROUND_ROBIN, SelectionStrategy.RANDOM, SelectionStrategy.STICKY]
+)
+async def test_basic_selection(bench, backend, strategy):
+    discovery = BasicServiceDiscovery(await populated_registry(backend, "bench_discovery_basic"))
+
+    async def select() -> None:
+        assert await discovery.select_instance(SERVICE, strategy, "orders-007")
+
+    await bench.measure_async(
+        f"discovery.basic.{strategy.value}", select, ITERATIONS, instances=INSTANCES
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_cached_selection(bench, backend):
+    discovery = CachedServiceDiscovery(
+        BasicServiceDiscovery(await populated_registry(backend, "bench_discovery_cached")),
+        CacheConfig(ttl_seconds=60.0),
+    )
+
+    async def select() -> None:
+        assert await discovery.select_instance(SERVICE)
+
+    await bench.measure_async("discovery.cached.round_robin", select, ITERATIONS * 10)
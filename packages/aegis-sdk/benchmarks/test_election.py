@@ -0,0 +1,122 @@
+"""Leader handoff and contended elections through ElectionCoordinator.
+
+Handoff is measured from the leader releasing its key until the standby,
+driven by HeartbeatMonitor, has won the election. Crash failover bounded by
+the leader TTL is covered by ``tests/performance/test_failover_performance.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from aegis_sdk.domain.value_objects import Duration, FailoverPolicy, InstanceId, ServiceName
+from aegis_sdk.infrastructure.election_coordinator import ElectionCoordinator
+from aegis_sdk.infrastructure.heartbeat_monitor import HeartbeatMonitor
+from aegis_sdk.infrastructure.simple_logger import SimpleLogger
+
+HANDOFF_TRIALS = 20
+CANDIDATES = 50
+CONTENDED_ROUNDS = 10
+SERVICE = ServiceName(value="bench-orders")
+LOGGER = SimpleLogger("aegis_sdk.bench", logging.CRITICAL)
+
+
+class NoRegistry:
+    """Service registry without entries; status updates are skipped."""
+
+    async def get_instance(self, service_name: str, instance_id: str) -> None:
+        return None
+
+
+def coordinator(kv, instance_id: str, group_id: str) -> ElectionCoordinator:
+    return ElectionCoordinator(
+        kv,
+        NoRegistry(),
+        SERVICE,
+        InstanceId(value=instance_id),
+        group_id,
+        FailoverPolicy.aggressive(),
+        LOGGER,
+    )
+
+
+async def measure_handoff(kv, group_id: str) -> float:
+    """Release a leader and return seconds until the standby is elected."""
+    leader = coordinator(kv, f"leader-{group_id}", group_id)
+    assert await leader.start_election()
+
+    elected = asyncio.Event()
+    standby_id = f"standby-{group_id}"
+    standby = coordinator(kv, standby_id, group_id)
+    standby.set_on_elected_callback(elected.set)
+    monitor = HeartbeatMonitor(
+        kv,
+        SERVICE,
+        InstanceId(value=standby_id),
+        group_id,
+        FailoverPolicy.aggressive(),
+        LOGGER,
+    )
+    monitor.set_election_trigger(standby)
+    monitor.set_heartbeat_interval(Duration(seconds=0.1))
+    await monitor.start_monitoring()
+    # Let the monitor observe the current leader
+    await asyncio.sleep(0.2)
+
+    released_at = time.perf_counter()
+    await leader.release_leadership()
+    await asyncio.wait_for(elected.wait(), timeout=10)
+    latency = time.perf_counter() - released_at
+
+    await monitor.stop_monitoring()
+    await standby.release_leadership()
+    return latency
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_leader_handoff(bench, backend):
+    kv = await backend.kv_store("bench_election_handoff")
+    started = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(measure_handoff(kv, f"handoff-{trial}") for trial in range(HANDOFF_TRIALS))
+    )
+    bench.record(
+        "election.handoff",
+        [latency * 1e6 for latency in latencies],
+        time.perf_counter() - started,
+        election_delay_s=FailoverPolicy.aggressive().election_delay.seconds,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_contended_election(bench, backend):
+    kv = await backend.kv_store("bench_election_contended")
+    latencies_us: list[float] = []
+    started = time.perf_counter()
+    for round_number in range(CONTENDED_ROUNDS):
+        group_id = f"storm-{round_number}"
+        candidates = [coordinator(kv, f"c{index}", group_id) for index in range(CANDIDATES)]
+        elected_at: list[float] = []
+        for candidate in candidates:
+            candidate.set_on_elected_callback(
+                lambda elected_at=elected_at: elected_at.append(time.perf_counter())
+            )
+        begin = time.perf_counter()
+        # Losers keep retrying with backoff; only the time to the winner counts
+        results = await asyncio.gather(*(c.start_election() for c in candidates))
+        assert sum(results) == 1
+        latencies_us.append((elected_at[0] - begin) * 1e6)
+        for candidate in candidates:
+            await candidate.release_leadership()
+    bench.record(
+        "election.contended",
+        latencies_us,
+        time.perf_counter() - started,
+        candidates=CANDIDATES,
+    )
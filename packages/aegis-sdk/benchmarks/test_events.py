@@ -0,0 +1,54 @@
+"""Event publishing and end-to-end delivery to a subscriber."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from aegis_sdk.domain.models import Event
+
+ITERATIONS = 5_000
+DELIVERED = 5_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_event_publish(bench, backend):
+    publisher = await backend.message_bus("bench-publisher", "publisher-1")
+    event = Event(domain="bench", event_type="tick", payload={"symbol": "AAPL", "price": 189.5})
+    await bench.measure_async("events.publish", lambda: publisher.publish_event(event), ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_event_publish_to_consume(bench, backend):
+    publisher = await backend.message_bus("bench-publisher", "publisher-1")
+    consumer = await backend.message_bus("bench-consumer", "consumer-1")
+
+    latencies_us: list[float] = []
+    received = asyncio.Event()
+
+    async def on_event(event: Event) -> None:
+        latencies_us.append((time.time() - event.payload["sent"]) * 1e6)
+        if len(latencies_us) == DELIVERED:
+            received.set()
+
+    await consumer.subscribe_event(
+        "events.bench.delivered", on_event, durable="bench-consumer", mode="broadcast"
+    )
+    # Give JetStream consumers time to be created before publishing
+    await asyncio.sleep(0.2)
+
+    started = time.perf_counter()
+    for sequence in range(DELIVERED):
+        await publisher.publish_event(
+            Event(
+                domain="bench",
+                event_type="delivered",
+                payload={"sequence": sequence, "sent": time.time()},
+            )
+        )
+    await asyncio.wait_for(received.wait(), timeout=60)
+    bench.record("events.publish_to_consume", latencies_us, time.perf_counter() - started)
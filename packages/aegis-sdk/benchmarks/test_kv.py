@@ -0,0 +1,74 @@
+"""KV store reads, writes, compare-and-set and watch notification latency."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+
+import pytest
+
+from aegis_sdk.domain.models import KVOptions
+
+ITERATIONS = 2_000
+WATCHED_UPDATES = 1_000
+VALUE = {"instance_id": "orders-1", "status": "ACTIVE", "metadata": {"zone": "a"}}
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_kv_put(bench, backend):
+    kv = await backend.kv_store("bench_kv_put")
+    keys = itertools.cycle([f"key-{index}" for index in range(100)])
+    await bench.measure_async("kv.put", lambda: kv.put(next(keys), VALUE), ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_kv_get(bench, backend):
+    kv = await backend.kv_store("bench_kv_get")
+    for index in range(100):
+        await kv.put(f"key-{index}", VALUE)
+    keys = itertools.cycle([f"key-{index}" for index in range(100)])
+    await bench.measure_async("kv.get", lambda: kv.get(next(keys)), ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_kv_compare_and_set(bench, backend):
+    kv = await backend.kv_store("bench_kv_cas")
+    revision = await kv.put("counter", {"value": 0})
+
+    async def increment() -> None:
+        nonlocal revision
+        revision = await kv.put("counter", {"value": revision}, KVOptions(revision=revision))
+
+    await bench.measure_async("kv.compare_and_set", increment, ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_kv_watch_latency(bench, backend):
+    kv = await backend.kv_store("bench_kv_watch")
+    synced = asyncio.Event()
+    latencies_us: list[float] = []
+    done = asyncio.Event()
+
+    async def consume() -> None:
+        async for event in kv.watch(prefix="watched-", on_synced=synced.set):
+            if event.operation != "PUT" or event.entry is None:
+                continue
+            latencies_us.append((time.time() - event.entry.value["sent"]) * 1e6)
+            if len(latencies_us) == WATCHED_UPDATES:
+                done.set()
+                return
+
+    watcher = asyncio.create_task(consume())
+    await asyncio.wait_for(synced.wait(), timeout=10)
+
+    started = time.perf_counter()
+    for index in range(WATCHED_UPDATES):
+        await kv.put(f"watched-{index % 10}", {"sent": time.time()})
+    await asyncio.wait_for(done.wait(), timeout=60)
+    await watcher
+    bench.record("kv.watch_notify", latencies_us, time.perf_counter() - started)
@@ -0,0 +1,114 @@
+"""RPC round trip through the message bus, and the SDK overhead around it."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from aegis_sdk.application.service import Service
+from aegis_sdk.domain.models import RPCRequest, RPCResponse, ServiceInstance
+
+ITERATIONS = 2_000
+CONCURRENT_CALLS = 5_000
+IN_FLIGHT = 64
+
+
+async def echo(params: dict) -> dict:
+    return params
+
+
+class CannedBus:
+    """Message bus answering every RPC at once with the same response."""
+
+    def __init__(self) -> None:
+        self.response = RPCResponse(result={"status": "ok"})
+
+    async def call_rpc(self, request: RPCRequest, instance_id: str | None = None) -> RPCResponse:
+        return self.response
+
+
+class SingleInstanceDiscovery:
+    """Discovery that always knows one instance of every service."""
+
+    def __init__(self, service_name: str) -> None:
+        self.instance = ServiceInstance(
+            service_name=service_name, instance_id=f"{service_name}-1", version="1.0.0"
+        )
+
+    async def discover_instances(self, service_name: str, only_healthy: bool = True) -> list:
+        return [self.instance]
+
+    async def select_instance(self, service_name: str, **kwargs) -> ServiceInstance:
+        return self.instance
+
+    async def invalidate_cache(self, service_name: str | None = None) -> None:
+        return None
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_rpc_round_trip(bench, backend):
+    server = await backend.message_bus("bench-echo", "echo-1")
+    client = await backend.message_bus("bench-client", "client-1")
+    await server.register_rpc_handler("bench-echo", "echo", echo)
+
+    request = RPCRequest(method="echo", params={"symbol": "AAPL", "qty": 100}, target="bench-echo")
+
+    async def call() -> None:
+        response = await client.call_rpc(request)
+        assert response.success, response.error
+
+    await bench.measure_async("rpc.round_trip", call, ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_rpc_pipelined_throughput(bench, backend):
+    servers = [await backend.message_bus("bench-echo", f"echo-{index}") for index in range(2)]
+    for server in servers:
+        await server.register_rpc_handler("bench-echo", "echo", echo)
+    client = await backend.message_bus("bench-client", "client-1")
+
+    request = RPCRequest(method="echo", params={"symbol": "AAPL"}, target="bench-echo")
+    semaphore = asyncio.Semaphore(IN_FLIGHT)
+    latencies_us: list[float] = []
+
+    async def call() -> None:
+        async with semaphore:
+            begin = time.perf_counter()
+            response = await client.call_rpc(request)
+            latencies_us.append((time.perf_counter() - begin) * 1e6)
+            assert response.success, response.error
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(CONCURRENT_CALLS)))
+    bench.record(
+        "rpc.pipelined",
+        latencies_us,
+        time.perf_counter() - started,
+        in_flight=IN_FLIGHT,
+        instances=len(servers),
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("discovery_enabled", [False, True], ids=["direct", "discovery"])
+async def test_service_call_overhead(bench, discovery_enabled):
+    """Service.call_rpc without a transport: validation, resolution and dispatch."""
+    service = Service(
+        "bench-client",
+        CannedBus(),
+        instance_id="client-1",
+        service_discovery=SingleInstanceDiscovery("bench-echo"),
+        enable_registration=False,
+    )
+    request = RPCRequest(method="echo", params={"symbol": "AAPL"}, target="bench-echo")
+
+    async def call() -> None:
+        assert await service.call_rpc(request, discovery_enabled=discovery_enabled)
+
+    name = "discovery" if discovery_enabled else "direct"
+    await bench.measure_async(f"rpc.service_overhead.{name}", call, ITERATIONS * 10)
@@ -0,0 +1,54 @@
+"""Encode and decode cost of the message codec (transport independent)."""
+
+from __future__ import annotations
+
+import pytest
+
+from aegis_sdk.domain.models import Command, Event, RPCRequest, RPCResponse
+from aegis_sdk.infrastructure.serialization import (
+    detect_and_deserialize,
+    serialize_to_json,
+    serialize_to_msgpack,
+)
+
+ITERATIONS = 20_000
+
+MESSAGES = {
+    "rpc_request": RPCRequest(
+        method="get_quote",
+        params={"symbol": "AAPL", "depth": 5, "fields": ["bid", "ask"]},
+        target="market-data",
+        source="trader",
+    ),
+    "rpc_response": RPCResponse(
+        correlation_id="req-1", result={"bid": 189.5, "ask": 189.7, "size": 300}
+    ),
+    "event": Event(domain="orders", event_type="filled", payload={"order_id": "o-1", "qty": 100}),
+    "command": Command(command="rebalance", payload={"portfolio": "p-7"}, priority="high"),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("kind", sorted(MESSAGES))
+@pytest.mark.parametrize("codec", ["msgpack", "json"])
+def test_encode(bench, kind, codec):
+    message = MESSAGES[kind]
+    encode = serialize_to_msgpack if codec == "msgpack" else serialize_to_json
+    bench.measure(f"serialization.encode.{codec}.{kind}", lambda: encode(message), ITERATIONS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("kind", sorted(MESSAGES))
+@pytest.mark.parametrize("codec", ["msgpack", "json"])
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_decode(bench, kind, codec, validate):
+    message = MESSAGES[kind]
+    encode = serialize_to_msgpack if codec == "msgpack" else serialize_to_json
+    data = encode(message)
+    model_class = type(message)
+    mode = "validated" if validate else "trusted"
+    bench.measure(
+        f"serialization.decode.{codec}.{mode}.{kind}",
+        lambda: detect_and_deserialize(data, model_class, validate=validate),
+        ITERATIONS,
+    )
@@ -66,7 +66,7 @@ class StaleServiceCleaner:
         now = datetime.now(UTC)
 
         # Get all service registry keys
-        all_keys = await self.kv_store.keys("service-instances__")
+        all_keys = await self.kv_store.keys("service-instances")
 
         self.logger.info(f"Found {len(all_keys)} service entries to check")
 
@@ -197,7 +197,7 @@ class StaleServiceCleaner:
         Returns:
             Dictionary with statistics
         """
-        all_keys = await self.kv_store.keys("service-instances__")
+        all_keys = await self.kv_store.keys("service-instances")
         services: dict[str, list[str]] = {}
         entries_with_ttl = 0
         entries_without_ttl = 0
@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
+import logging
 import os
 import time
 from unittest.mock import AsyncMock, MagicMock
@@ -9,7 +10,16 @@ import pytest
 import pytest_asyncio
 from testcontainers.nats import NatsContainer
 
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVStore
 from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+from aegis_sdk.infrastructure.simple_logger import SimpleLogger
+
+
+class NoRegistry:
+    """Service registry without entries; status updates are skipped."""
+
+    async def get_instance(self, service_name: str, instance_id: str) -> None:
+        return None
 
 
 @pytest.fixture
@@ -122,3 +132,23 @@ def mock_service_registry():
     mock.list_instances = AsyncMock()
     mock.list_all_services = AsyncMock()
     return mock
+
+
+@pytest.fixture
+def quiet_logger():
+    """Create a real logger that drops everything below CRITICAL."""
+    return SimpleLogger("aegis_sdk.tests", logging.CRITICAL)
+
+
+@pytest.fixture
+def no_registry():
+    """Create a service registry stand-in without entries."""
+    return NoRegistry()
+
+
+@pytest_asyncio.fixture
+async def in_memory_kv_store():
+    """Create an in-memory KV store on a private bucket."""
+    store = InMemoryKVStore()
+    await store.connect("sticky_active")
+    return store
@@ -0,0 +1,14 @@
+"""MessageBusPort contract tests run against InMemoryMessageBus."""
+
+from aegis_sdk.infrastructure.in_memory_message_bus import InMemoryBroker, InMemoryMessageBus
+from aegis_sdk.ports.message_bus import MessageBusPort
+from tests.contracts.test_message_bus_contract import MessageBusContractTest
+
+
+class TestInMemoryMessageBusContract(MessageBusContractTest):
+    """InMemoryMessageBus must behave like the NATS adapter."""
+
+    async def create_message_bus(self) -> MessageBusPort:
+        bus = InMemoryMessageBus(InMemoryBroker(), "test_service", "instance-1")
+        await bus.connect()
+        return bus
@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 import pytest
+import pytest_asyncio
 
 from aegis_sdk.domain.models import Command, Event
 from aegis_sdk.ports.message_bus import MessageBusPort
@@ -31,7 +32,7 @@ class MessageBusContractTest(ABC):
         """
         ...
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def message_bus(self) -> MessageBusPort:
         """Fixture that provides a MessageBusPort instance."""
         bus = await self.create_message_bus()
@@ -193,7 +194,8 @@ class MessageBusContractTest(ABC):
         # Verify command was handled
         assert command_received is not None
         assert command_received.payload == {"data": "test"}
-        assert result.get("result") == "command processed"
+        assert result.get("status") == "completed"
+        assert result.get("result") == {"result": "command processed"}
 
     @pytest.mark.asyncio
     async def test_service_registration(self, message_bus: MessageBusPort):
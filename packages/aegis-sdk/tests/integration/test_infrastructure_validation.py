@@ -13,7 +13,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from nats.aio.client import Client as NATSClient
@@ -226,7 +226,7 @@ class TestNATSAdapterFailoverAndHealthChecks:
         heartbeat_data = json.loads(call_args[0][1].decode())
         assert heartbeat_data["instance_id"] == "instance-123"
         assert "timestamp" in heartbeat_data
-        assert "metrics" in heartbeat_data
+        assert "metrics" not in heartbeat_data
 
 
 @pytest.mark.asyncio
@@ -670,7 +670,7 @@ class TestMetricsIntegration:
         mock_metrics = Mock()
         mock_metrics.gauge = Mock()
         mock_metrics.increment = Mock()
-        mock_metrics.timer = Mock(return_value=Mock(__enter__=Mock(), __exit__=Mock()))
+        mock_metrics.timer_handle = Mock(return_value=MagicMock())
 
         config = NATSConnectionConfig(pool_size=2)
         adapter = NATSAdapter(config=config, metrics=mock_metrics)
@@ -701,9 +701,15 @@ class TestMetricsIntegration:
         request = RPCRequest(method="test", params={}, target="service")
         await adapter.call_rpc(request)
 
-        # Check timer and increment calls
-        mock_metrics.timer.assert_called()
-        mock_metrics.increment.assert_called_with("rpc.client.service.test.success")
+        # Check the handles bound for the called method
+        mock_metrics.timer_handle.assert_called_with(
+            "rpc.client.{service}.{method}", service="service", method="test"
+        )
+        mock_metrics.counter.assert_any_call(
+            "rpc.client.{service}.{method}.success", service="service", method="test"
+        )
+        successes = adapter._client_rpc_metrics[("service", "test")][1]
+        successes.inc.assert_called_once_with()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""Throughput of inbound RPC handling across NATS connection pool sizes.
+
+nats-py dispatches the messages of one subscription sequentially, so a queue
+subscription on a single connection caps a service at one in-flight handler
+per method. The fake server below reproduces that: each subscription drains
+its own pending queue with a single task, and queue groups are balanced
+round-robin across members the way the NATS server does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+
+from aegis_sdk.domain.models import RPCRequest
+from aegis_sdk.infrastructure.config import NATSConnectionConfig
+from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+
+POOL_SIZES = [1, 2, 4, 8]
+REQUESTS = 400
+HANDLER_IO_SECONDS = 0.002
+
+
+class FakeMsg:
+    """Inbound request message that records its response."""
+
+    def __init__(self, data: bytes, server: FakeServer):
+        self.data = data
+        self._server = server
+
+    async def respond(self, data: bytes) -> None:
+        self._server.responses += 1
+        if self._server.responses == self._server.expected:
+            self._server.done.set()
+
+
+class FakeSubscription:
+    """Subscription whose callback runs one message at a time, like nats-py."""
+
+    def __init__(self, cb):
+        self._cb = cb
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._wait_for_msgs())
+
+    async def _wait_for_msgs(self) -> None:
+        while True:
+            msg = await self._pending.get()
+            await self._cb(msg)
+
+    def deliver(self, msg: FakeMsg) -> None:
+        self._pending.put_nowait(msg)
+
+    def stop(self) -> None:
+        self._task.cancel()
+
+
+class FakeServer:
+    """Routes published requests to queue group members round-robin."""
+
+    def __init__(self):
+        self.groups: dict[tuple[str, str | None], list[FakeSubscription]] = defaultdict(list)
+        self._cursors: dict[tuple[str, str | None], itertools.cycle] = {}
+        self.responses = 0
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    def publish(self, subject: str, data: bytes) -> None:
+        for key, members in self.groups.items():
+            if key[0] != subject:
+                continue
+            if key not in self._cursors:
+                self._cursors[key] = itertools.cycle(members)
+            next(self._cursors[key]).deliver(FakeMsg(data, self))
+
+    def stop(self) -> None:
+        for members in self.groups.values():
+            for sub in members:
+                sub.stop()
+
+
+class FakeConnection:
+    """Pooled connection that registers subscriptions with the fake server."""
+
+    is_connected = True
+
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    async def subscribe(self, subject: str, queue: str | None = None, cb=None):
+        sub = FakeSubscription(cb)
+        self._server.groups[(subject, queue)].append(sub)
+        return sub
+
+    def jetstream(self, **kwargs):
+        return None
+
+
+async def handle(params: dict) -> dict:
+    """Handler that waits on downstream I/O, e.g. a database call."""
+    await asyncio.sleep(HANDLER_IO_SECONDS)
+    return {"ok": True}
+
+
+async def measure_throughput(pool_size: int, strategy: str) -> float:
+    """Serve REQUESTS calls and return requests per second."""
+    server = FakeServer()
+    config = NATSConnectionConfig(
+        pool_size=pool_size, subscription_strategy=strategy, enable_jetstream=False
+    )
+    adapter = NATSAdapter(config=config)
+
+    with patch("aegis_sdk.infrastructure.nats_adapter.nats") as mock_nats:
+
+        async def connect(**kwargs):
+            return FakeConnection(server)
+
+        mock_nats.connect = connect
+        with patch("builtins.print"):
+            await adapter.connect()
+
+    await adapter.register_rpc_handler("bench", "work", handle)
+
+    payload = adapter._serializer.serialize(RPCRequest(method="work", target="bench"))
+    server.expected = REQUESTS
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        server.publish("rpc.bench.work", payload)
+    await asyncio.wait_for(server.done.wait(), timeout=60)
+    elapsed = time.perf_counter() - start
+
+    server.stop()
+    return REQUESTS / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestConnectionPoolPerformance:
+    """Inbound RPC throughput versus pool size and subscription strategy."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_pool_size(self):
+        """Replicated queue subscriptions scale with the number of connections."""
+        print("\nInbound RPC Throughput by Pool Size (req/s):")
+        replicated = {}
+        for pool_size in POOL_SIZES:
+            single = await measure_throughput(pool_size, "single")
+            replicated[pool_size] = await measure_throughput(pool_size, "replicate")
+            print(f"  Pool {pool_size}:")
+            print(f"    Single connection: {single:8.0f}")
+            print(f"    Replicated:        {replicated[pool_size]:8.0f}")
+
+        # Generous bounds for noisy CI; ideal scaling would be 2x and 8x
+        assert replicated[2] > replicated[1] * 1.5
+        assert replicated[8] > replicated[1] * 4
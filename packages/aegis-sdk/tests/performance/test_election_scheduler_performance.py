@@ -0,0 +1,155 @@
+"""KV load and CPU of leader elections as the number of groups grows.
+
+One leader instance and one standby instance share N sticky-active groups.
+In the per-group setup every group has its own election coordinator and
+renewal timer on the leader and its own heartbeat monitor watch on the
+standby. In the scheduled setup each instance runs a single ElectionScheduler.
+Both run on an InMemoryKVStore, whose status reports the bucket sequence and
+open watches, and are measured over the same steady-state window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from aegis_sdk.domain.value_objects import Duration, FailoverPolicy, InstanceId, ServiceName
+from aegis_sdk.infrastructure.election_coordinator import ElectionCoordinator
+from aegis_sdk.infrastructure.election_scheduler import ElectionScheduler
+from aegis_sdk.infrastructure.heartbeat_monitor import HeartbeatMonitor
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVStore
+from aegis_sdk.ports.logger import LoggerPort
+from aegis_sdk.ports.service_registry import ServiceRegistryPort
+
+GROUP_COUNTS = [10, 50, 200]
+LEADER_TTL_SECONDS = 0.6
+WINDOW_SECONDS = 1.5
+
+
+async def renew_forever(coordinator: ElectionCoordinator) -> None:
+    """Per-group renewal timer, as run by the failover monitoring use case."""
+    while True:
+        await asyncio.sleep(LEADER_TTL_SECONDS / 3)
+        await coordinator.renew_leadership()
+
+
+async def run_per_group(
+    store: InMemoryKVStore, groups: list[str], logger: LoggerPort, registry: ServiceRegistryPort
+) -> list[Any]:
+    """Start a coordinator per group on the leader and a monitor per group on the standby."""
+    service_name = ServiceName(value="orders")
+    policy = FailoverPolicy.aggressive()
+    running: list[Any] = []
+    for group_id in groups:
+        coordinator = ElectionCoordinator(
+            store, registry, service_name, InstanceId(value="node-1"), group_id, policy, logger
+        )
+        assert await coordinator.start_election()
+        running.append(asyncio.create_task(renew_forever(coordinator)))
+
+        monitor = HeartbeatMonitor(
+            store, service_name, InstanceId(value="node-2"), group_id, policy, logger
+        )
+        monitor.set_heartbeat_interval(Duration(seconds=LEADER_TTL_SECONDS / 3))
+        await monitor.start_monitoring()
+        running.append(monitor)
+    return running
+
+
+async def stop_per_group(running: list[Any]) -> None:
+    """Stop every monitor and renewal timer started by run_per_group."""
+    for item in running:
+        if isinstance(item, HeartbeatMonitor):
+            await item.stop_monitoring()
+        else:
+            item.cancel()
+
+
+async def run_scheduled(
+    store: InMemoryKVStore, groups: list[str], logger: LoggerPort
+) -> list[ElectionScheduler]:
+    """Start one scheduler per instance owning every group."""
+    schedulers = []
+    for instance_id in ("node-1", "node-2"):
+        scheduler = ElectionScheduler(
+            store,
+            ServiceName(value="orders"),
+            InstanceId(value=instance_id),
+            FailoverPolicy.aggressive(),
+            logger,
+            lease_ttl_seconds=LEADER_TTL_SECONDS,
+        )
+        for group_id in groups:
+            scheduler.add_group(group_id)
+        await scheduler.start()
+        schedulers.append(scheduler)
+
+        # The first instance takes every group before the standby joins
+        deadline = time.perf_counter() + 5
+        while len(schedulers[0].held_groups()) < len(groups):
+            assert time.perf_counter() < deadline
+            await asyncio.sleep(0.01)
+    return schedulers
+
+
+async def measure(
+    group_count: int, scheduled: bool, logger: LoggerPort, registry: ServiceRegistryPort
+) -> tuple[float, int, float]:
+    """Return (KV writes per second, open watches, CPU milliseconds per second)."""
+    store = InMemoryKVStore()
+    await store.connect("sticky_active")
+    groups = [f"shard-{index}" for index in range(group_count)]
+    if scheduled:
+        running: list[Any] = await run_scheduled(store, groups, logger)
+    else:
+        running = await run_per_group(store, groups, logger, registry)
+
+    # Let startup settle, then measure the steady state
+    await asyncio.sleep(LEADER_TTL_SECONDS / 2)
+    revision = (await store.status())["revision"]
+    cpu_start = time.process_time()
+    await asyncio.sleep(WINDOW_SECONDS)
+    cpu = time.process_time() - cpu_start
+    status = await store.status()
+    writes, watches = status["revision"] - revision, status["watchers"]
+
+    if scheduled:
+        for scheduler in running:
+            await scheduler.stop()
+    else:
+        await stop_per_group(running)
+    return writes / WINDOW_SECONDS, watches, cpu / WINDOW_SECONDS * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestElectionSchedulerPerformance:
+    """Election overhead versus number of sticky-active groups."""
+
+    @pytest.mark.asyncio
+    async def test_overhead_is_flat_in_group_count(self, quiet_logger, no_registry):
+        """Scheduled elections keep KV writes and watches constant as groups grow."""
+        print(f"\nElection Overhead (TTL {LEADER_TTL_SECONDS}s, leader + standby):")
+        scheduled_writes = {}
+        for group_count in GROUP_COUNTS:
+            per_group = await measure(group_count, False, quiet_logger, no_registry)
+            scheduled = await measure(group_count, True, quiet_logger, no_registry)
+            scheduled_writes[group_count] = scheduled[0]
+            print(f"  {group_count} groups:")
+            print(
+                f"    Per-group: {per_group[0]:7.1f} writes/s {per_group[1]:4d} watches "
+                f"{per_group[2]:6.1f}ms CPU/s"
+            )
+            print(
+                f"    Scheduled: {scheduled[0]:7.1f} writes/s {scheduled[1]:4d} watches "
+                f"{scheduled[2]:6.1f}ms CPU/s"
+            )
+
+            assert scheduled[1] == 2
+            assert scheduled[0] < per_group[0]
+
+        # Lease renewal does not depend on how many groups it covers
+        assert scheduled_writes[GROUP_COUNTS[-1]] <= scheduled_writes[GROUP_COUNTS[0]] * 1.5
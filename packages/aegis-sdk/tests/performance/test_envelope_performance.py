@@ -0,0 +1,85 @@
+"""Receive-side cost of the header envelope for a filtering fan-out consumer.
+
+A consumer sees events from many sources and only reads the payload of the
+ones from a single source. With the body format every event is decoded into
+an Event before the filter runs; with the envelope format the filter reads a
+header and only the matching events have their payload decoded.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from aegis_sdk.domain.models import Event
+from aegis_sdk.infrastructure.envelope import EventView, encode_event
+from aegis_sdk.infrastructure.serialization import detect_and_deserialize, serialize_to_msgpack
+
+MESSAGES = 20_000
+SOURCES = 10
+
+
+def make_events() -> list[Event]:
+    return [
+        Event(
+            domain="market",
+            event_type="tick",
+            source=f"feed-{index % SOURCES}",
+            payload={"symbol": "AAPL", "bid": 189.5, "ask": 189.7, "levels": list(range(10))},
+        )
+        for index in range(MESSAGES)
+    ]
+
+
+def consume_bodies(bodies: list[bytes], validate: bool) -> int:
+    """Decode every message, then filter on its source."""
+    matched = 0
+    for body in bodies:
+        event = detect_and_deserialize(body, Event, validate)
+        if event.source == "feed-0":
+            matched += len(event.payload)
+    return matched
+
+
+def consume_envelopes(messages: list[tuple[dict[str, str], bytes]]) -> int:
+    """Filter on the source header and decode only matching payloads."""
+    matched = 0
+    for headers, body in messages:
+        event = EventView(headers, body)
+        if event.source == "feed-0":
+            matched += len(event.payload)
+    return matched
+
+
+def microseconds_per_message(func, *args) -> float:
+    """Average cost of consuming one message in microseconds."""
+    func(*args)
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) / MESSAGES * 1_000_000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestEnvelopePerformance:
+    """Per-message consumer cost by wire format."""
+
+    def test_envelope_skips_decoding_filtered_events(self):
+        """Filtering on headers is cheaper than decoding every body."""
+        events = make_events()
+        bodies = [serialize_to_msgpack(event) for event in events]
+        envelopes = [encode_event(event) for event in events]
+
+        validated = microseconds_per_message(consume_bodies, bodies, True)
+        trusted = microseconds_per_message(consume_bodies, bodies, False)
+        envelope = microseconds_per_message(consume_envelopes, envelopes)
+        assert consume_bodies(bodies, False) == consume_envelopes(envelopes)
+
+        print(f"\nFan-out Consumer (µs/message, 1 in {SOURCES} matches):")
+        print(f"  Body, validated: {validated:6.2f}")
+        print(f"  Body, trusted:   {trusted:6.2f}")
+        print(f"  Header envelope: {envelope:6.2f}")
+
+        assert envelope < trusted
+        assert envelope < validated / 3
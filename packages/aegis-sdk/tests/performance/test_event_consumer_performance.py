@@ -0,0 +1,112 @@
+"""Event throughput of pull consumers by fetch batch size.
+
+A fake pull subscription serves a backlog of events and charges a fixed
+round-trip for every fetch, like a pull request to the server would. The
+handler waits on simulated I/O for each event. The backlog is drained
+through NATSAdapter's pull path once per batch size, with the same
+concurrency limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from aegis_sdk.domain.models import Event, EventSubscriptionOptions
+from aegis_sdk.infrastructure.config import NATSConnectionConfig
+from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+from aegis_sdk.infrastructure.serialization import serialize_to_msgpack
+
+EVENTS = 2000
+BATCH_SIZES = [1, 10, 100]
+MAX_CONCURRENCY = 50
+FETCH_ROUND_TRIP_SECONDS = 0.001
+HANDLER_IO_SECONDS = 0.002
+
+
+class FakeMsg:
+    """JetStream message whose acks are counted."""
+
+    def __init__(self, data: bytes, acks: list[int]):
+        self.data = data
+        self.headers = None
+        self._acks = acks
+
+    async def ack(self) -> None:
+        self._acks[0] += 1
+
+    async def nak(self) -> None:
+        return None
+
+
+class FakePullSubscription:
+    """Serves a fixed backlog, one round-trip per fetch."""
+
+    def __init__(self, count: int):
+        self.acks = [0]
+        self.fetches = 0
+        data = serialize_to_msgpack(Event(domain="orders", event_type="created"))
+        self._backlog = [FakeMsg(data, self.acks) for _ in range(count)]
+
+    async def fetch(self, batch: int, timeout: float) -> list[FakeMsg]:
+        await asyncio.sleep(FETCH_ROUND_TRIP_SECONDS)
+        if not self._backlog:
+            raise TimeoutError
+        self.fetches += 1
+        msgs, self._backlog = self._backlog[:batch], self._backlog[batch:]
+        return msgs
+
+
+async def measure(batch_size: int) -> tuple[float, int]:
+    """Return (events per second, fetches) to drain the backlog."""
+    adapter = NATSAdapter(config=NATSConnectionConfig())
+    subscription = FakePullSubscription(EVENTS)
+    adapter._js = MagicMock()
+
+    async def pull_subscribe(*args, **kwargs) -> FakePullSubscription:
+        return subscription
+
+    adapter._js.pull_subscribe = pull_subscribe
+    done = asyncio.Event()
+    handled = 0
+
+    async def handler(event: Event) -> None:
+        nonlocal handled
+        await asyncio.sleep(HANDLER_IO_SECONDS)
+        handled += 1
+        if handled == EVENTS:
+            done.set()
+
+    options = EventSubscriptionOptions(
+        pull=True, batch_size=batch_size, max_concurrency=MAX_CONCURRENCY
+    )
+    start = time.perf_counter()
+    await adapter.subscribe_event("orders.*", handler, options=options)
+    await asyncio.wait_for(done.wait(), timeout=60)
+    elapsed = time.perf_counter() - start
+    await adapter.disconnect()
+
+    assert subscription.acks[0] == EVENTS
+    return EVENTS / elapsed, subscription.fetches
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestEventConsumerPerformance:
+    """Pull consumer throughput versus fetch batch size."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_batch_size(self):
+        """Larger batches amortize fetch round-trips and run handlers concurrently."""
+        print(f"\nPull Consumer Throughput ({EVENTS} events, concurrency {MAX_CONCURRENCY}):")
+        throughput = {}
+        for batch_size in BATCH_SIZES:
+            rate, fetches = await measure(batch_size)
+            throughput[batch_size] = rate
+            print(f"  Batch {batch_size:3d}: {rate:8.0f} events/s  {fetches:4d} fetches")
+
+        assert throughput[10] > throughput[1] * 3
+        assert throughput[100] > throughput[10] * 2
@@ -0,0 +1,108 @@
+"""Event publish throughput by PubAck window size.
+
+A fake JetStream context acknowledges every publish after a fixed round-trip,
+as the stream leader would. One coroutine publishes a block of events, first
+awaiting each PubAck through publish_event, then through
+publish_events_batch with increasing window sizes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aegis_sdk.domain.models import Event
+from aegis_sdk.infrastructure.config import NATSConnectionConfig
+from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+
+EVENTS = 2000
+WINDOW_SIZES = [1, 16, 256]
+ROUND_TRIP_SECONDS = 0.001
+
+
+class FakeJetStream:
+    """Acknowledges publishes one round-trip after they are sent."""
+
+    def __init__(self):
+        self.stored: set[str] = set()
+
+    def _ack(self, message_id: str) -> SimpleNamespace:
+        duplicate = message_id in self.stored
+        self.stored.add(message_id)
+        return SimpleNamespace(duplicate=duplicate)
+
+    async def publish(self, subject: str, payload: bytes, headers: dict) -> SimpleNamespace:
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        return self._ack(headers["Nats-Msg-Id"])
+
+    async def publish_async(self, subject: str, payload: bytes, headers: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        ack = loop.create_future()
+        loop.call_later(ROUND_TRIP_SECONDS, ack.set_result, self._ack(headers["Nats-Msg-Id"]))
+        return ack
+
+
+def make_adapter(window: int = 256) -> tuple[NATSAdapter, FakeJetStream]:
+    """Create an adapter publishing to a fake JetStream context."""
+    adapter = NATSAdapter(config=NATSConnectionConfig(publish_window=window))
+    js = FakeJetStream()
+    adapter._js = js
+    return adapter, js
+
+
+def make_events() -> list[Event]:
+    return [Event(domain="orders", event_type="created", payload={"n": n}) for n in range(EVENTS)]
+
+
+async def measure_sequential() -> float:
+    """Return events per second publishing one PubAck at a time."""
+    adapter, js = make_adapter()
+    events = make_events()
+    start = time.perf_counter()
+    for event in events:
+        await adapter.publish_event(event)
+    elapsed = time.perf_counter() - start
+    assert len(js.stored) == EVENTS
+    return EVENTS / elapsed
+
+
+async def measure_batch(window: int) -> float:
+    """Return events per second publishing through a PubAck window."""
+    adapter, js = make_adapter(window)
+    events = make_events()
+    start = time.perf_counter()
+    errors = await adapter.publish_events_batch(events)
+    elapsed = time.perf_counter() - start
+
+    assert errors == {}
+    assert len(js.stored) == EVENTS
+    # Publishing the batch again only produces duplicates
+    assert await adapter.publish_events_batch(events) == {}
+    assert len(js.stored) == EVENTS
+    await adapter.disconnect()
+    return EVENTS / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestEventPublishPerformance:
+    """Publish throughput versus outstanding PubAck window."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_window(self):
+        """A wider window overlaps round-trips instead of paying one per event."""
+        rtt_ms = ROUND_TRIP_SECONDS * 1000
+        print(f"\nEvent Publish Throughput ({EVENTS} events, RTT {rtt_ms:.0f}ms):")
+        sequential = await measure_sequential()
+        print(f"  publish_event: {sequential:8.0f} events/s")
+
+        throughput = {}
+        for window in WINDOW_SIZES:
+            throughput[window] = await measure_batch(window)
+            print(f"  Window {window:3d}:    {throughput[window]:8.0f} events/s")
+
+        assert throughput[16] > sequential * 5
+        assert throughput[256] > throughput[16]
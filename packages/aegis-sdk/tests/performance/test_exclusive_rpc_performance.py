@@ -0,0 +1,138 @@
+"""Latency of exclusive RPC calls through a queue group with standbys in it.
+
+Three SingleActiveService instances share one exclusive method and only one
+of them is active. Calls go through a fake network that delivers a queue
+group request to a random member and charges a fixed round-trip per hop.
+The client retries NOT_ACTIVE answers with exponential backoff, starting at
+the retry policy's default initial delay.
+Three routings are compared: standbys answering NOT_ACTIVE, standbys
+forwarding to the leader, and only the active instance joining the group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+from typing import Any
+
+import pytest
+
+from aegis_sdk.application.single_active_dtos import SingleActiveConfig
+from aegis_sdk.application.single_active_service import SingleActiveService
+from aegis_sdk.domain.models import RPCHandlerOptions, RPCRequest, RPCResponse
+from aegis_sdk.domain.value_objects import Duration, RetryPolicy
+
+CALLS = 300
+INSTANCES = 3
+ROUND_TRIP_SECONDS = 0.001
+
+
+class FakeNetwork:
+    """Routes RPC requests to registered handlers, one round-trip per hop."""
+
+    def __init__(self):
+        self.handlers: dict[str, Any] = {}
+        self.queue_members: set[str] = set()
+
+    async def deliver(self, request: RPCRequest, instance_id: str | None) -> RPCResponse:
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        if instance_id is None:
+            instance_id = random.choice(sorted(self.queue_members))
+        result = await self.handlers[instance_id](dict(request.params))
+        return RPCResponse(correlation_id=request.message_id, result=result)
+
+
+class FakeBus:
+    """Message bus of one instance on the fake network."""
+
+    def __init__(self, network: FakeNetwork, instance_id: str):
+        self._network = network
+        self._instance_id = instance_id
+
+    async def register_service(self, service_name: str, instance_id: str) -> None:
+        return None
+
+    async def register_rpc_handler(
+        self, service: str, method: str, handler, options: RPCHandlerOptions | None = None
+    ) -> None:
+        self._network.handlers[self._instance_id] = handler
+        if options is None or options.join_queue_group:
+            self._network.queue_members.add(self._instance_id)
+
+    async def join_rpc_queue_group(self, service: str, method: str) -> None:
+        self._network.queue_members.add(self._instance_id)
+
+    async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+        self._network.queue_members.discard(self._instance_id)
+
+    async def call_rpc(self, request: RPCRequest, instance_id: str | None = None) -> RPCResponse:
+        return await self._network.deliver(request, instance_id)
+
+
+async def start_instances(network: FakeNetwork, **routing: Any) -> None:
+    """Create the instances, with the first one active."""
+    for index in range(INSTANCES):
+        instance_id = f"orders-{index}"
+        config = SingleActiveConfig(service_name="orders", instance_id=instance_id, **routing)
+        service = SingleActiveService(config=config, message_bus=FakeBus(network, instance_id))
+
+        async def place_order(params: dict, served_by: str = instance_id) -> dict:
+            return {"served_by": served_by}
+
+        service.rpc("place_order")(service.exclusive_rpc("place_order")(place_order))
+        await service._register_with_infrastructure()
+
+        service.is_active = index == 0
+        service._update_leader("orders-0")
+        await service._sync_queue_membership()
+
+
+async def call_with_retry(network: FakeNetwork, policy: RetryPolicy) -> float:
+    """Call the exclusive method like a retrying client; return the latency."""
+    request = RPCRequest(method="place_order", target="orders")
+    start = time.perf_counter()
+    attempt = 0
+    while True:
+        response = await network.deliver(request, None)
+        if response.result["success"]:
+            return time.perf_counter() - start
+        attempt += 1
+        await asyncio.sleep(policy.calculate_delay(attempt).seconds)
+
+
+async def measure(**routing: Any) -> tuple[float, float]:
+    """Return (p50, p99) latency in milliseconds."""
+    random.seed(7)
+    network = FakeNetwork()
+    await start_instances(network, **routing)
+    policy = RetryPolicy(max_delay=Duration(seconds=0.4))
+
+    latencies = await asyncio.gather(*(call_with_retry(network, policy) for _ in range(CALLS)))
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p99 = latencies_ms[min(len(latencies_ms) - 1, int(len(latencies_ms) * 0.99))]
+    return statistics.median(latencies_ms), p99
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestExclusiveRPCPerformance:
+    """Exclusive call latency by routing mode."""
+
+    @pytest.mark.asyncio
+    async def test_forwarding_removes_retries_from_p99(self):
+        """Forwarding and active-only membership avoid NOT_ACTIVE retries."""
+        retry_p50, retry_p99 = await measure(forward_to_leader=False)
+        forward_p50, forward_p99 = await measure()
+        active_p50, active_p99 = await measure(forward_to_leader=False, active_only_queue=True)
+
+        rtt_ms = ROUND_TRIP_SECONDS * 1000
+        print(f"\nExclusive RPC Latency ({INSTANCES} instances, RTT {rtt_ms:.0f}ms):")
+        print(f"  Client retry: P50 {retry_p50:6.1f}ms  P99 {retry_p99:6.1f}ms")
+        print(f"  Forwarding:   P50 {forward_p50:6.1f}ms  P99 {forward_p99:6.1f}ms")
+        print(f"  Active-only:  P50 {active_p50:6.1f}ms  P99 {active_p99:6.1f}ms")
+
+        # At most one extra hop instead of a backoff delay
+        assert forward_p99 < retry_p99 / 5
+        assert active_p99 <= forward_p99
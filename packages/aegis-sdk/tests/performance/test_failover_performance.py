@@ -0,0 +1,101 @@
+"""Failover latency of watch-based leader failure detection.
+
+Each trial runs a leader that refreshes its key on every heartbeat and a
+standby driven by HeartbeatMonitor and ElectionCoordinator, all on an
+InMemoryKVStore whose keys expire after their TTL. The leader is killed
+at a random point in its heartbeat cycle, and latency is measured from the
+kill until the standby has won the election and is serving. Trials use
+separate groups and run concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+
+import pytest
+
+from aegis_sdk.domain.models import KVOptions
+from aegis_sdk.domain.value_objects import Duration, FailoverPolicy, InstanceId, ServiceName
+from aegis_sdk.infrastructure.election_coordinator import ElectionCoordinator
+from aegis_sdk.infrastructure.heartbeat_monitor import HeartbeatMonitor
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVStore
+from aegis_sdk.ports.logger import LoggerPort
+from aegis_sdk.ports.service_registry import ServiceRegistryPort
+
+TRIALS = 40
+LEADER_TTL_SECONDS = 1
+HEARTBEAT_SECONDS = 0.1
+
+
+async def run_leader(store: InMemoryKVStore, key: str, instance_id: str) -> None:
+    """Refresh the leader key on every heartbeat until cancelled."""
+    while True:
+        value = {"instance_id": instance_id, "last_heartbeat": time.time()}
+        await store.put(key, value, KVOptions(ttl=LEADER_TTL_SECONDS))
+        await asyncio.sleep(HEARTBEAT_SECONDS)
+
+
+async def measure_failover(
+    store: InMemoryKVStore, group_id: str, logger: LoggerPort, registry: ServiceRegistryPort
+) -> float:
+    """Kill a leader and return seconds until the standby serves."""
+    service_name = ServiceName(value="orders")
+    key = f"sticky-active.orders.{group_id}.leader"
+    policy = FailoverPolicy.aggressive()
+    serving = asyncio.Event()
+
+    leader = asyncio.create_task(run_leader(store, key, f"leader-{group_id}"))
+    await asyncio.sleep(HEARTBEAT_SECONDS)
+
+    standby_id = InstanceId(value=f"standby-{group_id}")
+    monitor = HeartbeatMonitor(store, service_name, standby_id, group_id, policy, logger)
+    coordinator = ElectionCoordinator(
+        store, registry, service_name, standby_id, group_id, policy, logger
+    )
+    coordinator.set_on_elected_callback(serving.set)
+    monitor.set_election_trigger(coordinator)
+    monitor.set_heartbeat_interval(Duration(seconds=HEARTBEAT_SECONDS))
+    await monitor.start_monitoring()
+
+    # Kill the leader at a random phase of its heartbeat cycle
+    await asyncio.sleep(random.uniform(0.3, 0.8))
+    leader.cancel()
+    killed_at = time.perf_counter()
+
+    await asyncio.wait_for(serving.wait(), timeout=LEADER_TTL_SECONDS * 5)
+    latency = time.perf_counter() - killed_at
+
+    await monitor.stop_monitoring()
+    return latency
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestFailoverPerformance:
+    """Leader kill to new leader serving."""
+
+    @pytest.mark.asyncio
+    async def test_failover_latency(self, in_memory_kv_store, quiet_logger, no_registry):
+        """Failover completes within one leader TTL plus the election delay."""
+        latencies = await asyncio.gather(
+            *(
+                measure_failover(in_memory_kv_store, f"g{trial}", quiet_logger, no_registry)
+                for trial in range(TRIALS)
+            )
+        )
+
+        latencies_ms = sorted(latency * 1000 for latency in latencies)
+        p50 = statistics.median(latencies_ms)
+        p99 = latencies_ms[min(len(latencies_ms) - 1, int(len(latencies_ms) * 0.99))]
+        election_delay = FailoverPolicy.aggressive().election_delay.seconds
+
+        print(f"\nFailover Latency (TTL {LEADER_TTL_SECONDS}s, {TRIALS} trials):")
+        print(f"  P50: {p50:.0f}ms")
+        print(f"  P99: {p99:.0f}ms")
+        print(f"  Max: {latencies_ms[-1]:.0f}ms")
+
+        # Detection is bounded by the TTL, not by a polling phase
+        assert p99 < (LEADER_TTL_SECONDS + election_delay + 0.25) * 1000
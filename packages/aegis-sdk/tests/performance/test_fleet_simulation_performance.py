@@ -0,0 +1,164 @@
+"""Fleet-scale scenarios simulated on the in-memory transport.
+
+A thousand service instances share one InMemoryBroker and one
+InMemoryKVServer, so scenarios that would otherwise need a cluster (a fleet
+serving RPC, an election storm, every leader lease expiring at once) run in a
+single process. Leases follow a ManualClock and expire when the test advances
+it. With no network in the way, the timings are the SDK's own CPU cost:
+serialization, dispatch and election logic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from aegis_sdk.domain.models import RPCRequest
+from aegis_sdk.domain.value_objects import Duration, FailoverPolicy, InstanceId, ServiceName
+from aegis_sdk.infrastructure.election_coordinator import LEADER_TTL_SECONDS, ElectionCoordinator
+from aegis_sdk.infrastructure.heartbeat_monitor import HeartbeatMonitor
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVServer, InMemoryKVStore
+from aegis_sdk.infrastructure.in_memory_message_bus import InMemoryBroker, InMemoryMessageBus
+from aegis_sdk.infrastructure.manual_clock import ManualClock
+from aegis_sdk.ports.logger import LoggerPort
+from aegis_sdk.ports.service_registry import ServiceRegistryPort
+
+INSTANCES = 1000
+RPC_CALLS = 5000
+GROUPS = 100
+CANDIDATES_PER_GROUP = INSTANCES // GROUPS
+SERVICE = ServiceName(value="orders")
+
+
+async def candidate(
+    server: InMemoryKVServer,
+    instance_id: str,
+    group_id: str,
+    logger: LoggerPort,
+    registry: ServiceRegistryPort,
+) -> ElectionCoordinator:
+    """An election coordinator with its own store on the shared bucket."""
+    store = InMemoryKVStore(server)
+    await store.connect("sticky_active")
+    return ElectionCoordinator(
+        store,
+        registry,
+        SERVICE,
+        InstanceId(value=instance_id),
+        group_id,
+        FailoverPolicy.aggressive(),
+        logger,
+    )
+
+
+@pytest.mark.performance
+class TestFleetSimulationPerformance:
+    """A thousand instances in one process."""
+
+    @pytest.mark.asyncio
+    async def test_rpc_overhead_across_fleet(self):
+        """RPC calls spread over the fleet cost little CPU per call."""
+        broker = InMemoryBroker()
+        buses = []
+        for index in range(INSTANCES):
+            bus = InMemoryMessageBus(broker, "orders", f"orders-{index}")
+            await bus.connect()
+            await bus.register_rpc_handler("orders", "get", lambda params: params)
+            buses.append(bus)
+
+        client = InMemoryMessageBus(broker, "gateway", "gateway-0")
+        await client.connect()
+        request = RPCRequest(method="get", target="orders", params={"order_id": "o-1"})
+
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        for _ in range(RPC_CALLS):
+            response = await client.call_rpc(request)
+            assert response.success
+        cpu_per_call_us = (time.process_time() - cpu_started) / RPC_CALLS * 1e6
+        wall_per_call_us = (time.perf_counter() - wall_started) / RPC_CALLS * 1e6
+
+        print(f"\nRPC across {INSTANCES} instances ({RPC_CALLS} calls):")
+        print(f"  CPU per call:  {cpu_per_call_us:.1f}us")
+        print(f"  Wall per call: {wall_per_call_us:.1f}us")
+        print(f"  Subscriptions: {broker.subscription_count}")
+
+        # Client and server side together, both codecs included
+        assert cpu_per_call_us < 1000
+
+        for bus in [*buses, client]:
+            await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_election_storm_and_mass_lease_expiry(self, quiet_logger, no_registry):
+        """Every group elects one leader at once, then all fail over together."""
+        clock = ManualClock()
+        server = InMemoryKVServer(clock)
+
+        candidates = {
+            f"g{group}": [
+                await candidate(
+                    server, f"g{group}-c{index}", f"g{group}", quiet_logger, no_registry
+                )
+                for index in range(CANDIDATES_PER_GROUP)
+            ]
+            for group in range(GROUPS)
+        }
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(c.start_election() for group in candidates.values() for c in group)
+        )
+        storm_seconds = time.perf_counter() - started
+        assert sum(results) == GROUPS
+
+        # One standby per group follows its leader through HeartbeatMonitor
+        elected_at: dict[str, float] = {}
+        monitors = []
+        for group_id in candidates:
+            standby_id = f"{group_id}-standby"
+            standby = await candidate(server, standby_id, group_id, quiet_logger, no_registry)
+            standby.set_on_elected_callback(
+                lambda group_id=group_id: elected_at.setdefault(group_id, time.perf_counter())
+            )
+            store = InMemoryKVStore(server)
+            await store.connect("sticky_active")
+            monitor = HeartbeatMonitor(
+                store,
+                SERVICE,
+                InstanceId(value=standby_id),
+                group_id,
+                FailoverPolicy.aggressive(),
+                quiet_logger,
+            )
+            monitor.set_election_trigger(standby)
+            monitor.set_heartbeat_interval(Duration(seconds=0.1))
+            await monitor.start_monitoring()
+            monitors.append(monitor)
+        await asyncio.sleep(0.2)
+
+        # No leader renews; moving the clock past the TTL expires every lease
+        expired_at = time.perf_counter()
+        clock.advance(LEADER_TTL_SECONDS + 1)
+        deadline = expired_at + 5
+        while len(elected_at) < GROUPS and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        failover_ms = sorted((at - expired_at) * 1000 for at in elected_at.values())
+
+        for monitor in monitors:
+            await monitor.stop_monitoring()
+
+        election_delay = FailoverPolicy.aggressive().election_delay.seconds
+        print(f"\nElection storm ({GROUPS} groups x {CANDIDATES_PER_GROUP} candidates):")
+        print(f"  Storm settled in: {storm_seconds * 1000:.0f}ms")
+        print(f"Mass lease expiry ({GROUPS} groups):")
+        print(f"  P50 failover: {statistics.median(failover_ms):.0f}ms")
+        print(f"  Max failover: {failover_ms[-1]:.0f}ms")
+
+        assert len(elected_at) == GROUPS
+        # Losers give up after their retries, bounded by max_election_time
+        assert storm_seconds < FailoverPolicy.aggressive().max_election_time.seconds + 0.5
+        assert failover_ms[-1] < (election_delay + 1) * 1000
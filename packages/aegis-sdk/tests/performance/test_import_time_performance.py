@@ -0,0 +1,104 @@
+"""Import cost of the SDK's package namespaces.
+
+Each import runs in a fresh interpreter under ``python -X importtime``. The
+package namespaces load their exports lazily, so importing them must not pull
+in nats, msgpack or pydantic; the heavier paths a service actually needs are
+reported with their biggest contributors and held to a loose budget.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+# Budgets are cumulative import time in milliseconds, generous for slow CI
+SLIM_IMPORTS = {
+    "aegis_sdk": 50,
+    "aegis_sdk.application": 50,
+    "aegis_sdk.domain": 50,
+    "aegis_sdk.infrastructure": 50,
+    "aegis_sdk.ports": 50,
+}
+HEAVY_MODULES = ("nats", "msgpack", "pydantic")
+FULL_IMPORTS = {
+    "aegis_sdk.infrastructure.nats_adapter": 2000,
+    "aegis_sdk.application.service": 2000,
+}
+
+
+class ImportProfile:
+    """Parsed ``-X importtime`` output of one interpreter run."""
+
+    def __init__(self, stderr: str, loaded: set[str]):
+        """Parse the report.
+
+        Args:
+            stderr: Standard error of the run
+            loaded: Names of all modules loaded by the end of the run
+        """
+        self.loaded = loaded
+        # Cumulative microseconds of each top-level import, and of the
+        # imports it triggered directly
+        self.cumulative: dict[str, int] = {}
+        self.children: dict[str, list[tuple[str, int]]] = {}
+        pending: list[tuple[str, int]] = []
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or line.count("|") != 2:
+                continue
+            _, total, name = line.split("|")
+            if not total.strip().isdigit():
+                continue
+            # Nested imports are indented, two spaces per level, and are
+            # reported before the import that triggered them
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            if depth == 1:
+                pending.append((name.strip(), int(total)))
+            elif depth == 0:
+                self.cumulative[name.strip()] = int(total)
+                self.children[name.strip()] = pending
+                pending = []
+
+
+def import_profile(module: str) -> ImportProfile:
+    """Import a module in a fresh interpreter under ``-X importtime``."""
+    script = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=PACKAGE_ROOT,
+        check=True,
+    )
+    return ImportProfile(completed.stderr, set(completed.stdout.split()))
+
+
+@pytest.mark.performance
+class TestImportTimePerformance:
+    """Import cost of the package namespaces and the service path."""
+
+    @pytest.mark.parametrize(("module", "budget_ms"), SLIM_IMPORTS.items())
+    def test_package_namespaces_load_lazily(self, module: str, budget_ms: int):
+        """Importing a package namespace loads none of the heavy dependencies."""
+        profile = import_profile(module)
+        elapsed_ms = profile.cumulative[module] / 1000
+
+        print(f"\nimport {module}: {elapsed_ms:.1f}ms")
+        assert not profile.loaded.intersection(HEAVY_MODULES)
+        assert elapsed_ms < budget_ms
+
+    @pytest.mark.parametrize(("module", "budget_ms"), FULL_IMPORTS.items())
+    def test_service_import_budget(self, module: str, budget_ms: int):
+        """The modules a running service needs stay within their budget."""
+        profile = import_profile(module)
+        elapsed_ms = profile.cumulative[module] / 1000
+        slowest = sorted(profile.children[module], key=lambda item: item[1], reverse=True)
+
+        print(f"\nimport {module}: {elapsed_ms:.1f}ms")
+        for name, total in slowest[:5]:
+            print(f"  {name:<40} {total / 1000:7.1f}ms")
+        assert elapsed_ms < budget_ms
@@ -0,0 +1,138 @@
+"""Performance tests for prefix watches on NATS KV.
+
+Compares the registry's watch on dot-separated keys, which the server filters
+by subject, against the legacy ``service-instances__`` layout, whose prefix
+ends mid-token so every bucket mutation is received and discarded
+client-side, across increasing amounts of unrelated churn in the bucket.
+Every key is one ``NATSKVStore.put()`` accepts.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from nats.js.kv import KeyValue
+
+from aegis_sdk.infrastructure.kv_service_registry import LEGACY_SEPARATOR, KVServiceRegistry
+from aegis_sdk.infrastructure.nats_kv_store import NATSKVStore
+
+RELEVANT_UPDATES = 1_000
+CHURN_LEVELS = [0, 10_000, 50_000]
+
+
+def subject_matches(subject_filter: str, key: str) -> bool:
+    """Match a bucket-relative subject filter the way the server does."""
+    if subject_filter == ">":
+        return True
+    if subject_filter.endswith(".>"):
+        return key.startswith(subject_filter[:-1])
+    return key == subject_filter
+
+
+class FakeBucket:
+    """In-process bucket that delivers decoded entries like a KV watcher."""
+
+    def __init__(self, keys: list[str]):
+        self._keys = keys
+        self._payload = json.dumps({"status": "ACTIVE", "version": "1.0.0"}).encode()
+        self.delivered = 0
+        self.server_time = 0.0
+
+    async def watch(self, subject_filter: str, include_history: bool = False):
+        # Filtering happens on the server, so keep it out of the client CPU figure
+        start = time.process_time()
+        keys = iter([key for key in self._keys if subject_matches(subject_filter, key)])
+        self.server_time += time.process_time() - start
+        created = datetime.now(UTC)
+        bucket = self
+
+        class Watcher:
+            async def updates(self, timeout: float = 5.0):
+                key = next(keys, None)
+                if key is None:
+                    raise RuntimeError("watcher closed")
+                bucket.delivered += 1
+                # Every delivered message costs an Entry decode in the client
+                return KeyValue.Entry(
+                    bucket="bench",
+                    key=key,
+                    value=bucket._payload,
+                    revision=bucket.delivered,
+                    delta=1,
+                    created=created,
+                    operation=None,
+                )
+
+            async def stop(self):
+                pass
+
+        return Watcher()
+
+
+def churned_keys(churn: int, legacy: bool = False) -> list[str]:
+    """Interleave relevant instance updates with unrelated bucket churn."""
+    registry = KVServiceRegistry(MagicMock())
+    validator = NATSKVStore(metrics=MagicMock(), logger=MagicMock())
+    keys = []
+    ratio = max(churn // RELEVANT_UPDATES, 0)
+    for i in range(RELEVANT_UPDATES):
+        key = registry._make_key("echo", f"instance-{i % 10}")
+        if legacy:
+            key = key.replace(".", LEGACY_SEPARATOR)
+        keys.append(key)
+        keys.extend(f"sessions.user-{i}-{j}" for j in range(ratio))
+    for key in set(keys):
+        validator._validate_key(key)
+    return keys
+
+
+async def consume(prefix: str, keys: list[str]) -> tuple[int, int, float]:
+    """Drain a prefix watch and return (events, delivered, cpu seconds)."""
+    store = NATSKVStore(metrics=MagicMock(), logger=MagicMock())
+    bucket = FakeBucket(keys)
+    store._kv = bucket  # type: ignore[assignment]
+    store._bucket_name = "bench"
+
+    start = time.process_time()
+    events = 0
+    async for _ in store.watch(prefix=prefix):
+        events += 1
+    return events, bucket.delivered, time.process_time() - start - bucket.server_time
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestKVWatchFilterPerformance:
+    """Decode CPU of prefix watches versus bucket churn."""
+
+    @pytest.mark.asyncio
+    async def test_server_side_filter_cost_independent_of_churn(self):
+        """Server-filtered watches only pay for relevant updates."""
+        print("\nKV Prefix Watch CPU vs Bucket Churn:")
+        server_costs = []
+        for churn in CHURN_LEVELS:
+            keys = churned_keys(churn)
+            legacy_keys = churned_keys(churn, legacy=True)
+            # "service-instances." ends on a token boundary and becomes a subject filter
+            filtered = await consume("service-instances.", keys)
+            # "service-instances__" does not, so every mutation is delivered and discarded
+            unfiltered = await consume("service-instances__", legacy_keys)
+
+            assert filtered[0] == unfiltered[0] == RELEVANT_UPDATES
+            assert filtered[1] == RELEVANT_UPDATES
+            assert unfiltered[1] == len(legacy_keys)
+            server_costs.append(filtered[2])
+
+            print(f"  Churn {churn:>6}:")
+            print(f"    Server-side filter: {filtered[1]:>6} delivered, {filtered[2] * 1000:.1f}ms")
+            print(
+                f"    Client-side filter: {unfiltered[1]:>6} delivered, "
+                f"{unfiltered[2] * 1000:.1f}ms"
+            )
+
+        # Filtered cost must not scale with churn (generous bound for noisy CI)
+        assert max(server_costs) < min(server_costs) * 3 + 0.05
@@ -0,0 +1,94 @@
+"""Event loop stalls caused by logging during an error storm.
+
+A burst of handler errors is logged to a stream that takes a fixed time per
+write, like a slow terminal or a full pipe. A ticker coroutine measures how
+late it wakes up while the burst is logged. SimpleLogger writes on the
+calling thread, so every record holds up the loop; AsyncLogger only queues
+the record and rate-limits the repeated message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import time
+
+import pytest
+
+from aegis_sdk.infrastructure.async_logger import AsyncLogger
+from aegis_sdk.infrastructure.simple_logger import SimpleLogger
+
+ERRORS = 2000
+WRITE_SECONDS = 0.0002
+TICK_SECONDS = 0.001
+
+
+class SlowStream(io.StringIO):
+    """Stream that blocks for a fixed time on every write."""
+
+    def write(self, text: str) -> int:
+        time.sleep(WRITE_SECONDS)
+        return super().write(text)
+
+
+def simple_logger(stream: SlowStream) -> SimpleLogger:
+    logger = SimpleLogger(f"aegis_sdk.bench.{id(stream)}")
+    handler = logging.StreamHandler(stream)
+    logger._logger.handlers = [handler]
+    logger._logger.propagate = False
+    return logger
+
+
+async def measure(logger) -> tuple[float, float]:
+    """Return (worst tick lateness in ms, burst duration in ms)."""
+    worst = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal worst
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            worst = max(worst, time.perf_counter() - start - TICK_SECONDS)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    for index in range(ERRORS):
+        logger.error("Event handler error", error="boom", subject=f"events.orders.{index}")
+        if index % 50 == 0:
+            await asyncio.sleep(0)
+    burst = time.perf_counter() - start
+    await asyncio.sleep(0.01)
+    running = False
+    await task
+    return worst * 1000, burst * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestLoggingPerformance:
+    """Event loop responsiveness by logger."""
+
+    @pytest.mark.asyncio
+    async def test_async_logger_keeps_loop_responsive(self):
+        """Queued, rate-limited logging does not stall the event loop."""
+        sync_stream = SlowStream()
+        sync_stall, sync_burst = await measure(simple_logger(sync_stream))
+
+        async_stream = SlowStream()
+        logger = AsyncLogger(stream=async_stream)
+        async_stall, async_burst = await measure(logger)
+        logger.close()
+
+        print(f"\nError Storm Logging ({ERRORS} errors, {WRITE_SECONDS * 1e6:.0f}µs/write):")
+        print(f"  SimpleLogger: burst {sync_burst:7.1f} ms  worst tick delay {sync_stall:6.1f} ms")
+        print(
+            f"  AsyncLogger:  burst {async_burst:7.1f} ms  worst tick delay {async_stall:6.1f} ms"
+        )
+        print(f"  Suppressed:   {logger.suppressed}")
+
+        assert async_burst < sync_burst / 10
+        assert async_stall < sync_stall / 2
+        assert logger.suppressed == ERRORS - 100
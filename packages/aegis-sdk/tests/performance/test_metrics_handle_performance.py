@@ -0,0 +1,79 @@
+"""Per-increment overhead of string-keyed metrics versus pre-bound handles.
+
+The string path formats the metric name on every call and looks it up in a
+dict, as the RPC handler wrapper used to do. Handles resolve the name once
+when the handler is registered; PrometheusMetrics handles then update a
+value stored on the handle itself.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
+from aegis_sdk.infrastructure.prometheus_metrics import PrometheusMetrics
+
+INCREMENTS = 1_000_000
+SERVICE = "order-service"
+METHOD = "create_order"
+
+
+def per_increment_ns(increment) -> float:
+    """Time a no-argument increment callable and return ns per call."""
+    start = time.perf_counter()
+    for _ in range(INCREMENTS):
+        increment()
+    return (time.perf_counter() - start) / INCREMENTS * 1e9
+
+
+@pytest.mark.performance
+class TestMetricsHandlePerformance:
+    """Overhead of one counter increment on the RPC hot path."""
+
+    def test_bound_handles_beat_formatted_names(self):
+        """Pre-bound handles cost less per increment than f-string names."""
+        in_memory = InMemoryMetrics()
+        prometheus = PrometheusMetrics()
+
+        def formatted() -> None:
+            in_memory.increment(f"rpc.{SERVICE}.{METHOD}.success")
+
+        in_memory_handle = in_memory.counter(
+            "rpc.{service}.{method}.success", service=SERVICE, method=METHOD
+        )
+        prometheus_handle = prometheus.counter(
+            "rpc.{service}.{method}.success", service=SERVICE, method=METHOD
+        )
+
+        formatted_ns = per_increment_ns(formatted)
+        in_memory_ns = per_increment_ns(in_memory_handle.inc)
+        prometheus_ns = per_increment_ns(prometheus_handle.inc)
+
+        print("\nCounter Increment Overhead:")
+        print(f"  f-string + InMemoryMetrics: {formatted_ns:.0f}ns")
+        print(f"  InMemoryMetrics handle:     {in_memory_ns:.0f}ns")
+        print(f"  PrometheusMetrics handle:   {prometheus_ns:.0f}ns")
+
+        assert prometheus.get_all()["counters"][f"rpc.{SERVICE}.{METHOD}.success"] == INCREMENTS
+        assert prometheus_ns < formatted_ns
+
+    def test_render_cost(self):
+        """Rendering a realistic registry for a scrape stays cheap."""
+        metrics = PrometheusMetrics()
+        for index in range(50):
+            labels = {"service": SERVICE, "method": f"method_{index}"}
+            metrics.counter("rpc.{service}.{method}.success", **labels).inc()
+            metrics.counter("rpc.{service}.{method}.error", **labels).inc()
+            timer = metrics.timer_handle("rpc.{service}.{method}", **labels)
+            for value in range(100):
+                timer.observe(value / 10)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            text = metrics.render()
+        render_ms = (time.perf_counter() - start) / 100 * 1000
+
+        print(f"\nRender: {render_ms:.3f}ms for {len(text.splitlines())} lines")
+        assert render_ms < 50
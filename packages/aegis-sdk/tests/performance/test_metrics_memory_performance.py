@@ -0,0 +1,91 @@
+"""Performance tests for bounded-memory metrics summaries.
+
+These tests verify that timer/record metrics keep a constant memory
+footprint no matter how many samples are recorded, and that recording
+and percentile extraction stay cheap.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+import pytest
+
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics, MetricsSummary
+
+# Set AEGIS_BENCHMARK_SAMPLES to shorten local runs; the full run records 10M samples
+TOTAL_SAMPLES = int(os.getenv("AEGIS_BENCHMARK_SAMPLES", "10000000"))
+
+
+def histogram_size_bytes(summary: MetricsSummary) -> int:
+    """Approximate the memory held by a summary's histogram buckets."""
+    histogram = summary._histogram
+    size = sys.getsizeof(histogram._positive) + sys.getsizeof(histogram._negative)
+    for store in (histogram._positive, histogram._negative):
+        for index, count in store.items():
+            size += sys.getsizeof(index) + sys.getsizeof(count)
+    return size
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestMetricsMemoryPerformance:
+    """Memory and latency characteristics of metrics summaries."""
+
+    def test_constant_memory_after_many_samples(self):
+        """Histogram memory stops growing once the value range is covered."""
+        metrics = InMemoryMetrics()
+        rng = random.Random(42)
+        # Log-normal latencies in milliseconds, cycled to keep generation cheap
+        pool = [rng.lognormvariate(1.0, 1.5) for _ in range(200_000)]
+        checkpoints = sorted(
+            {n for n in (len(pool), 1_000_000, TOTAL_SAMPLES) if n <= TOTAL_SAMPLES}
+        )
+
+        sizes: dict[int, int] = {}
+        recorded = 0
+        start = time.perf_counter()
+        for checkpoint in checkpoints:
+            while recorded < checkpoint:
+                metrics.record("rpc.latency", pool[recorded % len(pool)])
+                recorded += 1
+            sizes[checkpoint] = histogram_size_bytes(metrics._summaries["rpc.latency"])
+        elapsed = time.perf_counter() - start
+
+        summary = metrics._summaries["rpc.latency"]
+        print("\nMetrics Summary Memory:")
+        for checkpoint, size in sizes.items():
+            print(f"  {checkpoint:>10,} samples: {size / 1024:.1f} KiB")
+        print(f"  Buckets: {summary._histogram.bucket_count}")
+        print(f"  Record cost: {elapsed / recorded * 1e6:.2f}µs/sample")
+        print(f"  Unbounded list would need: {recorded * 8 / 1024 / 1024:.1f} MiB")
+
+        assert summary.count == recorded
+        assert summary._histogram.bucket_count <= summary._histogram.max_buckets
+        assert sizes[checkpoints[-1]] == sizes[checkpoints[0]]
+
+    def test_percentile_accuracy_and_cost(self):
+        """Percentiles stay within the configured error and are cheap to extract."""
+        metrics = InMemoryMetrics(relative_accuracy=0.01)
+        rng = random.Random(7)
+        values = [rng.lognormvariate(1.0, 1.5) for _ in range(100_000)]
+        for value in values:
+            metrics.record("latency", value)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            snapshot = metrics.get_all()["summaries"]["latency"]
+        snapshot_time = (time.perf_counter() - start) / 100
+
+        exact = sorted(values)
+        print("\nMetrics Percentile Accuracy:")
+        for name, p in (("p50", 50), ("p90", 90), ("p99", 99)):
+            expected = exact[int(p / 100 * len(exact))]
+            print(f"  {name}: estimated={snapshot[name]:.3f} exact={expected:.3f}")
+            assert snapshot[name] == pytest.approx(expected, rel=0.011, abs=0.01)
+        print(f"  Snapshot time: {snapshot_time * 1000:.3f}ms")
+
+        assert snapshot_time < 0.01
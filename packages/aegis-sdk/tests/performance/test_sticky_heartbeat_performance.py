@@ -0,0 +1,174 @@
+"""KV round-trips per sticky-active heartbeat tick.
+
+Runs the heartbeat use case against the real election repository and service
+registry on top of a KV store fake that counts operations and simulates a
+network round-trip per call. The uncoalesced sequence (read election state,
+refresh the leader key with a read-then-write, read the leader key back, read
+and rewrite the registry entry, save election state) is replayed alongside for
+comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from aegis_sdk.application.sticky_active_use_cases import (
+    StickyActiveHeartbeatRequest,
+    StickyActiveHeartbeatUseCase,
+)
+from aegis_sdk.domain.aggregates import StickyActiveElection
+from aegis_sdk.domain.exceptions import KVKeyAlreadyExistsError, KVRevisionMismatchError
+from aegis_sdk.domain.models import KVEntry, KVOptions, ServiceInstance
+from aegis_sdk.domain.value_objects import InstanceId, ServiceName
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
+from aegis_sdk.infrastructure.kv_service_registry import KVServiceRegistry
+from aegis_sdk.infrastructure.nats_kv_election_repository import NatsKvElectionRepository
+
+ROUND_TRIP_SECONDS = 0.001
+TICKS = 50
+
+
+class CountingKVStore:
+    """In-memory KV store that counts operations and delays each one."""
+
+    def __init__(self, round_trip: float = 0.0):
+        self.round_trip = round_trip
+        self.operations = 0
+        self._entries: dict[str, KVEntry] = {}
+        self._revision = 0
+
+    async def _round_trip(self) -> None:
+        self.operations += 1
+        if self.round_trip:
+            await asyncio.sleep(self.round_trip)
+
+    async def get(self, key: str) -> KVEntry | None:
+        await self._round_trip()
+        return self._entries.get(key)
+
+    async def put(self, key: str, value: Any, options: KVOptions | None = None) -> int:
+        await self._round_trip()
+        current = self._entries.get(key)
+        if options and options.create_only and current:
+            raise KVKeyAlreadyExistsError(key)
+        if options and options.revision is not None:
+            actual = current.revision if current else 0
+            if actual != options.revision:
+                raise KVRevisionMismatchError(key, options.revision, actual)
+
+        self._revision += 1
+        now = datetime.now(UTC).isoformat()
+        self._entries[key] = KVEntry(
+            key=key,
+            value=value,
+            revision=self._revision,
+            created_at=current.created_at if current else now,
+            updated_at=now,
+        )
+        return self._revision
+
+    async def delete(self, key: str, revision: int | None = None) -> bool:
+        await self._round_trip()
+        return self._entries.pop(key, None) is not None
+
+
+async def uncoalesced_heartbeat(
+    repository: NatsKvElectionRepository,
+    registry: KVServiceRegistry,
+    request: StickyActiveHeartbeatRequest,
+) -> None:
+    """Replay the heartbeat as a strictly sequential read-modify-write chain."""
+    # Nothing is known locally between ticks
+    repository._held_leaderships.clear()
+    repository._election_states.clear()
+
+    service_name = ServiceName(value=request.service_name)
+    instance_id = InstanceId(value=request.instance_id)
+    election = await repository.get_election_state(service_name, instance_id, request.group_id)
+    if election.is_leader:
+        await repository.update_leadership(
+            service_name, instance_id, request.group_id, request.leader_ttl_seconds
+        )
+        election.update_leader_heartbeat()
+    await repository.get_current_leader(service_name, request.group_id)
+    instance = await registry.get_instance(request.service_name, request.instance_id)
+    await registry.update_heartbeat(instance, request.ttl_seconds)
+    repository._election_states.clear()
+    await repository.save_election_state(election)
+
+
+async def setup_instance(
+    repository: NatsKvElectionRepository,
+    registry: KVServiceRegistry,
+    instance_id: str,
+    leader: bool,
+) -> tuple[StickyActiveHeartbeatRequest, ServiceInstance]:
+    """Register an instance and persist its election state."""
+    service_name = ServiceName(value="orders")
+    election = StickyActiveElection(
+        service_name=service_name, instance_id=InstanceId(value=instance_id)
+    )
+    election.start_election()
+    if leader:
+        await repository.attempt_leadership(
+            service_name, InstanceId(value=instance_id), "default", ttl_seconds=5
+        )
+        election.win_election()
+    else:
+        election.lose_election(InstanceId(value="leader-1"))
+    await repository.save_election_state(election)
+
+    instance = ServiceInstance(service_name="orders", instance_id=instance_id, version="1.0.0")
+    await registry.register(instance, ttl_seconds=30)
+    request = StickyActiveHeartbeatRequest(service_name="orders", instance_id=instance_id)
+    return request, instance
+
+
+async def measure(leader: bool, coalesced: bool) -> tuple[float, float]:
+    """Return (KV operations per tick, milliseconds per tick)."""
+    store = CountingKVStore(round_trip=ROUND_TRIP_SECONDS)
+    repository = NatsKvElectionRepository(store, metrics=InMemoryMetrics())
+    registry = KVServiceRegistry(store)
+    use_case = StickyActiveHeartbeatUseCase(repository, registry, InMemoryMetrics(), None)
+
+    instance_id = "leader-1" if leader else "standby-1"
+    request, instance = await setup_instance(repository, registry, instance_id, leader)
+
+    # Warm up so the coalesced path runs from its steady state
+    await use_case.execute(request, instance)
+    store.operations = 0
+
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        if coalesced:
+            assert await use_case.execute(request, instance)
+        else:
+            await uncoalesced_heartbeat(repository, registry, request)
+    elapsed = time.perf_counter() - start
+
+    return store.operations / TICKS, elapsed / TICKS * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestStickyHeartbeatPerformance:
+    """KV load and latency of the sticky-active heartbeat."""
+
+    @pytest.mark.asyncio
+    async def test_kv_operations_per_heartbeat(self):
+        """Coalesced heartbeat needs far fewer KV round-trips per tick."""
+        print(f"\nSticky-Active Heartbeat (RTT {ROUND_TRIP_SECONDS * 1000:.0f}ms):")
+        for role, leader in (("Leader", True), ("Standby", False)):
+            before_ops, before_ms = await measure(leader, coalesced=False)
+            after_ops, after_ms = await measure(leader, coalesced=True)
+            print(f"  {role}:")
+            print(f"    Uncoalesced: {before_ops:4.1f} ops/tick {before_ms:6.2f}ms/tick")
+            print(f"    Coalesced:   {after_ops:4.1f} ops/tick {after_ms:6.2f}ms/tick")
+
+            assert after_ops <= before_ops / 2
+            assert after_ms < before_ms
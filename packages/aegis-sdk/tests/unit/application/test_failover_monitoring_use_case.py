@@ -24,6 +24,13 @@ def mock_kv_store():
     kv_store.put.return_value = None
     kv_store.delete.return_value = None
     kv_store.create.return_value = True
+
+    async def watch(*args, **kwargs):
+        # A quiet watch: the leader key does not change while the test runs
+        await asyncio.Event().wait()
+        yield
+
+    kv_store.watch = watch
     return kv_store
 
 
@@ -59,13 +66,7 @@ def mock_metrics():
 @pytest.fixture
 def mock_logger():
     """Create a mock logger."""
-    logger = Mock()
-    logger.info = AsyncMock()
-    logger.warning = AsyncMock()
-    logger.error = AsyncMock()
-    logger.exception = AsyncMock()
-    logger.debug = AsyncMock()
-    return logger
+    return Mock()
 
 
 @pytest.fixture
@@ -594,6 +595,31 @@ class TestFailoverMonitoringUseCase:
         mock_metrics.gauge.assert_called_with("failover.active_instances", 1)
         mock_logger.info.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_on_elected_starts_leader_renewal(
+        self,
+        failover_monitoring_use_case,
+        mock_service_registry,
+    ):
+        """Test winning an election starts renewing the leader key."""
+        # Arrange
+        key = "test-service/instance-1/test-group"
+        mock_coordinator = Mock(spec=ElectionCoordinator)
+        mock_coordinator.is_elected.side_effect = [True, False]
+        mock_coordinator.renew_leadership = AsyncMock(return_value=True)
+        failover_monitoring_use_case._coordinators[key] = mock_coordinator
+        mock_service_registry.get_instance.return_value = None
+
+        # Act
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await failover_monitoring_use_case._on_elected(
+                "test-service", "instance-1", "test-group"
+            )
+            await failover_monitoring_use_case._monitoring_tasks[key]
+
+        # Assert
+        mock_coordinator.renew_leadership.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_on_lost_callback(
         self,
@@ -781,3 +807,96 @@ class TestFailoverMonitoringUseCase:
         mock_coordinator.release_leadership.assert_called_once()
         assert key not in failover_monitoring_use_case._monitors
         assert key not in failover_monitoring_use_case._coordinators
+
+    @pytest.mark.asyncio
+    async def test_shared_elections_run_groups_on_one_scheduler(
+        self,
+        in_memory_kv_store,
+        mock_service_registry,
+        mock_message_bus,
+        mock_metrics,
+        quiet_logger,
+    ):
+        """Test shared elections add every group of an instance to one scheduler."""
+        # Arrange
+        use_case = FailoverMonitoringUseCase(
+            kv_store=in_memory_kv_store,
+            service_registry=mock_service_registry,
+            message_bus=mock_message_bus,
+            metrics=mock_metrics,
+            logger=quiet_logger,
+            failover_policy=FailoverPolicy.aggressive(),
+            shared_elections=True,
+        )
+
+        # Act
+        for group_id in ("g1", "g2"):
+            await use_case.start_monitoring("orders", "node-1", group_id)
+        for _ in range(100):
+            statuses = [await use_case.get_status("orders", "node-1", g) for g in ("g1", "g2")]
+            if statuses == [StickyActiveStatus.ACTIVE] * 2:
+                break
+            await asyncio.sleep(0.01)
+
+        # Assert
+        assert statuses == [StickyActiveStatus.ACTIVE] * 2
+        assert list(use_case._schedulers) == ["orders/node-1"]
+        assert use_case._monitors == {} and use_case._coordinators == {}
+        mock_metrics.increment.assert_any_call("failover.election.won")
+
+        await use_case.stop_monitoring("orders", "node-1", "g1")
+        assert not await in_memory_kv_store.exists("sticky-active.orders.g1.leader")
+        assert list(use_case._schedulers) == ["orders/node-1"]
+
+        await use_case.stop_all_monitoring()
+        assert use_case._schedulers == {}
+        assert await in_memory_kv_store.keys("sticky-active.") == []
+
+    @pytest.mark.asyncio
+    async def test_monitor_follows_leader_key_events(
+        self,
+        in_memory_kv_store,
+        mock_service_registry,
+        mock_message_bus,
+        mock_metrics,
+        quiet_logger,
+    ):
+        """Test the heartbeat monitor tracks leader PUT and DELETE events from the watch."""
+        # Arrange
+        leader_key = "sticky-active.orders.g1.leader"
+        await in_memory_kv_store.put(leader_key, {"instance_id": "node-2", "ttl": 30})
+        use_case = FailoverMonitoringUseCase(
+            kv_store=in_memory_kv_store,
+            service_registry=mock_service_registry,
+            message_bus=mock_message_bus,
+            metrics=mock_metrics,
+            logger=quiet_logger,
+            failover_policy=FailoverPolicy.aggressive(),
+        )
+
+        async def wait_for_leader(expected):
+            for _ in range(100):
+                if monitor._current_leader == expected:
+                    return
+                await asyncio.sleep(0.01)
+
+        # Act & Assert - the initial entry is replayed as a PUT
+        await use_case.start_monitoring("orders", "node-1", "g1")
+        monitor = use_case._monitors["orders/node-1/g1"]
+        await wait_for_leader("node-2")
+        assert monitor._current_leader == "node-2"
+        assert await use_case.get_status("orders", "node-1", "g1") == StickyActiveStatus.STANDBY
+
+        # A leader change is followed
+        await in_memory_kv_store.put(leader_key, {"instance_id": "node-3", "ttl": 30})
+        await wait_for_leader("node-3")
+        assert monitor._current_leader == "node-3"
+
+        # A DELETE clears the leader and this instance takes over
+        await in_memory_kv_store.delete(leader_key)
+        await wait_for_leader("node-1")
+        assert monitor._current_leader == "node-1"
+        entry = await in_memory_kv_store.get(leader_key)
+        assert entry.value["instance_id"] == "node-1"
+
+        await use_case.stop_all_monitoring()
@@ -18,7 +18,7 @@ class TestMetricsSummary:
         assert summary.total == 0.0
         assert summary.min == float("inf")
         assert summary.max == float("-inf")
-        assert summary.values == []
+        assert summary.percentile(50) == 0.0
 
     def test_add_single_value(self):
         """Test adding a single value."""
@@ -29,7 +29,7 @@ class TestMetricsSummary:
         assert summary.total == 10.5
         assert summary.min == 10.5
         assert summary.max == 10.5
-        assert summary.values == [10.5]
+        assert summary.percentile(50) == 10.5
         assert summary.average == 10.5
 
     def test_add_multiple_values(self):
@@ -44,7 +44,7 @@ class TestMetricsSummary:
         assert summary.total == 75.0
         assert summary.min == 5.0
         assert summary.max == 25.0
-        assert summary.values == values
+        assert summary.percentile(50) == pytest.approx(15.0, rel=0.01)
         assert summary.average == 15.0
 
     def test_percentile_calculation(self):
@@ -54,10 +54,11 @@ class TestMetricsSummary:
         for i in range(1, 101):
             summary.add(float(i))
 
+        # Percentiles are estimated within the 1% default relative accuracy
         assert summary.percentile(0) == 1.0
-        assert summary.percentile(50) == 51.0  # 50th percentile of 1-100 is 51
-        assert summary.percentile(90) == 91.0  # 90th percentile of 1-100 is 91
-        assert summary.percentile(99) == 100.0  # 99th percentile of 1-100 is 100
+        assert summary.percentile(50) == pytest.approx(51.0, rel=0.01)
+        assert summary.percentile(90) == pytest.approx(91.0, rel=0.01)
+        assert summary.percentile(99) == pytest.approx(100.0, rel=0.01)
         assert summary.percentile(100) == 100.0
 
     def test_percentile_empty_values(self):
@@ -89,7 +90,7 @@ class TestMetricsSummary:
         assert pydantic_model.average == 3.0
         assert pydantic_model.min == 1.0
         assert pydantic_model.max == 5.0
-        assert pydantic_model.p50 == 3.0
+        assert pydantic_model.p50 == pytest.approx(3.0, rel=0.01)
         assert pydantic_model.p90 == 5.0
         assert pydantic_model.p99 == 5.0
 
@@ -168,7 +169,7 @@ class TestMetrics:
 
         summary = metrics._summaries["operation"]
         assert summary.count == 1
-        assert summary.values[0] == 100.0  # 100ms in milliseconds
+        assert summary.max == 100.0  # 100ms in milliseconds
 
     def test_get_snapshot(self):
         """Test getting metrics snapshot."""
@@ -285,7 +286,7 @@ class TestMetricsIntegration:
 
         summary = metrics._summaries["async_op"]
         assert summary.count == 1
-        assert summary.values[0] >= 10.0  # At least 10ms
+        assert summary.min >= 10.0  # At least 10ms
 
     def test_metrics_thread_safety_scenario(self):
         """Test basic thread safety scenario."""
@@ -10,6 +10,8 @@ from aegis_sdk.domain import CommandPriority, ServiceStatus
 from aegis_sdk.domain.exceptions import ServiceUnavailableError
 from aegis_sdk.domain.models import (
     Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
     RPCRequest,
     ServiceInfo,
     ServiceInstance,
@@ -186,6 +188,45 @@ class TestRPCMethods:
         assert "get_data" in service._handler_registry._rpc_handlers
         assert service._handler_registry._rpc_handlers["get_data"] is get_data
 
+    @pytest.mark.asyncio
+    async def test_rpc_decorator_with_execution_options(self, mock_message_bus):
+        """Test RPC decorator passes concurrency options to the message bus."""
+        service = Service("test-service", mock_message_bus, enable_registration=False)
+
+        @service.rpc("render", max_concurrency=8, offload="thread")
+        def render(params):
+            return {"ok": True}
+
+        @service.rpc("ping")
+        async def ping(params):
+            return {}
+
+        assert service._handler_registry.rpc_options == {
+            "render": RPCHandlerOptions(max_concurrency=8, offload="thread")
+        }
+
+        await service.start()
+        try:
+            mock_message_bus.register_rpc_handler.assert_any_call(
+                "test-service",
+                "render",
+                render,
+                RPCHandlerOptions(max_concurrency=8, offload="thread"),
+            )
+            mock_message_bus.register_rpc_handler.assert_any_call("test-service", "ping", ping)
+        finally:
+            await service.stop()
+
+    def test_rpc_decorator_rejects_offloaded_coroutine(self, mock_message_bus):
+        """Test offloading requires a regular function handler."""
+        service = Service("test-service", mock_message_bus)
+
+        with pytest.raises(ValueError, match="must be a regular function"):
+
+            @service.rpc("crunch", offload="process")
+            async def crunch(params):
+                return {}
+
     def test_rpc_decorator_invalid_method(self, mock_message_bus):
         """Test RPC decorator with invalid method name."""
         service = Service("test-service", mock_message_bus)
@@ -293,6 +334,39 @@ class TestRPCMethods:
         call_args = mock_message_bus.call_rpc.call_args[0][0]
         assert call_args.target == "user-service"
 
+    @pytest.mark.asyncio
+    async def test_call_rpc_route_to_selected_instance(self, mock_message_bus):
+        """Test RPC call routed to the instance chosen by discovery."""
+        mock_discovery = MagicMock()
+        mock_discovery.select_instance = AsyncMock(
+            return_value=ServiceInstance(
+                service_name="user-service",
+                instance_id="user-service-abc123",
+                version="1.0.0",
+                status="ACTIVE",
+            )
+        )
+        mock_discovery.invalidate_cache = AsyncMock()
+        service = Service("test-service", mock_message_bus, service_discovery=mock_discovery)
+
+        mock_response = MagicMock()
+        mock_response.success = True
+        mock_response.result = {"user": "john"}
+        mock_message_bus.call_rpc.return_value = mock_response
+
+        request = service.create_rpc_request("user-service", "get_user", {"id": 123})
+        result = await service.call_rpc(
+            request,
+            selection_strategy=SelectionStrategy.STICKY,
+            preferred_instance_id="user-service-abc123",
+            route_to_instance=True,
+        )
+
+        assert result == {"user": "john"}
+        mock_message_bus.call_rpc.assert_called_once_with(
+            request, instance_id="user-service-abc123"
+        )
+
     @pytest.mark.asyncio
     async def test_call_rpc_with_discovery_no_instances(self, mock_message_bus):
         """Test RPC call when no healthy instances available."""
@@ -446,6 +520,40 @@ class TestEventMethods:
         assert handler1 in handler_funcs
         assert handler2 in handler_funcs
 
+    @pytest.mark.asyncio
+    async def test_subscribe_decorator_with_delivery_options(self, mock_message_bus):
+        """Test subscription options are passed to the message bus."""
+        service = Service("test-service", mock_message_bus, enable_registration=False)
+        options = EventSubscriptionOptions(pull=True, batch_size=50, max_concurrency=4)
+
+        @service.subscribe("orders.>", options=options)
+        async def handle_orders(event):
+            pass
+
+        @service.subscribe("user.created")
+        async def handle_user(event):
+            pass
+
+        assert service._handler_registry.event_options == {"orders.>": options}
+
+        await service.start()
+        try:
+            mock_message_bus.subscribe_event.assert_any_call(
+                "orders.>",
+                handle_orders,
+                "test-service-orders->",
+                mode="compete",
+                options=options,
+            )
+            mock_message_bus.subscribe_event.assert_any_call(
+                "user.created", handle_user, "test-service-user-created", mode="compete"
+            )
+        finally:
+            await service.stop()
+
+        assert service.unsubscribe("orders.>")
+        assert service._handler_registry.event_options == {}
+
     @pytest.mark.asyncio
     async def test_publish_event(self, mock_message_bus):
         """Test publishing an event."""
@@ -466,6 +574,28 @@ class TestEventMethods:
         assert event_arg.payload == {"order_id": "123"}
         assert event_arg.source == service.instance_id
 
+    @pytest.mark.asyncio
+    async def test_publish_events_batch(self, mock_message_bus):
+        """Test batched publishing stamps the source and returns bus errors."""
+        service = Service("test-service", mock_message_bus)
+        mock_message_bus.publish_events_batch = AsyncMock(return_value={})
+        events = [Event(domain="order", event_type="created", payload={"n": n}) for n in range(3)]
+
+        with patch.object(service, "is_operational", return_value=True):
+            errors = await service.publish_events_batch(events)
+
+        assert errors == {}
+        mock_message_bus.publish_events_batch.assert_awaited_once_with(events)
+        assert all(event.source == service.instance_id for event in events)
+
+    @pytest.mark.asyncio
+    async def test_publish_events_batch_requires_operational(self, mock_message_bus):
+        """Test batched publishing is refused while the service is stopped."""
+        service = Service("test-service", mock_message_bus)
+
+        with pytest.raises(RuntimeError):
+            await service.publish_events_batch([service.create_event("order", "created", {})])
+
 
 class TestCommandMethods:
     """Test cases for command functionality."""
@@ -514,6 +644,20 @@ class TestCommandMethods:
         assert command_arg.target == "worker-service"
         assert command_arg.source == service.instance_id
 
+    @pytest.mark.asyncio
+    async def test_start_command(self, mock_message_bus):
+        """Test starting a command returns the bus's command handle."""
+        service = Service("test-service", mock_message_bus)
+        handle = MagicMock()
+        mock_message_bus.start_command = AsyncMock(return_value=handle)
+
+        command = service.create_command("worker-service", "process_data")
+        result = await service.start_command(command)
+
+        assert result is handle
+        command_arg = mock_message_bus.start_command.call_args[0][0]
+        assert command_arg.source == service.instance_id
+
 
 class TestServiceInfo:
     """Test cases for service info and status."""
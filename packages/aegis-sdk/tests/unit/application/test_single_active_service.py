@@ -1,5 +1,6 @@
 """Unit tests for SingleActiveService using sticky active pattern."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -13,6 +14,7 @@ from aegis_sdk.application.single_active_service import SingleActiveService, exc
 from aegis_sdk.application.sticky_active_use_cases import (
     StickyActiveRegistrationResponse,
 )
+from aegis_sdk.domain.models import RPCResponse
 
 
 class TestSingleActiveService:
@@ -215,6 +217,145 @@ class TestSingleActiveService:
         assert result["result"] == {"result": "success"}
         handler.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_exclusive_rpc_forwards_to_leader(self):
+        """Test a standby forwards exclusive calls to the known leader."""
+        mock_bus = Mock()
+        leader_result = {"success": True, "result": {"from": "leader-1"}, "error": None}
+        mock_bus.call_rpc = AsyncMock(
+            return_value=RPCResponse(correlation_id="c-1", result=leader_result)
+        )
+        config = SingleActiveConfig(service_name="test-service")
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        handler = AsyncMock(return_value={"result": "success"})
+        decorated = service.exclusive_rpc("test_method")(handler)
+
+        service._update_leader("leader-1")
+        result = await decorated({"param": "value"})
+
+        assert result == leader_result
+        handler.assert_not_called()
+        request = mock_bus.call_rpc.call_args[0][0]
+        assert mock_bus.call_rpc.call_args[1]["instance_id"] == "leader-1"
+        assert request.method == "test_method"
+        assert request.target == "test-service"
+        assert request.params == {"param": "value", "_forward_hops": 1}
+
+    @pytest.mark.asyncio
+    async def test_demoted_leader_forwards_to_new_leader(self):
+        """Test a leader that loses its role forwards calls to the leader elected next."""
+        mock_bus = Mock()
+        leader_result = {"success": True, "result": {"from": "leader-2"}, "error": None}
+        mock_bus.call_rpc = AsyncMock(
+            return_value=RPCResponse(correlation_id="c-1", result=leader_result)
+        )
+        config = SingleActiveConfig(service_name="test-service", enable_registration=True)
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        handler = AsyncMock(return_value={"result": "success"})
+        decorated = service.exclusive_rpc("test_method")(handler)
+
+        # Demoted by the monitor after it reported the new leader
+        service._update_active_status(True)
+        service._update_leader("leader-2")
+        service._update_active_status(False)
+        assert await decorated({"param": "value"}) == leader_result
+
+        # Demoted by a failed heartbeat before any new leader is known
+        service._update_active_status(True)
+        service._heartbeat_use_case = Mock(execute=AsyncMock(return_value=False))
+        await service._update_registry_heartbeat()
+        assert not service.is_active
+        assert service._leader_id is None
+
+        service._update_leader("leader-2")
+        result = await decorated({"param": "value"})
+
+        assert result == leader_result
+        handler.assert_not_called()
+        assert mock_bus.call_rpc.call_args[1]["instance_id"] == "leader-2"
+
+    @pytest.mark.asyncio
+    async def test_exclusive_rpc_forward_hop_limit(self):
+        """Test an already forwarded call is not forwarded again."""
+        mock_bus = Mock()
+        mock_bus.call_rpc = AsyncMock()
+        config = SingleActiveConfig(service_name="test-service")
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        decorated = service.exclusive_rpc("test_method")(AsyncMock())
+
+        service._update_leader("leader-1")
+        result = await decorated({"param": "value", "_forward_hops": 1})
+
+        assert result["error"] == "NOT_ACTIVE"
+        mock_bus.call_rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exclusive_rpc_forward_failure_falls_back(self):
+        """Test a failed forward answers NOT_ACTIVE so clients can retry."""
+        mock_bus = Mock()
+        mock_bus.call_rpc = AsyncMock(side_effect=TimeoutError("no responders"))
+        mock_metrics = Mock()
+        config = SingleActiveConfig(service_name="test-service")
+        service = SingleActiveService(config=config, message_bus=mock_bus, metrics=mock_metrics)
+        decorated = service.exclusive_rpc("test_method")(AsyncMock())
+
+        service._update_leader("leader-1")
+        result = await decorated({})
+
+        assert result["error"] == "NOT_ACTIVE"
+        mock_metrics.increment.assert_any_call("sticky_active.rpc.forward_failed")
+
+    @pytest.mark.asyncio
+    async def test_exclusive_rpc_active_handler_ignores_hop_count(self):
+        """Test the leader handles forwarded calls without the hop parameter."""
+        mock_bus = Mock()
+        config = SingleActiveConfig(service_name="test-service")
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        handler = AsyncMock(return_value={"ok": True})
+        decorated = service.exclusive_rpc("test_method")(handler)
+
+        service.is_active = True
+        result = await decorated({"param": "value", "_forward_hops": 1})
+
+        assert result["success"] is True
+        handler.assert_called_once_with({"param": "value"})
+
+    @pytest.mark.asyncio
+    async def test_active_only_queue_membership_follows_leadership(self):
+        """Test exclusive methods join the queue group only while active."""
+        mock_bus = Mock()
+        mock_bus.join_rpc_queue_group = AsyncMock()
+        mock_bus.leave_rpc_queue_group = AsyncMock()
+        config = SingleActiveConfig(service_name="test-service", active_only_queue=True)
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        service.rpc("exclusive")(service.exclusive_rpc("exclusive")(AsyncMock()))
+        service.rpc("shared")(AsyncMock())
+
+        service._update_active_status(True)
+        await asyncio.gather(*service._membership_tasks)
+        mock_bus.join_rpc_queue_group.assert_awaited_once_with("test-service", "exclusive")
+
+        service._update_active_status(False)
+        await asyncio.gather(*service._membership_tasks)
+        mock_bus.leave_rpc_queue_group.assert_awaited_once_with("test-service", "exclusive")
+
+    @pytest.mark.asyncio
+    async def test_active_only_queue_registers_exclusive_outside_group(self):
+        """Test exclusive methods are registered without joining the queue group."""
+        mock_bus = Mock()
+        mock_bus.register_service = AsyncMock()
+        mock_bus.register_rpc_handler = AsyncMock()
+        config = SingleActiveConfig(service_name="test-service", active_only_queue=True)
+        service = SingleActiveService(config=config, message_bus=mock_bus)
+        service.rpc("exclusive")(service.exclusive_rpc("exclusive")(AsyncMock()))
+        service.rpc("shared")(AsyncMock())
+
+        await service._register_with_infrastructure()
+
+        calls = {call[0][1]: call[0] for call in mock_bus.register_rpc_handler.call_args_list}
+        assert calls["exclusive"][3].join_queue_group is False
+        assert len(calls["shared"]) == 3
+
     @pytest.mark.asyncio
     async def test_exclusive_rpc_module_decorator_rejected_when_not_active(self):
         """Test that exclusive RPC module decorator rejects when not active."""
@@ -257,7 +257,7 @@ class TestStickyActiveHeartbeatUseCase:
             status="ACTIVE",
             sticky_active_status="ACTIVE",
         )
-        mock_service_registry.get_instances.return_value = [service_instance]
+        mock_service_registry.get_instance.return_value = service_instance
 
         use_case = StickyActiveHeartbeatUseCase(
             mock_election_repository,
@@ -277,7 +277,10 @@ class TestStickyActiveHeartbeatUseCase:
         # Assert
         assert result is True
         mock_election_repository.update_leadership.assert_called_once()
-        mock_service_registry.update_heartbeat.assert_called_once()
+        # The refresh outcome decides the status; the leader key is not read back
+        mock_election_repository.get_current_leader.assert_not_called()
+        mock_service_registry.register.assert_called_once()
+        mock_service_registry.update_heartbeat.assert_not_called()
         mock_metrics.increment.assert_any_call("sticky_active.leader.heartbeat")
         mock_metrics.increment.assert_any_call("sticky_active.heartbeat.success")
 
@@ -310,7 +313,7 @@ class TestStickyActiveHeartbeatUseCase:
             status="ACTIVE",
             sticky_active_status="STANDBY",
         )
-        mock_service_registry.get_instances.return_value = [service_instance]
+        mock_service_registry.get_instance.return_value = service_instance
 
         use_case = StickyActiveHeartbeatUseCase(
             mock_election_repository,
@@ -330,7 +333,7 @@ class TestStickyActiveHeartbeatUseCase:
         # Assert
         assert result is True
         mock_election_repository.update_leadership.assert_not_called()
-        mock_service_registry.update_heartbeat.assert_called_once()
+        mock_service_registry.register.assert_called_once()
         assert service_instance.sticky_active_status == "STANDBY"
 
     @pytest.mark.asyncio
@@ -360,7 +363,7 @@ class TestStickyActiveHeartbeatUseCase:
             version="1.0.0",
             status="ACTIVE",
         )
-        mock_service_registry.get_instances.return_value = [service_instance]
+        mock_service_registry.get_instance.return_value = service_instance
 
         use_case = StickyActiveHeartbeatUseCase(
             mock_election_repository,
@@ -453,6 +456,106 @@ class TestStickyActiveHeartbeatUseCase:
         mock_logger.error.assert_called_once()
         mock_service_registry.update_heartbeat.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_heartbeat_with_local_instance(
+        self,
+        mock_election_repository,
+        mock_service_registry,
+        mock_metrics,
+        mock_logger,
+    ):
+        """Test a caller-provided instance is written without a registry read."""
+        # Arrange
+        election = StickyActiveElection(
+            service_name=ServiceName(value="test-service"),
+            instance_id=InstanceId(value="instance-1"),
+            group_id="default",
+        )
+        election.start_election()
+        election.win_election()
+        mock_election_repository.get_election_state.return_value = election
+
+        service_instance = ServiceInstance(
+            service_name="test-service",
+            instance_id="instance-1",
+            version="1.0.0",
+            status="ACTIVE",
+        )
+        previous_heartbeat = service_instance.last_heartbeat
+
+        use_case = StickyActiveHeartbeatUseCase(
+            mock_election_repository,
+            mock_service_registry,
+            mock_metrics,
+            mock_logger,
+        )
+
+        request = StickyActiveHeartbeatRequest(
+            service_name="test-service",
+            instance_id="instance-1",
+            ttl_seconds=15,
+        )
+
+        # Act
+        await asyncio.sleep(0.001)
+        result = await use_case.execute(request, service_instance)
+
+        # Assert
+        assert result is True
+        mock_service_registry.get_instance.assert_not_called()
+        mock_service_registry.register.assert_awaited_once_with(service_instance, 15)
+        mock_election_repository.save_election_state.assert_awaited_once_with(election)
+        assert service_instance.sticky_active_status == "ACTIVE"
+        assert service_instance.last_heartbeat > previous_heartbeat
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_lost_leadership_reports_standby(
+        self,
+        mock_election_repository,
+        mock_service_registry,
+        mock_metrics,
+        mock_logger,
+    ):
+        """Test a rejected leader refresh publishes STANDBY status."""
+        # Arrange
+        election = StickyActiveElection(
+            service_name=ServiceName(value="test-service"),
+            instance_id=InstanceId(value="instance-1"),
+            group_id="default",
+        )
+        election.start_election()
+        election.win_election()
+        mock_election_repository.get_election_state.return_value = election
+        mock_election_repository.update_leadership.return_value = False
+
+        service_instance = ServiceInstance(
+            service_name="test-service",
+            instance_id="instance-1",
+            version="1.0.0",
+            status="ACTIVE",
+            sticky_active_status="ACTIVE",
+        )
+
+        use_case = StickyActiveHeartbeatUseCase(
+            mock_election_repository,
+            mock_service_registry,
+            mock_metrics,
+            mock_logger,
+        )
+
+        request = StickyActiveHeartbeatRequest(
+            service_name="test-service",
+            instance_id="instance-1",
+        )
+
+        # Act
+        result = await use_case.execute(request, service_instance)
+
+        # Assert
+        assert result is True
+        assert service_instance.sticky_active_status == "STANDBY"
+        mock_election_repository.save_election_state.assert_awaited_once_with(election)
+
 
 class TestStickyActiveMonitoringUseCase:
     """Test StickyActiveMonitoringUseCase."""
@@ -443,6 +443,40 @@ class TestStickyActiveMonitoringUseCaseExtended:
         assert status_changes == [True]
         assert election.is_leader
 
+    @pytest.mark.asyncio
+    async def test_monitoring_reports_leader_changes(
+        self,
+        mock_election_repository,
+        mock_service_registry,
+        mock_message_bus,
+        mock_metrics,
+        mock_logger,
+    ):
+        """Test the leader callback follows the leadership watch."""
+        leaders = []
+
+        async def watch():
+            yield {"type": "elected", "leader_id": "instance-2", "metadata": {}}
+            yield {"type": "lost", "leader_id": None, "metadata": {}}
+
+        mock_election_repository.watch_leadership = MagicMock(return_value=watch())
+        mock_election_repository.get_election_state.return_value = None
+
+        use_case = StickyActiveMonitoringUseCase(
+            mock_election_repository,
+            mock_service_registry,
+            mock_message_bus,
+            mock_metrics,
+            mock_logger,
+        )
+        use_case.set_leader_callback(leaders.append)
+
+        await use_case._monitor_leadership(
+            ServiceName(value="test-service"), InstanceId(value="instance-1"), "default"
+        )
+
+        assert leaders == ["instance-2", None]
+
     @pytest.mark.asyncio
     async def test_monitoring_restart_existing_task(
         self,
@@ -0,0 +1,90 @@
+"""Tests for metrics domain models."""
+
+import pytest
+
+from aegis_sdk.domain.metrics_models import StreamingHistogram
+
+
+class TestStreamingHistogram:
+    """Test cases for StreamingHistogram."""
+
+    def test_empty_histogram(self):
+        """Test quantiles of an empty histogram."""
+        histogram = StreamingHistogram()
+        assert histogram.count == 0
+        assert histogram.quantile(0.5) == 0.0
+        assert histogram.bucket_count == 0
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            StreamingHistogram(relative_accuracy=0)
+        with pytest.raises(ValueError):
+            StreamingHistogram(relative_accuracy=1)
+        with pytest.raises(ValueError):
+            StreamingHistogram(max_buckets=1)
+
+    @pytest.mark.parametrize("accuracy", [0.05, 0.01, 0.001])
+    def test_quantiles_within_relative_accuracy(self, accuracy):
+        """Test estimates stay within the configured error bound."""
+        histogram = StreamingHistogram(relative_accuracy=accuracy)
+        values = [float(i) for i in range(1, 1001)]
+        for value in values:
+            histogram.add(value)
+
+        for q in (0.0, 0.25, 0.5, 0.9, 0.99, 1.0):
+            expected = values[min(int(q * len(values)), len(values) - 1)]
+            assert histogram.quantile(q) == pytest.approx(expected, rel=accuracy * 1.001)
+
+    def test_quantiles_single_pass_matches_individual(self):
+        """Test batch quantiles return the same values in request order."""
+        histogram = StreamingHistogram()
+        for i in range(1, 101):
+            histogram.add(float(i))
+
+        batch = histogram.quantiles([0.99, 0.5, 0.9])
+        assert batch == [histogram.quantile(0.99), histogram.quantile(0.5), histogram.quantile(0.9)]
+
+    def test_zero_and_negative_values(self):
+        """Test values at or below zero are ordered correctly."""
+        histogram = StreamingHistogram()
+        for value in (-10.0, -1.0, 0.0, 0.0, 1.0, 10.0):
+            histogram.add(value)
+
+        assert histogram.quantile(0.0) == pytest.approx(-10.0, rel=0.01)
+        assert histogram.quantile(0.4) == 0.0
+        assert histogram.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+
+    def test_bucket_count_is_bounded(self):
+        """Test memory stays bounded by collapsing the lowest buckets."""
+        histogram = StreamingHistogram(relative_accuracy=0.01, max_buckets=64)
+        for exponent in range(-6, 7):
+            for step in range(1, 100):
+                histogram.add(step * 10.0**exponent)
+
+        assert histogram.bucket_count <= 64
+        assert histogram.count == 13 * 99
+        # Tail percentiles remain accurate after collapsing
+        assert histogram.quantile(1.0) == pytest.approx(99 * 10.0**6, rel=0.01)
+
+    def test_merge_matches_single_histogram(self):
+        """Test merging histograms gives the same estimates as recording into one."""
+        combined = StreamingHistogram()
+        parts = [StreamingHistogram() for _ in range(3)]
+        for i in range(1, 3001):
+            combined.add(float(i))
+            parts[i % 3].add(float(i))
+
+        merged = StreamingHistogram()
+        for part in parts:
+            merged.merge(part)
+
+        assert merged.count == combined.count
+        assert merged.quantiles([0.5, 0.99]) == combined.quantiles([0.5, 0.99])
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test histograms with different bucket widths cannot be merged."""
+        with pytest.raises(ValueError):
+            StreamingHistogram(relative_accuracy=0.01).merge(
+                StreamingHistogram(relative_accuracy=0.02)
+            )
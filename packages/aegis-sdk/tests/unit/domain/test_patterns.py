@@ -31,6 +31,16 @@ class TestSubjectPatterns:
         assert SubjectPatterns.service_instance("api", "inst-1") == "service.api.inst-1"
         assert SubjectPatterns.service_instance("worker", "abc123") == "service.worker.abc123"
 
+    def test_rpc_instance_pattern(self):
+        """Test per-instance RPC subject generation."""
+        assert (
+            SubjectPatterns.rpc_instance("api", "inst-1", "get_user")
+            == "service.api.inst-1.get_user"
+        )
+        assert SubjectPatterns.rpc_instance("api", "inst-1", "ping") != SubjectPatterns.rpc(
+            "api", "ping"
+        )
+
     def test_heartbeat_pattern(self):
         """Test heartbeat subject pattern."""
         assert SubjectPatterns.heartbeat("api") == "internal.heartbeat.api"
@@ -53,6 +63,15 @@ class TestSubjectPatterns:
         assert SubjectPatterns.command_callback(cmd_id) == f"commands.callback.{cmd_id}"
         assert SubjectPatterns.command_cancel(cmd_id) == f"commands.cancel.{cmd_id}"
 
+    def test_scoped_command_patterns(self):
+        """Test command lifecycle patterns scoped to a sender inbox."""
+        cmd_id = "123e4567-e89b-12d3-a456-426614174000"
+
+        assert SubjectPatterns.command_progress(cmd_id, "abc") == f"commands.progress.abc.{cmd_id}"
+        assert SubjectPatterns.command_callback(cmd_id, "abc") == f"commands.callback.abc.{cmd_id}"
+        assert SubjectPatterns.command_progress_inbox("abc") == "commands.progress.abc.*"
+        assert SubjectPatterns.command_callback_inbox("abc") == "commands.callback.abc.*"
+
     def test_is_valid_service_name(self):
         """Test service name validation."""
         # Valid service names
@@ -91,6 +110,20 @@ class TestSubjectPatterns:
         assert SubjectPatterns.is_valid_method_name("method name") is False  # contains space
         assert SubjectPatterns.is_valid_method_name("method@name") is False  # contains special char
 
+    def test_built_subjects_are_interned(self):
+        """Test that repeated builds return the same string object."""
+        method = "".join(["cre", "ate"])
+        assert SubjectPatterns.rpc("orders", method) is SubjectPatterns.rpc("orders", "create")
+        assert SubjectPatterns.event("order", "created") is SubjectPatterns.event(
+            "order", "created"
+        )
+        assert SubjectPatterns.command("worker", "task") is SubjectPatterns.command(
+            "worker", "task"
+        )
+        assert SubjectPatterns.rpc_instance("orders", "orders-1", "get") is (
+            SubjectPatterns.rpc_instance("orders", "orders-1", "get")
+        )
+
     def test_pattern_consistency(self):
         """Test that patterns are consistent and predictable."""
         # Test that patterns follow a consistent structure
@@ -0,0 +1,54 @@
+"""Tests for domain types."""
+
+import asyncio
+
+import pytest
+
+from aegis_sdk.domain.exceptions import CommandCancelledError, CommandError
+from aegis_sdk.domain.types import CancellationToken
+
+
+class TestCancellationToken:
+    """Test cases for CancellationToken."""
+
+    def test_initial_state(self):
+        """Test a new token is not cancelled."""
+        token = CancellationToken("cmd-1")
+
+        assert token.is_cancelled is False
+        assert token.reason is None
+        token.raise_if_cancelled()
+
+    def test_cancel_keeps_first_reason(self):
+        """Test cancelling records the first reason only."""
+        token = CancellationToken("cmd-1")
+
+        token.cancel("user abort")
+        token.cancel("second request")
+
+        assert token.is_cancelled is True
+        assert token.reason == "user abort"
+
+    def test_raise_if_cancelled(self):
+        """Test a cancelled token raises CommandCancelledError."""
+        token = CancellationToken("cmd-1")
+        token.cancel("shutdown")
+
+        with pytest.raises(CommandCancelledError) as exc_info:
+            token.raise_if_cancelled()
+
+        assert isinstance(exc_info.value, CommandError)
+        assert exc_info.value.command_id == "cmd-1"
+        assert exc_info.value.reason == "shutdown"
+        assert str(exc_info.value) == "shutdown"
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_on_cancel(self):
+        """Test wait() completes once the token is cancelled."""
+        token = CancellationToken()
+        waiter = asyncio.create_task(token.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        token.cancel()
+        await asyncio.wait_for(waiter, timeout=1.0)
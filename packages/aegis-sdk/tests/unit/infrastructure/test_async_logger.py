@@ -0,0 +1,131 @@
+"""Unit tests for AsyncLogger."""
+
+import io
+import logging
+import threading
+import time
+
+import pytest
+
+from aegis_sdk.infrastructure.async_logger import (
+    AsyncLogger,
+    get_default_logger,
+    set_default_logger,
+)
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
+from aegis_sdk.ports.logger import LoggerPort
+
+
+class BlockingStream(io.StringIO):
+    """Stream whose writes wait until the test releases them."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+@pytest.fixture
+def stream():
+    return io.StringIO()
+
+
+class TestAsyncLogger:
+    """Test cases for AsyncLogger."""
+
+    def test_writes_records_from_background_thread(self, stream):
+        """Test records are formatted with their fields and written."""
+        logger = AsyncLogger("orders", stream=stream)
+
+        logger.info("Order placed", order_id="o-1", qty=3)
+        logger.debug("Hidden")
+        assert logger.flush()
+
+        output = stream.getvalue()
+        assert " - orders - INFO - Order placed order_id=o-1 qty=3\n" in output
+        assert "Hidden" not in output
+        assert isinstance(logger, LoggerPort)
+        logger.close()
+
+    def test_exception_includes_traceback(self, stream):
+        """Test exceptions are written with their traceback."""
+        logger = AsyncLogger(stream=stream)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Handler failed")
+        logger.flush()
+
+        output = stream.getvalue()
+        assert "ERROR - Handler failed" in output
+        assert "ValueError: boom" in output
+        logger.close()
+
+    def test_full_queue_drops_without_blocking(self):
+        """Test logging never waits for a stalled writer."""
+        stream = BlockingStream()
+        metrics = InMemoryMetrics()
+        logger = AsyncLogger(stream=stream, queue_size=10, rate_limit=0, metrics=metrics)
+
+        start = time.perf_counter()
+        for index in range(100):
+            logger.error("Event handler error", index=index)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert logger.dropped >= 80
+        assert metrics.get_all()["counters"]["logging.dropped"] == logger.dropped
+        stream.release.set()
+        logger.close()
+
+    def test_rate_limit_per_key(self, stream):
+        """Test repeated messages are sampled and the skip count reported."""
+        metrics = InMemoryMetrics()
+        logger = AsyncLogger(stream=stream, rate_limit=3, rate_window=0.05, metrics=metrics)
+
+        for _ in range(10):
+            logger.error("Event handler error")
+        logger.error("Connection lost")
+        for index in range(5):
+            logger.error(f"Error {index}", sample_key="numbered")
+        time.sleep(0.06)
+        logger.error("Event handler error")
+        logger.flush()
+
+        lines = stream.getvalue().splitlines()
+        assert sum("Event handler error" in line for line in lines) == 4
+        assert lines[-1].endswith("Event handler error suppressed=7")
+        assert sum("Connection lost" in line for line in lines) == 1
+        assert sum("Error " in line for line in lines) == 3
+        assert logger.suppressed == 9
+        assert metrics.get_all()["counters"]["logging.suppressed"] == 9
+        logger.close()
+
+    def test_close_drains_queue(self, stream):
+        """Test closing writes what is queued and ignores later records."""
+        logger = AsyncLogger(stream=stream, level=logging.WARNING)
+
+        logger.warning("Shutting down")
+        logger.close()
+        logger.warning("After close")
+
+        assert "Shutting down" in stream.getvalue()
+        assert "After close" not in stream.getvalue()
+        assert not logger._thread.is_alive()
+
+    def test_default_logger_can_be_replaced(self):
+        """Test infrastructure components pick up a replaced default logger."""
+        from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
+
+        assert isinstance(get_default_logger(), AsyncLogger)
+        custom = AsyncLogger("custom", stream=io.StringIO())
+        set_default_logger(custom)
+        try:
+            assert NATSAdapter()._logger is custom
+        finally:
+            set_default_logger(None)
+            custom.close()
@@ -82,6 +82,16 @@ class TestNATSConnectionConfig:
         with pytest.raises(ValidationError):
             NATSConnectionConfig(pool_size=11)
 
+    def test_subscription_strategy_validation(self):
+        """Test subscription strategy accepts only known strategies."""
+        assert NATSConnectionConfig().subscription_strategy == "replicate"
+        for strategy in ("single", "replicate", "hash"):
+            config = NATSConnectionConfig(subscription_strategy=strategy)
+            assert config.subscription_strategy == strategy
+
+        with pytest.raises(ValidationError):
+            NATSConnectionConfig(subscription_strategy="random")
+
     def test_service_name_parsing(self):
         """Test service name parsing from string."""
         # From string
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from aegis_sdk.domain.enums import StickyActiveStatus
+from aegis_sdk.domain.exceptions import KVKeyAlreadyExistsError, KVRevisionMismatchError
 from aegis_sdk.domain.models import KVEntry
 from aegis_sdk.domain.value_objects import (
     ElectionState,
@@ -45,12 +46,7 @@ def mock_service_registry():
 @pytest.fixture
 def mock_logger():
     """Create a mock logger."""
-    logger = Mock(spec=LoggerPort)
-    logger.info = AsyncMock()
-    logger.warning = AsyncMock()
-    logger.error = AsyncMock()
-    logger.debug = AsyncMock()
-    return logger
+    return Mock(spec=LoggerPort)
 
 
 @pytest.fixture
@@ -178,7 +174,10 @@ async def test_start_election_lost_race(election_coordinator, mock_kv_store):
 @pytest.mark.asyncio
 async def test_start_election_existing_leader(election_coordinator, mock_kv_store):
     """Test election when another instance is already leader."""
-    # Another instance is leader
+    # Another instance is leader, so the atomic create is rejected
+    mock_kv_store.put.side_effect = KVKeyAlreadyExistsError(
+        "sticky-active.test-service.test-group.leader"
+    )
     mock_kv_store.get.return_value = KVEntry(
         key="sticky-active.test-service.test-group.leader",
         value={"instance_id": "instance-2"},
@@ -194,6 +193,58 @@ async def test_start_election_existing_leader(election_coordinator, mock_kv_stor
     assert election_coordinator._election_state.is_failed()
 
 
+@pytest.mark.asyncio
+async def test_start_election_creates_without_reading(election_coordinator, mock_kv_store):
+    """Test an uncontested election is a single atomic create."""
+    mock_kv_store.put.return_value = 4
+
+    result = await election_coordinator.start_election()
+
+    assert result is True
+    mock_kv_store.get.assert_not_called()
+    assert mock_kv_store.put.call_args[0][2].create_only is True
+    assert election_coordinator._leader_revision == 4
+
+
+@pytest.mark.asyncio
+async def test_renew_leadership_conditional_write(election_coordinator, mock_kv_store):
+    """Test renewal is one write conditioned on the held revision."""
+    mock_kv_store.put.side_effect = [4, 5, 6]
+    await election_coordinator.start_election()
+
+    assert await election_coordinator.renew_leadership() is True
+    assert await election_coordinator.renew_leadership() is True
+
+    mock_kv_store.get.assert_not_called()
+    renewals = [call[0][2] for call in mock_kv_store.put.call_args_list[1:]]
+    assert [options.revision for options in renewals] == [4, 5]
+    assert all(options.update_only for options in renewals)
+    assert mock_kv_store.put.call_args[0][1]["last_heartbeat"] > 0
+
+
+@pytest.mark.asyncio
+async def test_renew_leadership_mismatch_steps_down(
+    election_coordinator, mock_kv_store, mock_service_registry
+):
+    """Test a rejected renewal steps down immediately."""
+    mock_kv_store.put.side_effect = [
+        4,
+        KVRevisionMismatchError("sticky-active.test-service.test-group.leader", 4, 9),
+    ]
+    on_lost = AsyncMock()
+    election_coordinator.set_on_lost_callback(on_lost)
+    mock_service_registry.get_instance.return_value = None
+    await election_coordinator.start_election()
+
+    assert await election_coordinator.renew_leadership() is False
+
+    assert not election_coordinator.is_elected()
+    on_lost.assert_called_once()
+    # Nothing left to renew
+    assert await election_coordinator.renew_leadership() is False
+    assert mock_kv_store.put.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_start_election_timeout(election_coordinator):
     """Test election timeout."""
@@ -238,8 +289,9 @@ async def test_release_leadership(election_coordinator, mock_kv_store, mock_serv
 
     await election_coordinator.release_leadership()
 
-    # Verify leader key was deleted
-    mock_kv_store.delete.assert_called_once_with("sticky-active.test-service.test-group.leader")
+    # Verify leader key was deleted at the revision we hold
+    mock_kv_store.delete.assert_called_once_with("sticky-active.test-service.test-group.leader", 1)
+    assert not election_coordinator.is_elected()
 
     # Verify instance status was updated
     mock_service_registry.update_instance.assert_called_once()
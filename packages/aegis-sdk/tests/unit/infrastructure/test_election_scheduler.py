@@ -0,0 +1,274 @@
+"""Unit tests for ElectionScheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aegis_sdk.domain.value_objects import FailoverPolicy, InstanceId, ServiceName
+from aegis_sdk.infrastructure.election_scheduler import ElectionScheduler
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVStore
+from aegis_sdk.infrastructure.nats_kv_store import NATSKVStore
+from aegis_sdk.ports.logger import LoggerPort
+
+LEASE_TTL = 0.3
+NODE_1_LEASE = "sticky-active.orders.node-1.lease"
+
+
+def make_scheduler(
+    kv_store: InMemoryKVStore, instance_id: str, logger: LoggerPort | None
+) -> ElectionScheduler:
+    return ElectionScheduler(
+        kv_store,
+        ServiceName(value="orders"),
+        InstanceId(value=instance_id),
+        FailoverPolicy.aggressive(),
+        logger,
+        lease_ttl_seconds=LEASE_TTL,
+    )
+
+
+async def wait_until(condition, timeout: float = 3.0) -> None:
+    """Poll until the condition holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+async def revision(kv_store: InMemoryKVStore) -> int:
+    """Get the bucket sequence, which every write and delete advances."""
+    return (await kv_store.status())["revision"]
+
+
+async def keys_written_since(kv_store: InMemoryKVStore, since: int) -> set[str]:
+    """Get the keys whose current value was written after a revision."""
+    entries = await kv_store.get_many(await kv_store.keys())
+    return {key for key, entry in entries.items() if entry.revision > since}
+
+
+@pytest.fixture
+def kv_store(in_memory_kv_store):
+    return in_memory_kv_store
+
+
+@pytest.fixture
+def scheduler_for(kv_store, quiet_logger):
+    """Build schedulers on the shared store with a real, quiet logger."""
+    return lambda instance_id: make_scheduler(kv_store, instance_id, quiet_logger)
+
+
+class TestElectionScheduler:
+    """Test cases for ElectionScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_acquires_all_groups_under_one_lease(self, kv_store, scheduler_for):
+        """Test a lone instance wins every group and creates one lease."""
+        scheduler = scheduler_for("node-1")
+        elected = []
+        for group in ("g1", "g2", "g3"):
+            scheduler.add_group(group, on_elected=elected.append)
+
+        await scheduler.start()
+        await wait_until(lambda: len(elected) == 3)
+
+        assert sorted(elected) == ["g1", "g2", "g3"]
+        assert scheduler.held_groups() == ["g1", "g2", "g3"]
+        assert scheduler.get_leader("g1") == "node-1"
+        leader = (await kv_store.get("sticky-active.orders.g1.leader")).value
+        assert leader["lease"] == NODE_1_LEASE
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_renewal_writes_only_the_lease(self, kv_store, scheduler_for):
+        """Test held groups are kept alive by renewing the lease alone."""
+        scheduler = scheduler_for("node-1")
+        for group in range(20):
+            scheduler.add_group(f"g{group}")
+        await scheduler.start()
+        await wait_until(lambda: len(scheduler.held_groups()) == 20)
+
+        before = await revision(kv_store)
+        await asyncio.sleep(LEASE_TTL * 2)
+
+        assert await keys_written_since(kv_store, before) == {NODE_1_LEASE}
+        assert 4 <= await revision(kv_store) - before <= 8
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_standby_issues_no_writes(self, kv_store, scheduler_for):
+        """Test a standby follows live leaders without touching the store."""
+        leader = scheduler_for("node-1")
+        standby = scheduler_for("node-2")
+        for group in ("g1", "g2"):
+            leader.add_group(group)
+        await leader.start()
+        await wait_until(lambda: len(leader.held_groups()) == 2)
+
+        for group in ("g1", "g2"):
+            standby.add_group(group)
+        await standby.start()
+        await wait_until(lambda: standby.get_leader("g2") == "node-1")
+        before = await revision(kv_store)
+        await asyncio.sleep(LEASE_TTL * 2)
+
+        # Every write since is a renewal of the leader's lease
+        renewals = [e for e in await kv_store.history(NODE_1_LEASE) if e.revision > before]
+        assert await keys_written_since(kv_store, before) == {NODE_1_LEASE}
+        assert len(renewals) == await revision(kv_store) - before
+        assert standby.held_groups() == []
+        await standby.stop()
+        await leader.stop()
+
+    @pytest.mark.asyncio
+    async def test_standby_takes_over_released_groups(self, kv_store, scheduler_for):
+        """Test groups are claimed by the standby after a clean stop."""
+        leader = scheduler_for("node-1")
+        standby = scheduler_for("node-2")
+        lost = []
+        for group in ("g1", "g2"):
+            leader.add_group(group, on_lost=lost.append)
+            standby.add_group(group)
+        await leader.start()
+        await wait_until(lambda: len(leader.held_groups()) == 2)
+        await standby.start()
+        await wait_until(lambda: standby.get_leader("g1") == "node-1")
+
+        await leader.stop()
+        await wait_until(lambda: len(standby.held_groups()) == 2)
+
+        assert sorted(lost) == ["g1", "g2"]
+        assert not await kv_store.exists(NODE_1_LEASE)
+        await standby.stop()
+
+    @pytest.mark.asyncio
+    async def test_standby_takes_over_when_lease_lapses(self, kv_store, scheduler_for):
+        """Test a crashed leader's groups are taken over with CAS writes."""
+        leader = scheduler_for("node-1")
+        standby = scheduler_for("node-2")
+        for group in ("g1", "g2"):
+            leader.add_group(group)
+            standby.add_group(group)
+        await leader.start()
+        await wait_until(lambda: len(leader.held_groups()) == 2)
+        await standby.start()
+        await wait_until(lambda: standby.get_leader("g1") == "node-1")
+
+        # Crash: stop renewing without releasing anything
+        for task in leader._tasks:
+            task.cancel()
+
+        await wait_until(lambda: len(standby.held_groups()) == 2)
+        leader = (await kv_store.get("sticky-active.orders.g1.leader")).value
+        assert leader["instance_id"] == "node-2"
+        await standby.stop()
+
+    @pytest.mark.asyncio
+    async def test_leader_steps_down_when_group_is_taken(self, kv_store, scheduler_for):
+        """Test a leader notices another writer on its leader key."""
+        scheduler = scheduler_for("node-1")
+        lost = []
+        scheduler.add_group("g1", on_lost=lost.append)
+        await scheduler.start()
+        await wait_until(lambda: scheduler.is_leader("g1"))
+
+        await kv_store.put("sticky-active.orders.g1.leader", {"instance_id": "node-9"})
+        await wait_until(lambda: lost == ["g1"])
+
+        assert not scheduler.is_leader("g1")
+        assert scheduler.get_leader("g1") == "node-9"
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_lease_mismatch_steps_down_everywhere(self, kv_store, scheduler_for):
+        """Test losing the lease gives up all groups at once."""
+        scheduler = scheduler_for("node-1")
+        lost = []
+        for group in ("g1", "g2"):
+            scheduler.add_group(group, on_lost=lost.append)
+        await scheduler.start()
+        await wait_until(lambda: len(scheduler.held_groups()) == 2)
+
+        scheduler._lease_revision = 999
+        await wait_until(lambda: len(lost) == 2)
+
+        assert sorted(lost) == ["g1", "g2"]
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_hung_renewal_steps_down_before_lease_lapses(self, kv_store, scheduler_for):
+        """Test a leader whose renewal hangs gives up its groups within the lease TTL."""
+        scheduler = scheduler_for("node-1")
+        lost = []
+        for group in ("g1", "g2"):
+            scheduler.add_group(group, on_lost=lost.append)
+        await scheduler.start()
+        await wait_until(lambda: len(scheduler.held_groups()) == 2)
+
+        # Partition: lease writes never complete
+        put = kv_store.put
+        abandoned = []
+
+        async def hanging_put(key, value, options=None):
+            if key != NODE_1_LEASE:
+                return await put(key, value, options)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                abandoned.append(key)
+                raise
+
+        kv_store.put = hanging_put
+        renewed_at = scheduler._lease_renewed_at
+        await wait_until(lambda: len(lost) == 2)
+        stepped_down_at = asyncio.get_running_loop().time()
+
+        assert stepped_down_at < renewed_at + LEASE_TTL
+        assert scheduler.held_groups() == []
+        # The renewal timed out instead of blocking the tick loop
+        await wait_until(lambda: abandoned == [NODE_1_LEASE])
+        kv_store.put = put
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_add_group_twice_rejected(self, kv_store, scheduler_for):
+        """Test a group can only be registered once."""
+        scheduler = scheduler_for("node-1")
+        scheduler.add_group("g1")
+
+        with pytest.raises(ValueError):
+            scheduler.add_group("g1")
+
+    @pytest.mark.asyncio
+    async def test_remove_group_releases_it(self, kv_store, scheduler_for):
+        """Test removing a held group deletes its leader key."""
+        scheduler = scheduler_for("node-1")
+        scheduler.add_group("g1")
+        await scheduler.start()
+        await wait_until(lambda: scheduler.is_leader("g1"))
+
+        await scheduler.remove_group("g1")
+
+        assert not await kv_store.exists("sticky-active.orders.g1.leader")
+        assert scheduler.held_groups() == []
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_runs_with_default_logger(self, kv_store):
+        """Test the scheduler works with its default synchronous logger."""
+        scheduler = make_scheduler(kv_store, "node-1", None)
+        scheduler.add_group("g1")
+
+        await scheduler.start()
+        await wait_until(lambda: scheduler.is_leader("g1"))
+        await scheduler.stop()
+
+        assert scheduler.held_groups() == []
+
+    def test_keys_are_valid_nats_kv_keys(self, scheduler_for):
+        """Test leader and lease keys pass NATSKVStore key validation."""
+        scheduler = scheduler_for("node-1")
+
+        for key in (scheduler._leader_key("g1"), scheduler._lease_key()):
+            NATSKVStore()._validate_key(key)
@@ -0,0 +1,85 @@
+"""Unit tests for the header envelope format."""
+
+import pytest
+
+from aegis_sdk.domain.exceptions import SerializationError
+from aegis_sdk.domain.models import Event
+from aegis_sdk.infrastructure.envelope import (
+    ENVELOPE_HEADER,
+    EventView,
+    encode_event,
+    is_envelope,
+)
+
+
+def make_event() -> Event:
+    return Event(
+        domain="orders",
+        event_type="filled",
+        payload={"order_id": "o-1", "qty": 100},
+        source="broker",
+        version="2.1",
+    )
+
+
+class TestEventEnvelope:
+    """Test cases for envelope encoding and EventView."""
+
+    @pytest.mark.parametrize("use_msgpack", [True, False])
+    def test_round_trip(self, use_msgpack):
+        """Test an event survives encoding into headers and body."""
+        event = make_event()
+
+        headers, body = encode_event(event, use_msgpack)
+        view = EventView(headers, body)
+
+        assert headers[ENVELOPE_HEADER] == ("msgpack" if use_msgpack else "json")
+        assert "Aegis-Correlation-Id" not in headers
+        assert view.to_event() == event
+
+    def test_metadata_does_not_decode_payload(self):
+        """Test metadata is read from headers while the body stays encoded."""
+        event = make_event()
+        headers, body = encode_event(event)
+        view = EventView(headers, body)
+
+        assert view.domain == "orders"
+        assert view.source == "broker"
+        assert view.message_id == event.message_id
+        assert view.correlation_id is None
+        assert not view.decoded
+
+        assert view.payload == {"order_id": "o-1", "qty": 100}
+        assert view.decoded
+        assert view.payload is view.payload
+
+    def test_raw_payload_is_zero_copy(self):
+        """Test the raw payload is a view of the received body."""
+        headers, body = encode_event(make_event())
+
+        raw = EventView(headers, body).raw_payload
+
+        assert isinstance(raw, memoryview)
+        assert raw.obj is body
+
+    def test_is_envelope(self):
+        """Test only messages with the envelope header are recognized."""
+        headers, _ = encode_event(make_event())
+
+        assert is_envelope(headers)
+        assert not is_envelope(None)
+        assert not is_envelope({"Nats-Msg-Id": "1"})
+
+    def test_missing_headers_rejected(self):
+        """Test envelopes without routing headers are rejected."""
+        with pytest.raises(SerializationError, match="Aegis-Domain"):
+            EventView({ENVELOPE_HEADER: "msgpack", "Aegis-Message-Id": "1"}, b"")
+
+    def test_corrupt_payload_fails_on_access(self):
+        """Test a bad body only fails once the payload is read."""
+        headers, _ = encode_event(make_event(), use_msgpack=False)
+        view = EventView(headers, b"{not json")
+
+        assert view.event_type == "filled"
+        with pytest.raises(SerializationError):
+            _ = view.payload
@@ -0,0 +1,147 @@
+"""Unit tests for JetStreamEventPublisher."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from aegis_sdk.domain.models import Event
+from aegis_sdk.infrastructure.event_publisher import JetStreamEventPublisher
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
+
+
+class FakeJetStream:
+    """Records async publishes and hands out PubAck futures the test settles."""
+
+    def __init__(self):
+        self.published: list[tuple[str, dict]] = []
+        self.acks: list[asyncio.Future] = []
+        self.sending = asyncio.Event()
+        self.sending.set()
+
+    async def publish_async(self, subject: str, payload: bytes, headers: dict) -> asyncio.Future:
+        await self.sending.wait()
+        self.published.append((subject, headers))
+        ack = asyncio.get_running_loop().create_future()
+        self.acks.append(ack)
+        return ack
+
+    def ack_all(self, duplicate: bool = False) -> None:
+        for ack in self.acks:
+            if not ack.done():
+                ack.set_result(SimpleNamespace(duplicate=duplicate))
+
+
+def make_publisher(js: FakeJetStream, **kwargs) -> JetStreamEventPublisher:
+    return JetStreamEventPublisher(
+        lambda subject: js, lambda event: ({}, b"event"), InMemoryMetrics(), **kwargs
+    )
+
+
+def make_event(index: int = 0) -> Event:
+    return Event(domain="orders", event_type="created", payload={"index": index})
+
+
+class TestJetStreamEventPublisher:
+    """Test cases for JetStreamEventPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_future_resolves_on_pub_ack(self):
+        """Test each event's future resolves when its PubAck arrives."""
+        js = FakeJetStream()
+        publisher = make_publisher(js, flush_size=2)
+        event = make_event()
+
+        future = await publisher.publish(event)
+        await publisher.publish(make_event(1))
+
+        assert js.published[0] == ("events.orders.created", {"Nats-Msg-Id": event.message_id})
+        assert not future.done()
+        js.ack_all()
+        await asyncio.wait_for(future, timeout=1)
+        await asyncio.sleep(0)
+        assert publisher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_size_and_time(self):
+        """Test the buffer is sent when full or after the flush interval."""
+        js = FakeJetStream()
+        publisher = make_publisher(js, flush_size=3, flush_interval=0.02)
+
+        for index in range(4):
+            await publisher.publish(make_event(index))
+        assert len(js.published) == 3
+
+        await asyncio.sleep(0.05)
+        assert len(js.published) == 4
+        js.ack_all()
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_outstanding_acks(self):
+        """Test publishing waits once the window of unacknowledged events is full."""
+        js = FakeJetStream()
+        publisher = make_publisher(js, max_pending=2, flush_size=10)
+        await publisher.publish(make_event(0))
+        await publisher.publish(make_event(1))
+
+        blocked = asyncio.create_task(publisher.publish(make_event(2)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert len(js.published) == 2
+
+        js.ack_all()
+        await asyncio.wait_for(blocked, timeout=1)
+        await publisher.flush()
+        js.ack_all()
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_ack_times_out(self):
+        """Test an event fails when no PubAck arrives in time."""
+        js = FakeJetStream()
+        publisher = make_publisher(js, flush_size=1, ack_timeout=0.01)
+
+        future = await publisher.publish(make_event())
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(future, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_publish_error_fails_only_that_event(self):
+        """Test a rejected publish settles its own future with the error."""
+        js = FakeJetStream()
+        publisher = make_publisher(js, flush_size=2)
+
+        first = await publisher.publish(make_event(0))
+        second = await publisher.publish(make_event(1))
+        js.acks[0].set_exception(ValueError("stream full"))
+        js.acks[1].set_result(SimpleNamespace(duplicate=True))
+
+        with pytest.raises(ValueError):
+            await first
+        await second
+        counters = publisher._metrics.get_all()["counters"]
+        assert counters["events.publish.errors"] == 1
+        assert counters["events.publish.duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_timed_flush(self):
+        """Test close lets a timed flush finish sending instead of dropping it."""
+        js = FakeJetStream()
+        js.sending.clear()
+        publisher = make_publisher(js, flush_size=10, flush_interval=0.001)
+        futures = [await publisher.publish(make_event(index)) for index in range(2)]
+        await asyncio.sleep(0.01)
+
+        closing = asyncio.create_task(publisher.close())
+        await asyncio.sleep(0.01)
+        js.sending.set()
+        await asyncio.sleep(0.01)
+        js.ack_all()
+
+        await asyncio.wait_for(closing, timeout=1)
+        assert len(js.published) == 2
+        assert all(future.done() and future.exception() is None for future in futures)
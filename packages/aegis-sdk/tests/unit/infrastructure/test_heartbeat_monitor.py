@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from aegis_sdk.domain.models import KVEntry, KVWatchEvent
 from aegis_sdk.domain.value_objects import (
     Duration,
     FailoverPolicy,
@@ -20,6 +22,32 @@ from aegis_sdk.ports.kv_store import KVStorePort as KVStore
 from aegis_sdk.ports.logger import LoggerPort
 
 
+def leader_put(instance_id: str, ttl: float = 5, revision: int = 1) -> KVWatchEvent:
+    """Create a PUT event for the leader key as written by a heartbeat."""
+    key = "sticky-active.test-service.test-group.leader"
+    entry = KVEntry(
+        key=key,
+        value={"instance_id": instance_id, "last_heartbeat": time.time(), "ttl": ttl},
+        revision=revision,
+        created_at="2025-01-01T00:00:00+00:00",
+        updated_at="2025-01-01T00:00:00+00:00",
+    )
+    return KVWatchEvent(operation="PUT", entry=entry, key=key)
+
+
+class FakeLeaderWatch:
+    """Watch stand-in that delivers queued leader key events."""
+
+    def __init__(self):
+        self.events: asyncio.Queue = asyncio.Queue()
+        self.keys: list[str] = []
+
+    async def __call__(self, key=None, prefix=None, on_synced=None):
+        self.keys.append(key)
+        while True:
+            yield await self.events.get()
+
+
 class MockElectionTrigger:
     """Mock implementation of ElectionTrigger protocol."""
 
@@ -34,18 +62,14 @@ def mock_kv_store():
     store.get = AsyncMock()
     store.put = AsyncMock()
     store.delete = AsyncMock()
+    store.watch = FakeLeaderWatch()
     return store
 
 
 @pytest.fixture
 def mock_logger():
     """Create a mock logger."""
-    logger = Mock(spec=LoggerPort)
-    logger.info = AsyncMock()
-    logger.warning = AsyncMock()
-    logger.error = AsyncMock()
-    logger.debug = AsyncMock()
-    return logger
+    return Mock(spec=LoggerPort)
 
 
 @pytest.fixture
@@ -346,9 +370,8 @@ async def test_get_status(heartbeat_monitor):
 
 @pytest.mark.asyncio
 async def test_monitor_loop_no_leader(heartbeat_monitor, mock_kv_store, mock_election_trigger):
-    """Test monitor loop when no leader exists."""
+    """Test the monitor watches the leader key instead of polling it."""
     heartbeat_monitor.set_election_trigger(mock_election_trigger)
-    mock_kv_store.get.return_value = None  # No leader
 
     # Start monitoring
     await heartbeat_monitor.start_monitoring()
@@ -359,43 +382,94 @@ async def test_monitor_loop_no_leader(heartbeat_monitor, mock_kv_store, mock_ele
     # Stop monitoring
     await heartbeat_monitor.stop_monitoring()
 
-    # Verify KV store was checked
-    mock_kv_store.get.assert_called()
+    # Verify the leader key was watched and never read
+    assert mock_kv_store.watch.keys == ["sticky-active.test-service.test-group.leader"]
+    mock_kv_store.get.assert_not_called()
+    mock_election_trigger.trigger_election.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_monitor_loop_with_healthy_leader(heartbeat_monitor, mock_kv_store):
-    """Test monitor loop with healthy leader."""
-    now = datetime.now(UTC)
+async def test_monitor_loop_with_healthy_leader(
+    heartbeat_monitor, mock_kv_store, mock_election_trigger
+):
+    """Test heartbeats observed on the watch keep the leader alive."""
+    heartbeat_monitor.set_election_trigger(mock_election_trigger)
+    await heartbeat_monitor.start_monitoring()
 
-    # Mock leader key
-    mock_kv_store.get.side_effect = [
-        {"instance_id": "leader-1"},  # Leader exists
-        {  # Healthy heartbeat
-            "timestamp": now.isoformat(),
-            "ttl": 5,
-            "instance_id": "leader-1",
-        },
-    ]
+    # Leader refreshes its key faster than its 1s TTL
+    for revision in range(1, 6):
+        await mock_kv_store.watch.events.put(leader_put("leader-1", ttl=1, revision=revision))
+        await asyncio.sleep(0.3)
 
-    # Start monitoring
+    await heartbeat_monitor.stop_monitoring()
+
+    # Verify leader was tracked without reads or elections
+    assert heartbeat_monitor._current_leader == "leader-1"
+    mock_kv_store.get.assert_not_called()
+    mock_election_trigger.trigger_election.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_monitor_loop_leader_deleted(heartbeat_monitor, mock_kv_store, mock_election_trigger):
+    """Test a deleted leader key triggers an election immediately."""
+    heartbeat_monitor.set_election_trigger(mock_election_trigger)
     await heartbeat_monitor.start_monitoring()
 
-    # Let it run briefly
-    await asyncio.sleep(0.6)
+    await mock_kv_store.watch.events.put(leader_put("leader-1"))
+    await mock_kv_store.watch.events.put(
+        KVWatchEvent(operation="DELETE", key="sticky-active.test-service.test-group.leader")
+    )
+    # Aggressive policy waits 100ms before electing
+    await asyncio.sleep(0.3)
 
-    # Stop monitoring
     await heartbeat_monitor.stop_monitoring()
 
-    # Verify leader was tracked
-    assert heartbeat_monitor._current_leader == "leader-1"
+    mock_election_trigger.trigger_election.assert_called_once_with("test-service", "test-group")
+    assert heartbeat_monitor._current_leader is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_loop_leader_deadline(
+    heartbeat_monitor, mock_kv_store, mock_election_trigger
+):
+    """Test a silent leader is declared failed one TTL after its last heartbeat."""
+    heartbeat_monitor.set_election_trigger(mock_election_trigger)
+    mock_kv_store.get.return_value = None  # Key gone when re-checked
+    await heartbeat_monitor.start_monitoring()
+
+    await mock_kv_store.watch.events.put(leader_put("leader-1", ttl=1))
+    await asyncio.sleep(0.8)
+    mock_election_trigger.trigger_election.assert_not_called()
+
+    await asyncio.sleep(0.5)
+    await heartbeat_monitor.stop_monitoring()
+
+    mock_election_trigger.trigger_election.assert_called_once_with("test-service", "test-group")
+    mock_kv_store.get.assert_called_once_with("sticky-active.test-service.test-group.leader")
+
+
+@pytest.mark.asyncio
+async def test_monitor_loop_ignores_own_leadership(
+    heartbeat_monitor, mock_kv_store, mock_election_trigger
+):
+    """Test no deadline is armed while this instance holds the leader key."""
+    heartbeat_monitor.set_election_trigger(mock_election_trigger)
+    await heartbeat_monitor.start_monitoring()
+
+    await mock_kv_store.watch.events.put(leader_put("instance-1", ttl=1))
+    await asyncio.sleep(0.1)
+
+    assert heartbeat_monitor._current_leader == "instance-1"
+    assert heartbeat_monitor._deadline is None
+
+    await heartbeat_monitor.stop_monitoring()
 
 
 @pytest.mark.asyncio
 async def test_monitor_loop_error_handling(heartbeat_monitor, mock_kv_store, mock_logger):
     """Test monitor loop error handling."""
     # Make KV store raise an error
-    mock_kv_store.get.side_effect = Exception("KV store error")
+    mock_kv_store.watch = Mock(side_effect=Exception("KV store error"))
 
     # Start monitoring
     await heartbeat_monitor.start_monitoring()
@@ -414,7 +488,7 @@ async def test_monitor_loop_error_handling(heartbeat_monitor, mock_kv_store, moc
 async def test_monitor_loop_consecutive_failures(heartbeat_monitor, mock_kv_store, mock_logger):
     """Test monitor loop stops after too many consecutive failures."""
     # Make KV store always raise an error
-    mock_kv_store.get.side_effect = Exception("Persistent error")
+    mock_kv_store.watch = Mock(side_effect=Exception("Persistent error"))
 
     # Start monitoring
     await heartbeat_monitor.start_monitoring()
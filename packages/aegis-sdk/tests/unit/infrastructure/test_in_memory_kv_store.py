@@ -0,0 +1,186 @@
+"""Tests for the in-memory KV store."""
+
+import asyncio
+
+import pytest
+
+from aegis_sdk.domain.exceptions import (
+    KVKeyAlreadyExistsError,
+    KVKeyNotFoundError,
+    KVNotConnectedError,
+    KVRevisionMismatchError,
+)
+from aegis_sdk.domain.models import KVOptions
+from aegis_sdk.infrastructure.in_memory_kv_store import InMemoryKVServer, InMemoryKVStore
+from aegis_sdk.infrastructure.manual_clock import ManualClock
+from aegis_sdk.ports.kv_store import KVStorePort
+
+
+async def connected_store() -> InMemoryKVStore:
+    store = InMemoryKVStore()
+    await store.connect("test")
+    return store
+
+
+class TestInMemoryKVStore:
+    """Test cases for InMemoryKVStore."""
+
+    def test_implements_kv_store_port(self):
+        """Test that InMemoryKVStore implements KVStorePort."""
+        assert isinstance(InMemoryKVStore(), KVStorePort)
+
+    @pytest.mark.asyncio
+    async def test_requires_connection(self):
+        """Test operations fail before connect."""
+        with pytest.raises(KVNotConnectedError):
+            await InMemoryKVStore().get("key")
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_copy_values(self):
+        """Test values are stored by value with increasing revisions."""
+        store = await connected_store()
+        value = {"items": [1, 2]}
+        first = await store.put("a", value)
+        value["items"].append(3)
+        second = await store.put("b", value)
+
+        assert second > first
+        entry = await store.get("a")
+        assert entry.value == {"items": [1, 2]}
+        assert entry.revision == first
+
+    @pytest.mark.asyncio
+    async def test_create_only(self):
+        """Test create_only rejects existing keys."""
+        store = await connected_store()
+        await store.put("leader", "a", KVOptions(create_only=True))
+        with pytest.raises(KVKeyAlreadyExistsError):
+            await store.put("leader", "b", KVOptions(create_only=True))
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self):
+        """Test writes at a stale revision are rejected."""
+        store = await connected_store()
+        revision = await store.put("counter", 1)
+        await store.put("counter", 2, KVOptions(revision=revision))
+
+        with pytest.raises(KVRevisionMismatchError) as exc_info:
+            await store.put("counter", 3, KVOptions(revision=revision))
+        assert exc_info.value.expected_revision == revision
+
+    @pytest.mark.asyncio
+    async def test_update_only(self):
+        """Test update_only requires an existing key."""
+        store = await connected_store()
+        with pytest.raises(KVKeyNotFoundError):
+            await store.put("missing", 1, KVOptions(update_only=True))
+
+    @pytest.mark.asyncio
+    async def test_delete_with_revision(self):
+        """Test conditional deletes only remove the expected revision."""
+        store = await connected_store()
+        revision = await store.put("key", 1)
+        assert not await store.delete("key", revision + 1)
+        assert await store.delete("key", revision)
+        assert not await store.exists("key")
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """Test keys with a TTL disappear after it elapses."""
+        store = await connected_store()
+        await store.put("session", 1, KVOptions(ttl=1))
+        assert await store.exists("session")
+        await asyncio.sleep(1.05)
+        assert not await store.exists("session")
+
+    @pytest.mark.asyncio
+    async def test_watch_replays_then_streams(self):
+        """Test watches replay current values, signal sync, then stream changes."""
+        store = await connected_store()
+        await store.put("svc__a", 1)
+        await store.put("other", 1)
+        synced = asyncio.Event()
+        events = []
+
+        async def consume():
+            async for event in store.watch(prefix="svc__", on_synced=synced.set):
+                events.append((event.operation, event.key))
+                if len(events) == 3:
+                    return
+
+        watcher = asyncio.create_task(consume())
+        await asyncio.wait_for(synced.wait(), 1)
+        await store.put("svc__b", 2)
+        await store.delete("svc__a")
+        await asyncio.wait_for(watcher, 1)
+
+        assert events == [("PUT", "svc__a"), ("PUT", "svc__b"), ("DELETE", "svc__a")]
+
+    @pytest.mark.asyncio
+    async def test_status_counts_writes_and_watchers(self):
+        """Test status reports the bucket sequence and open watches."""
+        store = await connected_store()
+        await store.put("a", 1)
+        await store.put("a", 2)
+        await store.delete("a")
+
+        status = await store.status()
+        assert status["revision"] == 3
+        assert status["watchers"] == 0
+
+        synced = asyncio.Event()
+
+        async def consume():
+            async for _ in store.watch(prefix="a", on_synced=synced.set):
+                pass
+
+        watcher = asyncio.create_task(consume())
+        await asyncio.wait_for(synced.wait(), 1)
+        assert (await store.status())["watchers"] == 1
+
+        watcher.cancel()
+        await asyncio.gather(watcher, return_exceptions=True)
+        assert (await store.status())["watchers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_history_and_purge(self):
+        """Test history is newest first and purge removes it."""
+        store = await connected_store()
+        for value in range(3):
+            await store.put("key", value)
+        assert [entry.value for entry in await store.history("key")] == [2, 1, 0]
+
+        await store.purge("key")
+        assert await store.history("key") == []
+        assert await store.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_stores_share_a_bucket_through_the_server(self):
+        """Test stores opening the same bucket see each other's writes."""
+        server = InMemoryKVServer()
+        first, second, other = (InMemoryKVStore(server) for _ in range(3))
+        await first.connect("leases")
+        await second.connect("leases")
+        await other.connect("other")
+
+        revision = await first.put("leader", "a", KVOptions(create_only=True))
+        with pytest.raises(KVKeyAlreadyExistsError):
+            await second.put("leader", "b", KVOptions(create_only=True))
+        assert (await second.get("leader")).revision == revision
+        assert await other.get("leader") is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_follows_manual_clock(self):
+        """Test TTLs expire when a ManualClock is advanced, not in real time."""
+        clock = ManualClock()
+        store = InMemoryKVStore(InMemoryKVServer(clock))
+        await store.connect("leases")
+        await store.put("short", 1, KVOptions(ttl=5))
+        await store.put("renewed", 1, KVOptions(ttl=5))
+        clock.advance(4)
+        await store.put("renewed", 2, KVOptions(ttl=5))
+
+        clock.advance(1)
+        assert await store.keys() == ["renewed"]
+        clock.advance(4)
+        assert await store.keys() == []
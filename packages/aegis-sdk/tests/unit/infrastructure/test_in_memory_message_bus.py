@@ -0,0 +1,232 @@
+"""Tests for the in-memory message bus."""
+
+import asyncio
+
+import pytest
+
+from aegis_sdk.domain.exceptions import CommandCancelledError
+from aegis_sdk.domain.models import Command, Event, RPCRequest
+from aegis_sdk.infrastructure.in_memory_message_bus import (
+    InMemoryBroker,
+    InMemoryMessageBus,
+    subject_matches,
+)
+from aegis_sdk.ports.message_bus import MessageBusPort
+
+
+async def connected_bus(broker: InMemoryBroker, service: str, instance: str) -> InMemoryMessageBus:
+    bus = InMemoryMessageBus(broker, service, instance)
+    await bus.connect()
+    return bus
+
+
+class TestSubjectMatching:
+    """Test NATS wildcard matching."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "subject", "expected"),
+        [
+            ("events.order.created", "events.order.created", True),
+            ("events.order.*", "events.order.created", True),
+            ("events.*.created", "events.payment.created", True),
+            ("events.*", "events.order.created", False),
+            ("events.>", "events.order.created", True),
+            ("events.>", "events", False),
+            ("events.order.created", "events.order", False),
+        ],
+    )
+    def test_subject_matches(self, pattern, subject, expected):
+        """Test single-token and tail wildcards."""
+        assert subject_matches(pattern, subject) is expected
+
+
+class TestInMemoryMessageBus:
+    """Test cases for InMemoryMessageBus."""
+
+    def test_implements_message_bus_port(self):
+        """Test that InMemoryMessageBus implements MessageBusPort."""
+        assert isinstance(InMemoryMessageBus(), MessageBusPort)
+
+    @pytest.mark.asyncio
+    async def test_rpc_round_trip_is_load_balanced(self):
+        """Test RPC calls are spread over the instances of a service."""
+        broker = InMemoryBroker()
+        served_by = []
+
+        for instance in ("a", "b"):
+            server = await connected_bus(broker, "echo", instance)
+
+            async def handler(params, instance=instance):
+                served_by.append(instance)
+                return params
+
+            await server.register_rpc_handler("echo", "ping", handler)
+
+        client = await connected_bus(broker, "client", "c")
+        for _ in range(4):
+            response = await client.call_rpc(
+                RPCRequest(method="ping", params={"n": 1}, target="echo")
+            )
+            assert response.success
+            assert response.result == {"n": 1}
+
+        assert sorted(served_by) == ["a", "a", "b", "b"]
+
+    @pytest.mark.asyncio
+    async def test_rpc_to_specific_instance(self):
+        """Test addressing one instance directly."""
+        broker = InMemoryBroker()
+        for instance in ("a", "b"):
+            server = await connected_bus(broker, "echo", instance)
+            await server.register_rpc_handler(
+                "echo", "whoami", lambda params, instance=instance: instance
+            )
+
+        client = await connected_bus(broker, "client", "c")
+        response = await client.call_rpc(RPCRequest(method="whoami", target="echo"), "b")
+        assert response.result == "b"
+
+    @pytest.mark.asyncio
+    async def test_rpc_errors_are_returned(self):
+        """Test handler exceptions become failed responses."""
+        broker = InMemoryBroker()
+        server = await connected_bus(broker, "echo", "a")
+
+        async def fail(params):
+            raise ValueError("boom")
+
+        await server.register_rpc_handler("echo", "fail", fail)
+        client = await connected_bus(broker, "client", "c")
+
+        response = await client.call_rpc(RPCRequest(method="fail", target="echo"))
+        assert not response.success
+        assert response.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_rpc_without_responders_fails_fast(self):
+        """Test a call with no handler fails without waiting for the timeout."""
+        client = await connected_bus(InMemoryBroker(), "client", "c")
+        response = await asyncio.wait_for(
+            client.call_rpc(RPCRequest(method="missing", target="nobody", timeout=30)), 1
+        )
+        assert not response.success
+        assert "No responders" in response.error
+
+    @pytest.mark.asyncio
+    async def test_rpc_timeout(self):
+        """Test a slow handler produces a timeout response."""
+        broker = InMemoryBroker()
+        server = await connected_bus(broker, "slow", "a")
+
+        async def slow(params):
+            await asyncio.sleep(1)
+
+        await server.register_rpc_handler("slow", "wait", slow)
+        client = await connected_bus(broker, "client", "c")
+
+        response = await client.call_rpc(RPCRequest(method="wait", target="slow", timeout=0.05))
+        assert not response.success
+        assert "Timeout" in response.error
+
+    @pytest.mark.asyncio
+    async def test_compete_and_broadcast_events(self):
+        """Test compete mode delivers once per service, broadcast once per instance."""
+        broker = InMemoryBroker()
+        compete, broadcast = [], []
+        for instance in ("a", "b"):
+            bus = await connected_bus(broker, "audit", instance)
+
+            async def on_compete(event, instance=instance):
+                compete.append(instance)
+
+            async def on_broadcast(event, instance=instance):
+                broadcast.append(instance)
+
+            await bus.subscribe_event("order.*", on_compete, mode="compete")
+            await bus.subscribe_event("events.order.created", on_broadcast, mode="broadcast")
+
+        publisher = await connected_bus(broker, "orders", "p")
+        await publisher.publish_event(Event(domain="order", event_type="created"))
+        await asyncio.sleep(0.01)
+
+        assert len(compete) == 1
+        assert sorted(broadcast) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_command_completion(self):
+        """Test a command is handled and its result returned to the sender."""
+        broker = InMemoryBroker()
+        worker = await connected_bus(broker, "batch", "w")
+        progress_reports = []
+
+        async def handler(command, progress):
+            await progress(50.0)
+            progress_reports.append(50.0)
+            return {"processed": command.payload["items"]}
+
+        await worker.register_command_handler("batch", "process", handler)
+        sender = await connected_bus(broker, "client", "c")
+
+        result = await sender.send_command(
+            Command(command="process", target="batch", payload={"items": 3})
+        )
+        assert result["status"] == "completed"
+        assert result["result"] == {"processed": 3}
+        assert progress_reports == [50.0]
+
+    @pytest.mark.asyncio
+    async def test_command_waits_for_a_handler(self):
+        """Test a command sent before any handler exists is delivered once one registers."""
+        broker = InMemoryBroker()
+        sender = await connected_bus(broker, "client", "c")
+        handle = await sender.start_command(Command(command="process", target="batch"))
+
+        async def handler(command, progress):
+            await progress(100.0, "done")
+            return "late"
+
+        worker = await connected_bus(broker, "batch", "w")
+        await worker.register_command_handler("batch", "process", handler)
+
+        updates = [update async for update in handle.progress()]
+        result = await handle.result()
+        assert [update["status"] for update in updates] == ["done"]
+        assert result["result"] == "late"
+
+    @pytest.mark.asyncio
+    async def test_command_cancellation(self):
+        """Test cancelling a running command reaches a token-aware handler."""
+        broker = InMemoryBroker()
+        worker = await connected_bus(broker, "batch", "w")
+        started = asyncio.Event()
+
+        async def handler(command, progress, token):
+            started.set()
+            await token.wait()
+            raise CommandCancelledError(command.message_id, token.reason)
+
+        await worker.register_command_handler("batch", "long", handler)
+        sender = await connected_bus(broker, "client", "c")
+        handle = await sender.start_command(Command(command="long", target="batch"))
+        await asyncio.wait_for(started.wait(), 1)
+        await handle.cancel("operator")
+
+        result = await asyncio.wait_for(handle.result(), 1)
+        assert result["status"] == "cancelled"
+        assert result["reason"] == "operator"
+
+    @pytest.mark.asyncio
+    async def test_queue_group_spreads_over_many_instances(self):
+        """Test round-robin delivery stays even across a large fleet."""
+        broker = InMemoryBroker()
+        served = {}
+        for index in range(200):
+            server = await connected_bus(broker, "fleet", f"i{index}")
+            await server.register_rpc_handler(
+                "fleet", "ping", lambda params, index=index: served.setdefault(index, 0)
+            )
+
+        client = await connected_bus(broker, "client", "c")
+        for _ in range(400):
+            assert (await client.call_rpc(RPCRequest(method="ping", target="fleet"))).success
+        assert len(served) == 200
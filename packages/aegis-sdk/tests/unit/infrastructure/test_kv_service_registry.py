@@ -52,12 +52,12 @@ class TestKVServiceRegistry:
 
         await registry.register(sample_instance, ttl_seconds=30)
 
-        # Verify KV store was called
-        mock_kv_store.put.assert_called_once()
-        call_args = mock_kv_store.put.call_args
-
-        # Check key format
-        assert call_args[0][0] == "service-instances__test-service__test-123"
+        # Verify KV store was called under the current and the legacy key
+        assert [call[0][0] for call in mock_kv_store.put.call_args_list] == [
+            "service-instances.test-service.test-123",
+            "service-instances__test-service__test-123",
+        ]
+        call_args = mock_kv_store.put.call_args_list[0]
 
         # Check data includes camelCase fields
         data = call_args[0][1]
@@ -100,8 +100,8 @@ class TestKVServiceRegistry:
         await registry.update_heartbeat(sample_instance, ttl_seconds=30)
 
         # Verify get and put were called
-        mock_kv_store.get.assert_called_once_with("service-instances__test-service__test-123")
-        mock_kv_store.put.assert_called_once()
+        mock_kv_store.get.assert_called_once_with("service-instances.test-service.test-123")
+        assert mock_kv_store.put.call_count == 2
 
     @pytest.mark.asyncio
     async def test_update_heartbeat_missing_entry(self, mock_kv_store, sample_instance):
@@ -113,9 +113,9 @@ class TestKVServiceRegistry:
         await registry.update_heartbeat(sample_instance, ttl_seconds=30)
 
         # Should re-register
-        mock_kv_store.put.assert_called_once()
-        call_args = mock_kv_store.put.call_args
-        assert call_args[0][0] == "service-instances__test-service__test-123"
+        assert mock_kv_store.put.call_count == 2
+        call_args = mock_kv_store.put.call_args_list[0]
+        assert call_args[0][0] == "service-instances.test-service.test-123"
 
     @pytest.mark.asyncio
     async def test_deregister_success(self, mock_kv_store, mock_logger):
@@ -126,7 +126,10 @@ class TestKVServiceRegistry:
 
         await registry.deregister("test-service", "test-123")
 
-        mock_kv_store.delete.assert_called_once_with("service-instances__test-service__test-123")
+        assert [call[0][0] for call in mock_kv_store.delete.call_args_list] == [
+            "service-instances.test-service.test-123",
+            "service-instances__test-service__test-123",
+        ]
         mock_logger.info.assert_called_once()
 
     @pytest.mark.asyncio
@@ -138,7 +141,7 @@ class TestKVServiceRegistry:
 
         await registry.deregister("test-service", "test-123")
 
-        mock_kv_store.delete.assert_called_once()
+        assert mock_kv_store.delete.call_count == 2
         mock_logger.warning.assert_called_once()
 
     @pytest.mark.asyncio
@@ -203,8 +206,8 @@ class TestKVServiceRegistry:
         """Test listing service instances."""
         # Mock keys
         mock_kv_store.keys.return_value = [
-            "service-instances__test-service__inst-1",
-            "service-instances__test-service__inst-2",
+            "service-instances.test-service.inst-1",
+            "service-instances.test-service.inst-2",
         ]
 
         # Mock get calls for each instance
@@ -243,9 +246,9 @@ class TestKVServiceRegistry:
         """Test listing all services."""
         # Mock keys for different services
         mock_kv_store.keys.return_value = [
-            "service-instances__service-a__inst-1",
-            "service-instances__service-a__inst-2",
-            "service-instances__service-b__inst-1",
+            "service-instances.service-a.inst-1",
+            "service-instances.service-a.inst-2",
+            "service-instances.service-b.inst-1",
         ]
 
         # Mock get calls
@@ -586,11 +589,104 @@ class TestKVServiceRegistry:
         registry = KVServiceRegistry(MagicMock())
 
         key = registry._make_key("my-service", "instance-123")
-        assert key == "service-instances__my-service__instance-123"
+        assert key == "service-instances.my-service.instance-123"
 
         # Test with special characters
         key = registry._make_key("service_name", "inst_id")
-        assert key == "service-instances__service_name__inst_id"
+        assert key == "service-instances.service_name.inst_id"
+
+    def test_parse_key_accepts_both_layouts(self):
+        """Test that current and legacy registry keys are parsed."""
+        registry = KVServiceRegistry(MagicMock())
+
+        assert registry._parse_key("service-instances.orders.orders-1") == ("orders", "orders-1")
+        assert registry._parse_key("service-instances__orders__orders-1") == ("orders", "orders-1")
+        assert registry._parse_key("service-instances.orders") is None
+        assert registry._parse_key("services.orders.orders-1") is None
+
+    @pytest.mark.asyncio
+    async def test_list_instances_reads_legacy_keys(self, mock_kv_store):
+        """Test that instances registered under the legacy layout are still listed."""
+        mock_kv_store.keys.return_value = [
+            "service-instances.orders.orders-1",
+            "service-instances__orders__orders-2",
+            "service-instances.billing.billing-1",
+        ]
+
+        async def get(key):
+            entry = MagicMock()
+            entry.value = {
+                "serviceName": key.replace("__", ".").split(".")[1],
+                "instanceId": key.replace("__", ".").split(".")[2],
+                "version": "1.0.0",
+                "status": "ACTIVE",
+                "lastHeartbeat": "2025-01-01T00:00:00Z",
+            }
+            return entry
+
+        mock_kv_store.get.side_effect = get
+        registry = KVServiceRegistry(mock_kv_store)
+
+        instances = await registry.list_instances("orders")
+
+        assert [i.instance_id for i in instances] == ["orders-1", "orders-2"]
+        mock_kv_store.keys.assert_called_once_with("service-instances")
+
+    @pytest.mark.asyncio
+    async def test_legacy_keys_can_be_disabled(self, mock_kv_store, sample_instance):
+        """Test that after the cutover only the dotted key is written and deleted."""
+        mock_kv_store.delete.return_value = True
+        registry = KVServiceRegistry(mock_kv_store, legacy_keys=False)
+
+        await registry.register(sample_instance, ttl_seconds=30)
+        await registry.deregister("test-service", "test-123")
+
+        mock_kv_store.put.assert_called_once()
+        assert mock_kv_store.put.call_args[0][0] == "service-instances.test-service.test-123"
+        mock_kv_store.delete.assert_called_once_with("service-instances.test-service.test-123")
+
+    @pytest.mark.asyncio
+    async def test_list_instances_reads_dual_written_instance_once(self, mock_kv_store):
+        """Test that an instance written under both layouts is listed once."""
+        mock_kv_store.keys.return_value = [
+            "service-instances.orders.orders-1",
+            "service-instances__orders__orders-1",
+        ]
+        entry = MagicMock()
+        entry.value = {
+            "serviceName": "orders",
+            "instanceId": "orders-1",
+            "version": "1.0.0",
+            "status": "ACTIVE",
+        }
+        mock_kv_store.get.return_value = entry
+        registry = KVServiceRegistry(mock_kv_store)
+
+        instances = await registry.list_instances("orders")
+
+        assert [i.instance_id for i in instances] == ["orders-1"]
+        mock_kv_store.get.assert_called_once_with("service-instances.orders.orders-1")
+
+    @pytest.mark.asyncio
+    async def test_get_instance_falls_back_to_legacy_key(self, mock_kv_store):
+        """Test that an instance only registered by an older release is found."""
+        entry = MagicMock()
+        entry.value = {
+            "serviceName": "orders",
+            "instanceId": "orders-2",
+            "version": "1.0.0",
+            "status": "ACTIVE",
+        }
+        mock_kv_store.get.side_effect = lambda key: entry if "__" in key else None
+        registry = KVServiceRegistry(mock_kv_store)
+
+        instance = await registry.get_instance("orders", "orders-2")
+
+        assert instance is not None and instance.instance_id == "orders-2"
+        assert [call[0][0] for call in mock_kv_store.get.call_args_list] == [
+            "service-instances.orders.orders-2",
+            "service-instances__orders__orders-2",
+        ]
 
     @pytest.mark.asyncio
     async def test_get_instance_sticky_active_group_camelcase(self, mock_kv_store):
@@ -0,0 +1,52 @@
+"""Tests for the ManualClock implementation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from aegis_sdk.infrastructure.manual_clock import ManualClock
+from aegis_sdk.ports.clock import ClockPort
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestManualClock:
+    """Test the ManualClock implementation."""
+
+    def test_implements_clock_port(self):
+        """Test that ManualClock implements ClockPort interface."""
+        assert isinstance(ManualClock(), ClockPort)
+
+    def test_time_only_moves_when_advanced(self):
+        """Test now() stays put until advance() is called."""
+        clock = ManualClock(START)
+        assert clock.now() == START
+        assert clock.now() == START
+
+        clock.advance(1.5)
+        assert clock.now() == START + timedelta(seconds=1.5)
+
+    def test_rejects_naive_start_and_moving_backwards(self):
+        """Test the clock stays timezone-aware and monotonic."""
+        with pytest.raises(ValueError):
+            ManualClock(datetime(2025, 1, 1))
+
+        clock = ManualClock(START)
+        with pytest.raises(ValueError):
+            clock.advance(-1)
+        with pytest.raises(ValueError):
+            clock.set(START - timedelta(seconds=1))
+
+    def test_listeners_run_after_each_change(self):
+        """Test listeners see the new time."""
+        clock = ManualClock(START)
+        seen = []
+        listener = lambda: seen.append(clock.now())  # noqa: E731
+        clock.add_listener(listener)
+
+        clock.advance(1)
+        clock.set(START + timedelta(seconds=5))
+        clock.remove_listener(listener)
+        clock.advance(1)
+
+        assert seen == [START + timedelta(seconds=1), START + timedelta(seconds=5)]
@@ -0,0 +1,247 @@
+"""Unit tests for the watch-driven materialized service registry."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aegis_sdk.domain.models import KVEntry, KVWatchEvent, ServiceInstance
+from aegis_sdk.infrastructure.materialized_service_registry import MaterializedServiceRegistry
+
+
+def make_key(service: str, instance: str, legacy: bool = False) -> str:
+    """Registry key of an instance in the current or the legacy layout."""
+    if legacy:
+        return f"service-instances__{service}__{instance}"
+    return f"service-instances.{service}.{instance}"
+
+
+def make_put(
+    service: str,
+    instance: str,
+    revision: int,
+    status: str = "ACTIVE",
+    heartbeat_age: float = 0.0,
+    legacy: bool = False,
+) -> KVWatchEvent:
+    """Create a PUT event for a registry key."""
+    key = make_key(service, instance, legacy)
+    value = ServiceInstance(
+        service_name=service,
+        instance_id=instance,
+        version="1.0.0",
+        status=status,
+        last_heartbeat=datetime.now(UTC) - timedelta(seconds=heartbeat_age),
+    ).model_dump(by_alias=True)
+    entry = KVEntry(
+        key=key,
+        value=value,
+        revision=revision,
+        created_at="2025-01-01T00:00:00+00:00",
+        updated_at="2025-01-01T00:00:00+00:00",
+    )
+    return KVWatchEvent(operation="PUT", entry=entry, key=key)
+
+
+def make_delete(
+    service: str, instance: str, operation: str = "DELETE", legacy: bool = False
+) -> KVWatchEvent:
+    """Create a DELETE/PURGE event for a registry key."""
+    return KVWatchEvent(operation=operation, key=make_key(service, instance, legacy))
+
+
+class FakeWatchStore:
+    """KV store stub whose watch replays a snapshot and then live events."""
+
+    def __init__(self, snapshot: list[KVWatchEvent]):
+        self.snapshot = snapshot
+        self.live: asyncio.Queue = asyncio.Queue()
+        self.watch_calls: list[dict] = []
+        self.keys = AsyncMock(return_value=[])
+        self.get = AsyncMock(return_value=None)
+
+    async def watch(self, key=None, prefix=None, on_synced=None):
+        self.watch_calls.append({"key": key, "prefix": prefix})
+        for event in self.snapshot:
+            yield event
+        if on_synced:
+            on_synced()
+        while True:
+            event = await self.live.get()
+            if event is None:
+                return
+            yield event
+
+
+async def settle() -> None:
+    """Let the background watch task process queued events."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestMaterializedServiceRegistry:
+    """Test cases for MaterializedServiceRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_seeds_from_snapshot_and_signals_ready(self):
+        """Test the initial snapshot loads into the view and sets readiness."""
+        store = FakeWatchStore([make_put("echo", "a", 1), make_put("echo", "b", 2)])
+        registry = MaterializedServiceRegistry(store, logger=MagicMock())
+
+        assert not registry.is_ready
+        async with registry:
+            assert await registry.wait_ready(timeout=1.0)
+
+            instances = await registry.list_instances("echo")
+            assert sorted(i.instance_id for i in instances) == ["a", "b"]
+            assert registry.revision == 2
+            assert store.watch_calls == [{"key": None, "prefix": "service-instances"}]
+            # Reads are served from memory, not KV scans
+            store.keys.assert_not_called()
+            store.get.assert_not_called()
+
+        assert not registry.is_ready
+
+    @pytest.mark.asyncio
+    async def test_applies_live_events_incrementally(self):
+        """Test PUT/DELETE/PURGE events keep the view up to date."""
+        store = FakeWatchStore([make_put("echo", "a", 1)])
+        registry = MaterializedServiceRegistry(store)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+
+            await store.live.put(make_put("echo", "b", 2))
+            await store.live.put(make_put("orders", "x", 3))
+            await store.live.put(make_put("echo", "a", 4, status="STANDBY"))
+            await settle()
+
+            services = await registry.list_all_services()
+            assert sorted(services) == ["echo", "orders"]
+            instance = await registry.get_instance("echo", "a")
+            assert instance is not None and instance.status == "STANDBY"
+
+            await store.live.put(make_delete("echo", "a"))
+            await store.live.put(make_delete("orders", "x", operation="PURGE"))
+            await settle()
+
+            assert [i.instance_id for i in await registry.list_instances("echo")] == ["b"]
+            assert await registry.list_instances("orders") == []
+            assert "orders" not in await registry.list_all_services()
+            assert registry.revision == 4
+
+    @pytest.mark.asyncio
+    async def test_ignores_stale_revisions(self):
+        """Test replayed older revisions do not overwrite newer state."""
+        store = FakeWatchStore([make_put("echo", "a", 5, status="STANDBY")])
+        registry = MaterializedServiceRegistry(store)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+            await store.live.put(make_put("echo", "a", 3, status="ACTIVE"))
+            await settle()
+
+            instance = await registry.get_instance("echo", "a")
+            assert instance is not None and instance.status == "STANDBY"
+
+    @pytest.mark.asyncio
+    async def test_drops_instances_past_their_ttl(self):
+        """Test entries that expired without a delete marker are not served."""
+        store = FakeWatchStore(
+            [
+                make_put("echo", "a", 1),
+                make_put("echo", "b", 2, heartbeat_age=60),
+                make_put("orders", "x", 3, heartbeat_age=60),
+            ]
+        )
+        registry = MaterializedServiceRegistry(store, instance_ttl=30)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+
+            assert [i.instance_id for i in await registry.list_instances("echo")] == ["a"]
+            assert await registry.get_instance("echo", "b") is None
+            assert sorted(await registry.list_all_services()) == ["echo"]
+
+            # A fresh heartbeat brings the instance back
+            await store.live.put(make_put("echo", "b", 4))
+            await settle()
+            assert await registry.get_instance("echo", "b") is not None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_kv_scan_before_ready(self):
+        """Test reads use the KV Store until the snapshot has loaded."""
+        store = FakeWatchStore([])
+        store.keys.return_value = ["service-instances.echo.a"]
+        store.get.return_value = make_put("echo", "a", 1).entry
+        registry = MaterializedServiceRegistry(store)
+
+        instances = await registry.list_instances("echo")
+
+        assert [i.instance_id for i in instances] == ["a"]
+        store.keys.assert_awaited_once_with("service-instances")
+
+    @pytest.mark.asyncio
+    async def test_restart_reseeds_view(self):
+        """Test a restarted watch replaces the view with the new snapshot."""
+        store = FakeWatchStore([make_put("echo", "a", 1)])
+        registry = MaterializedServiceRegistry(store, reconnect_delay=0.01)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+
+            # Key "a" disappeared while the watch was down
+            store.snapshot = [make_put("echo", "b", 2)]
+            await store.live.put(None)
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(store.watch_calls) == 2:
+                    break
+            await settle()
+
+            assert [i.instance_id for i in await registry.list_instances("echo")] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_timeout(self):
+        """Test wait_ready returns False when the snapshot never completes."""
+        registry = MaterializedServiceRegistry(FakeWatchStore([]))
+
+        assert await registry.wait_ready(timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_includes_legacy_keys_until_cutover(self):
+        """Test instances of older releases stay in the view next to dual-written ones."""
+        store = FakeWatchStore(
+            [
+                make_put("echo", "a", 1),
+                make_put("echo", "a", 2, legacy=True),
+                make_put("echo", "old", 3, legacy=True),
+            ]
+        )
+        registry = MaterializedServiceRegistry(store)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+            instances = await registry.list_instances("echo")
+            assert sorted(i.instance_id for i in instances) == ["a", "old"]
+
+            # One copy of a dual-written instance going away keeps it registered
+            await store.live.put(make_delete("echo", "a", legacy=True))
+            await settle()
+            assert await registry.get_instance("echo", "a") is not None
+
+            await store.live.put(make_delete("echo", "a"))
+            await settle()
+            assert await registry.get_instance("echo", "a") is None
+
+    @pytest.mark.asyncio
+    async def test_watches_only_dotted_keys_after_cutover(self):
+        """Test the watch is narrowed to the dotted layout once legacy keys are off."""
+        store = FakeWatchStore([make_put("echo", "a", 1)])
+        registry = MaterializedServiceRegistry(store, legacy_keys=False)
+
+        async with registry:
+            await registry.wait_ready(timeout=1.0)
+
+        assert store.watch_calls == [{"key": None, "prefix": "service-instances."}]
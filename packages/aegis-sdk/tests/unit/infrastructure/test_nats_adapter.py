@@ -1,16 +1,27 @@
 """Unit tests for NATSAdapter."""
 
 import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
-
-from aegis_sdk.domain.models import RPCRequest, RPCResponse
+from nats.js.api import AckPolicy
+
+from aegis_sdk.domain.models import (
+    Command,
+    Event,
+    EventSubscriptionOptions,
+    RPCHandlerOptions,
+    RPCRequest,
+    RPCResponse,
+)
 from aegis_sdk.domain.value_objects import InstanceId, ServiceName
 from aegis_sdk.infrastructure.config import NATSConnectionConfig
+from aegis_sdk.infrastructure.envelope import EventView
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
 from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
-from aegis_sdk.infrastructure.serialization import serialize_to_json
+from aegis_sdk.infrastructure.serialization import detect_and_deserialize, serialize_to_json
 
 
 class TestNATSAdapterInit:
@@ -43,6 +54,13 @@ class TestNATSAdapterInit:
 
         assert adapter._metrics == mock_metrics
 
+    def test_init_with_logger(self):
+        """Test an injected logger replaces the default one."""
+        mock_logger = MagicMock()
+        adapter = NATSAdapter(logger=mock_logger)
+
+        assert adapter._logger is mock_logger
+
     def test_init_extracts_service_identification(self):
         """Test service name and instance ID extraction from config."""
         service_name = ServiceName(value="test-service")
@@ -274,6 +292,106 @@ class TestNATSAdapterConnectionPool:
             adapter._get_connection()
 
 
+class TestNATSAdapterSubscriptionStrategy:
+    """Test how subscriptions are spread across pooled connections."""
+
+    def make_adapter(self, strategy: str, pool_size: int = 4) -> NATSAdapter:
+        """Create an adapter with a pool of mock connections."""
+        adapter = NATSAdapter(
+            config=NATSConnectionConfig(pool_size=pool_size, subscription_strategy=strategy)
+        )
+        for _ in range(pool_size):
+            conn = MagicMock()
+            conn.is_connected = True
+            conn.subscribe = AsyncMock()
+            adapter._connections.append(conn)
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_connect_creates_jetstream_context_per_connection(self):
+        """Test each pooled connection gets its own JetStream context."""
+        adapter = NATSAdapter(config=NATSConnectionConfig(pool_size=3))
+        conns = [MagicMock() for _ in range(3)]
+
+        with patch("aegis_sdk.infrastructure.nats_adapter.nats") as mock_nats:
+            mock_nats.connect = AsyncMock(side_effect=conns)
+            with patch.object(adapter, "_ensure_streams", new_callable=AsyncMock):
+                await adapter.connect()
+
+        assert adapter._js_contexts == [conn.jetstream.return_value for conn in conns]
+        assert adapter._js is adapter._js_contexts[0]
+
+    @pytest.mark.asyncio
+    async def test_replicate_joins_queue_group_on_every_connection(self):
+        """Test the replicate strategy subscribes on all connections."""
+        adapter = self.make_adapter("replicate")
+        adapter._instance_id = "echo-abc123"
+
+        await adapter.register_rpc_handler("echo", "ping", AsyncMock())
+
+        for conn in adapter._connections:
+            service_call, instance_call = conn.subscribe.call_args_list
+            assert service_call[0][0] == "rpc.echo.ping"
+            assert service_call[1]["queue"] == "rpc.echo"
+            # Direct calls use a queue group private to the instance
+            assert instance_call[0][0] == "service.echo.echo-abc123.ping"
+            assert instance_call[1]["queue"] == "rpc.echo.echo-abc123"
+
+    @pytest.mark.asyncio
+    async def test_hash_pins_each_method_to_one_connection(self):
+        """Test the hash strategy spreads methods deterministically."""
+        adapter = self.make_adapter("hash")
+        methods = [f"method_{i}" for i in range(16)]
+
+        for method in methods:
+            await adapter.register_rpc_handler("echo", method, AsyncMock())
+
+        owners = {}
+        for index, conn in enumerate(adapter._connections):
+            for subscribe_call in conn.subscribe.call_args_list:
+                owners.setdefault(subscribe_call[0][0], []).append(index)
+
+        assert len(owners) == len(methods)
+        assert all(len(indexes) == 1 for indexes in owners.values())
+        assert len({indexes[0] for indexes in owners.values()}) > 1
+        assert owners["rpc.echo.method_0"] == [adapter._connection_index("rpc.echo.method_0")]
+
+    @pytest.mark.asyncio
+    async def test_single_uses_first_connection(self):
+        """Test the single strategy keeps subscriptions on connection 0."""
+        adapter = self.make_adapter("single")
+        adapter._js_contexts = [MagicMock() for _ in adapter._connections]
+        adapter._js = adapter._js_contexts[0]
+
+        for method in ("a", "b", "c"):
+            await adapter.register_rpc_handler("echo", method, AsyncMock())
+
+        assert adapter._connections[0].subscribe.call_count == 3
+        assert all(conn.subscribe.call_count == 0 for conn in adapter._connections[1:])
+        assert adapter._jetstream_for("commands.echo.a") is adapter._js
+
+    @pytest.mark.asyncio
+    async def test_broadcast_wildcard_subscribes_once(self):
+        """Test plain subscriptions are never replicated."""
+        adapter = self.make_adapter("replicate")
+        adapter._js = MagicMock()
+
+        await adapter.subscribe_event("events.orders.*", AsyncMock(), mode="broadcast")
+
+        calls = [conn.subscribe.call_count for conn in adapter._connections]
+        assert sorted(calls) == [0, 0, 0, 1]
+
+    def test_jetstream_for_uses_owning_connection(self):
+        """Test JetStream operations use the context of the owning connection."""
+        adapter = self.make_adapter("hash")
+        adapter._js_contexts = [MagicMock() for _ in adapter._connections]
+        adapter._js = adapter._js_contexts[0]
+
+        subject = "commands.echo.reindex"
+        index = adapter._connection_index(subject)
+        assert adapter._jetstream_for(subject) is adapter._js_contexts[index]
+
+
 class TestNATSAdapterStreams:
     """Test JetStream stream management."""
 
@@ -363,6 +481,168 @@ class TestNATSAdapterRPC:
         # Check keyword arguments
         assert call_args[1]["queue"] == "rpc.test-service"
 
+    @pytest.mark.asyncio
+    async def test_register_rpc_handler_subscribes_instance_subject(self, adapter_with_connection):
+        """Test RPC handler also listens on the per-instance subject."""
+        adapter = adapter_with_connection
+        adapter._instance_id = "test-service-abc123"
+        mock_conn = adapter._connections[0]
+        mock_conn.subscribe = AsyncMock()
+
+        await adapter.register_rpc_handler("test-service", "test-method", AsyncMock())
+
+        assert mock_conn.subscribe.call_count == 2
+        instance_call = mock_conn.subscribe.call_args_list[1]
+        assert instance_call[0][0] == "service.test-service.test-service-abc123.test-method"
+        assert "queue" not in instance_call[1]
+
+    @pytest.mark.asyncio
+    async def test_rpc_queue_group_join_and_leave(self, adapter_with_connection):
+        """Test a handler can stay out of the queue group and join it later."""
+        adapter = adapter_with_connection
+        adapter._instance_id = "test-service-abc123"
+        mock_conn = adapter._connections[0]
+        queue_sub = AsyncMock()
+        mock_conn.subscribe = AsyncMock(return_value=queue_sub)
+
+        await adapter.register_rpc_handler(
+            "test-service",
+            "test-method",
+            AsyncMock(),
+            RPCHandlerOptions(join_queue_group=False),
+        )
+
+        # Only the instance subject is served
+        assert mock_conn.subscribe.call_count == 1
+        assert mock_conn.subscribe.call_args[0][0].startswith("service.")
+
+        await adapter.join_rpc_queue_group("test-service", "test-method")
+        await adapter.join_rpc_queue_group("test-service", "test-method")
+
+        assert mock_conn.subscribe.call_count == 2
+        assert mock_conn.subscribe.call_args[0][0] == "rpc.test-service.test-method"
+        assert mock_conn.subscribe.call_args[1]["queue"] == "rpc.test-service"
+
+        await adapter.leave_rpc_queue_group("test-service", "test-method")
+
+        queue_sub.drain.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_join_rpc_queue_group_unknown_method(self, adapter_with_connection):
+        """Test joining the queue group needs a registered handler."""
+        with pytest.raises(ValueError):
+            await adapter_with_connection.join_rpc_queue_group("test-service", "missing")
+
+    @pytest.mark.asyncio
+    async def test_register_rpc_handler_concurrent_dispatch(self, adapter_with_connection):
+        """Test requests run concurrently up to the method's limit."""
+        adapter = adapter_with_connection
+        adapter._metrics = InMemoryMetrics()
+        mock_conn = adapter._connections[0]
+        mock_conn.subscribe = AsyncMock()
+
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def handler(params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return {"ok": True}
+
+        await adapter.register_rpc_handler(
+            "svc", "slow", handler, RPCHandlerOptions(max_concurrency=2)
+        )
+        wrapper = mock_conn.subscribe.call_args[1]["cb"]
+
+        msgs = []
+        for _ in range(3):
+            msg = MagicMock()
+            msg.data = serialize_to_json(RPCRequest(method="slow", target="svc"))
+            msg.respond = AsyncMock()
+            msgs.append(msg)
+
+        # Two requests are dispatched without waiting for their handlers
+        await wrapper(msgs[0])
+        await wrapper(msgs[1])
+        await asyncio.sleep(0)
+        assert running == 2
+        assert adapter._metrics.get_all()["gauges"]["rpc.svc.slow.in_flight"] == 2
+
+        # The third waits for a free slot
+        third = asyncio.create_task(wrapper(msgs[2]))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        release.set()
+        await third
+        await asyncio.gather(*adapter._handler_tasks)
+
+        assert peak == 2
+        assert all(msg.respond.await_count == 1 for msg in msgs)
+        gauges = adapter._metrics.get_all()["gauges"]
+        assert "rpc.svc.slow.queue_wait_ms" in gauges
+        assert gauges["rpc.svc.slow.in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_register_rpc_handler_thread_offload(self, adapter_with_connection):
+        """Test synchronous handlers can run in a worker thread."""
+        import threading
+
+        adapter = adapter_with_connection
+        mock_conn = adapter._connections[0]
+        mock_conn.subscribe = AsyncMock()
+        loop_thread = threading.get_ident()
+
+        def handler(params):
+            return {"same_thread": threading.get_ident() == loop_thread}
+
+        await adapter.register_rpc_handler(
+            "svc", "cpu", handler, RPCHandlerOptions(offload="thread")
+        )
+        wrapper = mock_conn.subscribe.call_args[1]["cb"]
+
+        msg = MagicMock()
+        msg.data = serialize_to_json(RPCRequest(method="cpu", target="svc"))
+        msg.respond = AsyncMock()
+        await wrapper(msg)
+
+        response = detect_and_deserialize(msg.respond.call_args[0][0], RPCResponse)
+        assert response.result == {"same_thread": False}
+
+        mock_conn.close = AsyncMock()
+        await adapter.disconnect()
+        assert adapter._executors == {}
+
+    @pytest.mark.asyncio
+    async def test_register_rpc_handler_offload_requires_sync_handler(
+        self, adapter_with_connection
+    ):
+        """Test offloading a coroutine handler is rejected."""
+        with pytest.raises(ValueError):
+            await adapter_with_connection.register_rpc_handler(
+                "svc", "cpu", AsyncMock(), RPCHandlerOptions(offload="thread")
+            )
+
+    @pytest.mark.asyncio
+    async def test_call_rpc_to_instance(self, adapter_with_connection):
+        """Test RPC call addressed to a specific instance."""
+        adapter = adapter_with_connection
+        mock_conn = adapter._connections[0]
+        response = RPCResponse(correlation_id="123", success=True, result={"data": "test"})
+        mock_response_msg = MagicMock()
+        mock_response_msg.data = serialize_to_json(response)
+        mock_conn.request = AsyncMock(return_value=mock_response_msg)
+
+        request = RPCRequest(method="test", target="service", params={})
+        result = await adapter.call_rpc(request, instance_id="service-abc123")
+
+        assert result.success is True
+        assert mock_conn.request.call_args[0][0] == "service.service.service-abc123.test"
+
     @pytest.mark.asyncio
     async def test_call_rpc_success(self, adapter_with_connection):
         """Test successful RPC call."""
@@ -421,6 +701,535 @@ class TestNATSAdapterRPC:
         assert "Connection error" in result.error
 
 
+class TestNATSAdapterCommands:
+    """Test command sending and completion tracking."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create adapter with a mock connection and JetStream context."""
+        adapter = NATSAdapter(config=NATSConnectionConfig(use_msgpack=False))
+        conn = MagicMock()
+        conn.is_connected = True
+        conn.subscribe = AsyncMock()
+        conn.publish = AsyncMock()
+        adapter._connections = [conn]
+        adapter._js = MagicMock()
+        adapter._js.publish = AsyncMock(return_value=MagicMock(stream="COMMANDS", seq=1))
+        return adapter
+
+    def inbox_callbacks(self, adapter):
+        """Get the progress and completion callbacks of the command inbox."""
+        calls = adapter._connections[0].subscribe.call_args_list
+        return {c[0][0]: c[1]["cb"] for c in calls}
+
+    @pytest.mark.asyncio
+    async def test_send_command_resolves_on_completion(self, adapter):
+        """Test tracked commands complete as soon as the callback arrives."""
+        scope = adapter._reply_scope
+        commands = [Command(command="reindex", target="search") for _ in range(3)]
+        tasks = [asyncio.create_task(adapter.send_command(cmd)) for cmd in commands]
+        await asyncio.sleep(0)
+
+        # One set of wildcard subscriptions serves every command
+        callbacks = self.inbox_callbacks(adapter)
+        assert set(callbacks) == {
+            f"commands.progress.{scope}.*",
+            f"commands.callback.{scope}.*",
+            "commands.progress.*",
+            "commands.callback.*",
+        }
+        publish_call = adapter._js.publish.call_args
+        assert publish_call[1]["headers"] == {"Aegis-Reply-Scope": scope}
+
+        for cmd in reversed(commands):
+            msg = MagicMock()
+            msg.subject = f"commands.callback.{scope}.{cmd.message_id}"
+            msg.data = json.dumps({"command_id": cmd.message_id, "status": "completed"}).encode()
+            await callbacks[f"commands.callback.{scope}.*"](msg)
+
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=0.05)
+
+        assert [r["command_id"] for r in results] == [c.message_id for c in commands]
+        assert adapter._connections[0].subscribe.call_count == 4
+        assert adapter._pending_commands == {}
+
+    @pytest.mark.asyncio
+    async def test_send_command_completes_from_unscoped_handler(self, adapter):
+        """Test replies from handlers without reply scopes still resolve commands."""
+        command = Command(command="reindex", target="search")
+        task = asyncio.create_task(adapter.send_command(command))
+        await asyncio.sleep(0)
+
+        msg = MagicMock()
+        msg.subject = f"commands.callback.{command.message_id}"
+        msg.data = json.dumps({"command_id": command.message_id, "status": "completed"}).encode()
+        await self.inbox_callbacks(adapter)["commands.callback.*"](msg)
+
+        result = await asyncio.wait_for(task, timeout=0.05)
+        assert result["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_legacy_command_replies_can_be_disabled(self):
+        """Test only the scoped inbox is subscribed without legacy replies."""
+        adapter = NATSAdapter(
+            config=NATSConnectionConfig(use_msgpack=False, legacy_command_replies=False)
+        )
+        conn = MagicMock()
+        conn.is_connected = True
+        conn.subscribe = AsyncMock()
+        adapter._connections = [conn]
+
+        await adapter._ensure_command_inbox()
+
+        scope = adapter._reply_scope
+        assert [c[0][0] for c in conn.subscribe.call_args_list] == [
+            f"commands.progress.{scope}.*",
+            f"commands.callback.{scope}.*",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_command_timeout(self, adapter):
+        """Test tracked commands time out and are forgotten."""
+        command = Command(command="reindex", target="search", timeout=0.01)
+
+        result = await adapter.send_command(command)
+
+        assert result == {"error": "Command timeout"}
+        assert adapter._pending_commands == {}
+
+    @pytest.mark.asyncio
+    async def test_send_command_without_tracking(self, adapter):
+        """Test untracked commands return the publish ack without an inbox."""
+        command = Command(command="reindex", target="search")
+
+        result = await adapter.send_command(command, track_progress=False)
+
+        assert result == {"command_id": command.message_id, "stream": "COMMANDS", "seq": 1}
+        adapter._connections[0].subscribe.assert_not_called()
+        assert adapter._js.publish.call_args[1]["headers"] is None
+
+    @pytest.mark.asyncio
+    async def test_command_handler_replies_to_sender_scope(self, adapter):
+        """Test handlers report to the scope from the command headers."""
+        adapter._js.subscribe = AsyncMock()
+
+        async def handler(cmd, report_progress):
+            await report_progress(50.0)
+            return {"done": True}
+
+        await adapter.register_command_handler("search", "reindex", handler)
+        wrapper = adapter._js.subscribe.call_args[1]["cb"]
+
+        for headers, scope_token in (({"Aegis-Reply-Scope": "abc"}, "abc."), (None, "")):
+            adapter._connections[0].publish.reset_mock()
+            command = Command(command="reindex", target="search")
+            msg = MagicMock()
+            msg.data = serialize_to_json(command)
+            msg.headers = headers
+            msg.ack = AsyncMock()
+            await wrapper(msg)
+
+            subjects = [c[0][0] for c in adapter._connections[0].publish.call_args_list]
+            assert subjects == [
+                f"commands.progress.{scope_token}{command.message_id}",
+                f"commands.callback.{scope_token}{command.message_id}",
+            ]
+
+
+class TestNATSAdapterCommandHandles:
+    """Test streaming command handles and cooperative cancellation."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create adapter with a mock connection and JetStream context."""
+        adapter = NATSAdapter(config=NATSConnectionConfig(use_msgpack=False))
+        conn = MagicMock()
+        conn.is_connected = True
+        conn.subscribe = AsyncMock()
+        conn.publish = AsyncMock()
+        adapter._connections = [conn]
+        adapter._js = MagicMock()
+        adapter._js.publish = AsyncMock(return_value=MagicMock(stream="COMMANDS", seq=1))
+        adapter._js.subscribe = AsyncMock()
+        return adapter
+
+    def callback(self, adapter, subject):
+        """Get the callback subscribed to a subject."""
+        for c in adapter._connections[0].subscribe.call_args_list:
+            if c[0][0] == subject:
+                return c[1]["cb"]
+        raise AssertionError(f"No subscription for {subject}")
+
+    def reply(self, subject, data):
+        """Build an inbound reply message."""
+        msg = MagicMock()
+        msg.subject = subject
+        msg.data = json.dumps(data).encode()
+        return msg
+
+    @pytest.mark.asyncio
+    async def test_handle_streams_progress_then_result(self, adapter):
+        """Test progress updates are streamed until the command completes."""
+        scope = adapter._reply_scope
+        command = Command(command="reindex", target="search")
+
+        handle = await adapter.start_command(command)
+        progress = self.callback(adapter, f"commands.progress.{scope}.*")
+        completion = self.callback(adapter, f"commands.callback.{scope}.*")
+
+        for percent in (25.0, 75.0):
+            await progress(
+                self.reply(
+                    f"commands.progress.{scope}.{command.message_id}",
+                    {"command_id": command.message_id, "progress": percent},
+                )
+            )
+        await completion(
+            self.reply(
+                f"commands.callback.{scope}.{command.message_id}",
+                {"command_id": command.message_id, "status": "completed", "result": {"n": 2}},
+            )
+        )
+
+        updates = [update["progress"] async for update in handle]
+        assert updates == [25.0, 75.0]
+        assert (await handle)["result"] == {"n": 2}
+        assert handle.done
+        assert adapter._pending_commands == {}
+
+    @pytest.mark.asyncio
+    async def test_handle_timeout_ends_progress(self, adapter):
+        """Test a command without completion resolves with a timeout error."""
+        handle = await adapter.start_command(
+            Command(command="reindex", target="search", timeout=0.01)
+        )
+
+        assert [update async for update in handle.progress()] == []
+        assert await handle.result() == {"error": "Command timeout"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_publishes_to_cancel_subject(self, adapter):
+        """Test cancel() publishes a cancellation request."""
+        command = Command(command="reindex", target="search")
+        handle = await adapter.start_command(command)
+
+        await handle.cancel("user abort")
+
+        subject, data = adapter._connections[0].publish.call_args[0]
+        assert subject == f"commands.cancel.{command.message_id}"
+        assert json.loads(data)["reason"] == "user abort"
+
+    @pytest.mark.asyncio
+    async def test_handler_receives_cancellation_token(self, adapter):
+        """Test handlers with a token parameter can be cancelled."""
+        started = asyncio.Event()
+
+        async def handler(cmd, report_progress, cancellation):
+            started.set()
+            await cancellation.wait()
+            cancellation.raise_if_cancelled()
+
+        await adapter.register_command_handler("search", "reindex", handler)
+        wrapper = adapter._js.subscribe.call_args[1]["cb"]
+        cancel_inbox = self.callback(adapter, "commands.cancel.*")
+
+        command = Command(command="reindex", target="search")
+        msg = MagicMock()
+        msg.data = serialize_to_json(command)
+        msg.headers = {"Aegis-Reply-Scope": "abc"}
+        msg.ack = AsyncMock()
+        task = asyncio.create_task(wrapper(msg))
+        await started.wait()
+
+        await cancel_inbox(self.reply(f"commands.cancel.{command.message_id}", {"reason": "stop"}))
+        await asyncio.wait_for(task, timeout=1.0)
+
+        subject, data = adapter._connections[0].publish.call_args[0]
+        assert subject == f"commands.callback.abc.{command.message_id}"
+        assert json.loads(data) == {
+            "command_id": command.message_id,
+            "status": "cancelled",
+            "reason": "stop",
+        }
+        msg.ack.assert_awaited_once()
+        assert adapter._running_commands == {}
+
+    @pytest.mark.asyncio
+    async def test_cancellation_before_command_starts(self, adapter):
+        """Test a cancellation that arrives while the command is queued is applied."""
+        seen = []
+
+        async def handler(cmd, report_progress, cancellation):
+            seen.append(cancellation.is_cancelled)
+            return {}
+
+        await adapter.register_command_handler("search", "reindex", handler)
+        wrapper = adapter._js.subscribe.call_args[1]["cb"]
+        cancel_inbox = self.callback(adapter, "commands.cancel.*")
+
+        command = Command(command="reindex", target="search")
+        await cancel_inbox(self.reply(f"commands.cancel.{command.message_id}", {}))
+
+        msg = MagicMock()
+        msg.data = serialize_to_json(command)
+        msg.headers = None
+        msg.ack = AsyncMock()
+        await wrapper(msg)
+
+        assert seen == [True]
+        assert adapter._early_cancellations == {}
+
+
+class TestNATSAdapterPullEvents:
+    """Test batched event delivery through pull consumers."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create adapter with a mock JetStream context."""
+        adapter = NATSAdapter(
+            config=NATSConnectionConfig(
+                use_msgpack=False,
+                service_name=ServiceName(value="billing"),
+                instance_id=InstanceId(value="billing-1"),
+            )
+        )
+        adapter._js = MagicMock()
+        adapter._js.pull_subscribe = AsyncMock()
+        return adapter
+
+    def make_msg(self, event_type: str = "created") -> MagicMock:
+        """Create a JetStream message carrying an event."""
+        msg = MagicMock()
+        msg.data = serialize_to_json(Event(domain="orders", event_type=event_type))
+        msg.ack = AsyncMock()
+        msg.nak = AsyncMock()
+        return msg
+
+    async def run_batches(self, adapter, batches, handler, options, mode="compete") -> None:
+        """Subscribe and let the fetch loop drain the given batches."""
+        fetched = asyncio.Event()
+
+        async def fetch(batch, timeout):
+            if batches:
+                return batches.pop(0)
+            fetched.set()
+            await asyncio.sleep(0.01)
+            raise TimeoutError
+
+        adapter._js.pull_subscribe.return_value.fetch = fetch
+        await adapter.subscribe_event("orders.*", handler, mode=mode, options=options)
+        await asyncio.wait_for(fetched.wait(), timeout=1)
+        await adapter.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_wildcard_pattern_gets_durable_consumer(self, adapter):
+        """Test wildcards are consumed durably through a filter subject."""
+        options = EventSubscriptionOptions(pull=True, batch_size=10, max_ack_pending=500)
+
+        await adapter.subscribe_event("orders.>", AsyncMock(), options=options)
+        await adapter.subscribe_event("orders.*", AsyncMock(), mode="broadcast", options=options)
+
+        first, second = adapter._js.pull_subscribe.call_args_list
+        assert first[0] == ("orders.>",)
+        assert first[1]["durable"] == "billing-orders-all"
+        config = first[1]["config"]
+        assert config.filter_subject == "orders.>"
+        assert config.ack_policy == AckPolicy.EXPLICIT
+        assert config.max_ack_pending == 500
+        assert second[1]["durable"] == "billing-orders-star-billing-1"
+        await adapter.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_batch_handled_concurrently_and_acked(self, adapter):
+        """Test events of a batch run concurrently up to the limit."""
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if event.event_type == "failed":
+                raise ValueError("boom")
+
+        msgs = [self.make_msg() for _ in range(7)] + [self.make_msg("failed")]
+        options = EventSubscriptionOptions(pull=True, batch_size=8, max_concurrency=4)
+        await self.run_batches(adapter, [msgs], handler, options)
+
+        assert peak == 4
+        assert all(msg.ack.await_count == 1 for msg in msgs[:7])
+        msgs[7].nak.assert_awaited_once()
+        msgs[7].ack.assert_not_awaited()
+        assert adapter._metrics.get_all()["counters"]["events.errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_logged(self, adapter):
+        """Test handler failures go to the adapter's logger."""
+        adapter._logger = MagicMock()
+
+        async def handler(event):
+            raise ValueError("boom")
+
+        msg = self.make_msg()
+        msg.subject = "events.orders.created"
+        options = EventSubscriptionOptions(pull=True, batch_size=1)
+        await self.run_batches(adapter, [[msg]], handler, options)
+
+        adapter._logger.error.assert_called_once_with(
+            "Event handler error", error="boom", subject="events.orders.created"
+        )
+
+    @pytest.mark.asyncio
+    async def test_ordered_batch_acked_once(self, adapter):
+        """Test ordered consumers ack a batch with a single ack-all."""
+        handled = []
+
+        async def handler(event):
+            handled.append(event.event_type)
+
+        msgs = [self.make_msg(f"e{index}") for index in range(5)]
+        options = EventSubscriptionOptions(pull=True, batch_size=5, ordered=True)
+        await self.run_batches(adapter, [msgs], handler, options, mode="broadcast")
+
+        config = adapter._js.pull_subscribe.call_args[1]["config"]
+        assert config.ack_policy == AckPolicy.ALL
+        assert handled == ["e0", "e1", "e2", "e3", "e4"]
+        assert [msg.ack.await_count for msg in msgs] == [0, 0, 0, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_ordered_batch_failure_redelivers_rest(self, adapter):
+        """Test a failure acks the handled prefix and rejects the remainder."""
+
+        async def handler(event):
+            if event.event_type == "e2":
+                raise ValueError("boom")
+
+        msgs = [self.make_msg(f"e{index}") for index in range(4)]
+        options = EventSubscriptionOptions(pull=True, batch_size=4, ordered=True)
+        await self.run_batches(adapter, [msgs], handler, options, mode="broadcast")
+
+        assert [msg.ack.await_count for msg in msgs] == [0, 1, 0, 0]
+        assert [msg.nak.await_count for msg in msgs] == [0, 0, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_ordered_rejected_in_compete_mode(self, adapter):
+        """Test ordered consumers cannot be shared between competing instances."""
+        options = EventSubscriptionOptions(pull=True, ordered=True)
+
+        with pytest.raises(ValueError, match="broadcast"):
+            await adapter.subscribe_event("orders.*", AsyncMock(), options=options)
+
+        adapter._js.pull_subscribe.assert_not_called()
+
+    def test_options_validation(self):
+        """Test inconsistent delivery options are rejected."""
+        with pytest.raises(ValueError, match="ordered requires pull"):
+            EventSubscriptionOptions(ordered=True)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            EventSubscriptionOptions(pull=True, ordered=True, max_concurrency=2)
+        with pytest.raises(ValueError, match="max_ack_pending"):
+            EventSubscriptionOptions(pull=True, batch_size=100, max_ack_pending=10)
+
+
+class TestNATSAdapterEventPublishing:
+    """Test event publishing with message ids and PubAck windows."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create adapter with a mock JetStream context."""
+        adapter = NATSAdapter(config=NATSConnectionConfig(publish_flush_size=2))
+        adapter._js = MagicMock()
+        adapter._js.publish = AsyncMock()
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_publish_event_sets_message_id(self, adapter):
+        """Test single publishes carry the deduplication header."""
+        event = Event(domain="orders", event_type="created")
+
+        await adapter.publish_event(event)
+
+        headers = adapter._js.publish.call_args[1]["headers"]
+        assert headers == {"Nats-Msg-Id": event.message_id}
+
+    @pytest.mark.asyncio
+    async def test_publish_events_batch_reports_failures(self, adapter):
+        """Test a batch waits for every PubAck and reports the failed events."""
+        loop = asyncio.get_running_loop()
+
+        async def publish_async(subject, payload, headers):
+            ack = loop.create_future()
+            if len(sent) == 1:
+                loop.call_soon(ack.set_exception, ValueError("stream full"))
+            else:
+                loop.call_soon(ack.set_result, MagicMock(duplicate=False))
+            sent.append(headers["Nats-Msg-Id"])
+            return ack
+
+        sent: list[str] = []
+        adapter._js.publish_async = publish_async
+        events = [Event(domain="orders", event_type="created") for _ in range(3)]
+
+        errors = await adapter.publish_events_batch(events)
+
+        assert sent == [event.message_id for event in events]
+        assert errors == {events[1].message_id: "stream full"}
+        adapter._js.publish.assert_not_called()
+        await adapter.disconnect()
+
+
+class TestNATSAdapterEventEnvelope:
+    """Test events carried in the header envelope format."""
+
+    async def receive(self, options=None):
+        """Publish an envelope event and return it with what the handler got."""
+        adapter = NATSAdapter(config=NATSConnectionConfig(header_envelope=True))
+        adapter._js = MagicMock()
+        adapter._js.publish = AsyncMock()
+        adapter._js.subscribe = AsyncMock()
+        event = Event(domain="orders", event_type="created", payload={"id": 7}, source="shop")
+
+        await adapter.publish_event(event)
+        subject, body = adapter._js.publish.call_args[0]
+        headers = adapter._js.publish.call_args[1]["headers"]
+        assert headers["Aegis-Source"] == "shop"
+        assert headers["Nats-Msg-Id"] == event.message_id
+
+        received = []
+        await adapter.subscribe_event(
+            subject, AsyncMock(side_effect=received.append), options=options
+        )
+        wrapper = adapter._js.subscribe.call_args[1]["cb"]
+        msg = MagicMock()
+        msg.headers = headers
+        msg.data = body
+        msg.ack = AsyncMock()
+        await wrapper(msg)
+
+        msg.ack.assert_awaited_once()
+        return event, received[0]
+
+    @pytest.mark.asyncio
+    async def test_envelope_publish_and_receive(self):
+        """Test metadata travels in headers and handlers get a decoded Event."""
+        event, received = await self.receive()
+
+        assert isinstance(received, Event)
+        assert received == event
+
+    @pytest.mark.asyncio
+    async def test_lazy_subscription_receives_view(self):
+        """Test subscriptions opting in to lazy payloads get an undecoded view."""
+        event, view = await self.receive(EventSubscriptionOptions(lazy_payload=True))
+
+        assert isinstance(view, EventView)
+        assert view.source == "shop"
+        assert not view.decoded
+        assert view.to_event() == event
+
+
 class TestNATSAdapterIntegration:
     """Test integration scenarios."""
 
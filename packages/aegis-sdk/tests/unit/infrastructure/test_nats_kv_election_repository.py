@@ -285,6 +285,60 @@ class TestNatsKvElectionRepositoryUpdateLeadership:
         assert result is False
         repo._metrics.increment.assert_called_with("election.leadership.update_error")
 
+    @pytest.mark.asyncio
+    async def test_update_leadership_uses_held_revision(self, repo):
+        """Test a held leadership is refreshed with one revision-checked update."""
+        service_name = ServiceName(value="test-service")
+        instance_id = InstanceId(value="instance-123")
+        repo._kv_store.put.side_effect = [7, 8, 9]
+
+        assert await repo.attempt_leadership(service_name, instance_id, "group1", 30)
+        assert await repo.update_leadership(service_name, instance_id, "group1", 30)
+        assert await repo.update_leadership(service_name, instance_id, "group1", 30)
+
+        repo._kv_store.get.assert_not_called()
+        refreshes = [call[0][2] for call in repo._kv_store.put.call_args_list[1:]]
+        assert [options.revision for options in refreshes] == [7, 8]
+        assert all(options.update_only for options in refreshes)
+
+    @pytest.mark.asyncio
+    async def test_update_leadership_stale_revision_falls_back(self, repo):
+        """Test a rejected revision re-reads and verifies the leader key."""
+        service_name = ServiceName(value="test-service")
+        instance_id = InstanceId(value="instance-123")
+        repo._kv_store.put.side_effect = [7, Exception("wrong last sequence"), 12]
+        repo._kv_store.get.return_value = KVEntry(
+            key="sticky-active.test-service.group1.leader",
+            value={"instance_id": "instance-123", "last_heartbeat": time.time()},
+            revision=11,
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+        )
+
+        await repo.attempt_leadership(service_name, instance_id, "group1", 30)
+        result = await repo.update_leadership(service_name, instance_id, "group1", 30)
+
+        assert result is True
+        repo._kv_store.get.assert_called_once()
+        assert repo._kv_store.put.call_args[0][2].revision == 11
+        repo._metrics.increment.assert_any_call("election.leadership.revision_stale")
+
+    @pytest.mark.asyncio
+    async def test_release_leadership_forgets_held_revision(self, repo):
+        """Test releasing leadership drops the held revision."""
+        service_name = ServiceName(value="test-service")
+        instance_id = InstanceId(value="instance-123")
+        repo._kv_store.put.return_value = 7
+        repo._kv_store.get.return_value = None
+
+        await repo.attempt_leadership(service_name, instance_id, "group1", 30)
+        await repo.release_leadership(service_name, instance_id, "group1")
+        result = await repo.update_leadership(service_name, instance_id, "group1", 30)
+
+        # Without a held revision the key is read first, and it is gone
+        assert result is False
+        assert repo._kv_store.put.call_count == 1
+
 
 class TestNatsKvElectionRepositoryGetCurrentLeader:
     """Test get current leader functionality."""
@@ -790,6 +844,45 @@ class TestNatsKvElectionRepositoryElectionState:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_unchanged_election_state_is_not_rewritten(self, repo, sample_election):
+        """Test saving an unchanged state skips the KV write."""
+        await repo.save_election_state(sample_election)
+        await repo.save_election_state(sample_election)
+
+        repo._kv_store.put.assert_called_once()
+
+        sample_election.leader_instance_id = InstanceId(value="other-leader")
+        await repo.save_election_state(sample_election)
+
+        assert repo._kv_store.put.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_election_state_served_from_saved_state(self, repo, sample_election):
+        """Test state saved by this repository is read back without the KV store."""
+        await repo.save_election_state(sample_election)
+
+        result = await repo.get_election_state(
+            sample_election.service_name, sample_election.instance_id, "group1"
+        )
+
+        repo._kv_store.get.assert_not_called()
+        assert result is not None
+        assert result is not sample_election
+        assert result.leader_instance_id == InstanceId(value="leader-instance")
+
+        await repo.delete_election_state(
+            sample_election.service_name, sample_election.instance_id, "group1"
+        )
+        repo._kv_store.get.return_value = None
+
+        assert (
+            await repo.get_election_state(
+                sample_election.service_name, sample_election.instance_id, "group1"
+            )
+            is None
+        )
+
     @pytest.mark.asyncio
     async def test_delete_election_state_success(self, repo):
         """Test successful deletion of election state."""
@@ -1,5 +1,7 @@
 """Unit tests for NATSKVStore."""
 
+import asyncio
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,10 +10,12 @@ import pytest
 from aegis_sdk.domain.exceptions import (
     KVKeyAlreadyExistsError,
     KVNotConnectedError,
+    KVRevisionMismatchError,
     KVStoreError,
 )
-from aegis_sdk.domain.models import KVEntry, KVOptions
+from aegis_sdk.domain.models import KVOptions
 from aegis_sdk.infrastructure.config import KVStoreConfig
+from aegis_sdk.infrastructure.nats_adapter import NATSAdapter
 from aegis_sdk.infrastructure.nats_kv_store import NATSKVStore
 
 
@@ -57,11 +61,18 @@ class TestNATSKVStoreKeyValidation:
     """Test key validation functionality."""
 
     def test_validate_key_with_dots(self):
-        """Test that keys with dots are rejected."""
+        """Test that dots are accepted as token separators."""
         store = NATSKVStore()
 
-        with pytest.raises(ValueError, match="contains invalid character '\\.'"):
-            store._validate_key("key.with.dots")
+        store._validate_key("service-instances.orders.orders-1")
+
+    @pytest.mark.parametrize("key", [".leading", "trailing.", "double..dot", ""])
+    def test_validate_key_with_empty_token(self, key):
+        """Test that keys with an empty dot-separated token are rejected."""
+        store = NATSKVStore()
+
+        with pytest.raises(ValueError, match="empty token"):
+            store._validate_key(key)
 
     def test_validate_key_with_spaces(self):
         """Test that keys with spaces are rejected."""
@@ -314,6 +325,49 @@ class TestNATSKVStoreBasicOperations:
         with pytest.raises(KVKeyAlreadyExistsError):
             await store.put("existing-key", {"data": "value"}, options)
 
+    @pytest.mark.asyncio
+    async def test_put_with_revision_is_server_side_cas(self, connected_store):
+        """Test a revision-checked put is one conditional update, not get + put."""
+        store = connected_store
+        store._kv.get = AsyncMock()
+        store._kv.put = AsyncMock()
+        store._kv.update = AsyncMock(return_value=8)
+
+        revision = await store.put("leader", {"id": "a"}, KVOptions(revision=7, ttl=5))
+
+        assert revision == 8
+        store._kv.update.assert_awaited_once_with("leader", b'{"id":"a"}', last=7)
+        store._kv.get.assert_not_called()
+        store._kv.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_put_with_revision_mismatch(self, connected_store):
+        """Test a rejected conditional update raises a revision mismatch."""
+        store = connected_store
+        store._kv.update = AsyncMock(side_effect=Exception("nats: wrong last sequence: 12"))
+
+        with pytest.raises(KVRevisionMismatchError) as exc_info:
+            await store.put("leader", {"id": "a"}, KVOptions(update_only=True, revision=7))
+
+        assert exc_info.value.expected_revision == 7
+        assert exc_info.value.actual_revision == 12
+
+    @pytest.mark.asyncio
+    async def test_put_update_only_uses_known_revision(self, connected_store):
+        """Test update_only reads the key only when no revision is given."""
+        store = connected_store
+        store._kv.get = AsyncMock(return_value=MagicMock(revision=4))
+        store._kv.update = AsyncMock(return_value=9)
+
+        await store.put("leader", {"id": "a"}, KVOptions(update_only=True, revision=7))
+        store._kv.get.assert_not_called()
+        store._kv.update.assert_awaited_once_with("leader", b'{"id":"a"}', last=7)
+
+        store._kv.update.reset_mock()
+        await store.put("leader", {"id": "a"}, KVOptions(update_only=True))
+        store._kv.get.assert_awaited_once_with("leader")
+        store._kv.update.assert_awaited_once_with("leader", b'{"id":"a"}', last=4)
+
     @pytest.mark.asyncio
     async def test_put_not_connected(self):
         """Test put when not connected."""
@@ -401,38 +455,205 @@ class TestNATSKVStoreBatchOperations:
 
         assert result == []
 
+    @staticmethod
+    def _nats_entry(value: bytes, revision: int) -> MagicMock:
+        entry = MagicMock()
+        entry.value = value
+        entry.revision = revision
+        entry.delta = None
+        entry.created = datetime(2025, 1, 1, tzinfo=UTC)
+        return entry
+
     @pytest.mark.asyncio
     async def test_get_many(self, connected_store):
         """Test get_many operation."""
         store = connected_store
+        stored = {
+            "key1": self._nats_entry(b'{"data": 1}', 1),
+            "key2": self._nats_entry(b'{"data": 2}', 2),
+        }
 
-        # Mock individual get calls
         async def mock_get(key):
-            if key == "key1":
-                return KVEntry(
-                    key="key1",
-                    value={"data": 1},
-                    revision=1,
-                    created_at="2025-01-01T00:00:00Z",
-                    updated_at="2025-01-01T00:00:00Z",
-                )
-            elif key == "key2":
-                return KVEntry(
-                    key="key2",
-                    value={"data": 2},
-                    revision=2,
-                    created_at="2025-01-01T00:00:00Z",
-                    updated_at="2025-01-01T00:00:00Z",
-                )
-            return None
-
-        with patch.object(store, "get", side_effect=mock_get):
-            result = await store.get_many(["key1", "key2", "missing"])
-
-            assert len(result) == 2
-            assert "key1" in result
-            assert "key2" in result
-            assert "missing" not in result
+            if key not in stored:
+                raise Exception("key not found")
+            return stored[key]
+
+        store._kv.get = AsyncMock(side_effect=mock_get)
+
+        result = await store.get_many(["key1", "key2", "missing"])
+
+        assert list(result) == ["key1", "key2"]
+        assert result["key1"].value == {"data": 1}
+        assert result["key2"].revision == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_in_flight_window(self, connected_store):
+        """Test batch operations never exceed the configured window."""
+        store = connected_store
+        store._config = KVStoreConfig(bucket="test_bucket", batch_window=4)
+        in_flight = 0
+        peak = 0
+
+        async def slow_put(key, value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return int(key.split("-")[1])
+
+        store._kv.put = AsyncMock(side_effect=slow_put)
+
+        result = await store.put_many({f"key-{i}": i for i in range(1, 51)})
+
+        assert peak == 4
+        assert list(result) == [f"key-{i}" for i in range(1, 51)]
+        assert result["key-7"] == 7
+
+    @pytest.mark.asyncio
+    async def test_batch_spreads_over_pooled_handles(self, connected_store):
+        """Test workers round-robin over the pooled bucket handles."""
+        store = connected_store
+        second = MagicMock()
+
+        async def delete(key):
+            await asyncio.sleep(0)
+
+        store._kv.delete = AsyncMock(side_effect=delete)
+        second.delete = AsyncMock(side_effect=delete)
+        store._kv_pool = [store._kv, second]
+
+        result = await store.delete_many(["a", "b", "c", "d"])
+
+        assert result == {"a": True, "b": True, "c": True, "d": True}
+        assert store._kv.delete.await_count > 0
+        assert second.delete.await_count > 0
+
+    @pytest.mark.asyncio
+    async def test_put_batch_reports_per_key_errors(self, connected_store):
+        """Test put_batch collects errors without aborting the batch."""
+        store = connected_store
+
+        async def put(key, value):
+            if key == "bad":
+                raise Exception("write failed")
+            return 10
+
+        store._kv.put = AsyncMock(side_effect=put)
+
+        batch = await store.put_batch({"good": 1, "bad": 2, "invalid*key": 3})
+
+        assert batch.results == {"good": 10}
+        assert batch.errors["bad"] == "write failed"
+        assert "invalid character" in batch.errors["invalid*key"]
+        assert not batch.ok
+
+    @pytest.mark.asyncio
+    async def test_put_many_raises_first_error_after_batch(self, connected_store):
+        """Test put_many raises the first failure once all entries were attempted."""
+        store = connected_store
+        store._kv.put = AsyncMock(side_effect=[1, Exception("boom"), 3])
+
+        with pytest.raises(Exception, match="boom"):
+            await store.put_many({"a": 1, "b": 2, "c": 3})
+
+        assert store._kv.put.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_many_operations_reject_invalid_keys(self, connected_store):
+        """Test the *_many helpers raise on an invalid key before touching the bucket."""
+        store = connected_store
+        store._kv.get = AsyncMock()
+        store._kv.put = AsyncMock()
+        store._kv.delete = AsyncMock()
+
+        with pytest.raises(ValueError, match="invalid character"):
+            await store.get_many(["good", "bad key"])
+        with pytest.raises(ValueError, match="invalid character"):
+            await store.put_many({"good": 1, "bad key": 2})
+        with pytest.raises(ValueError, match="invalid character"):
+            await store.delete_many(["good", "bad key"])
+
+        store._kv.get.assert_not_called()
+        store._kv.put.assert_not_called()
+        store._kv.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_not_connected(self):
+        """Test batch operations require a connection."""
+        store = NATSKVStore()
+
+        with pytest.raises(KVNotConnectedError):
+            await store.get_many(["key1"])
+
+    @pytest.mark.asyncio
+    async def test_get_batch_direct(self, connected_store):
+        """Test multi-subject direct get decodes streamed replies."""
+        store = connected_store
+        adapter = MagicMock(spec=NATSAdapter)
+        nc = MagicMock()
+        adapter._connections = [nc]
+        store._nats_adapter = adapter
+
+        def reply(headers, data=b""):
+            msg = MagicMock()
+            msg.headers = headers
+            msg.data = data
+            return msg
+
+        sub = MagicMock()
+        sub.next_msg = AsyncMock(
+            side_effect=[
+                reply(
+                    {
+                        "Nats-Subject": "$KV.test_bucket.key1",
+                        "Nats-Sequence": "7",
+                        "Nats-Time-Stamp": "2025-01-01T00:00:00.123456789Z",
+                    },
+                    b'{"data": 1}',
+                ),
+                reply(
+                    {
+                        "Nats-Subject": "$KV.test_bucket.key2",
+                        "Nats-Sequence": "8",
+                        "KV-Operation": "DEL",
+                    }
+                ),
+                reply({"Status": "204", "Description": "EOB"}),
+            ]
+        )
+        sub.unsubscribe = AsyncMock()
+        nc.new_inbox.return_value = "_INBOX.test"
+        nc.subscribe = AsyncMock(return_value=sub)
+        nc.publish = AsyncMock()
+
+        batch = await store.get_batch(["key1", "key2", "missing"], direct=True)
+
+        assert list(batch.results) == ["key1"]
+        entry = batch.results["key1"]
+        assert entry.value == {"data": 1}
+        assert entry.revision == 7
+        assert entry.created_at == "2025-01-01T00:00:00.123456+00:00"
+        subject, payload = nc.publish.call_args.args
+        assert subject == "$JS.API.DIRECT.GET.KV_test_bucket"
+        assert json.loads(payload)["multi_last"] == [
+            "$KV.test_bucket.key1",
+            "$KV.test_bucket.key2",
+            "$KV.test_bucket.missing",
+        ]
+        sub.unsubscribe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_batch_direct_falls_back(self, connected_store):
+        """Test direct get failures fall back to pipelined gets."""
+        store = connected_store
+        store._config = KVStoreConfig(bucket="test_bucket", direct_get_batch=True)
+        store._kv.get = AsyncMock(return_value=self._nats_entry(b'{"data": 1}', 3))
+
+        # Default adapter has no connections, so the direct path is unavailable
+        result = await store.get_many(["key1"])
+
+        assert result["key1"].revision == 3
 
 
 class TestNATSKVStoreAdvancedOperations:
@@ -456,6 +677,105 @@ class TestNATSKVStoreAdvancedOperations:
             async for _ in store.watch("test-key"):
                 pass
 
+    @staticmethod
+    def _watcher(keys: list[str]) -> MagicMock:
+        """Create a watcher that replays PUT updates for keys, then closes."""
+        updates = []
+        for revision, key in enumerate(keys, start=1):
+            update = MagicMock()
+            update.key = key
+            update.value = b'{"n": %d}' % revision
+            update.revision = revision
+            update.operation = None
+            update.delta = 1
+            update.created = datetime(2025, 1, 1, tzinfo=UTC)
+            updates.append(update)
+        updates.append(RuntimeError("watcher closed"))
+
+        watcher = MagicMock()
+        watcher.updates = AsyncMock(side_effect=updates)
+        watcher.stop = AsyncMock()
+        return watcher
+
+    @pytest.mark.parametrize(
+        ("prefix", "expected"),
+        [
+            ("service-instances.", ("service-instances.>", True)),
+            ("service-instances.echo", ("service-instances.>", False)),
+            ("orders.eu.", ("orders.eu.>", True)),
+            ("service-instances__", (">", False)),
+        ],
+    )
+    def test_prefix_subject_filter(self, prefix, expected):
+        """Test prefixes map to the narrowest whole-token subject filter."""
+        assert NATSKVStore._prefix_subject_filter(prefix) == expected
+
+    @pytest.mark.asyncio
+    async def test_watch_prefix_uses_server_side_filter(self, connected_store):
+        """Test token-aligned prefixes are filtered by the server."""
+        store = connected_store
+        watcher = self._watcher(["svc.a", "svc.b"])
+        store._kv.watch = AsyncMock(return_value=watcher)
+
+        events = [event async for event in store.watch(prefix="svc.")]
+
+        store._kv.watch.assert_awaited_once_with("svc.>", include_history=False)
+        assert [event.entry.key for event in events] == ["svc.a", "svc.b"]
+        assert not hasattr(store, "_watch_prefix")
+        watcher.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_watch_prefix_filters_remainder_client_side(self, connected_store):
+        """Test prefixes that end mid-token are narrowed client-side."""
+        store = connected_store
+        store._kv.watch = AsyncMock(return_value=self._watcher(["svc-a", "other", "svc-b"]))
+
+        events = [event async for event in store.watch(prefix="svc-")]
+
+        store._kv.watch.assert_awaited_once_with(">", include_history=False)
+        assert [event.entry.key for event in events] == ["svc-a", "svc-b"]
+
+    @pytest.mark.asyncio
+    async def test_watch_multiple_prefixes(self, connected_store):
+        """Test several prefixes get one filtered watcher each and are merged."""
+        store = connected_store
+        watchers = {
+            "orders.>": self._watcher(["orders.1", "orders.2"]),
+            "users.>": self._watcher(["users.1"]),
+        }
+        store._kv.watch = AsyncMock(side_effect=lambda subject, **_: watchers[subject])
+
+        events = [event async for event in store.watch(prefix=["orders.", "users."])]
+
+        assert sorted(event.entry.key for event in events) == ["orders.1", "orders.2", "users.1"]
+        assert store._kv.watch.await_count == 2
+        for watcher in watchers.values():
+            watcher.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_watch_signals_synced_after_replay(self, connected_store):
+        """Test on_synced fires at the end-of-replay marker and events carry keys."""
+        store = connected_store
+        watcher = self._watcher(["svc.a"])
+        delete = MagicMock()
+        delete.key = "svc.a"
+        delete.operation = "DEL"
+        delete.delta = 2
+        put, closed = list(watcher.updates.side_effect)
+        watcher.updates = AsyncMock(side_effect=[put, None, delete, None, closed])
+        store._kv.watch = AsyncMock(return_value=watcher)
+        synced = []
+
+        events = []
+        async for event in store.watch(prefix="svc.", on_synced=lambda: synced.append(len(events))):
+            events.append(event)
+
+        assert synced == [1]
+        assert [(event.operation, event.key) for event in events] == [
+            ("PUT", "svc.a"),
+            ("DELETE", "svc.a"),
+        ]
+
     @pytest.mark.asyncio
     async def test_history_success(self, connected_store):
         """Test successful history operation."""
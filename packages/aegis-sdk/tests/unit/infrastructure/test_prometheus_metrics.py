@@ -0,0 +1,175 @@
+"""Unit tests for PrometheusMetrics and MetricsHTTPServer."""
+
+import asyncio
+
+import pytest
+
+from aegis_sdk.infrastructure.in_memory_metrics import InMemoryMetrics
+from aegis_sdk.infrastructure.prometheus_metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsHTTPServer,
+    PrometheusMetrics,
+)
+from aegis_sdk.ports.metrics import CounterHandle, MetricsPort
+
+
+class TestPrometheusMetrics:
+    """Test cases for PrometheusMetrics."""
+
+    def test_implements_port(self):
+        """Test the backend is a MetricsPort."""
+        assert isinstance(PrometheusMetrics(), MetricsPort)
+
+    def test_counter_handle_updates_family_child(self):
+        """Test a template maps to a labelled family and handles hold the value."""
+        metrics = PrometheusMetrics()
+        handle = metrics.counter("rpc.{service}.{method}.success", service="svc", method="echo")
+        handle.inc()
+        handle.inc(2)
+
+        assert isinstance(handle, CounterHandle)
+        assert metrics.get_all()["counters"]["rpc.svc.echo.success"] == 3
+        text = metrics.render()
+        assert "# TYPE aegis_rpc_success counter" in text
+        assert 'aegis_rpc_success_total{service="svc",method="echo"} 3' in text
+
+    def test_same_labels_return_same_handle(self):
+        """Test binding a label set twice reuses the child."""
+        metrics = PrometheusMetrics()
+        first = metrics.counter(
+            "events.processed.{domain}.{event_type}", domain="a", event_type="b"
+        )
+        second = metrics.counter(
+            "events.processed.{domain}.{event_type}", domain="a", event_type="b"
+        )
+
+        assert first is second
+
+    def test_string_api_without_labels(self):
+        """Test the string API creates unlabelled families."""
+        metrics = PrometheusMetrics()
+        metrics.increment("kv.get.success")
+        metrics.increment("kv.get.success", 4)
+        metrics.gauge("nats.connections", 2)
+
+        text = metrics.render()
+        assert "aegis_kv_get_success_total 5" in text
+        assert "aegis_nats_connections 2" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test timer values land in cumulative buckets with count and sum."""
+        metrics = PrometheusMetrics(buckets=(1, 10))
+        timer = metrics.timer_handle("rpc.{service}.{method}", service="svc", method="echo")
+        for value in (0.5, 5, 50):
+            timer.observe(value)
+
+        text = metrics.render()
+        assert 'aegis_rpc_bucket{service="svc",method="echo",le="1"} 1' in text
+        assert 'aegis_rpc_bucket{service="svc",method="echo",le="10"} 2' in text
+        assert 'aegis_rpc_bucket{service="svc",method="echo",le="+Inf"} 3' in text
+        assert 'aegis_rpc_count{service="svc",method="echo"} 3' in text
+        assert 'aegis_rpc_sum{service="svc",method="echo"} 55.5' in text
+
+        summary = metrics.get_all()["summaries"]["rpc.svc.echo"]
+        assert summary["count"] == 3
+        assert summary["min"] == 0.5
+        assert summary["max"] == 50
+
+    def test_timer_context_manager(self):
+        """Test the timer context records one observation."""
+        metrics = PrometheusMetrics()
+        with metrics.timer("op"):
+            pass
+        with metrics.timer_handle("op").time():
+            pass
+
+        assert metrics.get_all()["summaries"]["op"]["count"] == 2
+
+    def test_label_values_are_escaped(self):
+        """Test quotes and backslashes in label values are escaped."""
+        metrics = PrometheusMetrics()
+        metrics.counter("x.{name}", name='a"b\\c').inc()
+
+        assert 'aegis_x_total{name="a\\"b\\\\c"} 1' in metrics.render()
+
+    def test_conflicting_families_raise(self):
+        """Test one family name cannot be reused with another type or label set."""
+        metrics = PrometheusMetrics()
+        metrics.counter("rpc.{service}.calls", service="svc")
+
+        with pytest.raises(ValueError):
+            metrics.gauge_handle("rpc.{service}.calls", service="svc")
+        with pytest.raises(ValueError):
+            metrics.counter("rpc.{method}.calls", method="m")
+
+    def test_missing_label_raises(self):
+        """Test every placeholder needs a value."""
+        with pytest.raises(ValueError):
+            PrometheusMetrics().counter("rpc.{service}.{method}.success", service="svc")
+
+    def test_reset_keeps_handles_bound(self):
+        """Test reset zeroes values without detaching existing handles."""
+        metrics = PrometheusMetrics()
+        handle = metrics.counter("rpc.{service}.calls", service="svc")
+        handle.inc(3)
+        metrics.reset()
+        handle.inc()
+
+        assert metrics.get_all()["counters"]["rpc.svc.calls"] == 1
+
+
+class TestDefaultHandles:
+    """Test the port's default handles forward to the string API."""
+
+    def test_in_memory_handles_use_resolved_names(self):
+        """Test handles on InMemoryMetrics keep the dotted names."""
+        metrics = InMemoryMetrics()
+        metrics.counter("rpc.{service}.{method}.success", service="svc", method="m").inc()
+        metrics.gauge_handle("nats.connections").set(3)
+        metrics.timer_handle("rpc.{service}", service="svc").observe(2.0)
+
+        snapshot = metrics.get_all()
+        assert snapshot["counters"]["rpc.svc.m.success"] == 1
+        assert snapshot["gauges"]["nats.connections"] == 3
+        assert snapshot["summaries"]["rpc.svc"]["count"] == 1
+
+
+@pytest.mark.asyncio
+class TestMetricsHTTPServer:
+    """Test cases for MetricsHTTPServer."""
+
+    async def _get(self, port: int, path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def test_serves_exposition(self):
+        """Test a scrape returns the rendered registry."""
+        metrics = PrometheusMetrics()
+        metrics.increment("heartbeats.sent")
+        server = MetricsHTTPServer(metrics, host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            response = await self._get(server.port, "/metrics")
+        finally:
+            await server.stop()
+
+        head, body = response.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 200 OK")
+        assert f"Content-Type: {OPENMETRICS_CONTENT_TYPE}".encode() in head
+        assert b"aegis_heartbeats_sent_total 1" in body
+
+    async def test_unknown_path_is_not_found(self):
+        """Test other paths get a 404."""
+        server = MetricsHTTPServer(PrometheusMetrics(), host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            response = await self._get(server.port, "/other")
+        finally:
+            await server.stop()
+
+        assert response.startswith(b"HTTP/1.1 404 Not Found")
@@ -6,12 +6,14 @@ import msgpack
 import pytest
 
 from aegis_sdk.domain.exceptions import SerializationError
-from aegis_sdk.domain.models import Event, Message, RPCRequest
+from aegis_sdk.domain.models import Command, Event, Message, RPCRequest, RPCResponse
 from aegis_sdk.infrastructure.serialization import (
+    MessageCodec,
     deserialize_from_json,
     deserialize_from_msgpack,
     deserialize_params,
     detect_and_deserialize,
+    get_codec,
     is_msgpack,
     serialize_dict,
     serialize_to_json,
@@ -356,3 +358,96 @@ class TestDeserializeParams:
 
         with pytest.raises(SerializationError):
             deserialize_params(b"invalid json", use_msgpack=False)
+
+
+class TestMessageCodec:
+    """Test cases for the compiled message codec."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            RPCRequest(method="add", params={"a": 1, "b": [1, 2]}, target="calc"),
+            RPCResponse(correlation_id="abc", result={"sum": 3}),
+            Event(domain="orders", event_type="created", payload={"id": 1}),
+            Command(command="process", payload={"batch": 5}, priority="high"),
+        ],
+    )
+    def test_encode_matches_model_dump(self, message):
+        """Test the direct encoder produces the same bytes as model_dump."""
+        expected = msgpack.packb(message.model_dump(mode="json"), use_bin_type=True)
+
+        assert get_codec(type(message)).encode_msgpack(message) == expected
+        assert serialize_to_msgpack(message) == expected
+
+    def test_encode_converts_nested_values(self):
+        """Test non-msgpack values in Any fields use pydantic's JSON rules."""
+        response = RPCResponse(result={"event": Event(domain="d", event_type="t")})
+        expected = msgpack.packb(response.model_dump(mode="json"), use_bin_type=True)
+
+        assert serialize_to_msgpack(response) == expected
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_round_trip(self, validate):
+        """Test decoding in validated and trusted modes returns equal models."""
+        request = RPCRequest(method="add", params={"a": 1}, target="calc", timeout=2.5)
+        data = serialize_to_msgpack(request)
+
+        decoded = deserialize_from_msgpack(data, RPCRequest, validate=validate)
+
+        assert decoded == request
+        assert decoded.model_fields_set == request.model_fields_set | {
+            "message_id",
+            "trace_id",
+            "timestamp",
+            "correlation_id",
+            "source",
+        }
+
+    def test_trusted_decode_fills_defaults(self):
+        """Test trusted decoding applies defaults for missing fields."""
+        decoded = get_codec(RPCRequest).from_dict({"method": "ping"}, validate=False)
+
+        assert decoded.method == "ping"
+        assert decoded.params == {}
+        assert decoded.timeout == 5.0
+        assert decoded.message_id
+        assert decoded.model_fields_set == {"method"}
+
+    def test_trusted_decode_skips_validation(self):
+        """Test validation only runs in validated mode."""
+        data = msgpack.packb({"method": "ping", "timestamp": "not-a-timestamp"})
+
+        with pytest.raises(SerializationError):
+            deserialize_from_msgpack(data, RPCRequest)
+
+        decoded = deserialize_from_msgpack(data, RPCRequest, validate=False)
+        assert decoded.timestamp == "not-a-timestamp"
+
+    def test_trusted_model_still_validates_assignment(self):
+        """Test models built without validation keep validate_assignment."""
+        decoded = get_codec(RPCRequest).from_dict({"method": "ping"}, validate=False)
+
+        with pytest.raises(ValueError):
+            decoded.timeout = -1.0
+
+    def test_custom_serialization_uses_model_dump(self):
+        """Test models with custom serializers bypass the direct encoder."""
+        from pydantic import field_serializer
+
+        class Shouting(Message):
+            text: str = "hi"
+
+            @field_serializer("text")
+            def shout(self, value: str) -> str:
+                return value.upper()
+
+        decoded = msgpack.unpackb(MessageCodec(Shouting).encode_msgpack(Shouting()))
+
+        assert decoded["text"] == "HI"
+
+    def test_json_round_trip_trusted(self):
+        """Test trusted decoding also applies to JSON payloads."""
+        event = Event(domain="orders", event_type="created", payload={"id": 1})
+        data = serialize_to_json(event)
+
+        assert detect_and_deserialize(data, Event, validate=False) == event
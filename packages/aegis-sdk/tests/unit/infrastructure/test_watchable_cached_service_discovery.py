@@ -364,6 +364,28 @@ class TestWatchableCachedServiceDiscovery:
                 for call in mock_logger.debug.call_args_list
             )
 
+    async def test_watch_delete_with_key_invalidates_service(
+        self, mock_registry, mock_kv_store, mock_logger, mock_metrics
+    ):
+        """Test a DELETE carrying only the key invalidates that service's cache."""
+        mock_kv_store.watch_events = [
+            KVWatchEvent(operation="DELETE", key="service-instances.test-service.instance-1"),
+        ]
+
+        basic_discovery = BasicServiceDiscovery(mock_registry, mock_logger)
+        config = WatchableCacheConfig(watch=WatchConfig(enabled=True))
+
+        async with WatchableCachedServiceDiscovery(
+            basic_discovery, mock_kv_store, config, mock_metrics, mock_logger
+        ):
+            await asyncio.sleep(0.05)
+
+            assert any(
+                call.kwargs.get("service") == "test-service"
+                and "Cache invalidated due to watch event" in call.args[0]
+                for call in mock_logger.info.call_args_list
+            )
+
     async def test_context_manager_usage(
         self, mock_registry, mock_kv_store, mock_logger, mock_metrics
     ):
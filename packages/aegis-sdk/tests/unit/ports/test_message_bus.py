@@ -28,11 +28,14 @@ class TestMessageBusPort:
             "disconnect",
             "is_connected",
             "register_rpc_handler",
+            "join_rpc_queue_group",
+            "leave_rpc_queue_group",
             "call_rpc",
             "subscribe_event",
             "publish_event",
             "register_command_handler",
             "send_command",
+            "start_command",
             "register_service",
             "unregister_service",
             "send_heartbeat",
@@ -107,6 +110,12 @@ class TestMessageBusPortImplementation:
                 key = f"{service}.{method}"
                 self.rpc_handlers[key] = handler
 
+            async def join_rpc_queue_group(self, service: str, method: str) -> None:
+                pass
+
+            async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+                pass
+
             async def call_rpc(self, request: RPCRequest) -> RPCResponse:
                 return RPCResponse(
                     correlation_id=request.message_id,
@@ -129,6 +138,9 @@ class TestMessageBusPortImplementation:
             async def send_command(self, command: Command, track_progress: bool = True) -> dict:
                 return {"command_id": command.message_id, "status": "sent"}
 
+            async def start_command(self, command: Command):
+                raise NotImplementedError
+
             async def register_service(self, service_name: str, instance_id: str) -> None:
                 pass
 
@@ -252,6 +264,12 @@ class TestMessageBusPortContract:
             async def register_rpc_handler(self, method: str, handler) -> None:  # type: ignore
                 pass
 
+            async def join_rpc_queue_group(self, service: str, method: str) -> None:
+                pass
+
+            async def leave_rpc_queue_group(self, service: str, method: str) -> None:
+                pass
+
             async def call_rpc(self, request: RPCRequest) -> RPCResponse:
                 return RPCResponse()
 
@@ -269,6 +287,9 @@ class TestMessageBusPortContract:
             async def send_command(self, command: Command, track_progress: bool = True) -> dict:
                 return {}
 
+            async def start_command(self, command: Command):
+                raise NotImplementedError
+
             async def register_service(self, service_name: str, instance_id: str) -> None:
                 pass
 